@@ -0,0 +1,215 @@
+"""
+MEME通离线性能基准
+描述: 基于 fixtures/ 中的上游接口样本数据，离线测量解码、聪明钱汇总、表格模型构建、
+      排序以及HTMLDelegate渲染的耗时。结果以JSON输出，可与基线对比检测性能回退。
+
+用法:
+    python bench_meme.py                              # 运行并输出JSON
+    python bench_meme.py --save-baseline base.json    # 保存为基线
+    python bench_meme.py --baseline base.json         # 与基线对比，超过阈值时返回码为1
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import statistics
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from PySide6.QtWidgets import QApplication, QListView, QStyleOptionViewItem
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QImage, QPainter, QStandardItemModel, QStandardItem
+
+import meme
+
+# 与 fixtures/ 中的样本一一对应的代币合约地址
+FIXTURE_CONTRACT = "9DHe3pycTuymFk4H4bbPoAJ4hQrr2kaLDF6J6aAKpump"
+
+DEFAULT_THRESHOLD = 1.25  # 中位数超过基线的1.25倍视为回退
+DEFAULT_REPEAT = 7
+
+def load_fixtures() -> Dict[str, bytes]:
+    """读取全部样本数据，文件名即PayloadDecoder中的接口名称"""
+    fixtures = {}
+    for name in sorted(os.listdir(FIXTURE_DIR)):
+        if name.endswith(".json"):
+            with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+                fixtures[name[:-5]] = f.read()
+    return fixtures
+
+def touch_model(model) -> None:
+    """模拟视图读取所有单元格"""
+    for row in range(model.rowCount()):
+        for col in range(model.columnCount()):
+            model.data(model.index(row, col), Qt.DisplayRole)
+
+def sort_model(model) -> None:
+    """按每一列升序、降序各排序一次"""
+    for col in range(model.columnCount()):
+        model.sort(col, Qt.AscendingOrder)
+        model.sort(col, Qt.DescendingOrder)
+
+class BenchmarkSuite:
+    """基准用例集合"""
+
+    def __init__(self, fixtures: Dict[str, bytes]):
+        self.fixtures = fixtures
+        self.cases: Dict[str, Callable[[], Any]] = {}
+
+        decoded = {name: meme.PayloadDecoder.decode(name, content) for name, content in fixtures.items()}
+        self.history = decoded["pump_user_coins"]
+        self.trades = decoded["debot_dev_info"].data.transactions
+        self.creator = decoded["pump_coins"][0].creator or ""
+        chain_fm = decoded["chain_fm_transactions"].response.data[0].result.data.json.data
+        self.chain_fm_transactions = chain_fm.parsedTransactions
+        self.address_labels = chain_fm.address_labels
+        self.tweets = decoded["pump_news_tweets"][2].result.data.json.data.data.tweets
+        self.smart_money_rows, _ = meme.SmartMoneyAnalyzer.aggregate(
+            self.chain_fm_transactions, self.address_labels, FIXTURE_CONTRACT)
+
+        self.register_decode()
+        self.register_aggregate()
+        self.register_models()
+        self.register_render()
+
+    def register_decode(self):
+        for name, content in self.fixtures.items():
+            self.cases[f"decode/{name}"] = lambda name=name, content=content: meme.PayloadDecoder.decode(name, content)
+
+    def register_aggregate(self):
+        self.cases["aggregate/smart_money"] = lambda: meme.SmartMoneyAnalyzer.aggregate(
+            self.chain_fm_transactions, self.address_labels, FIXTURE_CONTRACT)
+
+    def model_factories(self) -> Dict[str, Callable[[], Any]]:
+        return {
+            "DevHistoryTableModel": lambda: meme.DevHistoryTableModel(meme.DevHistoryRow.from_payloads(self.history)),
+            "DevTradeTableModel": lambda: meme.DevTradeTableModel(meme.DevTradeRow.from_payloads(self.trades), self.creator),
+            "SmartMoneyTableModel": lambda: meme.SmartMoneyTableModel(list(self.smart_money_rows)),
+            "SocialTableModel": lambda: meme.SocialTableModel(meme.TweetRow.from_payloads(self.tweets)),
+        }
+
+    def register_models(self):
+        for name, factory in self.model_factories().items():
+            self.cases[f"model/{name}"] = lambda factory=factory: touch_model(factory())
+            if hasattr(factory(), "sort") and name != "SmartMoneyTableModel":
+                self.cases[f"sort/{name}"] = lambda factory=factory: sort_model(factory())
+
+    def register_render(self):
+        self.log_view = QListView()
+        self.log_view.resize(600, 400)
+        self.delegate = meme.HTMLDelegate(self.log_view)
+        self.log_model = QStandardItemModel()
+        for i in range(50):
+            item = QStandardItem()
+            item.setData(meme.MainWindow.format_log_html(
+                "21:43:38", f"获取开发者交易记录 {i}", f"成功 - {i}条交易",
+                f"https://gmgn.ai/sol/token/{FIXTURE_CONTRACT}"), Qt.DisplayRole)
+            self.log_model.appendRow(item)
+        self.image = QImage(600, 40, QImage.Format_ARGB32)
+
+        self.cases["render/HTMLDelegate.paint"] = self.render_log
+        self.cases["render/HTMLDelegate.sizeHint"] = self.size_log
+
+    def render_log(self):
+        painter = QPainter(self.image)
+        option = QStyleOptionViewItem()
+        option.widget = self.log_view
+        option.rect = QRect(0, 0, 600, 40)
+        for row in range(self.log_model.rowCount()):
+            self.delegate.paint(painter, option, self.log_model.index(row, 0))
+        painter.end()
+
+    def size_log(self):
+        option = QStyleOptionViewItem()
+        option.widget = self.log_view
+        for row in range(self.log_model.rowCount()):
+            self.delegate.sizeHint(option, self.log_model.index(row, 0))
+
+    def run(self, repeat: int = DEFAULT_REPEAT, selected: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """运行用例，返回每个用例单次调用的耗时统计（毫秒）"""
+        results = {}
+        for name, func in self.cases.items():
+            if selected and not any(pattern in name for pattern in selected):
+                continue
+            timer = timeit.Timer(func)
+            number, _ = timer.autorange()
+            samples = [t / number * 1000 for t in timer.repeat(repeat=repeat, number=number)]
+            results[name] = {
+                "median_ms": statistics.median(samples),
+                "min_ms": min(samples),
+                "max_ms": max(samples),
+                "loops": number,
+                "repeat": repeat,
+            }
+        return results
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """与基线对比，返回回退的用例说明"""
+    regressions = []
+    for name, stat in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        ratio = stat["median_ms"] / base["median_ms"] if base["median_ms"] else 0
+        stat["baseline_ms"] = base["median_ms"]
+        stat["ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(f"{name}: {base['median_ms']:.4f}ms -> {stat['median_ms']:.4f}ms ({ratio:.2f}x)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="MEME通离线性能基准")
+    parser.add_argument("--output", help="结果JSON输出路径（默认输出到标准输出）")
+    parser.add_argument("--baseline", help="基线JSON路径，用于检测性能回退")
+    parser.add_argument("--save-baseline", help="将本次结果保存为基线")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"回退阈值（中位数相对基线的倍数，默认{DEFAULT_THRESHOLD}）")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="每个用例的重复次数")
+    parser.add_argument("-k", dest="selected", action="append", help="只运行名称包含该字符串的用例，可多次指定")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    suite = BenchmarkSuite(load_fixtures())
+    results = suite.run(repeat=args.repeat, selected=args.selected)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "threshold": args.threshold,
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(output)
+
+    if regressions:
+        print("性能回退:\n" + "\n".join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
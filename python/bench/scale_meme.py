@@ -0,0 +1,182 @@
+"""
+MEME通表格规模测试
+描述: 使用合成数据在不同规模下测量每个表格模型的内存、构建耗时、排序耗时和滚动帧耗时。
+      TableStyleDelegate 作为表格的代理参与绘制，日志视图使用 HTMLDelegate。
+      内存为 tracemalloc 统计的Python堆内存，不含Qt在C++侧分配的内存。
+
+用法:
+    python scale_meme.py                                 # 默认 10k、100k 行
+    python scale_meme.py --rows 10000 100000 1000000 --output scale.json
+    python scale_meme.py --models DevTradeTableModel --skew 1.5
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from PySide6.QtWidgets import QApplication, QTableView, QListView
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+
+import meme
+from synthetic import SyntheticPayloads
+
+DEFAULT_ROWS = [10000, 100000]
+DEFAULT_FRAMES = 60
+
+def build_dev_history(payloads: SyntheticPayloads, rows: int) -> Callable[[], Any]:
+    content = payloads.encode(payloads.pump_user_coins(rows))
+    return lambda: meme.DevHistoryTableModel(meme.DevHistoryRow.from_payloads(
+        meme.PayloadDecoder.decode("pump_user_coins", content)))
+
+def build_dev_trade(payloads: SyntheticPayloads, rows: int) -> Callable[[], Any]:
+    content = payloads.encode(payloads.debot_dev_info(rows))
+    return lambda: meme.DevTradeTableModel(meme.DevTradeRow.from_payloads(
+        meme.PayloadDecoder.decode("debot_dev_info", content).data.transactions), payloads.creator)
+
+def build_smart_money(payloads: SyntheticPayloads, rows: int) -> Callable[[], Any]:
+    # 只有带标签的地址会进入表格，按标签比例放大事件数，使表格行数接近目标规模
+    label_ratio = max(len(payloads.labels) / len(payloads.wallets), 0.01)
+    content = payloads.encode(payloads.chain_fm_transactions(int(rows / label_ratio)))
+
+    def build():
+        result = meme.PayloadDecoder.decode("chain_fm_transactions", content).response.data[0].result.data.json.data
+        smart_rows, _ = meme.SmartMoneyAnalyzer.aggregate(result.parsedTransactions, result.address_labels, payloads.mint)
+        return meme.SmartMoneyTableModel(smart_rows)
+    return build
+
+def build_social(payloads: SyntheticPayloads, rows: int) -> Callable[[], Any]:
+    content = payloads.encode(payloads.pump_news_tweets(rows))
+    return lambda: meme.SocialTableModel(meme.TweetRow.from_payloads(
+        meme.PayloadDecoder.decode("pump_news_tweets", content)[2].result.data.json.data.data.tweets))
+
+def build_log(payloads: SyntheticPayloads, rows: int) -> Callable[[], Any]:
+    def build():
+        model = QStandardItemModel()
+        for i in range(rows):
+            item = QStandardItem()
+            item.setData(meme.MainWindow.format_log_html(
+                "21:43:38", f"获取开发者交易记录 {i}", f"成功 - {i}条交易", "https://gmgn.ai"), Qt.DisplayRole)
+            model.appendRow(item)
+        return model
+    return build
+
+MODELS = {
+    "DevHistoryTableModel": build_dev_history,
+    "DevTradeTableModel": build_dev_trade,
+    "SmartMoneyTableModel": build_smart_money,
+    "SocialTableModel": build_social,
+    "LogView": build_log,
+}
+
+def measure_build(factory: Callable[[], Any]) -> Dict[str, Any]:
+    """测量解码+行转换+模型构建的耗时和内存"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    model = factory()
+    build_s = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"model": model, "build_s": build_s, "retained_mb": current / 2**20, "peak_mb": peak / 2**20}
+
+def measure_sort(model) -> Dict[str, float]:
+    """测量每一列的排序耗时"""
+    if "sort" not in type(model).__dict__:  # 未实现排序的模型
+        return {}
+    timings = {}
+    for col in range(model.columnCount()):
+        start = time.perf_counter()
+        model.sort(col, Qt.DescendingOrder)
+        timings[model.headerData(col, Qt.Horizontal)] = time.perf_counter() - start
+    return timings
+
+def measure_scroll(model, is_log: bool, frames: int, seed: int) -> Dict[str, float]:
+    """在offscreen视图中随机滚动并同步重绘，统计每帧耗时"""
+    if is_log:
+        view = QListView()
+        view.setItemDelegate(meme.HTMLDelegate(view))
+    else:
+        view = QTableView()
+        view.setItemDelegate(meme.TableStyleDelegate(view))
+    view.resize(1000, 600)
+    view.setModel(model)
+    view.show()
+    QApplication.processEvents()
+
+    scrollbar = view.verticalScrollBar()
+    rnd = random.Random(seed)
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        scrollbar.setValue(rnd.randint(0, max(scrollbar.maximum(), 0)))
+        view.viewport().repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    view.hide()
+    view.deleteLater()
+    samples.sort()
+    return {
+        "frame_median_ms": statistics.median(samples),
+        "frame_p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "frame_max_ms": samples[-1],
+    }
+
+def run(rows_list: List[int], models: List[str], frames: int, seed: int, skew: float, wallets: int) -> List[Dict[str, Any]]:
+    results = []
+    for rows in rows_list:
+        payloads = SyntheticPayloads(seed=seed, wallets=wallets, skew=skew)
+        for name in models:
+            factory = MODELS[name](payloads, rows)
+            build = measure_build(factory)
+            model = build.pop("model")
+            result = {"model": name, "rows": model.rowCount(), "target_rows": rows, **build}
+            result["sort_s"] = measure_sort(model)
+            result.update(measure_scroll(model, name == "LogView", frames, seed))
+            results.append(result)
+            print(f"{name:<22} rows={result['rows']:<9} build={build['build_s']:.3f}s "
+                  f"mem={build['retained_mb']:.1f}MB peak={build['peak_mb']:.1f}MB "
+                  f"sort_max={max(result['sort_s'].values(), default=0):.3f}s "
+                  f"frame_p95={result['frame_p95_ms']:.1f}ms", file=sys.stderr)
+            del model, factory
+            gc.collect()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="MEME通表格规模测试")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="测试规模（行数）")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=list(MODELS), help="要测试的模型")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="滚动帧数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skew", type=float, default=1.1, help="钱包活跃度Zipf指数")
+    parser.add_argument("--wallets", type=int, default=5000, help="钱包地址池大小")
+    parser.add_argument("--output", help="结果JSON输出路径（默认输出到标准输出）")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = run(args.rows, args.models, args.frames, args.seed, args.skew, args.wallets)
+    output = json.dumps({"results": results}, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+MEME通合成数据生成器
+描述: 按可配置的规模和分布生成与 debot、chain.fm、pump.news、pump.fun 上游响应结构一致的数据，
+      用于规模测试。钱包活跃度服从Zipf分布（少数钱包贡献大部分交易），可调整偏斜程度。
+
+用法:
+    python synthetic.py --rows 100000 --out /tmp/synthetic     # 生成全部接口的数据文件
+"""
+
+import argparse
+import itertools
+import os
+import random
+from typing import Any, Dict, List
+
+import msgspec
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+SOL_MINT = "So11111111111111111111111111111111111111112"
+BASE_TIME = 1738040000  # 秒
+LABELS = ["kol:ansem", "whale", "smart:sniper", "fund:alpha", "dev:serial", "smart:early", "kol:cupsey"]
+
+class SyntheticPayloads:
+    """合成上游响应数据"""
+
+    def __init__(self, seed: int = 0, wallets: int = 5000, skew: float = 1.1,
+                 label_ratio: float = 0.3, buy_ratio: float = 0.55):
+        """
+        Args:
+            seed: 随机种子
+            wallets: 钱包地址池大小
+            skew: Zipf分布指数，越大交易越集中在少数钱包上，0为均匀分布
+            label_ratio: 有chain.fm标签的钱包比例
+            buy_ratio: 买入交易占比
+        """
+        self.random = random.Random(seed)
+        self.mint = self.address(40) + "pump"
+        self.creator = self.address()
+        self.wallets = [self.address() for _ in range(wallets)]
+        self.labels = {
+            wallet: [{"label": self.random.choice(LABELS), "type": "public", "channel": self.address(8)}]
+            for wallet in self.wallets if self.random.random() < label_ratio
+        }
+        self.buy_ratio = buy_ratio
+        weights = [1.0 / (rank ** skew) for rank in range(1, wallets + 1)]
+        self.cum_weights = list(itertools.accumulate(weights))
+
+    def address(self, length: int = 44) -> str:
+        return "".join(self.random.choices(B58, k=length))
+
+    def wallet(self) -> str:
+        return self.random.choices(self.wallets, cum_weights=self.cum_weights)[0]
+
+    def pump_user_coins(self, rows: int) -> List[Dict[str, Any]]:
+        """pump.fun user-created-coins 响应"""
+        rnd = self.random
+        return [{
+            "mint": self.address(40) + "pump",
+            "name": f"Coin {i}",
+            "symbol": "".join(rnd.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=rnd.randint(3, 6))),
+            "description": "synthetic token",
+            "image_uri": f"https://ipfs.io/ipfs/Qm{self.address()}",
+            "twitter": None,
+            "website": None,
+            "creator": self.creator,
+            "created_timestamp": (BASE_TIME - rnd.randint(0, 86400 * 365)) * 1000,
+            "complete": rnd.random() < 0.05,
+            "usd_market_cap": rnd.lognormvariate(9, 1.5),
+            "reply_count": rnd.randint(0, 200),
+        } for i in range(rows)]
+
+    def debot_dev_info(self, rows: int) -> Dict[str, Any]:
+        """debot dev/info 响应"""
+        rnd = self.random
+        transactions = []
+        for i in range(rows):
+            op = rnd.choices(["buy", "sell", "trans_in", "trans_out"], [5, 4, 1, 1])[0]
+            other = self.wallet()
+            outgoing = op in ("sell", "trans_out")
+            transactions.append({
+                "op": op,
+                "from": self.creator if outgoing else other,
+                "to": other if outgoing else self.creator,
+                "price": rnd.uniform(1e-6, 5e-4),
+                "volume": rnd.lognormvariate(5, 1.2),
+                "amount": rnd.lognormvariate(14, 1.5),
+                "time": BASE_TIME + i,
+                "tx_hash": self.address(88),
+            })
+        return {"code": 0, "description": "success", "data": {
+            "position_clear": False, "position_increase": True, "position_decrease": True,
+            "trans_out_amount": 0, "transactions": transactions,
+        }}
+
+    def chain_fm_transactions(self, rows: int, events_per_tx: int = 2) -> Dict[str, Any]:
+        """经本地Node.js代理返回的 chain.fm parsedTransaction.list 响应，rows为事件总数"""
+        rnd = self.random
+        transactions = []
+        for i in range(0, rows, events_per_tx):
+            events = []
+            for j in range(min(events_per_tx, rows - i)):
+                is_buy = rnd.random() < self.buy_ratio
+                events.append({
+                    "index": j,
+                    "address": self.wallet(),
+                    "kind": "token:swap",
+                    "data": {
+                        "input": {"token": SOL_MINT if is_buy else self.mint, "amount": str(rnd.randint(10**8, 10**11))},
+                        "output": {"token": self.mint if is_buy else SOL_MINT, "amount": str(rnd.randint(10**8, 10**11))},
+                        "order": {"price_usd": rnd.uniform(1e-5, 1e-3), "volume_usd": rnd.lognormvariate(6, 1.3),
+                                  "volume_native": rnd.lognormvariate(1, 1.3)},
+                    },
+                })
+            transactions.append({"signature": self.address(88), "block_time": BASE_TIME + i, "events": events})
+
+        page = {"parsedTransactions": transactions, "data": [{"renderContext": {"addressLabelsMap": self.labels}}]}
+        return {"success": True, "dataType": "chain_fm_transactions", "response": {
+            "status": 200, "data": [{"result": {"data": {"json": {"data": page}}}}],
+        }}
+
+    def pump_news_tweets(self, rows: int) -> List[Dict[str, Any]]:
+        """pump.news tweets.getTweetsByTokenAddress 批量响应"""
+        rnd = self.random
+        tweets = []
+        for i in range(rows):
+            screen_name = "user" + self.address(8)
+            tweets.append({
+                "tweet_id": str(1884000000000000000 + i),
+                "text": f"$MEME synthetic tweet {i} " + " ".join(rnd.choices(["moon", "send", "rug", "chart", "based"], k=rnd.randint(3, 30))),
+                "views": int(rnd.paretovariate(1.2) * 100),
+                "favorite_count": int(rnd.paretovariate(1.3) * 5),
+                "retweet_count": int(rnd.paretovariate(1.4) * 2),
+                "user": {"name": "Trader " + screen_name[-4:], "screen_name": screen_name,
+                         "is_blue_verified": rnd.random() < 0.3, "followers_count": rnd.randint(10, 10**6),
+                         "description": "synthetic user"},
+            })
+        return [
+            {"result": {"data": {"json": []}}},
+            {"result": {"data": {"json": {"count": 0}}}},
+            {"result": {"data": {"json": {"data": {"data": {"tweets": tweets}}}}}},
+        ]
+
+    def generate(self, endpoint: str, rows: int) -> Any:
+        """按PayloadDecoder中的接口名称生成数据"""
+        return getattr(self, endpoint)(rows)
+
+    @staticmethod
+    def encode(payload: Any) -> bytes:
+        return msgspec.json.encode(payload)
+
+ENDPOINTS = ["pump_user_coins", "debot_dev_info", "chain_fm_transactions", "pump_news_tweets"]
+
+def main():
+    parser = argparse.ArgumentParser(description="生成合成上游响应数据")
+    parser.add_argument("--rows", type=int, default=10000, help="每个接口的行数")
+    parser.add_argument("--out", required=True, help="输出目录")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--wallets", type=int, default=5000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--label-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    payloads = SyntheticPayloads(seed=args.seed, wallets=args.wallets, skew=args.skew, label_ratio=args.label_ratio)
+    for endpoint in ENDPOINTS:
+        path = os.path.join(args.out, f"{endpoint}.json")
+        with open(path, "wb") as f:
+            f.write(payloads.encode(payloads.generate(endpoint, args.rows)))
+        print(path)
+
+if __name__ == "__main__":
+    main()
@@ -7,23 +7,55 @@ Solana代币信息查询工具
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QLineEdit,
                              QTextEdit, QLabel, QTableView, QStyledItemDelegate, QStyle, QHeaderView,
-                             QListView, QStyleOptionViewItem, QTabWidget)
+                             QListView, QStyleOptionViewItem, QTabWidget, QWidget, QVBoxLayout,
+                             QHBoxLayout, QComboBox, QScrollArea, QSystemTrayIcon, QTabBar, QBoxLayout)
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtCore import (Qt, QCoreApplication, QAbstractTableModel, QModelIndex, QThread, Signal,
-                         QDateTime, QSize, QUrl, QAbstractListModel, QEvent, QRect)
+                         QDateTime, QSize, QUrl, QAbstractListModel, QEvent, QRect, QTimer, QObject,
+                         QPointF, QRectF)
 from PySide6.QtGui import (QPixmap, QColor, QBrush, QFont, QPalette,
                           QStandardItemModel, QStandardItem, QTextDocument,
-                          QAbstractTextDocumentLayout, QDesktopServices)
+                          QAbstractTextDocumentLayout, QDesktopServices, QPainter, QAction,
+                          QKeySequence, QPen, QPolygonF)
 from qt_material import apply_stylesheet
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+import msgspec
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union, Generic, TypeVar, Iterator, Iterable
 import json
+import re
+import string
+import bisect
+import array
+import math
+import operator
 import base64
 import locale
 import urllib.parse
+import argparse
+import hashlib
+import io
+import random
+import threading
+import time
+import socket
+import collections
+import itertools
+import contextlib
+import concurrent.futures
+import contextvars
+import asyncio
+import cProfile
+import pstats
+import traceback
+import functools
+import http.server
+import urllib3.util.connection
 
 # 设置Qt属性
 QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
@@ -31,6 +63,1121 @@ QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
 # 设置数字格式化
 locale.setlocale(locale.LC_ALL, '')
 
+T = TypeVar('T')
+
+# ---------------------------------------------------------------------------
+# 查询链路耗时追踪
+# ---------------------------------------------------------------------------
+
+class TraceSpan(msgspec.Struct, gc=False):
+    """单个耗时区间，时间单位为微秒，相对所属追踪的起点"""
+    name: str
+    cat: str
+    start_us: float
+    dur_us: float
+    tid: int
+    args: Dict[str, Any] = {}
+
+class QueryTrace:
+    """一次查询的全部耗时区间"""
+
+    def __init__(self, name: str, timeout: Optional[float] = None):
+        self.name = name
+        self.created = datetime.now()
+        self.origin = time.perf_counter()
+        # 查询的整体截止时间，随追踪一起传递到工作线程；查询结束后置为None
+        self.deadline = self.origin + timeout if timeout else None
+        self.spans: List[TraceSpan] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, cat: str, start: float, end: float, **args):
+        """添加区间，start/end 为 time.perf_counter() 读数"""
+        span = TraceSpan(name, cat, (start - self.origin) * 1e6, (end - start) * 1e6,
+                         threading.get_ident(), args)
+        with self._lock:
+            self.spans.append(span)
+
+    def snapshot(self) -> List[TraceSpan]:
+        with self._lock:
+            return sorted(self.spans, key=lambda span: span.start_us)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """导出为Chrome trace-event格式（chrome://tracing、Perfetto可直接打开）"""
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"thread-{tid}"}}
+                  for tid in {span.tid for span in self.spans}]
+        events += [{
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": span.start_us,
+            "dur": span.dur_us,
+            "pid": pid,
+            "tid": span.tid,
+            "args": span.args,
+        } for span in self.snapshot()]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"query": self.name}}
+
+class Tracer:
+    """
+    查询链路追踪类，当前线程（或协程）没有激活的追踪时所有记录均为空操作
+
+    当前追踪保存在上下文变量中，提交到共享事件循环的协程继承提交时的追踪
+    """
+
+    HISTORY_SIZE = 20
+
+    _current: contextvars.ContextVar = contextvars.ContextVar("trace", default=None)
+    history: collections.deque = collections.deque(maxlen=HISTORY_SIZE)
+
+    @classmethod
+    def start(cls, name: str, timeout: Optional[float] = None) -> QueryTrace:
+        """开始新的查询追踪，并在当前线程激活；timeout为查询的整体截止时间（秒）"""
+        trace = QueryTrace(name, timeout)
+        cls.history.append(trace)
+        cls._current.set(trace)
+        return trace
+
+    @classmethod
+    def current(cls) -> Optional[QueryTrace]:
+        return cls._current.get()
+
+    @classmethod
+    @contextlib.contextmanager
+    def activate(cls, trace: Optional[QueryTrace]):
+        """在当前线程临时激活指定追踪"""
+        token = cls._current.set(trace)
+        try:
+            yield trace
+        finally:
+            cls._current.reset(token)
+
+    @classmethod
+    @contextlib.contextmanager
+    def span(cls, name: str, cat: str, **args):
+        """记录代码块耗时"""
+        trace = cls.current()
+        if trace is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            trace.add(name, cat, start, time.perf_counter(), **args)
+
+    @classmethod
+    def remaining(cls) -> Optional[float]:
+        """当前查询距截止时间的剩余秒数，没有截止时间时返回None"""
+        trace = cls.current()
+        if trace is None or trace.deadline is None:
+            return None
+        return trace.deadline - time.perf_counter()
+
+    @classmethod
+    def record(cls, name: str, cat: str, start: float, end: float, **args):
+        """记录已知起止时间的区间"""
+        trace = cls.current()
+        if trace is not None:
+            trace.add(name, cat, start, end, **args)
+
+    @classmethod
+    def bind(cls, slot, name: str):
+        """
+        包装信号槽，使其在绑定时的追踪中执行并记录渲染耗时
+
+        工作线程的完成信号在主线程执行槽函数，此时主线程激活的可能已是另一次查询
+        """
+        trace = cls.current()
+
+        def wrapper(*args):
+            with cls.activate(trace), cls.span(name, "render"):
+                return slot(*args)
+        return wrapper
+
+    @classmethod
+    def export_chrome_trace(cls, trace: QueryTrace, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace.to_chrome_trace(), f, ensure_ascii=False)
+
+_create_connection = urllib3.util.connection.create_connection
+
+def traced_create_connection(address, *args, **kwargs):
+    """拆分记录DNS解析和TCP连接耗时，未激活追踪时直接调用原函数"""
+    if Tracer.current() is None:
+        return _create_connection(address, *args, **kwargs)
+
+    host, port = address
+    with Tracer.span("dns", "http", host=host):
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+    error = None
+    with Tracer.span("connect", "http", host=host):
+        for _, _, _, _, sockaddr in infos:
+            try:
+                return _create_connection((sockaddr[0], port), *args, **kwargs)
+            except OSError as e:
+                error = e
+    raise error or OSError(f"无法解析主机: {host}")
+
+urllib3.util.connection.create_connection = traced_create_connection
+
+# ---------------------------------------------------------------------------
+# 运行指标
+# 计数器、仪表和耗时直方图，以Prometheus文本格式暴露在本地端口
+# ---------------------------------------------------------------------------
+
+class MetricFamily:
+    """同名指标的全部标签组合"""
+
+    TYPE = "untyped"
+    LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(label, "")) for label in self.labels)
+
+    def items(self) -> List[Tuple[Dict[str, str], Any]]:
+        """返回 (标签, 值) 列表的快照"""
+        with self._lock:
+            return [(dict(zip(self.labels, key)), self.copy_value(value)) for key, value in self.values.items()]
+
+    @staticmethod
+    def copy_value(value: Any) -> Any:
+        return value
+
+    @staticmethod
+    def format_labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ""
+        escaped = (f'{k}="{v.translate(MetricFamily.LABEL_ESCAPES)}"' for k, v in labels.items())
+        return "{" + ",".join(escaped) + "}"
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{self.format_labels(labels)} {value}" for labels, value in self.items()]
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+class Counter(MetricFamily):
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self.key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self.values.get(self.key(labels), 0)
+
+class Gauge(Counter):
+    TYPE = "gauge"
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self.values[self.key(labels)] = value
+
+class Histogram(MetricFamily):
+    """累积分桶直方图，每个标签组合的值为 [各桶计数, 总和, 总数]"""
+
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self.key(labels)
+        with self._lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    @staticmethod
+    def copy_value(value: Any) -> Any:
+        return [list(value[0]), value[1], value[2]]
+
+    def get(self, **labels) -> Tuple[List[int], float, int]:
+        """返回 (各桶计数, 总和, 总数)"""
+        with self._lock:
+            value = self.values.get(self.key(labels))
+            return self.copy_value(value) if value is not None else ([0] * len(self.buckets), 0.0, 0)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total, count) in self.items():
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{self.format_labels({**labels, 'le': str(bound)})} {bucket_count}")
+            lines.append(f"{self.name}_bucket{self.format_labels({**labels, 'le': '+Inf'})} {count}")
+            lines.append(f"{self.name}_sum{self.format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{self.format_labels(labels)} {count}")
+        return lines
+
+    def quantile(self, q: float, counts: List[int], count: int) -> Optional[float]:
+        """按桶内线性插值估算分位数（与PromQL histogram_quantile一致），落在+Inf桶时返回最大上界"""
+        if count == 0:
+            return None
+        rank = q * count
+        lower, previous = 0.0, 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            if bucket_count >= rank:
+                in_bucket = bucket_count - previous
+                return lower + (bound - lower) * ((rank - previous) / in_bucket if in_bucket else 1)
+            lower, previous = bound, bucket_count
+        return self.buckets[-1]
+
+class Metrics:
+    """全局指标注册表"""
+
+    http_requests = Counter("meme_http_requests_total", "HTTP请求数", ("host", "method", "status"))
+    http_duration = Histogram("meme_http_request_duration_seconds", "HTTP请求耗时（含下载）", ("host",))
+    http_inflight = Gauge("meme_http_inflight_requests", "进行中的HTTP请求数", ("host",))
+    upstream_responses = Counter("meme_upstream_responses_total", "经本地Node.js代理转发的上游响应状态码", ("source", "status"))
+    fetch_total = Counter("meme_fetch_total", "数据获取次数，result为ok/empty/error", ("source", "result"))
+    fetch_duration = Histogram("meme_fetch_duration_seconds", "数据获取耗时（含解码）", ("source",))
+    schema_errors = Counter("meme_schema_errors_total", "上游数据结构不匹配次数", ("endpoint",))
+    cache_requests = Counter("meme_cache_requests_total", "缓存查询次数，result为hit/miss", ("cache", "result"))
+    workers_active = Gauge("meme_workers_active", "运行中的API工作线程数")
+    start_time = Gauge("meme_process_start_time_seconds", "进程启动时间（Unix时间戳）")
+    event_loop_lag = Histogram("meme_event_loop_lag_seconds", "主线程事件循环心跳延迟（帧延迟）",
+                               buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+    event_loop_stalls = Counter("meme_event_loop_stalls_total", "主线程卡顿超过阈值的次数")
+    hedged_requests = Counter("meme_hedged_requests_total", "发出对冲请求的次数，winner为先返回的请求", ("host", "winner"))
+    scheduler_waiting = Gauge("meme_scheduler_waiting_requests", "等待并发名额的请求数", ("priority",))
+    scheduler_wait = Histogram("meme_scheduler_wait_seconds", "请求等待并发名额的耗时", ("priority",),
+                               buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+    scanner_mints = Counter("meme_scanner_mints_total", "新币扫描看到的代币数，result为new/seen", ("feed", "result"))
+
+    FAMILIES: List[MetricFamily] = [http_requests, http_duration, http_inflight, upstream_responses,
+                                    fetch_total, fetch_duration, schema_errors, cache_requests,
+                                    workers_active, start_time, event_loop_lag, event_loop_stalls,
+                                    hedged_requests, scheduler_waiting, scheduler_wait, scanner_mints]
+
+    @classmethod
+    def render(cls) -> str:
+        """Prometheus文本格式（0.0.4）"""
+        return "\n".join(family.render() for family in cls.FAMILIES) + "\n"
+
+    @classmethod
+    def record_fetch(cls, source: str, result: str, seconds: float):
+        cls.fetch_total.inc(source=source, result=result)
+        cls.fetch_duration.observe(seconds, source=source)
+
+    @classmethod
+    def instrument(cls, source: str):
+        """
+        装饰数据获取函数，记录次数和耗时
+
+        返回None、False、空字符串或抛出异常记为error，返回空列表记为empty
+        """
+        def classify(value: Any) -> str:
+            if isinstance(value, (list, tuple, dict)):
+                return "ok" if value else "empty"
+            return "ok" if value is not None and value is not False and value != "" else "error"
+
+        def decorator(func):
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    start = time.perf_counter()
+                    result = "error"
+                    try:
+                        value = await func(*args, **kwargs)
+                        result = classify(value)
+                        return value
+                    finally:
+                        cls.record_fetch(source, result, time.perf_counter() - start)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                result = "error"
+                try:
+                    value = func(*args, **kwargs)
+                    result = classify(value)
+                    return value
+                finally:
+                    cls.record_fetch(source, result, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def record_upstream(cls, source: str, proxy_response: 'ProxyResponse'):
+        """记录本地Node.js代理转发的上游状态码，上游限流（429）只能从这里看到"""
+        upstream = proxy_response.response
+        cls.upstream_responses.inc(source=source, status=upstream.status if upstream is not None else "proxy_error")
+
+    @classmethod
+    def record_cache(cls, cache: str, hit: bool):
+        cls.cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+Metrics.start_time.set(time.time())
+
+class MetricsServer:
+    """本地Prometheus指标端点，在后台线程中提供 /metrics"""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = Metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 抓取请求不输出到控制台
+
+    server: Optional[http.server.ThreadingHTTPServer] = None
+
+    @classmethod
+    def start(cls, port: int, host: str = "127.0.0.1") -> Optional[str]:
+        """
+        启动指标端点
+
+        Returns:
+            Optional[str]: 指标地址，端口被占用等原因启动失败时返回None
+        """
+        try:
+            cls.server = http.server.ThreadingHTTPServer((host, port), cls.Handler)
+        except OSError as e:
+            print(f"指标端点启动失败: {e}")
+            return None
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, name="metrics", daemon=True).start()
+        return cls.url()
+
+    @classmethod
+    def url(cls) -> Optional[str]:
+        if cls.server is None:
+            return None
+        host, port = cls.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+# ---------------------------------------------------------------------------
+# 按查询划分的性能分析
+# ---------------------------------------------------------------------------
+
+class SamplingProfiler:
+    """采样分析器：后台线程定时采集所有线程的Python调用栈，按折叠栈格式计数"""
+
+    # 自身的后台线程不参与采样
+    IGNORED_THREADS = {"profiler", "watchdog", "metrics"}
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: collections.Counter = collections.Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @staticmethod
+    def frame_label(code) -> str:
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    @staticmethod
+    def is_idle(frame) -> bool:
+        """主线程停在 app.exec() 中等待事件，最内层Python帧是 main()"""
+        return frame.f_code.co_name == "main" and frame.f_code.co_filename == __file__
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                name = names.get(ident, f"thread-{ident}")
+                if name in self.IGNORED_THREADS or self.is_idle(frame):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self.frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(name)
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 可直接读取的折叠栈文本"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+class ProfileSession:
+    """
+    一次查询的性能分析数据
+
+    Python 3.12起cProfile基于sys.monitoring，同一时间只能有一个分析器，且事件覆盖所有线程；
+    此时只使用主线程的分析器，工作线程不再单独分析（统计中各线程的调用栈可能交错）。
+    """
+
+    PER_THREAD_CPROFILE = sys.version_info < (3, 12)
+
+    def __init__(self, name: str, mode: str, interval: float):
+        self.name = name
+        self.mode = mode
+        self.created = datetime.now()
+        self.sampler = SamplingProfiler(interval)
+        self.main_profile = cProfile.Profile() if mode == "cprofile" else None
+        self.profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """在主线程调用；3.12之前cProfile只分析调用enable的线程，工作线程通过 profile_thread 单独分析"""
+        self.sampler.start()
+        if self.main_profile is not None:
+            self.main_profile.enable()
+
+    def stop(self):
+        if self.main_profile is not None:
+            self.main_profile.disable()
+            self.profiles.append(self.main_profile)
+        self.sampler.stop()
+
+    @contextlib.contextmanager
+    def profile_thread(self):
+        if self.mode != "cprofile" or not self.PER_THREAD_CPROFILE:
+            yield
+            return
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self.profiles.append(profile)
+
+    def save(self, directory: str) -> List[str]:
+        """写入折叠栈（.collapsed）和pstats（.prof，仅cprofile模式），返回文件路径"""
+        os.makedirs(directory, exist_ok=True)
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.name)
+        base = os.path.join(directory, f"profile_{self.created.strftime('%Y%m%d_%H%M%S')}_{safe_name}")
+        paths = []
+
+        if self.sampler.samples:
+            with open(base + ".collapsed", "w", encoding="utf-8") as f:
+                f.write(self.sampler.collapsed())
+            paths.append(base + ".collapsed")
+
+        with self._lock:
+            profiles = list(self.profiles)
+        if profiles:
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(base + ".prof")
+            paths.append(base + ".prof")
+        return paths
+
+class QueryProfiler:
+    """
+    按查询划分的性能分析开关
+
+    每次查询开始时结束上一次查询的分析并写入文件；关闭分析或退出程序时写入当前查询的分析。
+    sample模式只运行采样分析器，开销很低；cprofile模式额外记录确定性的函数调用统计。
+    """
+
+    MODES = ("sample", "cprofile")
+    SAMPLE_INTERVAL = 0.005
+
+    enabled = False
+    mode = "sample"
+    directory = "profiles"
+    session: Optional[ProfileSession] = None
+
+    @classmethod
+    def configure(cls, mode: str, directory: str):
+        if mode not in cls.MODES:
+            raise ValueError(f"未知的性能分析模式: {mode}")
+        cls.mode = mode
+        cls.directory = directory
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> List[str]:
+        """打开或关闭性能分析，关闭时返回写入的文件"""
+        cls.enabled = enabled
+        return [] if enabled else cls.finish()
+
+    @classmethod
+    def begin(cls, name: str) -> List[str]:
+        """开始新查询的分析，返回上一次查询写入的文件"""
+        paths = cls.finish()
+        if cls.enabled:
+            cls.session = ProfileSession(name, cls.mode, cls.SAMPLE_INTERVAL)
+            cls.session.start()
+        return paths
+
+    @classmethod
+    def finish(cls) -> List[str]:
+        session, cls.session = cls.session, None
+        if session is None:
+            return []
+        session.stop()
+        try:
+            return session.save(cls.directory)
+        except OSError as e:
+            print(f"性能分析结果写入失败: {e}")
+            return []
+
+    @classmethod
+    @contextlib.contextmanager
+    def profile_thread(cls):
+        """在工作线程中记录cProfile统计，未开启分析时为空操作"""
+        session = cls.session
+        if session is None:
+            yield
+            return
+        with session.profile_thread():
+            yield
+
+# ---------------------------------------------------------------------------
+# 上游接口数据结构
+# 只声明界面用到的字段，其余字段在解码时直接跳过
+# ---------------------------------------------------------------------------
+
+class PumpCoin(msgspec.Struct):
+    """pump.fun代币记录（coins/search 与 user-created-coins）"""
+    mint: str
+    name: str = ''
+    symbol: str = ''
+    description: Optional[str] = None
+    image_uri: Optional[str] = None
+    twitter: Optional[str] = None
+    website: Optional[str] = None
+    creator: Optional[str] = None
+    created_timestamp: int = 0
+    complete: bool = False
+    usd_market_cap: float = 0.0
+
+class DevTransaction(msgspec.Struct):
+    """debot开发者交易记录"""
+    op: str = ''
+    from_: str = msgspec.field(name='from', default='')
+    to: str = ''
+    price: float = 0.0
+    volume: float = 0.0
+    amount: float = 0.0
+    time: float = 0.0
+    tx_hash: str = ''
+
+class DevTradeInfo(msgspec.Struct):
+    """debot开发者交易汇总"""
+    position_clear: bool = False
+    position_increase: bool = False
+    position_decrease: bool = False
+    trans_out_amount: float = 0.0
+    transactions: Optional[List[DevTransaction]] = None
+
+class DebotResponse(msgspec.Struct):
+    """debot dev/info 响应"""
+    data: Optional[DevTradeInfo] = None
+
+class TrpcPayload(msgspec.Struct, Generic[T]):
+    data: T
+
+class TrpcJson(msgspec.Struct, Generic[T]):
+    json: TrpcPayload[T]
+
+class TrpcResult(msgspec.Struct, Generic[T]):
+    data: TrpcJson[T]
+
+class TrpcCall(msgspec.Struct, Generic[T]):
+    """tRPC批量调用中的单个结果：result.data.json.data"""
+    result: TrpcResult[T]
+
+class ProxyUpstream(msgspec.Struct, Generic[T]):
+    data: T
+    status: int = 0
+
+class ProxyResponse(msgspec.Struct, Generic[T]):
+    """本地Node.js代理服务（localhost:3000）响应"""
+    success: bool = False
+    error: Optional[str] = None
+    response: Optional[ProxyUpstream[T]] = None
+
+class ChainFmOrder(msgspec.Struct):
+    volume_native: float = 0.0
+    volume_usd: float = 0.0
+    price_usd: float = 0.0
+
+class ChainFmTokenRef(msgspec.Struct):
+    token: str = ''
+
+class ChainFmEventData(msgspec.Struct):
+    order: ChainFmOrder = msgspec.field(default_factory=ChainFmOrder)
+    input: ChainFmTokenRef = msgspec.field(default_factory=ChainFmTokenRef)
+    output: ChainFmTokenRef = msgspec.field(default_factory=ChainFmTokenRef)
+
+class ChainFmEvent(msgspec.Struct):
+    """chain.fm交易事件"""
+    index: int = 0
+    address: str = ''
+    data: ChainFmEventData = msgspec.field(default_factory=ChainFmEventData)
+
+class ChainFmTransaction(msgspec.Struct):
+    signature: str = ''
+    block_time: int = 0
+    events: List[ChainFmEvent] = []
+
+class ChainFmAddressLabel(msgspec.Struct):
+    label: str = ''
+
+class ChainFmRenderContext(msgspec.Struct):
+    addressLabelsMap: Dict[str, List[ChainFmAddressLabel]] = {}
+
+class ChainFmPage(msgspec.Struct):
+    renderContext: ChainFmRenderContext
+
+class ChainFmTransactionList(msgspec.Struct):
+    """chain.fm parsedTransaction.list 结果"""
+    parsedTransactions: List[ChainFmTransaction] = []
+    data: List[ChainFmPage] = []
+
+    @property
+    def address_labels(self) -> Dict[str, List[ChainFmAddressLabel]]:
+        """地址标签表"""
+        return self.data[0].renderContext.addressLabelsMap if self.data else {}
+
+class PumpNewsStats(msgspec.Struct):
+    filter_tweets: int = 0
+    followers: int = 0
+    likes: int = 0
+    views: int = 0
+    official_tweets: int = 0
+
+class PumpNewsAnalysis(msgspec.Struct):
+    summary: str = ''
+
+class PumpNewsTokenData(msgspec.Struct):
+    """pump.news代币社交统计"""
+    stats: PumpNewsStats
+    smartbuy: int = 0
+    analysis: Dict[str, PumpNewsAnalysis] = {}
+
+class PumpNewsTokenList(msgspec.Struct):
+    data: List[PumpNewsTokenData] = []
+
+class PumpNewsUser(msgspec.Struct):
+    name: str = ''
+    screen_name: str = ''
+    is_blue_verified: bool = False
+
+class PumpNewsTweet(msgspec.Struct):
+    """pump.news推文"""
+    tweet_id: Union[int, str, None] = None
+    text: str = ''
+    views: int = 0
+    favorite_count: int = 0
+    retweet_count: int = 0
+    user: PumpNewsUser = msgspec.field(default_factory=PumpNewsUser)
+
+class PumpNewsTweetList(msgspec.Struct):
+    tweets: List[PumpNewsTweet] = []
+
+class PumpNewsTweetPage(msgspec.Struct):
+    data: PumpNewsTweetList
+
+class GmgnEnvelope(msgspec.Struct, Generic[T]):
+    """GMGN接口响应外层"""
+    data: T
+
+class GmgnHolderStat(msgspec.Struct):
+    holder_count: int = 0
+    bluechip_owner_count: int = 0
+    bluechip_owner_percentage: float = 0.0
+    top_rat_trader_percentage: float = 0.0
+
+class GmgnWalletTagStat(msgspec.Struct):
+    smart_wallets: int = 0
+    fresh_wallets: int = 0
+    renowned_wallets: int = 0
+    sniper_wallets: int = 0
+    rat_trader_wallets: int = 0
+    whale_wallets: int = 0
+    top_wallets: int = 0
+    following_wallets: int = 0
+
+class GmgnSecurity(msgspec.Struct):
+    top_10_holder_rate: float = 0.0
+    burn_status: Optional[str] = None
+
+class GmgnSecurityLaunchpad(msgspec.Struct):
+    security: GmgnSecurity
+
+class SchemaError(ValueError):
+    """上游接口数据结构与声明不一致"""
+
+class PayloadDecoder:
+    """上游接口数据解码类"""
+
+    # 每个上游接口对应的声明结构
+    SCHEMAS = {
+        "pump_coins": List[PumpCoin],
+        "pump_user_coins": List[PumpCoin],
+        "debot_dev_info": DebotResponse,
+        "chain_fm_transactions": ProxyResponse[List[TrpcCall[ChainFmTransactionList]]],
+        "pump_news_stats": Tuple[TrpcCall[PumpNewsTokenList], msgspec.Raw],
+        "pump_news_tweets": Tuple[msgspec.Raw, msgspec.Raw, TrpcCall[PumpNewsTweetPage]],
+        "gmgn_holder": ProxyResponse[GmgnEnvelope[GmgnHolderStat]],
+        "gmgn_wallet_tags": ProxyResponse[GmgnEnvelope[GmgnWalletTagStat]],
+        "gmgn_top_holders": ProxyResponse[GmgnEnvelope[GmgnSecurityLaunchpad]],
+    }
+
+    _decoders: Dict[str, msgspec.json.Decoder] = {}
+
+    # 按内容哈希缓存最近的解码结果，内容未变化的响应直接返回同一个对象
+    MEMO_SIZE = 64
+    _memo: collections.OrderedDict = collections.OrderedDict()
+    _memo_lock = threading.Lock()
+
+    @classmethod
+    def decode(cls, endpoint: str, content: bytes) -> Any:
+        """
+        按声明结构解码响应内容
+
+        Args:
+            endpoint: 接口名称（SCHEMAS中的键）
+            content: 原始响应字节
+
+        Returns:
+            Any: 解码后的类型化记录
+
+        Raises:
+            SchemaError: 响应不是合法JSON或结构与声明不一致，错误信息包含出错路径
+        """
+        decoder = cls._decoders.get(endpoint)
+        if decoder is None:
+            # 宽松模式：允许 "0.25" 这类字符串数字转换为数值
+            decoder = msgspec.json.Decoder(cls.SCHEMAS[endpoint], strict=False)
+            cls._decoders[endpoint] = decoder
+
+        try:
+            with Tracer.span(f"decode {endpoint}", "decode", bytes=len(content)):
+                return decoder.decode(content)
+        except msgspec.ValidationError as e:
+            Metrics.schema_errors.inc(endpoint=endpoint)
+            raise SchemaError(f"{endpoint} 数据结构变化: {e}") from e
+        except msgspec.DecodeError as e:
+            Metrics.schema_errors.inc(endpoint=endpoint)
+            raise SchemaError(f"{endpoint} JSON解析错误: {e}") from e
+
+    @classmethod
+    def decode_response(cls, endpoint: str, response: requests.Response) -> Any:
+        """
+        解码HTTP响应
+
+        内容与之前解码过的响应相同（304或内容哈希一致）时返回之前的解码结果，
+        界面据此判断数据未变化并跳过表格重建
+        """
+        digest = getattr(response, "content_hash", None) or HttpCache.digest(response.content)
+        key = (endpoint, digest)
+        memo = cls.memo_get(key)
+        if memo is not None:
+            return memo
+
+        result = cls.decode(endpoint, response.content)
+        Metrics.record_cache("decode", False)
+        cls.memo_put(key, result)
+        return result
+
+    @classmethod
+    def memo_get(cls, key: Tuple[str, str]) -> Any:
+        """返回缓存的解码结果，未命中时返回None"""
+        with cls._memo_lock:
+            result = cls._memo.get(key)
+            if result is None:
+                return None
+            cls._memo.move_to_end(key)
+        Metrics.record_cache("decode", True)
+        return result
+
+    @classmethod
+    def memo_put(cls, key: Tuple[str, str], result: Any):
+        """缓存解码结果，超过容量时淘汰最久未使用的条目"""
+        with cls._memo_lock:
+            cls._memo[key] = result
+            if len(cls._memo) > cls.MEMO_SIZE:
+                cls._memo.popitem(last=False)
+
+    @classmethod
+    def decode_stream(cls, endpoint: str, response: requests.Response, array_key: str, item_type: Any,
+                      locate, on_rows=None) -> Any:
+        """
+        边接收边解码大数组
+
+        Args:
+            endpoint: 接口名称（SCHEMAS中的键）
+            response: HttpClient.open_stream 返回的响应
+            array_key: 要增量解码的数组的键名
+            item_type: 数组元素类型
+            locate: 从解码结果中取出该数组的函数
+            on_rows: 每解码一批元素时调用，参数为这批元素
+
+        Returns:
+            Any: 与 decode_response 相同的解码结果
+        """
+        if getattr(response, "from_cache", False):
+            # 304：内容未变化，直接返回之前的解码结果
+            return cls.decode_response(endpoint, response)
+
+        stream = JsonArrayStream(array_key, item_type)
+        items = []
+        with Tracer.span(f"stream {endpoint}", "decode"):
+            for chunk in HttpClient.iter_body(response):
+                rows = stream.feed(chunk)
+                if rows:
+                    items.extend(rows)
+                    if on_rows is not None:
+                        on_rows(rows)
+            result = cls.decode(endpoint, stream.finish())
+
+        # 内容与之前解码过的响应相同时返回之前的结果，界面据此跳过表格重建
+        key = (endpoint, response.content_hash)
+        memo = cls.memo_get(key)
+        if memo is not None:
+            return memo
+
+        if stream.found:
+            try:
+                locate(result).extend(items)
+            except (AttributeError, IndexError, TypeError) as e:
+                raise SchemaError(f"{endpoint} 数据结构变化: 无法定位 {array_key}") from e
+        Metrics.record_cache("decode", False)
+        cls.memo_put(key, result)
+        return result
+
+    @staticmethod
+    def to_builtins(obj: Any) -> Any:
+        """将类型化记录转换为可JSON序列化的内置类型"""
+        return msgspec.to_builtins(obj)
+
+class JsonArrayStream:
+    """
+    增量解析JSON文档中指定键对应的对象数组
+
+    逐块输入响应体，每读完一个数组元素就解码为 item_type 返回；数组以外的部分原样保留为骨架
+    （数组替换为[]），读完后按完整结构解码骨架。缓冲区只保存尚未读完的一个元素，不保留整个响应体，
+    已解码的元素由调用方保存（decode_stream 会保存全部元素并放回结果中）。
+    """
+
+    STRUCTURE = re.compile(rb'["{}\[\]]')
+    STRING_END = re.compile(rb'["\\]')
+    KEY_TAIL = 256  # 未找到键时保留的末尾字节数，防止键被数据块截断
+
+    def __init__(self, key: str, item_type: Any):
+        self.key = key
+        self.key_pattern = re.compile(rb'"' + re.escape(key.encode("utf-8")) + rb'"\s*:\s*\[')
+        self.decoder = msgspec.json.Decoder(item_type, strict=False)
+        self.state = "before"  # before（寻找数组）/ array（数组内）/ after（数组之后）
+        self.found = False
+        self.skeleton = bytearray()
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.item_start: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """输入一块数据，返回其中读完的数组元素"""
+        if self.state == "after":
+            self.skeleton += chunk
+            return []
+
+        self.buffer += chunk
+        if self.state == "before":
+            match = self.key_pattern.search(self.buffer)
+            if match is None:
+                cut = max(len(self.buffer) - self.KEY_TAIL, 0)
+                self.skeleton += self.buffer[:cut]
+                del self.buffer[:cut]
+                return []
+            self.skeleton += self.buffer[:match.end()]
+            del self.buffer[:match.end()]
+            self.state = "array"
+            self.found = True
+        return self.scan()
+
+    def scan(self) -> List[Any]:
+        items = []
+        buffer = self.buffer
+        pos = self.pos
+        if self.escape and pos < len(buffer):
+            pos += 1
+            self.escape = False
+
+        while pos < len(buffer):
+            if self.in_string:
+                match = self.STRING_END.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):  # 转义字符在下一块数据中
+                        self.escape = True
+                        pos = len(buffer)
+                        break
+                    pos = match.end() + 1
+                    continue
+                self.in_string = False
+                pos = match.end()
+                continue
+
+            match = self.STRUCTURE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            token = match.group()
+            pos = match.end()
+            if token == b'"':
+                self.in_string = True
+            elif token in (b"{", b"["):
+                if self.depth == 0:
+                    self.item_start = match.start()
+                self.depth += 1
+            elif self.depth == 0:  # 目标数组结束
+                self.state = "after"
+                self.skeleton += buffer[match.start():]
+                self.buffer = bytearray()
+                self.pos = 0
+                return items
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    items.append(self.decode_item(bytes(buffer[self.item_start:pos])))
+                    self.item_start = None
+
+        # 丢弃已解析的部分，只保留未读完的元素
+        cut = pos if self.item_start is None else self.item_start
+        del buffer[:cut]
+        self.pos = pos - cut
+        if self.item_start is not None:
+            self.item_start -= cut
+        return items
+
+    def decode_item(self, content: bytes) -> Any:
+        try:
+            return self.decoder.decode(content)
+        except msgspec.ValidationError as e:
+            raise SchemaError(f"{self.key} 元素数据结构变化: {e}") from e
+        except msgspec.DecodeError as e:
+            raise SchemaError(f"{self.key} 元素JSON解析错误: {e}") from e
+
+    def finish(self) -> bytes:
+        """返回数组替换为[]后的文档"""
+        if self.state == "array":
+            raise SchemaError(f"{self.key} 数据不完整")
+        return bytes(self.skeleton + self.buffer)
+
+# ---------------------------------------------------------------------------
+# 表格行记录
+# 只保留表格展示用到的字段，不参与GC跟踪，地址字符串统一驻留以便跨行共享
+# ---------------------------------------------------------------------------
+
+def intern_address(address: Optional[str]) -> str:
+    """驻留地址字符串，同一地址在所有行中只保存一份"""
+    return sys.intern(address) if address else ''
+
+class DevHistoryRow(msgspec.Struct, gc=False):
+    """开发者历史发币行"""
+    mint: str
+    symbol: str
+    complete: bool
+    usd_market_cap: float
+    created_timestamp: int
+
+    @classmethod
+    def from_payload(cls, coin: PumpCoin) -> 'DevHistoryRow':
+        return cls(intern_address(coin.mint), coin.symbol, coin.complete,
+                   coin.usd_market_cap, coin.created_timestamp)
+
+    @classmethod
+    def from_payloads(cls, coins: List[PumpCoin]) -> List['DevHistoryRow']:
+        return [cls.from_payload(coin) for coin in coins]
+
+class DevTradeRow(msgspec.Struct, gc=False):
+    """开发者交易行"""
+    op: str
+    from_: str
+    to: str
+    price: float
+    volume: float
+    amount: float
+    time: float
+
+    @classmethod
+    def from_payload(cls, tx: DevTransaction) -> 'DevTradeRow':
+        return cls(sys.intern(tx.op), intern_address(tx.from_), intern_address(tx.to),
+                   tx.price, tx.volume, tx.amount, tx.time)
+
+    @classmethod
+    def from_payloads(cls, transactions: List[DevTransaction]) -> List['DevTradeRow']:
+        return [cls.from_payload(tx) for tx in transactions]
+
+class SmartMoneyRow(msgspec.Struct, gc=False):
+    """聪明钱交易行"""
+    address: str
+    label: str
+    is_buy: bool
+    price_usd: float
+    volume_native: float
+
+    @classmethod
+    def from_event(cls, event: ChainFmEvent, label: str, contract: str) -> 'SmartMoneyRow':
+        order = event.data.order
+        return cls(intern_address(event.address), sys.intern(label),
+                   event.data.output.token == contract, order.price_usd, order.volume_native)
+
+class TweetRow(msgspec.Struct, gc=False):
+    """推文行（展开用户信息，丢弃其余嵌套结构）"""
+    tweet_id: str
+    name: str
+    screen_name: str
+    is_blue_verified: bool
+    views: int
+    favorite_count: int
+    retweet_count: int
+    text: str
+
+    @classmethod
+    def from_payload(cls, tweet: PumpNewsTweet) -> 'TweetRow':
+        user = tweet.user
+        tweet_id = str(tweet.tweet_id) if tweet.tweet_id is not None else ''
+        return cls(tweet_id, user.name, sys.intern(user.screen_name), user.is_blue_verified,
+                   tweet.views, tweet.favorite_count, tweet.retweet_count, tweet.text)
+
+    @classmethod
+    def from_payloads(cls, tweets: List[PumpNewsTweet]) -> List['TweetRow']:
+        return [cls.from_payload(tweet) for tweet in tweets]
+
 class TableStyleDelegate(QStyledItemDelegate):
     """表格样式代理类"""
 
@@ -51,42 +1198,599 @@ class TableStyleDelegate(QStyledItemDelegate):
         # 设置买卖操作的背景色
         model = index.model()
         if hasattr(model, '_data') and index.row() < len(model._data):
-            op = model._data[index.row()].get('op', '')
+            op = getattr(model._data[index.row()], 'op', '')
             if op == 'buy':
                 option.backgroundBrush = QBrush(QColor('#e6ffe6'))  # 浅绿色
             elif op == 'sell':
                 option.backgroundBrush = QBrush(QColor('#ffe6e6'))  # 浅红色
 
+# ---------------------------------------------------------------------------
+# 请求调度
+# ---------------------------------------------------------------------------
+
+class Priority:
+    """请求优先级，数值越小越优先"""
+    INTERACTIVE = 0  # 用户正在查看的代币
+    PREFETCH = 1     # 预取，被查询接管后提升为交互优先级
+    BACKGROUND = 2   # 刷新、扫描、归档等后台任务
+
+    NAMES = {INTERACTIVE: "interactive", PREFETCH: "prefetch", BACKGROUND: "background"}
+
+class PriorityContext:
+    """线程当前执行的任务的优先级，可在任务执行过程中提升"""
+    __slots__ = ("priority",)
+
+    def __init__(self, priority: int):
+        self.priority = priority
+
+class RequestScheduler:
+    """
+    按主机限制并发的优先级请求调度
+
+    - 每个主机有固定的并发数，其中保留给交互请求的并发数低优先级请求不能占用；
+    - 同一主机上排队的请求按优先级、再按先后顺序放行；
+    - 有交互请求排队或进行中时，后台请求暂缓发出。
+
+    已发出的HTTP请求无法安全中断，低优先级任务在发出下一个请求前让出。
+    线程中的请求用 slot 排队，事件循环中的原生异步请求用 slot_async 排队，两者共用同一份名额。
+    """
+
+    DEFAULT_HOST_SLOTS = 4
+    HOST_SLOTS = {"localhost": 3}  # 本地Node.js代理用无头浏览器转发，并发过高会拖慢所有GMGN/chain.fm请求
+    RESERVED_INTERACTIVE = 1
+
+    _cond = threading.Condition()
+    _active: Dict[str, int] = collections.defaultdict(int)
+    _waiting: List[Tuple[str, int, PriorityContext]] = []
+    _interactive = 0  # 排队和进行中的交互请求数
+    _seq = 0
+    _async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+    _context: contextvars.ContextVar = contextvars.ContextVar("priority", default=None)
+
+    @classmethod
+    def current(cls) -> PriorityContext:
+        """当前线程的优先级，未指定时视为交互（主线程中的请求都是用户操作触发的）"""
+        context = cls._context.get()
+        return context if context is not None else PriorityContext(Priority.INTERACTIVE)
+
+    @classmethod
+    @contextlib.contextmanager
+    def use(cls, context: PriorityContext):
+        """在当前线程使用指定优先级"""
+        token = cls._context.set(context)
+        try:
+            yield context
+        finally:
+            cls._context.reset(token)
+
+    @classmethod
+    def priority(cls, priority: int):
+        return cls.use(PriorityContext(priority))
+
+    @classmethod
+    def promote(cls, context: PriorityContext, priority: int = Priority.INTERACTIVE):
+        """提升任务优先级（预取结果被查询接管时）"""
+        with cls._cond:
+            if priority < context.priority:
+                if priority == Priority.INTERACTIVE:
+                    cls._interactive += sum(1 for _, _, c in cls._waiting if c is context)
+                context.priority = priority
+                cls.notify_all()
+
+    @classmethod
+    def host_slots(cls, host: str) -> int:
+        return cls.HOST_SLOTS.get(host, cls.DEFAULT_HOST_SLOTS)
+
+    @classmethod
+    def can_start(cls, host: str, seq: int, context: PriorityContext) -> bool:
+        priority = context.priority
+        if priority == Priority.BACKGROUND and cls._interactive:
+            return False
+        limit = cls.host_slots(host)
+        if priority != Priority.INTERACTIVE:
+            limit -= cls.RESERVED_INTERACTIVE
+        if cls._active[host] >= limit:
+            return False
+        first = min((c.priority, s) for h, s, c in cls._waiting if h == host)
+        return first == (priority, seq)
+
+    @classmethod
+    def notify_all(cls):
+        """唤醒所有等待名额的线程和协程，调用方持有锁"""
+        cls._cond.notify_all()
+        for loop, future in cls._async_waiters:
+            loop.call_soon_threadsafe(cls.wake, future)
+        cls._async_waiters = []
+
+    @staticmethod
+    def wake(future: asyncio.Future):
+        if not future.done():
+            future.set_result(None)
+
+    @classmethod
+    def enqueue(cls, host: str, context: PriorityContext) -> Tuple[str, int, PriorityContext]:
+        """加入排队，调用方持有锁"""
+        cls._seq += 1
+        ticket = (host, cls._seq, context)
+        cls._waiting.append(ticket)
+        if context.priority == Priority.INTERACTIVE:
+            cls._interactive += 1
+        Metrics.scheduler_waiting.inc(priority=Priority.NAMES[context.priority])
+        return ticket
+
+    @staticmethod
+    def repriority(context: PriorityContext, priority: int) -> int:
+        """等待期间被提升时更新排队指标，返回当前优先级"""
+        if context.priority != priority:
+            Metrics.scheduler_waiting.dec(priority=Priority.NAMES[priority])
+            Metrics.scheduler_waiting.inc(priority=Priority.NAMES[context.priority])
+        return context.priority
+
+    @classmethod
+    def admit(cls, ticket: Tuple[str, int, PriorityContext]):
+        """放行排队的请求，调用方持有锁"""
+        host, _, context = ticket
+        cls._waiting.remove(ticket)
+        cls._active[host] += 1
+        Metrics.scheduler_waiting.dec(priority=Priority.NAMES[context.priority])
+        # 放行后可能还有其他请求可以开始（例如不同主机）
+        cls.notify_all()
+
+    @classmethod
+    def withdraw(cls, ticket: Tuple[str, int, PriorityContext]):
+        """取消排队（等待中的协程被取消），调用方持有锁"""
+        _, _, context = ticket
+        cls._waiting.remove(ticket)
+        if context.priority == Priority.INTERACTIVE:
+            cls._interactive -= 1
+        Metrics.scheduler_waiting.dec(priority=Priority.NAMES[context.priority])
+        cls.notify_all()
+
+    @classmethod
+    def release(cls, host: str, priority: int):
+        with cls._cond:
+            cls._active[host] -= 1
+            if priority == Priority.INTERACTIVE:
+                cls._interactive -= 1
+            cls.notify_all()
+
+    @staticmethod
+    def record_wait(host: str, start: float, priority: int):
+        waited = time.perf_counter() - start
+        Metrics.scheduler_wait.observe(waited, priority=Priority.NAMES[priority])
+        if waited > 0.001:
+            Tracer.record(f"slot {host}", "queue", start, start + waited, priority=Priority.NAMES[priority])
+
+    @classmethod
+    @contextlib.contextmanager
+    def slot(cls, host: str):
+        """占用主机的一个并发，按当前线程的优先级排队"""
+        context = cls.current()
+        start = time.perf_counter()
+        with cls._cond:
+            ticket = cls.enqueue(host, context)
+            priority = context.priority
+            while not cls.can_start(host, ticket[1], context):
+                cls._cond.wait()
+                priority = cls.repriority(context, priority)
+            cls.admit(ticket)
+
+        cls.record_wait(host, start, priority)
+        try:
+            yield
+        finally:
+            cls.release(host, priority)
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def slot_async(cls, host: str):
+        """slot 的协程版本，在事件循环中等待名额，不阻塞事件循环线程"""
+        context = cls.current()
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        with cls._cond:
+            ticket = cls.enqueue(host, context)
+            priority = context.priority
+        try:
+            while True:
+                with cls._cond:
+                    priority = cls.repriority(context, priority)
+                    if cls.can_start(host, ticket[1], context):
+                        cls.admit(ticket)
+                        break
+                    future = loop.create_future()
+                    cls._async_waiters.append((loop, future))
+                await future
+        except BaseException:
+            with cls._cond:
+                cls.withdraw(ticket)
+            raise
+
+        cls.record_wait(host, start, priority)
+        try:
+            yield
+        finally:
+            cls.release(host, priority)
+
+    @classmethod
+    def checkpoint(cls):
+        """后台任务的让出点：有交互请求排队或进行中时阻塞，直到交互请求全部完成"""
+        if cls.current().priority != Priority.BACKGROUND:
+            return
+        with cls._cond:
+            while cls._interactive:
+                cls._cond.wait()
+
+# ---------------------------------------------------------------------------
+# 合约地址校验与预取
+# ---------------------------------------------------------------------------
+
+class SolanaAddress:
+    """Solana地址（base58编码的32字节公钥）本地校验"""
+
+    ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+    INDEX = {char: i for i, char in enumerate(ALPHABET)}
+    MIN_LENGTH = 32
+    MAX_LENGTH = 44
+
+    @classmethod
+    def decode(cls, text: str) -> Optional[bytes]:
+        """base58解码，含非法字符时返回None"""
+        value = 0
+        for char in text:
+            digit = cls.INDEX.get(char)
+            if digit is None:
+                return None
+            value = value * 58 + digit
+        leading_zeros = len(text) - len(text.lstrip("1"))
+        return b"\x00" * leading_zeros + value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+    @classmethod
+    def is_valid(cls, text: str) -> bool:
+        if not cls.MIN_LENGTH <= len(text) <= cls.MAX_LENGTH:
+            return False
+        decoded = cls.decode(text)
+        return decoded is not None and len(decoded) == 32
+
+class PrefetchCache:
+    """
+    预取缓存
+
+    输入合法地址后以预取优先级在线程池中提前发起查询，ApiWorker 执行同一调用时直接接管
+    进行中或已完成的结果；每个结果只被接管一次，过期或失败的结果重新实时请求。
+    预取不写入价格序列、告警引擎和导出（track=False），结果被查询接管时才补做。
+    """
+
+    MAX_WORKERS = 2   # 与用户点击触发的查询争用带宽，只用少量线程
+    TTL_SECONDS = 60
+    MAX_ENTRIES = 64
+
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="prefetch")
+    _entries: Dict[Tuple, Tuple[float, concurrent.futures.Future, PriorityContext]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def key(func, args: Tuple, kwargs: Dict[str, Any]) -> Tuple:
+        # on_rows、track 只影响结果的交付方式，预取的结果同样可以接管
+        return (getattr(func, "__qualname__", repr(func)), args,
+                tuple(sorted((k, v) for k, v in kwargs.items() if k not in ("on_rows", "track"))))
+
+    @staticmethod
+    def tracker(func):
+        """预取结果被接管时补做的写入，参数为 (调用参数, 结果)"""
+        return {
+            DevDataFetcher.fetch_dev_history: lambda args, coins: DevDataFetcher.track_history(args[0], coins),
+            DevDataFetcher.fetch_dev_trades: lambda args, data: DevDataFetcher.track_trades(args[0], data),
+            NodeService.fetch_chain_fm_data: lambda args, data: NodeService.index_chain_fm_data(args[0], data),
+            SocialDataFetcher.fetch_tweets: lambda args, tweets: ColumnarExporter.export_tweets(args[0], args[1], tweets),
+        }.get(func)
+
+    @classmethod
+    def submit(cls, func, *args, **kwargs) -> concurrent.futures.Future:
+        """提交预取，同一调用已在缓存中时直接返回"""
+        key = cls.key(func, args, kwargs)
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and now - entry[0] < cls.TTL_SECONDS:
+                return entry[1]
+            context = PriorityContext(Priority.PREFETCH)
+            future = cls._executor.submit(cls.run, context, func, *args, **kwargs)
+            cls._entries[key] = (now, future, context)
+            if len(cls._entries) > cls.MAX_ENTRIES:
+                oldest = min(cls._entries, key=lambda k: cls._entries[k][0])
+                cls._entries.pop(oldest)[1].cancel()
+        return future
+
+    @classmethod
+    def cancel_pending(cls):
+        """取消尚未开始的预取（输入了新的地址）"""
+        with cls._lock:
+            for key in [key for key, (_, future, _) in cls._entries.items() if future.cancel()]:
+                del cls._entries[key]
+
+    @staticmethod
+    def run(context: PriorityContext, func, *args, **kwargs) -> Any:
+        with RequestScheduler.use(context):
+            return func(*args, **kwargs)
+
+    @classmethod
+    def fetch(cls, func, *args, **kwargs) -> Any:
+        """执行调用，优先接管预取结果"""
+        try:
+            key = cls.key(func, args, kwargs)
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        with cls._lock:
+            entry = cls._entries.pop(key, None)
+        future = entry[1] if entry is not None and time.monotonic() - entry[0] < cls.TTL_SECONDS else None
+        if future is not None and not future.cancelled():
+            # 查询在等待这个结果，剩余的请求按当前线程的优先级继续
+            RequestScheduler.promote(entry[2], RequestScheduler.current().priority)
+            with Tracer.span("adopt prefetch", "queue"):
+                remaining = Tracer.remaining()
+                concurrent.futures.wait([future], timeout=max(remaining, 0) if remaining is not None else None)
+            if not future.done():
+                raise QueryDeadlineExceeded("等待预取结果超过查询截止时间")
+            if future.exception() is None:
+                Metrics.record_cache("prefetch", True)
+                result = future.result()
+                tracker = cls.tracker(func)
+                if tracker is not None and kwargs.get("track", True):
+                    tracker(args, result)
+                return result
+        Metrics.record_cache("prefetch", False)
+        return func(*args, **kwargs)
+
+    @classmethod
+    def prefetch_token(cls, contract_address: str, tweet_category: str = "top"):
+        """预取查询代币信息时会用到的全部接口"""
+        cls.cancel_pending()
+        coin = cls.submit(CoinDataFetcher.fetch_coin_data, contract_address)
+        coin.add_done_callback(cls.prefetch_dev_history)
+        cls.submit(DevDataFetcher.fetch_dev_trades, contract_address, track=False)
+        cls.submit(NodeService.fetch_chain_fm_data, contract_address, track=False)
+        cls.submit(SocialDataFetcher.fetch_social_stats, contract_address)
+        cls.submit(SocialDataFetcher.fetch_tweets, contract_address, tweet_category, track=False)
+
+    @classmethod
+    def prefetch_dev_history(cls, coin: concurrent.futures.Future):
+        """代币数据返回后才知道开发者地址"""
+        if coin.cancelled() or coin.exception() is not None:
+            return
+        coin_data = coin.result()
+        if coin_data is not None and coin_data.creator:
+            cls.submit(DevDataFetcher.fetch_dev_history, coin_data.creator, track=False)
+
 class ApiWorker(QThread):
     """API异步工作线程"""
     finished = Signal(object)  # 完成信号
     error = Signal(str)      # 错误信号
+    progress = Signal(object)  # 流式解码的一批数据
 
     def __init__(self, api_call, *args, **kwargs):
         super().__init__()
         self.api_call = api_call
         self.args = args
         self.kwargs = kwargs
+        self.trace = Tracer.current()  # 继承创建者所在查询的追踪
+        self.created = time.perf_counter()
+        self.priority = Priority.INTERACTIVE  # 启动前可改为预取或后台优先级
+        self.streaming = False  # 为True时通过progress信号逐批发送已解码的数据
 
     def run(self):
-        try:
-            result = self.api_call(*self.args, **self.kwargs)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+        Metrics.workers_active.inc()
+        with Tracer.activate(self.trace), RequestScheduler.priority(self.priority):
+            Tracer.record("queue", "queue", self.created, time.perf_counter())
+            try:
+                with Tracer.span(getattr(self.api_call, "__qualname__", str(self.api_call)), "fetch"), \
+                        QueryProfiler.profile_thread():
+                    kwargs = dict(self.kwargs, on_rows=self.progress.emit) if self.streaming else self.kwargs
+                    result = PrefetchCache.fetch(self.api_call, *self.args, **kwargs)
+                self.finished.emit(result)
+            except Exception as e:
+                self.error.emit(str(e))
+            finally:
+                Metrics.workers_active.dec()
 
-class DevHistoryTableModel(QAbstractTableModel):
-    """开发者历史发币表格模型"""
+# ---------------------------------------------------------------------------
+# 分页加载
+# ---------------------------------------------------------------------------
+
+class PagedSource:
+    """
+    表格模型的分页数据源
+
+    next_block 在分页线程池中执行，返回下一块表格行；数据取完后置 exhausted。
+    local 为True的数据源数据已在内存中，由模型在主线程中直接读取
+    """
+
+    DEFAULT_BLOCK_SIZE = 30  # 每块行数，可由 --block-size 指定
+    MAX_WORKERS = 2
+
+    local = False
+
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="paging")
+
+    def __init__(self, block_size: Optional[int] = None):
+        self.block_size = block_size or PagedSource.DEFAULT_BLOCK_SIZE
+        self.exhausted = False
+
+    def next_block(self) -> Optional[List[Any]]:
+        """返回下一块表格行，None表示加载失败"""
+        raise NotImplementedError
 
-    def __init__(self, data: List[Dict[str, Any]], parent=None):
+    def submit(self) -> concurrent.futures.Future:
+        """在分页线程中加载下一块，用户滚动触发的加载按交互优先级调度"""
+        return self._executor.submit(PrefetchCache.run, PriorityContext(Priority.INTERACTIVE), self.next_block)
+
+class ListSource(PagedSource):
+    """已下载到内存中的数据，按块转换为表格行"""
+
+    local = True
+
+    def __init__(self, items: List[Any], convert, block_size: Optional[int] = None):
+        """
+        Args:
+            items: 全部原始数据
+            convert: 把一块原始数据转换为表格行的函数
+            block_size: 每块行数
+        """
+        super().__init__(block_size)
+        self.items = items
+        self.convert = convert
+        self.offset = 0
+        self.exhausted = not items
+
+    def next_block(self) -> List[Any]:
+        block = self.items[self.offset:self.offset + self.block_size]
+        self.offset += len(block)
+        self.exhausted = self.offset >= len(self.items)
+        return self.convert(block)
+
+class DevHistorySource(PagedSource):
+    """pump.fun 开发者历史发币，按 offset/limit 请求后续页"""
+
+    def __init__(self, creator: str, first_page: List[PumpCoin], block_size: Optional[int] = None):
+        super().__init__(block_size)
+        self.creator = creator
+        self.offset = len(first_page)
+        self.exhausted = len(first_page) < self.block_size
+
+    def next_block(self) -> Optional[List[DevHistoryRow]]:
+        coins = DevDataFetcher.fetch_dev_history(self.creator, self.offset, self.block_size)
+        if coins is None:
+            return None
+        self.offset += len(coins)
+        self.exhausted = len(coins) < self.block_size
+        return DevHistoryRow.from_payloads(coins)
+
+class SmartMoneySource(PagedSource):
+    """chain.fm 交易列表，按页请求后续交易并汇总带标签地址的记录"""
+
+    def __init__(self, contract: str, first_page: ChainFmTransactionList, block_size: Optional[int] = None):
+        super().__init__(block_size)
+        self.contract = contract
+        self.page = 2
+        self.exhausted = len(first_page.parsedTransactions) < self.block_size
+
+    def next_block(self) -> Optional[List[SmartMoneyRow]]:
+        # 一页中可能没有带标签的地址，继续请求直到有可显示的行或没有更多数据
+        while True:
+            data = NodeService.fetch_chain_fm_data(self.contract, page=self.page, page_size=self.block_size)
+            if data is None:
+                return None
+            self.page += 1
+            self.exhausted = len(data.parsedTransactions) < self.block_size
+            rows, _ = SmartMoneyAnalyzer.aggregate(data.parsedTransactions, data.address_labels, self.contract)
+            if rows or self.exhausted:
+                return rows
+
+class PagedTableModel(QAbstractTableModel):
+    """
+    支持按块加载的表格模型基类
+
+    指定数据源时，视图滚动到末尾会调用 fetchMore 加载下一块；
+    从上游加载期间在末尾显示一行占位，加载失败后不再继续加载
+    """
+
+    PLACEHOLDER_TEXT = "加载中..."
+
+    block_loaded = Signal(object)  # 分页线程加载完成的一块表格行（None表示失败）
+    load_failed = Signal(str)
+
+    def __init__(self, source: Optional[PagedSource] = None, parent=None):
         super().__init__(parent)
+        self.source = source
+        self.loading = False
+        self.block_loaded.connect(self.on_block_loaded)
+
+    def loaded_rows(self) -> List[Any]:
+        """已加载的表格行"""
+        raise NotImplementedError
+
+    def append_rows(self, rows: List[Any]):
+        """在末尾追加表格行"""
+        if not rows:
+            return
+        data = self.loaded_rows()
+        self.beginInsertRows(QModelIndex(), len(data), len(data) + len(rows) - 1)
+        data.extend(rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.loaded_rows()) + (1 if self.loading else 0)
+
+    def is_placeholder(self, index: QModelIndex) -> bool:
+        return self.loading and index.row() == len(self.loaded_rows())
+
+    def placeholder_data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.column() == 0:
+            return self.PLACEHOLDER_TEXT
+        elif role == Qt.ForegroundRole:
+            return QColor("#999999")
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return (not parent.isValid() and self.source is not None
+                and not self.source.exhausted and not self.loading)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        if self.source.local:
+            self.append_rows(self.source.next_block())
+            return
+
+        row = len(self.loaded_rows())
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.loading = True
+        self.endInsertRows()
+        future = self.source.submit()
+        # 模型已被替换时信号发送失败，结果直接丢弃
+        future.add_done_callback(
+            lambda f: self.block_loaded.emit(f.result() if f.exception() is None else None))
+
+    def fetch_all_local(self):
+        """排序前读取本地数据源的全部数据，保证排序覆盖所有行"""
+        while self.source is not None and self.source.local and not self.source.exhausted:
+            self.append_rows(self.source.next_block())
+
+    def on_block_loaded(self, rows: Optional[List[Any]]):
+        if self.loading:
+            row = len(self.loaded_rows())
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.loading = False
+            self.endRemoveRows()
+
+        if rows is None:
+            self.source.exhausted = True  # 不再重试，避免滚动时反复请求失败的页
+            self.load_failed.emit("加载下一页失败")
+            return
+        self.append_rows(rows)
+
+class DevHistoryTableModel(PagedTableModel):
+    """开发者历史发币表格模型"""
+
+    def __init__(self, data: List[DevHistoryRow], source: Optional[PagedSource] = None, parent=None):
+        super().__init__(source, parent)
         self._data = data
         self._headers = ["发币", "成功", "市值", "时间"]
         self._sort_column = 0  # 默认排序列
         self._sort_order = Qt.AscendingOrder  # 默认升序
+        self._sorted = False  # 排序过后，后续页按当前排序并入
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+    def loaded_rows(self) -> List[DevHistoryRow]:
+        return self._data
+
+    def append_rows(self, rows: List[DevHistoryRow]):
+        super().append_rows(rows)
+        if rows and self._sorted:
+            self.sort(self._sort_column, self._sort_order)
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self._headers)
@@ -94,21 +1798,21 @@ class DevHistoryTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
+        if self.is_placeholder(index):
+            return self.placeholder_data(index, role)
 
         if role == Qt.DisplayRole:
             row_data = self._data[index.row()]
             col = index.column()
 
             if col == 0:
-                return row_data.get('symbol', '')
+                return row_data.symbol
             elif col == 1:
-                return "是" if row_data.get('complete', False) else "否"
+                return "是" if row_data.complete else "否"
             elif col == 2:
-                market_cap = row_data.get('usd_market_cap', 0)
-                return self.format_market_cap(market_cap)
+                return self.format_market_cap(row_data.usd_market_cap)
             elif col == 3:
-                timestamp = row_data.get('created_timestamp', 0)
-                return TimeUtil.get_time_diff(timestamp)
+                return TimeUtil.get_time_diff(row_data.created_timestamp)
 
         return None
 
@@ -119,19 +1823,21 @@ class DevHistoryTableModel(QAbstractTableModel):
 
     def sort(self, column: int, order: Qt.SortOrder):
         """实现排序"""
+        self.fetch_all_local()
         self.layoutAboutToBeChanged.emit()
 
         if column == 0:  # 发币
-            self._data.sort(key=lambda x: x.get('symbol', ''), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.symbol, reverse=(order == Qt.DescendingOrder))
         elif column == 1:  # 成功
-            self._data.sort(key=lambda x: x.get('complete', False), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.complete, reverse=(order == Qt.DescendingOrder))
         elif column == 2:  # 市值
-            self._data.sort(key=lambda x: x.get('usd_market_cap', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: (x.usd_market_cap, x.created_timestamp), reverse=(order == Qt.DescendingOrder))
         elif column == 3:  # 时间
-            self._data.sort(key=lambda x: x.get('created_timestamp', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.created_timestamp, reverse=(order == Qt.DescendingOrder))
 
         self._sort_column = column
         self._sort_order = order
+        self._sorted = True
         self.layoutChanged.emit()
 
     @staticmethod
@@ -143,19 +1849,19 @@ class DevHistoryTableModel(QAbstractTableModel):
             return f"{value/1000:.1f}K"
         return f"{value:.1f}"
 
-class DevTradeTableModel(QAbstractTableModel):
+class DevTradeTableModel(PagedTableModel):
     """开发者交易记录表格模型"""
 
-    def __init__(self, data: List[Dict[str, Any]], creator: str, parent=None):
-        super().__init__(parent)
+    def __init__(self, data: List[DevTradeRow], creator: str, source: Optional[PagedSource] = None, parent=None):
+        super().__init__(source, parent)
         self._data = data
         self._headers = ["操作", "From", "To", "价格", "金额", "数量", "时间"]
         self.creator = creator
         self._sort_column = 0
         self._sort_order = Qt.AscendingOrder
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._data)
+    def loaded_rows(self) -> List[DevTradeRow]:
+        return self._data
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self._headers)
@@ -163,6 +1869,8 @@ class DevTradeTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
+        if self.is_placeholder(index):
+            return self.placeholder_data(index, role)
 
         if role == Qt.DisplayRole:
             row_data = self._data[index.row()]
@@ -175,25 +1883,24 @@ class DevTradeTableModel(QAbstractTableModel):
                     "trans_in": "转入",
                     "trans_out": "转出"
                 }
-                return op_map.get(row_data.get('op', ''), '')
+                return op_map.get(row_data.op, '')
             elif col == 1:
-                address = row_data.get('from', '')
+                address = row_data.from_
                 return "Dev" if address == self.creator else self.format_address(address)
             elif col == 2:
-                address = row_data.get('to', '')
+                address = row_data.to
                 return "Dev" if address == self.creator else self.format_address(address)
             elif col == 3:
-                price = row_data.get('price', 0)
+                price = row_data.price
                 return f"${price:.6f}" if price else ''
             elif col == 4:
-                volume = row_data.get('volume', 0)
+                volume = row_data.volume
                 return locale.format_string("%d", int(volume), grouping=True) if volume else ''
             elif col == 5:
-                amount = row_data.get('amount', 0)
+                amount = row_data.amount
                 return locale.format_string("%d", int(amount), grouping=True) if amount else ''
             elif col == 6:
-                timestamp = row_data.get('time', 0)
-                return TimeUtil.get_time_diff(timestamp * 1000)  # 转换为毫秒
+                return TimeUtil.get_time_diff(row_data.time * 1000)  # 转换为毫秒
 
         return None
 
@@ -204,22 +1911,23 @@ class DevTradeTableModel(QAbstractTableModel):
 
     def sort(self, column: int, order: Qt.SortOrder):
         """实现排序"""
+        self.fetch_all_local()
         self.layoutAboutToBeChanged.emit()
 
         if column == 0:  # 操作
-            self._data.sort(key=lambda x: x.get('op', ''), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.op, reverse=(order == Qt.DescendingOrder))
         elif column == 1:  # From
-            self._data.sort(key=lambda x: x.get('from', ''), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.from_, reverse=(order == Qt.DescendingOrder))
         elif column == 2:  # To
-            self._data.sort(key=lambda x: x.get('to', ''), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.to, reverse=(order == Qt.DescendingOrder))
         elif column == 3:  # 价格
-            self._data.sort(key=lambda x: x.get('price', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.price, reverse=(order == Qt.DescendingOrder))
         elif column == 4:  # 金额
-            self._data.sort(key=lambda x: x.get('volume', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.volume, reverse=(order == Qt.DescendingOrder))
         elif column == 5:  # 数量
-            self._data.sort(key=lambda x: x.get('amount', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.amount, reverse=(order == Qt.DescendingOrder))
         elif column == 6:  # 时间
-            self._data.sort(key=lambda x: x.get('time', 0), reverse=(order == Qt.DescendingOrder))
+            self._data.sort(key=lambda x: x.time, reverse=(order == Qt.DescendingOrder))
 
         self._sort_column = column
         self._sort_order = order
@@ -232,164 +1940,950 @@ class DevTradeTableModel(QAbstractTableModel):
             return address
         return f"{address[:3]}...{address[-3:]}"
 
-class DevDataFetcher:
-    """开发者数据获取类"""
+class CassetteMiss(requests.ConnectionError):
+    """回放模式下没有匹配的录制记录"""
 
-    @staticmethod
-    def fetch_dev_history(creator: str) -> Optional[List[Dict[str, Any]]]:
-        """获取开发者历史发币记录"""
-        url = f"https://frontend-api-v3.pump.fun/coins/user-created-coins/{creator}"
-        params = {
-            "offset": 0,
-            "limit": 10,
-            "includeNsfw": False
-        }
+class CassetteAdapter(HTTPAdapter):
+    """
+    录制/回放传输适配器
 
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"获取开发者历史记录失败: {e}")
-            return None
+    录制模式下请求照常发出，同时把请求/响应对（含耗时）写入录制文件；
+    回放模式下完全不访问网络，按录制的耗时（可缩放）返回响应，并可注入故障。
+    """
+
+    # 回放时响应体已解压，这些头部不再适用
+    DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+    FAILURE_MODES = ("error", "timeout", "status")
+
+    def __init__(self, path: str, mode: str = "replay", latency_scale: float = 1.0,
+                 failure_rate: float = 0.0, failure_mode: str = "error",
+                 failure_hosts: Optional[List[str]] = None, seed: Optional[int] = None):
+        """
+        Args:
+            path: 录制文件路径
+            mode: record（录制）或 replay（回放）
+            latency_scale: 回放耗时相对录制耗时的倍数，0表示不等待
+            failure_rate: 回放时注入故障的概率
+            failure_mode: 故障类型，error（连接错误）、timeout（超时）或 status（返回503）
+            failure_hosts: 只对这些主机注入故障，为空时对所有主机生效
+            seed: 故障注入随机种子，便于复现
+        """
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"未知的录制模式: {mode}")
+        if failure_mode not in self.FAILURE_MODES:
+            raise ValueError(f"未知的故障类型: {failure_mode}")
+
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.failure_rate = failure_rate
+        self.failure_mode = failure_mode
+        self.failure_hosts = set(failure_hosts or [])
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._interactions: List[Dict[str, Any]] = []
+        self._replay_queues: Dict[str, List[Dict[str, Any]]] = {}
+
+        if mode == "replay":
+            self.load()
 
     @staticmethod
-    def fetch_dev_trades(contract: str) -> Optional[Dict[str, Any]]:
-        """获取开发者交易记录"""
-        url = f"https://debot.ai/api/dashboard/token/dev/info"
-        params = {
-            "chain": "solana",
-            "token": contract
+    def request_key(method: str, url: str, body: Union[bytes, str, None]) -> str:
+        """请求匹配键：方法 + 完整URL + 请求体摘要"""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha1(body or b"").hexdigest()[:16]
+        return f"{method} {url} {digest}"
+
+    def load(self):
+        """读取录制文件"""
+        with open(self.path, "r", encoding="utf-8") as f:
+            self._interactions = json.load(f).get("interactions", [])
+
+        self._replay_queues = {}
+        for interaction in self._interactions:
+            self._replay_queues.setdefault(interaction["key"], []).append(interaction)
+
+    def save(self):
+        """写入录制文件"""
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "interactions": self._interactions}, f, ensure_ascii=False, indent=1)
+
+    def send(self, request, **kwargs):
+        if self.mode == "record":
+            return self.record(request, **kwargs)
+        return self.replay(request, **kwargs)
+
+    def record(self, request, **kwargs):
+        """发出真实请求并保存请求/响应对"""
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        content = response.content
+        elapsed = time.perf_counter() - start
+
+        interaction = {
+            "key": self.request_key(request.method, request.url, request.body),
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "body": request.body.decode("utf-8", "replace") if isinstance(request.body, bytes) else request.body,
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {k: v for k, v in response.headers.items() if k.lower() not in self.DROPPED_HEADERS},
+                "body_b64": base64.b64encode(content).decode("ascii"),
+            },
+            "elapsed": elapsed,
         }
 
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json().get('data', {})
-        except Exception as e:
-            print(f"获取开发者交易记录失败: {e}")
-            return None
+        with self._lock:
+            self._interactions.append(interaction)
+            self.save()
+
+        return response
+
+    def replay(self, request, **kwargs):
+        """从录制文件返回响应"""
+        key = self.request_key(request.method, request.url, request.body)
+
+        with self._lock:
+            queue = self._replay_queues.get(key)
+            Metrics.record_cache("cassette", bool(queue))
+            if not queue:
+                raise CassetteMiss(f"录制文件中没有匹配的请求: {request.method} {request.url}", request=request)
+            # 同一请求按录制顺序依次返回，最后一条重复使用
+            interaction = queue.pop(0) if len(queue) > 1 else queue[0]
+            inject_failure = self.should_inject_failure(request.url)
+
+        if self.latency_scale > 0:
+            time.sleep(interaction.get("elapsed", 0) * self.latency_scale)
+
+        if inject_failure:
+            if self.failure_mode == "error":
+                raise requests.ConnectionError(f"注入故障: {request.url}", request=request)
+            if self.failure_mode == "timeout":
+                raise requests.ReadTimeout(f"注入超时: {request.url}", request=request)
+            return self.build_replay_response(request, 503, "Service Unavailable", {}, b"")
+
+        recorded = interaction["response"]
+        return self.build_replay_response(request, recorded["status"], recorded.get("reason", ""),
+                                   recorded["headers"], base64.b64decode(recorded["body_b64"]))
+
+    def should_inject_failure(self, url: str) -> bool:
+        if self.failure_rate <= 0:
+            return False
+        if self.failure_hosts and urllib.parse.urlsplit(url).hostname not in self.failure_hosts:
+            return False
+        return self._random.random() < self.failure_rate
+
+    def build_replay_response(self, request, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+class HttpCacheEntry(msgspec.Struct, gc=False):
+    """带校验器的GET响应"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    content: bytes
+    content_hash: str
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class HttpCache:
+    """
+    条件请求缓存
+
+    保存带ETag/Last-Modified的GET响应，再次请求时发送条件请求，304时用缓存内容构造响应。
+    服务器不支持校验器时不保存响应体，只为响应计算内容哈希，PayloadDecoder 据此跳过重复解码。
+    """
+
+    MAX_BYTES = 32 * 2**20
 
-    @staticmethod
-    def format_dev_info(creator: str, original_text: str = "") -> str:
-        """格式化开发者信息"""
-        dev_info = f"""<span style='color: #000; font-weight: bold;'>DEV信息：</span>
-                  <a href='https://gmgn.ai/sol/address/{creator}' style='color: #3498db; text-decoration: none;'>{creator}</a>
-                  <span style='cursor: pointer; font-size: 0.5em;' 
-                  onclick='window.copyDevAddress("{creator}")'>📋</span>"""
-        return f"""
-        <html>
-        <head>
-        <style>
-            a:hover {{ text-decoration: underline; }}
-        </style>
-        <script>
-            function copyDevAddress(address) {{
-                navigator.clipboard.writeText(address);
-                window.logCopied(address);
-            }}
-        </script>
-        </head>
-        <body>
-            {dev_info}
-        </body>
-        </html>
-        """
-
-    @staticmethod
-    def format_dev_history(history_data: List[Dict[str, Any]]) -> str:
-        """格式化开发者历史信息"""
-        if not history_data:
-            return "未找到开发者历史信息"
+    def __init__(self):
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
 
-        total_coins = len(history_data)
-        success_coins = sum(1 for coin in history_data if coin.get('complete', False))
-        max_market_cap = max((coin.get('usd_market_cap', 0) for coin in history_data), default=0)
+    @staticmethod
+    def key(url: str, params: Any = None) -> str:
+        """缓存键：带查询参数的完整URL"""
+        return requests.Request("GET", url, params=params).prepare().url
 
-        total_display = f"{total_coins}+" if total_coins >= 10 else str(total_coins)
-        success_display = f"{success_coins}+" if success_coins >= 10 else str(success_coins)
-        market_cap_display = DevHistoryTableModel.format_market_cap(max_market_cap)
+    @staticmethod
+    def hasher():
+        """增量计算内容哈希，结果与 digest 一致"""
+        return hashlib.blake2b(digest_size=16)
 
-        return f"发币：{total_display}次，成功：{success_display}次，最高市值：{market_cap_display}"
+    @staticmethod
+    def digest(content: bytes) -> str:
+        hasher = HttpCache.hasher()
+        hasher.update(content)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[HttpCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: str, response: requests.Response):
+        """保存带校验器的响应，超过容量时淘汰最久未使用的条目"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = HttpCacheEntry(etag, last_modified, dict(response.headers), response.content, response.content_hash)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._size > self.MAX_BYTES and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
 
     @staticmethod
-    def format_dev_trade_status(trade_data: Dict[str, Any]) -> str:
-        """格式化开发者交易状态"""
-        status = []
+    def build_response(entry: HttpCacheEntry, not_modified: requests.Response) -> requests.Response:
+        """用缓存内容和304响应的头部构造200响应"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.headers.update(not_modified.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry.content
+        response._content_consumed = True
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        response.content_hash = entry.content_hash
+        return response
+
+class QueryDeadlineExceeded(requests.Timeout):
+    """查询超过整体截止时间"""
+
+class HttpClient:
+    """HTTP请求类，所有上游请求（含本地Node.js代理）共用同一个会话"""
+
+    session = requests.Session()
+    cache = HttpCache()
+
+    # 每个数据源的超时预算：(连接超时, 读取超时) 秒，读取超时为两次收到数据之间的最长间隔
+    TIMEOUTS = {
+        "frontend-api-v3.pump.fun": (3.05, 10),
+        "debot.ai": (3.05, 10),
+        "www.pump.news": (3.05, 10),
+        "localhost": (3.05, 30),  # 本地Node.js代理用无头浏览器转发，首次加载较慢
+    }
+    DEFAULT_TIMEOUT = (3.05, 15)
+
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # 对冲请求：幂等GET在该主机的P95耗时后仍未返回时再发一次，取先返回的结果
+    hedging = False
+    HEDGE_HOSTS = {"frontend-api-v3.pump.fun", "debot.ai", "www.pump.news"}
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_DEFAULT_DELAY = 1.0
+    _hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+    @classmethod
+    def get(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request("GET", url, **kwargs)
+
+    @classmethod
+    def post(cls, url: str, **kwargs) -> requests.Response:
+        return cls.request("POST", url, **kwargs)
+
+    @classmethod
+    def request(cls, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送请求，超时取数据源预算和查询剩余时间中较小的一个
 
-        if trade_data.get('position_clear'):
-            status.append("<span style='color: #e74c3c;'>清仓</span>")
-        if trade_data.get('position_increase'):
-            status.append("加仓")
-        if trade_data.get('position_decrease'):
-            status.append("减仓")
-        if trade_data.get('trans_out_amount', 0) > 0:
-            status.append("转出")
+        Raises:
+            QueryDeadlineExceeded: 查询已超过整体截止时间
+        """
+        host = urllib.parse.urlsplit(url).hostname or ""
+        cls.apply_timeout(url, host, kwargs)
+        if method == "GET" and not kwargs.get("stream"):
+            return cls.conditional_get(url, host, **kwargs)
+        return cls.dispatch(method, url, host, **kwargs)
+
+    @classmethod
+    def apply_timeout(cls, url: str, host: str, kwargs: Dict[str, Any]):
+        """未指定超时时使用数据源预算，并截断到查询剩余时间"""
+        if "timeout" in kwargs:
+            return
+        connect_timeout, read_timeout = cls.TIMEOUTS.get(host, cls.DEFAULT_TIMEOUT)
+        remaining = Tracer.remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                raise QueryDeadlineExceeded(f"查询超过截止时间: {url}")
+            connect_timeout, read_timeout = min(connect_timeout, remaining), min(read_timeout, remaining)
+        kwargs["timeout"] = (connect_timeout, read_timeout)
+
+    @classmethod
+    def open_stream(cls, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送请求但不读取响应体，调用方用 iter_body 逐块读取
 
-        return "，".join(status) if status else "无操作"
+        GET请求同样发送条件请求，304时返回由缓存内容构造的完整响应（带 from_cache 属性）
 
-class CoinDataFetcher:
-    """代币数据获取类"""
+        Raises:
+            requests.HTTPError: 响应状态码表示错误
+        """
+        host = urllib.parse.urlsplit(url).hostname or ""
+        cls.apply_timeout(url, host, kwargs)
+        kwargs["stream"] = True
+        key = entry = None
+        if method == "GET":
+            key = HttpCache.key(url, kwargs.get("params"))
+            entry = cls.cache.get(key)
+            if entry is not None:
+                kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+
+        response = cls.dispatch(method, url, host, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            Metrics.record_cache("http", True)
+            response.close()
+            return HttpCache.build_response(entry, response)
+        if key is not None:
+            Metrics.record_cache("http", False)
+            response.cache_key = key
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response
+
+    @classmethod
+    def iter_body(cls, response: requests.Response) -> Iterator[bytes]:
+        """
+        逐块读取响应体，读完后为响应设置 content_hash；带校验器的GET响应读完后写入条件请求缓存
+        """
+        key = getattr(response, "cache_key", None)
+        cacheable = key is not None and ("ETag" in response.headers or "Last-Modified" in response.headers)
+        chunks = [] if cacheable else None
+        hasher = HttpCache.hasher()
+        try:
+            for chunk in response.iter_content(cls.STREAM_CHUNK_SIZE):
+                hasher.update(chunk)
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+        finally:
+            response.close()
+        response.content_hash = hasher.hexdigest()
+        if chunks is not None:
+            response._content = b"".join(chunks)
+            cls.cache.store(key, response)
+
+    @classmethod
+    def conditional_get(cls, url: str, host: str, **kwargs) -> requests.Response:
+        """
+        有缓存的校验器时发送条件GET，304视为缓存命中
 
-    BASE_URL = "https://frontend-api-v3.pump.fun/coins/search"
+        返回的200响应带有 content_hash 属性，来自缓存时还带有 from_cache 属性
+        """
+        key = HttpCache.key(url, kwargs.get("params"))
+        entry = cls.cache.get(key)
+        if entry is not None:
+            kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+
+        response = cls.dispatch("GET", url, host, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            Metrics.record_cache("http", True)
+            return HttpCache.build_response(entry, response)
+
+        Metrics.record_cache("http", False)
+        if response.status_code == 200:
+            response.content_hash = HttpCache.digest(response.content)
+            cls.cache.store(key, response)
+        return response
+
+    @classmethod
+    def dispatch(cls, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        if cls.hedging and method == "GET" and host in cls.HEDGE_HOSTS:
+            return cls.hedged_request(method, url, host, **kwargs)
+        return cls.send(method, url, host, **kwargs)
+
+    @classmethod
+    def hedge_delay(cls, host: str) -> float:
+        """对冲请求的发出时机：该主机观测到的P95耗时，样本不足时使用默认值"""
+        counts, _, count = Metrics.http_duration.get(host=host)
+        if count < cls.HEDGE_MIN_SAMPLES:
+            return cls.HEDGE_DEFAULT_DELAY
+        return Metrics.http_duration.quantile(0.95, counts, count)
+
+    @classmethod
+    def hedged_request(cls, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        """发送对冲请求，两次请求都失败时抛出首次请求的异常"""
+        trace, context = Tracer.current(), RequestScheduler.current()
+
+        def attempt(name: str) -> requests.Response:
+            with Tracer.activate(trace), RequestScheduler.use(context), Tracer.span(name, "http"):
+                return cls.send(method, url, host, **kwargs)
+
+        primary = cls._hedge_executor.submit(attempt, "primary")
+        done, _ = concurrent.futures.wait([primary], timeout=cls.hedge_delay(host))
+        if done:
+            return primary.result()
+
+        hedge = cls._hedge_executor.submit(attempt, "hedge")
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    Metrics.hedged_requests.inc(host=host, winner="primary" if future is primary else "hedge")
+                    for loser in pending:
+                        loser.add_done_callback(lambda f: f.exception() is None and f.result().close())
+                    return future.result()
+        return primary.result()
+
+    @classmethod
+    def send(cls, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        """
+        发送单个请求并记录按主机统计的请求数、状态码和耗时
 
-    @staticmethod
-    def fetch_coin_data(contract_address: str) -> Optional[Dict[str, Any]]:
+        请求先按当前线程的优先级在 RequestScheduler 中排队等待主机的并发名额
         """
-        获取代币数据
+        with RequestScheduler.slot(host):
+            status = "error"
+            start = time.perf_counter()
+            Metrics.http_inflight.inc(host=host)
+            try:
+                if Tracer.current() is None:
+                    response = cls.session.request(method, url, **kwargs)
+                else:
+                    response = cls.traced_request(method, url, host, **kwargs)
+                status = response.status_code
+                return response
+            finally:
+                Metrics.http_inflight.dec(host=host)
+                Metrics.http_requests.inc(host=host, method=method, status=status)
+                Metrics.http_duration.observe(time.perf_counter() - start, host=host)
+
+    @classmethod
+    def traced_request(cls, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        """发送请求并分别记录首字节和下载耗时"""
+        stream = kwargs.pop("stream", False)
+        start = time.perf_counter()
+        with Tracer.span("ttfb", "http"):
+            response = cls.session.request(method, url, stream=True, **kwargs)
+        if not stream:
+            with Tracer.span("download", "http"):
+                response.content
+        Tracer.record(f"{method} {host}", "http", start, time.perf_counter(),
+                      url=url, status=response.status_code)
+        return response
+
+    @classmethod
+    def use_cassette(cls, adapter: CassetteAdapter):
+        """在会话上挂载录制/回放适配器"""
+        cls.session.mount("http://", adapter)
+        cls.session.mount("https://", adapter)
+        AsyncHttpClient.native = False  # 异步请求同样经过适配器
+
+# ---------------------------------------------------------------------------
+# 异步请求引擎
+# 所有异步请求共用一个运行在独立线程中的asyncio事件循环，结果通过Qt信号回到主线程
+# ---------------------------------------------------------------------------
+
+class AsyncFetchEngine:
+    """
+    共享的asyncio事件循环
+
+    GMGN、Node.js代理、批量开发者分析的异步请求以及无头浏览器都在这个事件循环中执行；
+    Qt主线程通过 AsyncTask 接收结果，脚本通过 run 同步等待结果。
+    界面中其余数据源需要边接收边解码和接管预取结果，仍由 ApiWorker 在线程中获取
+    """
+
+    BLOCKING_WORKERS = 8  # 没有原生异步传输时执行阻塞请求的线程数
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock = threading.Lock()
+    _blocking_executor = concurrent.futures.ThreadPoolExecutor(max_workers=BLOCKING_WORKERS,
+                                                               thread_name_prefix="asyncio-io")
+
+    @classmethod
+    def loop(cls) -> asyncio.AbstractEventLoop:
+        """返回共享事件循环，第一次调用时启动事件循环线程"""
+        with cls._lock:
+            if cls._loop is None:
+                # pyppeteer 在Windows上需要Selector事件循环
+                loop = asyncio.SelectorEventLoop() if sys.platform == "win32" else asyncio.new_event_loop()
+                threading.Thread(target=cls.run_forever, args=(loop,), name="asyncio", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
 
-        Args:
-            contract_address: 代币合约地址
+    @staticmethod
+    def run_forever(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
-        Returns:
-            Optional[Dict]: 代币数据字典或None（如果获取失败）
+    @classmethod
+    def in_loop(cls) -> bool:
+        try:
+            return asyncio.get_running_loop() is cls._loop
+        except RuntimeError:
+            return False
+
+    @classmethod
+    def submit(cls, coro) -> concurrent.futures.Future:
+        """在共享事件循环中执行协程，协程继承调用线程当前的追踪和优先级"""
+        return asyncio.run_coroutine_threadsafe(coro, cls.loop())
+
+    @classmethod
+    def run(cls, coro, timeout: Optional[float] = None) -> Any:
         """
-        params = {
-            "offset": 0,
-            "limit": 50,
-            "sort": "market_cap",
-            "includeNsfw": False,
-            "order": "DESC",
-            "searchTerm": contract_address,
-            "type": "exact"
+        同步执行协程并返回结果，供脚本和同步代码调用
+
+        Raises:
+            RuntimeError: 在事件循环线程中调用（会造成死锁）
+        """
+        if cls.in_loop():
+            coro.close()
+            raise RuntimeError("不能在事件循环线程中同步等待协程")
+        return cls.submit(coro).result(timeout)
+
+    @staticmethod
+    async def gather(*aws, return_exceptions: bool = False) -> List[Any]:
+        """在事件循环中并发执行多个协程，可与 run 组合使用"""
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
+
+    @classmethod
+    async def to_thread(cls, func, *args, **kwargs) -> Any:
+        """在阻塞请求线程中执行函数，保留当前的追踪和优先级"""
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(cls._blocking_executor, call)
+
+class AsyncHttpClient:
+    """
+    异步HTTP请求类
+
+    安装了httpx时在共享事件循环中直接收发，大量并发请求不占用额外线程；
+    未安装httpx或挂载了录制/回放适配器时，改为在少量线程中调用 HttpClient。
+    两种方式都返回 requests.Response，超时、条件请求缓存和指标与 HttpClient 一致；
+    原生异步请求同样经 RequestScheduler 按优先级排队，与线程中的请求共用每个主机的并发名额
+    """
+
+    native = True
+    MAX_CONNECTIONS = 200
+
+    _client = None
+
+    @classmethod
+    def client(cls):
+        """返回共享的 httpx.AsyncClient，没有原生异步传输时返回None"""
+        if cls._client is None and cls.native:
+            try:
+                import httpx
+            except ImportError:
+                cls.native = False
+                return None
+            cls._client = httpx.AsyncClient(
+                headers=dict(HttpClient.session.headers),
+                limits=httpx.Limits(max_connections=cls.MAX_CONNECTIONS),
+                follow_redirects=True,
+            )
+        return cls._client
+
+    @classmethod
+    async def get(cls, url: str, **kwargs) -> requests.Response:
+        return await cls.request("GET", url, **kwargs)
+
+    @classmethod
+    async def post(cls, url: str, **kwargs) -> requests.Response:
+        return await cls.request("POST", url, **kwargs)
+
+    @classmethod
+    async def request(cls, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        发送请求，参数与 HttpClient.request 相同
+
+        Raises:
+            QueryDeadlineExceeded: 查询已超过整体截止时间
+        """
+        client = cls.client() if cls.native else None
+        if client is None:
+            return await AsyncFetchEngine.to_thread(HttpClient.request, method, url, **kwargs)
+
+        host = urllib.parse.urlsplit(url).hostname or ""
+        HttpClient.apply_timeout(url, host, kwargs)
+        key = entry = None
+        if method == "GET":
+            key = HttpCache.key(url, kwargs.get("params"))
+            entry = HttpClient.cache.get(key)
+            if entry is not None:
+                kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+
+        response = await cls.send(client, method, url, host, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            Metrics.record_cache("http", True)
+            return HttpCache.build_response(entry, response)
+        if key is not None:
+            Metrics.record_cache("http", False)
+            if response.status_code == 200:
+                response.content_hash = HttpCache.digest(response.content)
+                HttpClient.cache.store(key, response)
+        return response
+
+    @classmethod
+    async def send(cls, client, method: str, url: str, host: str, timeout: Tuple[float, float],
+                   **kwargs) -> requests.Response:
+        """发送单个请求，记录与 HttpClient.send 相同的指标，网络错误转换为 requests 的异常"""
+        import httpx
+
+        connect_timeout, read_timeout = timeout
+        async with RequestScheduler.slot_async(host):
+            status = "error"
+            start = time.perf_counter()
+            Metrics.http_inflight.inc(host=host)
+            try:
+                upstream = await client.request(
+                    method, url, timeout=httpx.Timeout(read_timeout, connect=connect_timeout), **kwargs)
+                status = upstream.status_code
+            except httpx.TimeoutException as e:
+                raise requests.Timeout(f"{method} {url}: {e}") from e
+            except httpx.HTTPError as e:
+                raise requests.ConnectionError(f"{method} {url}: {e}") from e
+            finally:
+                end = time.perf_counter()
+                Metrics.http_inflight.dec(host=host)
+                Metrics.http_requests.inc(host=host, method=method, status=status)
+                Metrics.http_duration.observe(end - start, host=host)
+        Tracer.record(f"{method} {host}", "http", start, end, url=url, status=status)
+        return cls.to_requests_response(upstream)
+
+    @staticmethod
+    def to_requests_response(upstream) -> requests.Response:
+        response = requests.Response()
+        response.status_code = upstream.status_code
+        response.reason = upstream.reason_phrase
+        response.headers = CaseInsensitiveDict(upstream.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = upstream.content
+        response._content_consumed = True
+        response.url = str(upstream.url)
+        response.elapsed = upstream.elapsed
+        return response
+
+class AsyncTask(QObject):
+    """在共享事件循环中执行协程，通过信号在主线程中返回结果，用法与 ApiWorker 相同"""
+    finished = Signal(object)  # 完成信号
+    error = Signal(str)      # 错误信号
+
+    def __init__(self, coro_func, *args, **kwargs):
+        super().__init__()
+        self.coro_func = coro_func
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Optional[concurrent.futures.Future] = None
+
+    def start(self):
+        self.future = AsyncFetchEngine.submit(self.coro_func(*self.args, **self.kwargs))
+        self.future.add_done_callback(self.on_done)
+
+    def on_done(self, future: concurrent.futures.Future):
+        # 在事件循环线程中执行，信号排队到主线程
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.error.emit(str(error))
+        else:
+            self.finished.emit(future.result())
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+
+class DevDataFetcher:
+    """开发者数据获取类"""
+
+    TRADES_URL = "https://debot.ai/api/dashboard/token/dev/info"
+
+    @staticmethod
+    @Metrics.instrument("pump_user_coins")
+    def fetch_dev_history(creator: str, offset: int = 0, limit: Optional[int] = None,
+                          track: bool = True) -> Optional[List[PumpCoin]]:
+        """
+        获取开发者历史发币记录
+
+        Args:
+            creator: 开发者地址
+            offset: 起始位置
+            limit: 每页数量，默认为分页块大小
+            track: 为False时只更新开发者信誉索引，不导出（扫描器和预取使用）
+        """
+        url, params = DevDataFetcher.history_request(creator, offset, limit)
+        try:
+            response = HttpClient.get(url, params=params)
+            response.raise_for_status()
+            coins = PayloadDecoder.decode_response("pump_user_coins", response)
+            DevDataFetcher.index_history(creator, coins, track)
+            return coins
+        except Exception as e:
+            print(f"获取开发者历史记录失败: {e}")
+            return None
+
+    @staticmethod
+    def history_request(creator: str, offset: int, limit: Optional[int]) -> Tuple[str, Dict[str, Any]]:
+        url = f"https://frontend-api-v3.pump.fun/coins/user-created-coins/{creator}"
+        params = {
+            "offset": offset,
+            "limit": limit or PagedSource.DEFAULT_BLOCK_SIZE,
+            "includeNsfw": False
         }
+        return url, params
+
+    @staticmethod
+    @Metrics.instrument("debot_dev_info")
+    def fetch_dev_trades(contract: str, on_rows=None, track: bool = True) -> Optional[DevTradeInfo]:
+        """
+        获取开发者交易记录
 
+        Args:
+            contract: 代币合约地址
+            on_rows: 交易记录边接收边解码，每解码一批调用一次
+            track: 为False时只更新开发者信誉索引，不写入价格序列和告警引擎、不导出（扫描器和预取使用）
+        """
         try:
-            response = requests.get(CoinDataFetcher.BASE_URL, params=params)
-            response.raise_for_status()  # 检查HTTP错误
-            data = response.json()
-            return data[0] if data and len(data) > 0 else None
-        except requests.RequestException as e:
-            print(f"API请求错误: {e}")
+            response = HttpClient.open_stream("GET", DevDataFetcher.TRADES_URL, params=DevDataFetcher.trades_params(contract))
+            trade_data = PayloadDecoder.decode_stream("debot_dev_info", response, "transactions", DevTransaction,
+                                                      lambda result: result.data.transactions, on_rows).data
+            if trade_data is not None:
+                DevDataFetcher.index_trades(contract, trade_data, track)
+            return trade_data
+        except Exception as e:
+            print(f"获取开发者交易记录失败: {e}")
             return None
-        except json.JSONDecodeError as e:
-            print(f"JSON解析错误: {e}")
+
+    @staticmethod
+    @Metrics.instrument("debot_dev_info")
+    async def fetch_dev_trades_async(contract: str, track: bool = True) -> Optional[DevTradeInfo]:
+        """fetch_dev_trades 的异步版本（一次性解码，不逐批回调），track 含义相同"""
+        try:
+            response = await AsyncHttpClient.get(DevDataFetcher.TRADES_URL, params=DevDataFetcher.trades_params(contract))
+            response.raise_for_status()
+            trade_data = PayloadDecoder.decode_response("debot_dev_info", response).data
+            if trade_data is not None:
+                DevDataFetcher.index_trades(contract, trade_data, track)
+            return trade_data
+        except Exception as e:
+            print(f"获取开发者交易记录失败: {e}")
             return None
 
-class ImageHandler:
-    """图片处理类"""
+    @staticmethod
+    def index_history(creator: str, coins: List[PumpCoin], track: bool = True):
+        """把开发者历史并入开发者信誉索引，已在告警引擎中的代币同步更新信誉指标"""
+        DevReputationIndex.record_history(creator, coins)
+        if track:
+            DevDataFetcher.track_history(creator, coins)
+        reputation = DevReputationIndex.get(creator)
+        if reputation is not None and coins:
+            facts = AlertEngine.reputation_facts(reputation)
+            for coin in coins:
+                AlertEngine.update(coin.mint, facts, create=False)
+
+    @staticmethod
+    def track_history(creator: str, coins: Optional[List[PumpCoin]]):
+        """导出用户查看过的开发者历史"""
+        if coins:
+            ColumnarExporter.export_dev_history(creator, coins)
+
+    @staticmethod
+    def index_trades(contract: str, trade_data: DevTradeInfo, track: bool = True):
+        """把开发者交易并入开发者信誉索引；track为True时同时写入代币的价格序列和告警引擎，并导出"""
+        DevReputationIndex.record_trades(contract, trade_data)
+        if track:
+            DevDataFetcher.track_trades(contract, trade_data)
+
+    @staticmethod
+    def track_trades(contract: str, trade_data: Optional[DevTradeInfo]):
+        """把用户查看过的代币的开发者交易写入价格序列和告警引擎，并导出"""
+        if trade_data is None:
+            return
+        if trade_data.transactions:
+            TimeSeriesStore.series(contract).add_dev_trades(trade_data.transactions)
+            ColumnarExporter.export_dev_trades(contract, trade_data.transactions)
+        creator = DevReputationIndex.creator_of(contract)
+        AlertEngine.update(contract, AlertEngine.dev_facts(
+            trade_data, DevReputationIndex.get(creator) if creator else None))
+
+    @staticmethod
+    def trades_params(contract: str) -> Dict[str, Any]:
+        return {
+            "chain": "solana",
+            "token": contract
+        }
+
+    @staticmethod
+    def format_dev_info(creator: str, original_text: str = "") -> str:
+        """格式化开发者信息"""
+        return RichText.STYLE_BLOCK + RichText.html("dev_info", creator=creator)
+
+    @staticmethod
+    def format_dev_history(history_data: List[PumpCoin], creator: Optional[str] = None,
+                           block_size: Optional[int] = None) -> str:
+        """
+        格式化开发者历史信息
+
+        history_data 是第一页；整页返回时还有后续页，统计只是下限，数字后加"+"
+        """
+        if not history_data:
+            return "未找到开发者历史信息"
+
+        total_coins = len(history_data)
+        success_coins = sum(1 for coin in history_data if coin.complete)
+        max_market_cap = max((coin.usd_market_cap for coin in history_data), default=0)
+
+        more = "+" if total_coins >= (block_size or PagedSource.DEFAULT_BLOCK_SIZE) else ""
+        total_display = f"{total_coins}{more}"
+        success_display = f"{success_coins}{more}"
+        market_cap_display = DevHistoryTableModel.format_market_cap(max_market_cap) + more
+
+        summary = f"发币：{total_display}次，成功：{success_display}次，最高市值：{market_cap_display}"
+
+        # 附加跨代币累计的信誉评分
+        creator = creator or history_data[0].creator or ""
+        reputation = DevReputationIndex.format_reputation(DevReputationIndex.get(creator))
+        return f"{summary}，{reputation}" if reputation else summary
+
+    @staticmethod
+    def format_dev_trade_status(trade_data: DevTradeInfo) -> str:
+        """格式化开发者交易状态"""
+        status = []
+
+        if trade_data.position_clear:
+            status.append("<span style='color: #e74c3c;'>清仓</span>")
+        if trade_data.position_increase:
+            status.append("加仓")
+        if trade_data.position_decrease:
+            status.append("减仓")
+        if trade_data.trans_out_amount > 0:
+            status.append("转出")
+
+        return "，".join(status) if status else "无操作"
+
+class CoinDataFetcher:
+    """代币数据获取类"""
+
+    BASE_URL = "https://frontend-api-v3.pump.fun/coins/search"
 
     @staticmethod
-    def get_image_base64(image_url: str) -> str:
+    @Metrics.instrument("pump_coins")
+    def fetch_coin_data(contract_address: str) -> Optional[PumpCoin]:
         """
-        获取图片的base64编码
+        获取代币数据
 
         Args:
-            image_url: 图片URL
+            contract_address: 代币合约地址
 
         Returns:
-            str: base64编码的图片数据
+            Optional[PumpCoin]: 代币数据或None（如果获取失败）
+        """
+        try:
+            response = HttpClient.get(CoinDataFetcher.BASE_URL, params=CoinDataFetcher.search_params(contract_address))
+            return CoinDataFetcher.parse_coin_data(response)
+        except requests.RequestException as e:
+            print(f"API请求错误: {e}")
+            return None
+        except SchemaError as e:
+            print(f"数据解析错误: {e}")
+            return None
+
+    @staticmethod
+    @Metrics.instrument("pump_coins")
+    async def fetch_coin_data_async(contract_address: str) -> Optional[PumpCoin]:
+        """fetch_coin_data 的异步版本"""
+        try:
+            response = await AsyncHttpClient.get(CoinDataFetcher.BASE_URL,
+                                                 params=CoinDataFetcher.search_params(contract_address))
+            return CoinDataFetcher.parse_coin_data(response)
+        except requests.RequestException as e:
+            print(f"API请求错误: {e}")
+            return None
+        except SchemaError as e:
+            print(f"数据解析错误: {e}")
+            return None
+
+    @staticmethod
+    @Metrics.instrument("pump_listing")
+    def fetch_listing(sort: str, offset: int = 0, limit: int = 50, order: str = "DESC") -> Optional[List[PumpCoin]]:
+        """
+        按排序翻页获取代币列表（与精确查询使用同一个接口）
+
+        Args:
+            sort: 排序字段，如 created_timestamp（最新）、last_trade_timestamp（最近成交）、market_cap
+            offset: 起始位置
+            limit: 每页数量
+            order: ASC 或 DESC
         """
+        params = {
+            "offset": offset,
+            "limit": limit,
+            "sort": sort,
+            "includeNsfw": False,
+            "order": order,
+        }
         try:
-            response = requests.get(image_url)
+            response = HttpClient.get(CoinDataFetcher.BASE_URL, params=params)
             response.raise_for_status()
-            image_data = base64.b64encode(response.content).decode('utf-8')
-            return f"data:image/png;base64,{image_data}"
-        except Exception as e:
-            print(f"图片处理错误: {e}")
-            return ""
+            return PayloadDecoder.decode_response("pump_coins", response)
+        except requests.RequestException as e:
+            print(f"API请求错误: {e}")
+            return None
+        except SchemaError as e:
+            print(f"数据解析错误: {e}")
+            return None
+
+    @staticmethod
+    def search_params(contract_address: str) -> Dict[str, Any]:
+        return {
+            "offset": 0,
+            "limit": 50,
+            "sort": "market_cap",
+            "includeNsfw": False,
+            "order": "DESC",
+            "searchTerm": contract_address,
+            "type": "exact"
+        }
+
+    @staticmethod
+    def parse_coin_data(response: requests.Response) -> Optional[PumpCoin]:
+        response.raise_for_status()  # 检查HTTP错误
+        data = PayloadDecoder.decode_response("pump_coins", response)
+        return data[0] if data and len(data) > 0 else None
+
+class ImageHandler:
+    """图片处理类"""
 
     @staticmethod
+    @Metrics.instrument("image")
     def download_and_display_image(image_url: str, label: QLabel) -> bool:
         """
         下载并显示图片
@@ -402,22 +2896,19 @@ class ImageHandler:
             bool: 是否成功显示图片
         """
         try:
-            response = requests.get(image_url)
+            response = HttpClient.get(image_url)
             response.raise_for_status()
 
-            temp_file = "temp_image.png"
-            with open(temp_file, "wb") as f:
-                f.write(response.content)
-
-            pixmap = QPixmap(temp_file)
+            pixmap = QPixmap()
+            if not pixmap.loadFromData(response.content):
+                print(f"图片解码失败: {image_url}")
+                return False
             label.setPixmap(pixmap.scaled(
                 label.width(),
                 label.height(),
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
             ))
-
-            os.remove(temp_file)
             return True
 
         except Exception as e:
@@ -453,19 +2944,129 @@ class TimeUtil:
         else:
             return f"{minutes}分钟前"
 
-class SmartMoneyTableModel(QAbstractTableModel):
+    @staticmethod
+    def format_duration(seconds: float) -> str:
+        """格式化时长，负数（发射前）前面加“前”"""
+        prefix = "前" if seconds < 0 else ""
+        seconds = int(abs(seconds))
+        if seconds >= 86400:
+            return f"{prefix}{seconds // 86400}天{seconds % 86400 // 3600}小时"
+        if seconds >= 3600:
+            return f"{prefix}{seconds // 3600}小时{seconds % 3600 // 60}分"
+        if seconds >= 60:
+            return f"{prefix}{seconds // 60}分{seconds % 60}秒"
+        return f"{prefix}{seconds}秒"
+
+class SmartMoneySummary(msgspec.Struct):
+    """聪明钱买卖汇总"""
+    buy_count: int = 0
+    sell_count: int = 0
+    buy_volume: float = 0.0
+    sell_volume: float = 0.0
+
+    @property
+    def net_volume(self) -> float:
+        return self.buy_volume - self.sell_volume
+
+class SmartMoneyAnalyzer:
+    """聪明钱数据分析类"""
+
+    @staticmethod
+    def aggregate(transactions_data: List[ChainFmTransaction],
+                  address_labels_map: Dict[str, List[ChainFmAddressLabel]],
+                  contract: str) -> Tuple[List[SmartMoneyRow], SmartMoneySummary]:
+        """
+        汇总带标签地址的买卖记录
+
+        Args:
+            transactions_data: chain.fm交易列表
+            address_labels_map: 地址标签表
+            contract: 代币合约地址（输出代币为该地址即为买入）
+
+        Returns:
+            Tuple[List[SmartMoneyRow], SmartMoneySummary]: 表格行及买卖汇总
+        """
+        rows = []
+        primary_label = WalletLabelIndex.primary_label
+
+        for tx in transactions_data:
+            for event in tx.events:
+                labels = address_labels_map.get(event.address)
+
+                # 只取第一个标签；本次响应中没有标签时使用其他代币上学到的标签
+                label = labels[0].label if labels else primary_label(event.address)
+                if label is None:  # 如果没有标签，跳过
+                    continue
+
+                rows.append(SmartMoneyRow.from_event(event, label, contract))
+
+        return rows, SmartMoneyAnalyzer.summarize(rows)
+
+    @staticmethod
+    def trade_key(signature: str, ordinal: int = 0) -> int:
+        """
+        成交的去重键
+
+        同一笔交易不论来自chain.fm还是开发者交易记录都得到相同的键，ordinal 为该代币的成交在交易内的序号
+        """
+        return hash((signature, ordinal))
+
+    @staticmethod
+    def swaps(data: ChainFmTransactionList, contract: str) -> Iterator[Tuple[int, int, bool, ChainFmOrder, Optional[str]]]:
+        """
+        逐个给出该代币的成交
+
+        Returns:
+            Iterator: (去重键, 区块时间, 是否买入, 订单, 标签)，标签取本次响应或钱包标签索引，没有标签时为None
+        """
+        labels_map = data.address_labels
+        primary_label = WalletLabelIndex.primary_label
+        trade_key = SmartMoneyAnalyzer.trade_key
+        for tx in data.parsedTransactions:
+            ordinal = 0
+            for event in tx.events:
+                event_data = event.data
+                is_buy = event_data.output.token == contract
+                if not is_buy and event_data.input.token != contract:
+                    continue
+                labels = labels_map.get(event.address)
+                label = labels[0].label if labels else primary_label(event.address)
+                yield trade_key(tx.signature, ordinal), tx.block_time, is_buy, event_data.order, label
+                ordinal += 1
+
+    @staticmethod
+    def sol_price(data: ChainFmTransactionList, contract: str) -> float:
+        """按该代币成交的美元金额与SOL金额之比估算SOL价格，没有成交时返回0"""
+        volume_usd = volume_native = 0.0
+        for _, _, _, order, _ in SmartMoneyAnalyzer.swaps(data, contract):
+            if order.volume_usd and order.volume_native:
+                volume_usd += order.volume_usd
+                volume_native += order.volume_native
+        return volume_usd / volume_native if volume_native else 0.0
+
+    @staticmethod
+    def summarize(rows: List[SmartMoneyRow]) -> SmartMoneySummary:
+        """按表格行统计买卖汇总"""
+        summary = SmartMoneySummary()
+        for row in rows:
+            if row.is_buy:
+                summary.buy_count += 1
+                summary.buy_volume += row.volume_native
+            else:
+                summary.sell_count += 1
+                summary.sell_volume += row.volume_native
+        return summary
+
+class SmartMoneyTableModel(PagedTableModel):
     """聪明钱交易表格模型"""
 
-    def __init__(self, data: List[Dict[str, Any]], parent=None):
-        super().__init__(parent)
+    def __init__(self, data: List[SmartMoneyRow], source: Optional[PagedSource] = None, parent=None):
+        super().__init__(source, parent)
         self._data = data
         self._headers = ["聪明钱", "操作", "价格", "金额(SOL)"]
-        print(f"SmartMoneyTableModel initialized with {len(data)} rows")  # 调试信息
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        count = len(self._data)
-        print(f"rowCount called, returning {count}")  # 调试信息
-        return count
+    def loaded_rows(self) -> List[SmartMoneyRow]:
+        return self._data
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self._headers)
@@ -473,6 +3074,8 @@ class SmartMoneyTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
+        if self.is_placeholder(index):
+            return self.placeholder_data(index, role)
 
         if role == Qt.DisplayRole:
             try:
@@ -480,22 +3083,20 @@ class SmartMoneyTableModel(QAbstractTableModel):
                 col = index.column()
 
                 if col == 0:  # 聪明钱
-                    address = row_data.get('address', '')
-                    labels = row_data.get('labels', [])
-                    return ', '.join(labels) if labels else address[:6] + '...'
+                    return row_data.label if row_data.label else row_data.address[:6] + '...'
                 elif col == 1:  # 操作
-                    return "买入" if row_data.get('is_buy', False) else "卖出"
+                    return "买入" if row_data.is_buy else "卖出"
                 elif col == 2:  # 价格
-                    return f"${row_data.get('price_usd', 0):.4f}"
+                    return f"${row_data.price_usd:.4f}"
                 elif col == 3:  # 金额
-                    return f"{int(row_data.get('volume_native', 0))}"
+                    return f"{int(row_data.volume_native)}"
             except Exception as e:
                 print(f"Error in data method: {e}")  # 调试信息
                 return str(e)
 
         elif role == Qt.BackgroundRole:
             row_data = self._data[index.row()]
-            if row_data.get('is_buy', False):
+            if row_data.is_buy:
                 return QBrush(QColor('#e6ffe6'))  # 浅绿色
             else:
                 return QBrush(QColor('#ffe6e6'))  # 浅红色
@@ -507,18 +3108,18 @@ class SmartMoneyTableModel(QAbstractTableModel):
             return self._headers[section]
         return None
 
-class SocialTableModel(QAbstractTableModel):
+class SocialTableModel(PagedTableModel):
     """社交媒体表格模型"""
 
-    def __init__(self, tweets=None, parent=None):
-        super().__init__(parent)
+    def __init__(self, tweets: Optional[List[TweetRow]] = None, source: Optional[PagedSource] = None, parent=None):
+        super().__init__(source, parent)
         self._tweets = tweets or []
         self._headers = ["用户名", "蓝标", "浏览", "点赞", "转发", "内容"]
         self._sort_column = 0
         self._sort_order = Qt.AscendingOrder
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self._tweets)
+    def loaded_rows(self) -> List[TweetRow]:
+        return self._tweets
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(self._headers)
@@ -526,24 +3127,25 @@ class SocialTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
+        if self.is_placeholder(index):
+            return self.placeholder_data(index, role)
 
         if role == Qt.DisplayRole:
             tweet = self._tweets[index.row()]
             col = index.column()
-            user = tweet.get("user", {})
 
             if col == 0:  # 用户名
-                return f"{user.get('name', '')} (@{user.get('screen_name', '')})"
+                return f"{tweet.name} (@{tweet.screen_name})"
             elif col == 1:  # 蓝标
-                return "✓" if user.get("is_blue_verified") else ""
+                return "✓" if tweet.is_blue_verified else ""
             elif col == 2:  # 浏览
-                return f"{tweet.get('views', 0):,}"
+                return f"{tweet.views:,}"
             elif col == 3:  # 点赞
-                return f"{tweet.get('favorite_count', 0):,}"
+                return f"{tweet.favorite_count:,}"
             elif col == 4:  # 转发
-                return f"{tweet.get('retweet_count', 0):,}"
+                return f"{tweet.retweet_count:,}"
             elif col == 5:  # 内容
-                return tweet.get("text", "")
+                return tweet.text
 
         elif role == Qt.TextAlignmentRole:
             if index.column() in [2, 3, 4]:  # 数字列右对齐
@@ -563,56 +3165,2077 @@ class SocialTableModel(QAbstractTableModel):
 
     def sort(self, column: int, order: Qt.SortOrder):
         """实现排序"""
+        self.fetch_all_local()
         self.layoutAboutToBeChanged.emit()
 
         if column == 0:  # 用户名
-            self._tweets.sort(key=lambda x: x.get("user", {}).get("name", ""), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.name, reverse=(order == Qt.DescendingOrder))
         elif column == 1:  # 蓝标
-            self._tweets.sort(key=lambda x: x.get("user", {}).get("is_blue_verified", False), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.is_blue_verified, reverse=(order == Qt.DescendingOrder))
         elif column == 2:  # 浏览
-            self._tweets.sort(key=lambda x: x.get("views", 0), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.views, reverse=(order == Qt.DescendingOrder))
         elif column == 3:  # 点赞
-            self._tweets.sort(key=lambda x: x.get("favorite_count", 0), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.favorite_count, reverse=(order == Qt.DescendingOrder))
         elif column == 4:  # 转发
-            self._tweets.sort(key=lambda x: x.get("retweet_count", 0), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.retweet_count, reverse=(order == Qt.DescendingOrder))
         elif column == 5:  # 内容
-            self._tweets.sort(key=lambda x: x.get("text", ""), reverse=(order == Qt.DescendingOrder))
+            self._tweets.sort(key=lambda x: x.text, reverse=(order == Qt.DescendingOrder))
 
         self._sort_column = column
         self._sort_order = order
         self.layoutChanged.emit()
 
-class HTMLDelegate(QStyledItemDelegate):
-    """HTML格式的列表项代理"""
-    def paint(self, painter, option, index):
-        options = QStyleOptionViewItem(option)
-        self.initStyleOption(options, index)
+# ---------------------------------------------------------------------------
+# 持久索引
+# 跨查询积累的开发者信誉和钱包标签，保存在内存中并定期写回文件，查询为O(1)
+# ---------------------------------------------------------------------------
+
+class PersistentIndex:
+    """
+    定期写回文件的内存索引
+
+    子类声明自己的 _lock 并实现 load/dump；更新后调用 flush_if_due，
+    最多每 SAVE_INTERVAL 秒写一次文件，退出时再调用 flush。未调用 open 时只保存在内存中。
+    """
+
+    NAME = "索引"
+    SAVE_INTERVAL = 30.0  # 秒
+
+    path: Optional[str] = None
+    _lock: threading.Lock
+    _dirty = False
+    _saved_at = 0.0
+
+    @classmethod
+    def load(cls, content: Optional[bytes]):
+        """从文件内容恢复状态，content为None时清空，调用方持有锁"""
+        raise NotImplementedError
+
+    @classmethod
+    def dump(cls) -> bytes:
+        """序列化当前状态，调用方持有锁"""
+        raise NotImplementedError
+
+    @classmethod
+    def open(cls, path: str):
+        """读取索引文件，之后的更新定期写回该文件"""
+        content = None
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    content = f.read()
+            except OSError as e:
+                print(f"读取{cls.NAME}失败: {e}")
+        with cls._lock:
+            cls.path = path
+            try:
+                cls.load(content)
+            except msgspec.DecodeError as e:
+                print(f"读取{cls.NAME}失败: {e}")
+                cls.load(None)
+            cls._dirty = False
+            cls._saved_at = time.monotonic()
+
+    @classmethod
+    def flush_if_due(cls):
+        if cls._dirty and time.monotonic() - cls._saved_at >= cls.SAVE_INTERVAL:
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        """把索引写回文件，先写临时文件再替换，避免中途退出留下不完整的文件"""
+        if cls.path is None:
+            return
+        with cls._lock:
+            if not cls._dirty:
+                return
+            content = cls.dump()
+            cls._dirty = False
+            cls._saved_at = time.monotonic()
+        temp_path = cls.path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, cls.path)
+        except OSError as e:
+            print(f"保存{cls.NAME}失败: {e}")
+
+class DevToken(msgspec.Struct):
+    """开发者发行的一个代币"""
+    mint: str
+    symbol: str = ''
+    created_timestamp: int = 0
+    peak_market_cap: float = 0.0  # 历次查询到的最高市值
+    complete: bool = False
+    # 开发者行为（format_dev_trade_status 的各项），None 表示还没有获取过该代币的开发者交易
+    dev_cleared: Optional[bool] = None
+    dev_sold: Optional[bool] = None
+    dev_transferred: Optional[bool] = None
+
+class DevReputation(msgspec.Struct):
+    """开发者信誉记录，统计字段和评分在每次更新时重新计算"""
+    creator: str
+    tokens: Dict[str, DevToken] = msgspec.field(default_factory=dict)
+    launched: int = 0
+    completed: int = 0
+    rugged: int = 0
+    cleared: int = 0
+    peak_market_cap: float = 0.0
+    score: int = 50
+    serial_rugger: bool = False
+    verdict: str = "样本不足"
+    updated_at: float = 0.0
+
+class DevReputationFile(msgspec.Struct):
+    version: int = 1
+    creators: Dict[str, DevReputation] = msgspec.field(default_factory=dict)
+
+class DevReputationIndex(PersistentIndex):
+    """
+    跨代币的开发者信誉索引
+
+    按开发者地址保存历次查询到的发币记录和开发者行为，评分在更新时预先算好。
+    DevDataFetcher 每次取到开发者历史或开发者交易时增量更新。
+    开发者交易只带代币地址，代币出现在开发者历史中之前先暂存，之后再归入对应开发者。
+    """
+
+    NAME = "开发者信誉索引"
+    RUG_MARKET_CAP = 10_000          # 未毕业且最高市值低于该值（美元）视为归零
+    RUG_MIN_AGE = 24 * 3600 * 1000   # 发行未满一天的代币只按开发者清仓判断
+    SERIAL_LAUNCHES = 5              # 至少发过这么多币才可能判定为连环割
+    SERIAL_RUG_RATE = 0.8
+    PENDING_LIMIT = 1024
+
+    _creators: Dict[str, DevReputation] = {}
+    _mint_creators: Dict[str, str] = {}
+    _pending: Dict[str, DevTradeInfo] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, content: Optional[bytes]):
+        cls._creators = msgspec.json.decode(content, type=DevReputationFile).creators if content else {}
+        cls._mint_creators = {mint: creator for creator, record in cls._creators.items() for mint in record.tokens}
+        cls._pending = {}
+
+    @classmethod
+    def dump(cls) -> bytes:
+        return msgspec.json.encode(DevReputationFile(creators=cls._creators))
+
+    @classmethod
+    def get(cls, creator: str) -> Optional[DevReputation]:
+        return cls._creators.get(creator)
+
+    @classmethod
+    def creator_of(cls, mint: str) -> Optional[str]:
+        return cls._mint_creators.get(mint)
+
+    @classmethod
+    def is_serial_rugger(cls, creator: str) -> bool:
+        record = cls._creators.get(creator)
+        return record is not None and record.serial_rugger
+
+    @classmethod
+    def record_history(cls, creator: str, coins: List[PumpCoin]):
+        """合并一页开发者历史发币记录"""
+        if not coins:
+            return
+        with cls._lock:
+            record = cls._creators.get(creator)
+            if record is None:
+                record = cls._creators[creator] = DevReputation(creator)
+            for coin in coins:
+                token = record.tokens.get(coin.mint)
+                if token is None:
+                    token = record.tokens[coin.mint] = DevToken(coin.mint)
+                    cls._mint_creators[coin.mint] = creator
+                token.symbol = coin.symbol
+                token.created_timestamp = coin.created_timestamp
+                token.complete = token.complete or coin.complete
+                token.peak_market_cap = max(token.peak_market_cap, coin.usd_market_cap)
+                pending = cls._pending.pop(coin.mint, None)
+                if pending is not None:
+                    cls.apply_trades(token, pending)
+            cls.rescore(record)
+        cls.flush_if_due()
+
+    @classmethod
+    def record_trades(cls, mint: str, trade_data: DevTradeInfo):
+        """合并一个代币的开发者交易汇总"""
+        with cls._lock:
+            creator = cls._mint_creators.get(mint)
+            if creator is None:
+                cls._pending[mint] = msgspec.structs.replace(trade_data, transactions=None)
+                if len(cls._pending) > cls.PENDING_LIMIT:
+                    cls._pending.pop(next(iter(cls._pending)))
+                return
+            record = cls._creators[creator]
+            cls.apply_trades(record.tokens[mint], trade_data)
+            cls.rescore(record)
+        cls.flush_if_due()
 
-        style = options.widget.style() if options.widget else QApplication.style()
+    @staticmethod
+    def apply_trades(token: DevToken, trade_data: DevTradeInfo):
+        token.dev_cleared = trade_data.position_clear
+        token.dev_sold = trade_data.position_decrease
+        token.dev_transferred = trade_data.trans_out_amount > 0
+
+    @classmethod
+    def rescore(cls, record: DevReputation):
+        """重新计算统计字段和评分，调用方持有锁"""
+        now_ms = time.time() * 1000
+        tokens = record.tokens.values()
+        record.launched = len(record.tokens)
+        record.completed = sum(1 for token in tokens if token.complete)
+        record.cleared = sum(1 for token in tokens if token.dev_cleared)
+        record.rugged = sum(1 for token in tokens if not token.complete and (
+            token.dev_cleared or (token.peak_market_cap < cls.RUG_MARKET_CAP
+                                  and now_ms - token.created_timestamp >= cls.RUG_MIN_AGE)))
+        record.peak_market_cap = max((token.peak_market_cap for token in tokens), default=0.0)
+
+        # 发币越多，归零比例的权重越大
+        confidence = min(record.launched / cls.SERIAL_LAUNCHES, 1.0)
+        success_rate = record.completed / record.launched
+        rug_rate = record.rugged / record.launched
+        record.score = int(round(min(max(50 + 50 * success_rate - 50 * rug_rate * confidence, 0), 100)))
+        record.serial_rugger = record.launched >= cls.SERIAL_LAUNCHES and rug_rate >= cls.SERIAL_RUG_RATE
+
+        if record.serial_rugger:
+            record.verdict = "连环割"
+        elif record.launched < 2:
+            record.verdict = "样本不足"
+        elif record.score >= 70:
+            record.verdict = "优质"
+        elif record.score < 40:
+            record.verdict = "高风险"
+        else:
+            record.verdict = "一般"
+        record.updated_at = time.time()
+        cls._dirty = True
 
-        doc = QTextDocument()
-        doc.setHtml(options.text)
+    @staticmethod
+    def format_reputation(record: Optional[DevReputation]) -> str:
+        if record is None:
+            return ""
+        return f"信誉：{record.score}分（{record.verdict}，累计{record.launched}币/归零{record.rugged}）"
+
+class WalletLabel(msgspec.Struct, array_like=True, gc=False):
+    """一个钱包地址的全部已知标签，按数组保存以减小索引文件"""
+    labels: List[str]
+    first_seen: int
+    last_seen: int
+    sources: List[str]
+
+class WalletLabelFile(msgspec.Struct):
+    version: int = 1
+    wallets: Dict[str, WalletLabel] = msgspec.field(default_factory=dict)
+
+class WalletLabelIndex(PersistentIndex):
+    """
+    钱包标签索引
+
+    合并每次 chain.fm 响应中的 addressLabelsMap，在一个代币上学到的标签可用于其他代币，
+    包括 chain.fm 只返回了部分标签表的情况。标签按首次学到的顺序保存，第一个标签作为主标签。
+    """
+
+    NAME = "钱包标签索引"
+
+    _wallets: Dict[str, WalletLabel] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, content: Optional[bytes]):
+        wallets = msgspec.json.decode(content, type=WalletLabelFile).wallets if content else {}
+        for wallet in wallets.values():
+            wallet.labels = [sys.intern(label) for label in wallet.labels]
+            wallet.sources = [sys.intern(source) for source in wallet.sources]
+        cls._wallets = {intern_address(address): wallet for address, wallet in wallets.items()}
+
+    @classmethod
+    def dump(cls) -> bytes:
+        return msgspec.json.encode(WalletLabelFile(wallets=cls._wallets))
+
+    @classmethod
+    def merge(cls, labels_map: Dict[str, List[str]], source: str):
+        """
+        合并一批地址标签
 
-        options.text = ""
-        style.drawControl(QStyle.CE_ItemViewItem, options, painter)
+        Args:
+            labels_map: 地址 -> 标签列表
+            source: 标签来源，如 chain.fm
+        """
+        if not labels_map:
+            return
+        now = int(time.time())
+        source = sys.intern(source)
+        with cls._lock:
+            wallets = cls._wallets
+            for address, labels in labels_map.items():
+                wallet = wallets.get(address)
+                if wallet is None:
+                    wallets[intern_address(address)] = WalletLabel(
+                        [sys.intern(label) for label in dict.fromkeys(labels) if label], now, now, [source])
+                    continue
+                wallet.last_seen = now
+                for label in labels:
+                    if label and label not in wallet.labels:
+                        wallet.labels.append(sys.intern(label))
+                if source not in wallet.sources:
+                    wallet.sources.append(source)
+            cls._dirty = True
+        cls.flush_if_due()
+
+    @classmethod
+    def merge_chain_fm(cls, labels_map: Dict[str, List[ChainFmAddressLabel]]):
+        cls.merge({address: [label.label for label in labels] for address, labels in labels_map.items()}, "chain.fm")
+
+    @classmethod
+    def labels(cls, address: str) -> List[str]:
+        wallet = cls._wallets.get(address)
+        return wallet.labels if wallet is not None else []
+
+    @classmethod
+    def primary_label(cls, address: str) -> Optional[str]:
+        wallet = cls._wallets.get(address)
+        return wallet.labels[0] if wallet is not None and wallet.labels else None
+
+    @classmethod
+    def lookup(cls, addresses) -> Dict[str, List[str]]:
+        """批量查询，只返回有标签的地址"""
+        get = cls._wallets.get
+        found = {}
+        for address in addresses:
+            wallet = get(address)
+            if wallet is not None and wallet.labels:
+                found[address] = wallet.labels
+        return found
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._wallets)
+
+# ---------------------------------------------------------------------------
+# 时间序列
+# 按代币保存开发者交易和chain.fm交易的价格序列，增量聚合为多个周期的K线，
+# 图表按像素宽度取有界数量的点（K线 min-max 合并、折线 LTTB 降采样）
+# ---------------------------------------------------------------------------
+
+class Candle(msgspec.Struct, gc=False):
+    """一根K线，first_time/last_time 用于乱序到达的交易也能得到正确的开盘价和收盘价"""
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+    trades: int = 0
+    first_time: float = 0.0
+    last_time: float = 0.0
+
+    def add(self, time_s: float, price: float, volume: float):
+        if time_s < self.first_time:
+            self.first_time = time_s
+            self.open = price
+        if time_s >= self.last_time:
+            self.last_time = time_s
+            self.close = price
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.volume += volume
+        self.trades += 1
+
+    @classmethod
+    def merge(cls, candles: List['Candle']) -> 'Candle':
+        """把相邻的几根K线合并为一根"""
+        first, last = candles[0], candles[-1]
+        return cls(first.start, first.open, max(c.high for c in candles), min(c.low for c in candles), last.close,
+                   sum(c.volume for c in candles), sum(c.trades for c in candles), first.first_time, last.last_time)
+
+class ChartMarker(msgspec.Struct, array_like=True, gc=False):
+    """价格曲线上的开发者/聪明钱交易标记"""
+    time: float
+    price: float
+    volume: float
+    kind: str   # dev_buy / dev_sell / smart_buy / smart_sell
+    label: str = ''
+
+class ChartView(msgspec.Struct):
+    """一次绘制所需的数据，点数与图表宽度成正比"""
+    resolution: int  # 0 表示原始成交
+    candles: List[Candle]
+    points: List[Tuple[float, float]]
+    markers: List[ChartMarker]
+
+class PriceSeries:
+    """单个代币的价格序列"""
+
+    RESOLUTIONS = (5, 15, 60, 300, 900, 3600, 14400, 86400)  # 秒
+    LTTB_RAW_FACTOR = 20  # 区间内原始成交不超过目标点数的这么多倍时直接对原始成交做LTTB
+
+    def __init__(self, mint: str):
+        self.mint = mint
+        self._lock = threading.Lock()
+        self._seen = set()  # 已加入的成交（按交易签名去重，重复的响应不会重复计入）
+        self._marked = set()  # 已标记的成交，开发者成交和chain.fm成交是同一笔时只标记先到的一个
+        self._times = array.array("d")
+        self._prices = array.array("d")
+        self._pending: List[Tuple[float, float]] = []
+        self._candles: Dict[int, Dict[int, Candle]] = {res: {} for res in self.RESOLUTIONS}
+        self._candle_keys: Dict[int, Optional[List[int]]] = {res: [] for res in self.RESOLUTIONS}
+        self._markers: List[ChartMarker] = []
+        self._marker_times: Optional[List[float]] = []
+        self._last_view: Optional[Tuple[Tuple, ChartView]] = None
+
+    def __len__(self) -> int:
+        return len(self._times) + len(self._pending)
+
+    @property
+    def marker_count(self) -> int:
+        return len(self._markers)
+
+    def add_trades(self, trades, markers=()):
+        """
+        加入一批成交
 
-        ctx = QAbstractTextDocumentLayout.PaintContext()
+        Args:
+            trades: (去重键, 时间(秒), 价格, 成交额) 序列
+            markers: 需要在价格曲线上标出的成交，去重键相同的成交只标记一次
+        """
+        with self._lock:
+            for key, time_s, price, volume in trades:
+                if price <= 0 or key in self._seen:
+                    continue
+                self._seen.add(key)
+                self._pending.append((time_s, price))
+                for res, candles in self._candles.items():
+                    start = int(time_s // res * res)
+                    candle = candles.get(start)
+                    if candle is None:
+                        candles[start] = Candle(start, price, price, price, price, volume, 1, time_s, time_s)
+                        self._candle_keys[res] = None
+                    else:
+                        candle.add(time_s, price, volume)
+            for key, marker in markers:
+                if key in self._seen and key not in self._marked:
+                    self._marked.add(key)
+                    self._markers.append(marker)
+                    self._marker_times = None
+
+    def add_dev_trades(self, transactions: List[DevTransaction]):
+        """加入开发者成交，与chain.fm中同一交易签名的成交合并为一个点"""
+        trades, markers = [], []
+        for tx in transactions:
+            if tx.op not in ("buy", "sell"):
+                continue
+            key = SmartMoneyAnalyzer.trade_key(tx.tx_hash) if tx.tx_hash else hash((tx.op, tx.time, tx.amount))
+            trades.append((key, tx.time, tx.price, tx.volume))
+            markers.append((key, ChartMarker(tx.time, tx.price, tx.volume, f"dev_{tx.op}")))
+        self.add_trades(trades, markers)
+
+    def add_chain_fm(self, data: ChainFmTransactionList):
+        """加入chain.fm成交，带标签的地址（本次响应或钱包标签索引中）标记为聪明钱"""
+        trades, markers = [], []
+        for key, block_time, is_buy, order, label in SmartMoneyAnalyzer.swaps(data, self.mint):
+            trades.append((key, block_time, order.price_usd, order.volume_usd))
+            if label is not None:
+                markers.append((key, ChartMarker(block_time, order.price_usd, order.volume_usd,
+                                                 "smart_buy" if is_buy else "smart_sell", label)))
+        self.add_trades(trades, markers)
+
+    def sort_pending(self):
+        """把新成交并入按时间排序的数组，调用方持有锁"""
+        if not self._pending:
+            return
+        pending = sorted(self._pending)
+        self._pending = []
+        if not self._times or pending[0][0] >= self._times[-1]:
+            self._times.extend(t for t, _ in pending)
+            self._prices.extend(p for _, p in pending)
+            return
+        merged = sorted(list(zip(self._times, self._prices)) + pending)
+        self._times = array.array("d", (t for t, _ in merged))
+        self._prices = array.array("d", (p for _, p in merged))
+
+    def time_range(self) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            self.sort_pending()
+            if not self._times:
+                return None
+            return self._times[0], self._times[-1]
+
+    def candle_keys(self, resolution: int) -> List[int]:
+        """某个周期的K线起始时间（有序），调用方持有锁"""
+        keys = self._candle_keys[resolution]
+        if keys is None:
+            keys = self._candle_keys[resolution] = sorted(self._candles[resolution])
+        return keys
+
+    def candles_in(self, resolution: int, t0: float, t1: float) -> List[Candle]:
+        keys = self.candle_keys(resolution)
+        candles = self._candles[resolution]
+        lo = bisect.bisect_left(keys, t0 - resolution)
+        hi = bisect.bisect_right(keys, t1)
+        return [candles[key] for key in keys[lo:hi]]
+
+    def resolution_for(self, span: float, max_candles: int) -> int:
+        """能在max_candles根以内显示span秒的最小周期"""
+        for res in self.RESOLUTIONS:
+            if span / res <= max_candles:
+                return res
+        return self.RESOLUTIONS[-1]
+
+    def view(self, t0: float, t1: float, max_points: int, mode: str = "candle",
+             marker_columns: Optional[int] = None) -> ChartView:
+        """
+        取[t0, t1]区间内用于绘制的数据
 
-        textRect = style.subElementRect(QStyle.SE_ItemViewItemText, options)
-        painter.save()
-        painter.translate(textRect.topLeft())
-        doc.documentLayout().draw(painter, ctx)
-        painter.restore()
+        Args:
+            max_points: 最多返回的K线数或折线点数，通常为图表宽度（像素）除以每个点占用的宽度
+            mode: candle（K线）或 line（折线）
+            marker_columns: 交易标记按时间分成的列数，每列每种标记最多一个，默认与max_points相同
+        """
+        max_points = max(max_points, 3)
+        marker_columns = max(marker_columns or max_points, 1)
+        with self._lock:
+            # 数据和区间都没变时（定时刷新、窗口重绘）直接返回上次的结果
+            key = (t0, t1, max_points, mode, marker_columns, len(self._seen), len(self._markers))
+            if self._last_view is not None and self._last_view[0] == key:
+                return self._last_view[1]
+            view = self.build_view(t0, t1, max_points, mode, marker_columns)
+            self._last_view = (key, view)
+            return view
+
+    def build_view(self, t0: float, t1: float, max_points: int, mode: str, marker_columns: int) -> ChartView:
+        """调用方持有锁"""
+        self.sort_pending()
+        span = max(t1 - t0, 1)
+        if mode == "candle":
+            resolution = self.resolution_for(span, max_points)
+            candles = self.candles_in(resolution, t0, t1)
+            if len(candles) > max_points:
+                # 最大周期也放不下时按组合并（min-max）
+                group = math.ceil(len(candles) / max_points)
+                candles = [Candle.merge(candles[i:i + group]) for i in range(0, len(candles), group)]
+            return ChartView(resolution, candles, [], self.markers_in(t0, t1, marker_columns))
+
+        lo = bisect.bisect_left(self._times, t0)
+        hi = bisect.bisect_right(self._times, t1)
+        if hi - lo <= max_points:
+            resolution = 0
+            points = list(zip(self._times[lo:hi], self._prices[lo:hi]))
+        elif hi - lo <= max_points * self.LTTB_RAW_FACTOR:
+            resolution = 0
+            points = self.lttb(self._times[lo:hi], self._prices[lo:hi], max_points)
+        else:
+            # 先用K线做min-max抽取（每根K线贡献最低和最高两个点），再对结果做LTTB
+            resolution = self.resolution_for(span, max_points * self.LTTB_RAW_FACTOR // 2)
+            xs, ys = [], []
+            for candle in self.candles_in(resolution, t0, t1):
+                first, second = (candle.low, candle.high) if candle.close >= candle.open else (candle.high, candle.low)
+                xs += (candle.start, candle.start + resolution / 2)
+                ys += (first, second)
+            points = self.lttb(xs, ys, max_points)
+        return ChartView(resolution, [], points, self.markers_in(t0, t1, marker_columns))
+
+    def markers_in(self, t0: float, t1: float, columns: int) -> List[ChartMarker]:
+        """区间内的交易标记，按时间分成columns列，每列每种标记只保留成交额最大的一个，调用方持有锁"""
+        if self._marker_times is None:
+            self._markers.sort(key=lambda marker: marker.time)
+            self._marker_times = [marker.time for marker in self._markers]
+        lo = bisect.bisect_left(self._marker_times, t0)
+        hi = bisect.bisect_right(self._marker_times, t1)
+        if hi - lo <= columns:
+            return self._markers[lo:hi]
+
+        scale = columns / max(t1 - t0, 1)
+        best: Dict[Tuple[int, str], ChartMarker] = {}
+        for marker in self._markers[lo:hi]:
+            key = (int((marker.time - t0) * scale), marker.kind)
+            current = best.get(key)
+            if current is None or marker.volume > current.volume:
+                best[key] = marker
+        return sorted(best.values(), key=lambda marker: marker.time)
 
-    def sizeHint(self, option, index):
-        options = QStyleOptionViewItem(option)
-        self.initStyleOption(options, index)
+    @staticmethod
+    def lttb(xs, ys, threshold: int) -> List[Tuple[float, float]]:
+        """Largest-Triangle-Three-Buckets 降采样，保留首尾点和每个桶中与相邻桶构成最大三角形的点"""
+        n = len(xs)
+        if threshold >= n or threshold < 3:
+            return list(zip(xs, ys))
+
+        sampled = [(xs[0], ys[0])]
+        bucket_size = (n - 2) / (threshold - 2)
+        a = 0
+        for i in range(threshold - 2):
+            # 下一个桶的平均点
+            next_start = int((i + 1) * bucket_size) + 1
+            next_end = min(int((i + 2) * bucket_size) + 1, n)
+            count = next_end - next_start
+            avg_x = sum(xs[next_start:next_end]) / count
+            avg_y = sum(ys[next_start:next_end]) / count
+
+            start = int(i * bucket_size) + 1
+            end = int((i + 1) * bucket_size) + 1
+            ax, ay = xs[a], ys[a]
+            max_area = -1.0
+            chosen = start
+            for j in range(start, end):
+                area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+                if area > max_area:
+                    max_area = area
+                    chosen = j
+            sampled.append((xs[chosen], ys[chosen]))
+            a = chosen
+        sampled.append((xs[-1], ys[-1]))
+        return sampled
+
+class TimeSeriesStore:
+    """按代币保存价格序列，只保留最近查询的若干个代币"""
+
+    MAX_SERIES = 32
+
+    _series: collections.OrderedDict = collections.OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def series(cls, mint: str) -> PriceSeries:
+        with cls._lock:
+            series = cls._series.get(mint)
+            if series is None:
+                series = cls._series[mint] = PriceSeries(mint)
+                if len(cls._series) > cls.MAX_SERIES:
+                    cls._series.popitem(last=False)
+            else:
+                cls._series.move_to_end(mint)
+            return series
+
+    @classmethod
+    def get(cls, mint: str) -> Optional[PriceSeries]:
+        return cls._series.get(mint)
+
+    @classmethod
+    def mints(cls) -> List[str]:
+        with cls._lock:
+            return list(reversed(cls._series))
+
+# ---------------------------------------------------------------------------
+# 开发者交易分析
+# 按时间重放开发者的买入、卖出和转账，计算持仓、成本、已实现盈亏、集中抛售时段和向新钱包转出
+# ---------------------------------------------------------------------------
+
+class SellWindow(msgspec.Struct, gc=False):
+    """一段集中抛售：相邻卖出间隔不超过分析窗口"""
+    start: float
+    end: float
+    sells: int
+    amount: float
+    volume_usd: float
+    share: float  # 占持仓峰值的比例
+
+class DevTransfer(msgspec.Struct, gc=False):
+    time: float
+    to: str
+    amount: float
+    share: float  # 占转出前持仓的比例
+    fresh: bool   # 接收地址此前没有出现过，也没有已知标签
+
+class DevPositionTimeline(msgspec.Struct, gc=False):
+    """每笔交易后的持仓、剩余成本和累计已实现盈亏（美元），按时间排序"""
+    times: List[float]
+    ops: List[str]
+    amounts: List[float]
+    positions: List[float]
+    costs: List[float]
+    realized: List[float]
+
+class DevTradeReport(msgspec.Struct):
+    trades: int = 0
+    bought: float = 0.0
+    sold: float = 0.0
+    buy_usd: float = 0.0
+    sell_usd: float = 0.0
+    transferred_in: float = 0.0
+    transferred_out: float = 0.0
+    position: float = 0.0
+    peak_position: float = 0.0
+    cost_basis_usd: float = 0.0
+    realized_usd: float = 0.0
+    unrealized_usd: float = 0.0
+    sol_usd: float = 0.0  # 换算SOL用的价格，0表示没有可用价格
+    launch_time: float = 0.0
+    first_sell_after: Optional[float] = None  # 发射后多久第一次卖出（秒）
+    exit_after: Optional[float] = None        # 发射后多久持仓降到峰值的10%以下（秒）
+    sell_windows: List[SellWindow] = []
+    transfers: List[DevTransfer] = []
+    fresh_recipients: int = 0
+    timeline: Optional[DevPositionTimeline] = None
+
+    @property
+    def realized_sol(self) -> float:
+        return self.realized_usd / self.sol_usd if self.sol_usd else 0.0
+
+class DevTradeAnalytics:
+    """
+    开发者交易分析
+
+    交易按时间排序后先按列展开，持仓由带符号的数量用 itertools.accumulate 一次算出；
+    成本采用移动平均法，依赖前一笔的平均成本，这一步是一次线性遍历。
+    转入按转入时的价格计入成本，转出按平均成本扣除成本、不计盈亏。
+    """
+
+    SELL_WINDOW = 300        # 秒，相邻卖出间隔不超过该值时归为同一段抛售
+    MIN_WINDOW_SHARE = 0.05  # 抛售量不足持仓峰值该比例的时段不列出
+    MAX_WINDOWS = 5
+    EXIT_SHARE = 0.1
+    SIGNS = {"buy": 1.0, "trans_in": 1.0, "sell": -1.0, "trans_out": -1.0}
+
+    @classmethod
+    def analyze(cls, transactions: List[DevTransaction], launch_ms: int = 0, sol_usd: float = 0.0,
+                creator: str = "") -> DevTradeReport:
+        """
+        分析开发者交易
 
-        doc = QTextDocument()
-        doc.setHtml(options.text)
-        return QSize(doc.idealWidth(), doc.size().height())
+        Args:
+            transactions: debot返回的开发者交易
+            launch_ms: 代币创建时间（毫秒），0表示以第一笔交易为准
+            sol_usd: SOL价格（美元），用于换算SOL计价的盈亏
+            creator: 开发者地址，不计入新钱包判断
+        """
+        trades = sorted((tx for tx in transactions if tx.op in cls.SIGNS), key=lambda tx: tx.time)
+        report = DevTradeReport(trades=len(trades), sol_usd=sol_usd)
+        if not trades:
+            return report
+
+        times = [tx.time for tx in trades]
+        ops = [tx.op for tx in trades]
+        amounts = [tx.amount for tx in trades]
+        signs = cls.SIGNS
+        positions = list(itertools.accumulate(signs[op] * amount for op, amount in zip(ops, amounts)))
+        report.launch_time = launch_ms / 1000 if launch_ms else times[0]
+
+        costs, realized = cls.replay(trades)
+        report.timeline = DevPositionTimeline(times, ops, amounts, positions, costs, realized)
+
+        for tx in trades:
+            if tx.op == "buy":
+                report.bought += tx.amount
+                report.buy_usd += tx.volume
+            elif tx.op == "sell":
+                report.sold += tx.amount
+                report.sell_usd += tx.volume
+            elif tx.op == "trans_in":
+                report.transferred_in += tx.amount
+            else:
+                report.transferred_out += tx.amount
+
+        report.position = positions[-1]
+        report.peak_position = max(max(positions), 0.0)
+        report.cost_basis_usd = costs[-1]
+        report.realized_usd = realized[-1]
+        last_price = next((tx.price for tx in reversed(trades) if tx.price), 0.0)
+        report.unrealized_usd = max(report.position, 0.0) * last_price - report.cost_basis_usd
+
+        first_sell = next((tx.time for tx in trades if tx.op == "sell"), None)
+        if first_sell is not None:
+            report.first_sell_after = first_sell - report.launch_time
+        if report.peak_position > 0:
+            peak_index = positions.index(max(positions))
+            threshold = report.peak_position * cls.EXIT_SHARE
+            exit_index = next((i for i in range(peak_index, len(positions)) if positions[i] < threshold), None)
+            if exit_index is not None:
+                report.exit_after = times[exit_index] - report.launch_time
+
+        report.sell_windows = cls.sell_windows(trades, report.peak_position)
+        report.transfers = cls.transfers(trades, positions, creator)
+        report.fresh_recipients = len({transfer.to for transfer in report.transfers if transfer.fresh})
+        return report
 
-class HeadlessBrowser:
+    @staticmethod
+    def replay(trades: List[DevTransaction]) -> Tuple[List[float], List[float]]:
+        """
+        移动平均成本：返回每笔之后的剩余成本和累计已实现盈亏
+
+        成本对应的持仓单独计算、不为负：之前的买入不在列表中时卖出量可能超过持仓，
+        超出部分没有成本，不能抵消之后买入的持仓
+        """
+        costs, realized = [], []
+        cost = pnl = held = 0.0
+        for tx in trades:
+            op = tx.op
+            if op == "buy":
+                cost += tx.volume
+                held += tx.amount
+            elif op == "trans_in":
+                cost += tx.price * tx.amount
+                held += tx.amount
+            elif held > 0:
+                # 卖出或转出按平均成本扣除，持仓不足时只扣除已有部分
+                share = min(tx.amount / held, 1.0)
+                released = cost * share
+                cost -= released
+                held -= held * share
+                if op == "sell":
+                    pnl += tx.volume - released
+            elif op == "sell":
+                pnl += tx.volume
+            costs.append(cost)
+            realized.append(pnl)
+        return costs, realized
+
+    @classmethod
+    def sell_windows(cls, trades: List[DevTransaction], peak_position: float) -> List[SellWindow]:
+        windows = []
+        current = None
+        for tx in trades:
+            if tx.op != "sell":
+                continue
+            if current is not None and tx.time - current.end <= cls.SELL_WINDOW:
+                current.end = tx.time
+                current.sells += 1
+                current.amount += tx.amount
+                current.volume_usd += tx.volume
+            else:
+                current = SellWindow(tx.time, tx.time, 1, tx.amount, tx.volume, 0.0)
+                windows.append(current)
+        if peak_position <= 0:
+            return []
+        for window in windows:
+            window.share = window.amount / peak_position
+        windows = [window for window in windows if window.share >= cls.MIN_WINDOW_SHARE]
+        windows.sort(key=lambda window: window.amount, reverse=True)
+        return windows[:cls.MAX_WINDOWS]
+
+    @staticmethod
+    def transfers(trades: List[DevTransaction], positions: List[float], creator: str) -> List[DevTransfer]:
+        """转出记录；接收地址在此之前从未与开发者交易过、也没有已知标签时视为新钱包"""
+        seen = {creator}
+        transfers = []
+        held = 0.0
+        for tx, position in zip(trades, positions):
+            if tx.op == "trans_out":
+                fresh = tx.to not in seen and not WalletLabelIndex.labels(tx.to)
+                transfers.append(DevTransfer(tx.time, tx.to, tx.amount, min(tx.amount / held, 1.0) if held > 0 else 0.0,
+                                             fresh))
+            seen.add(tx.from_)
+            seen.add(tx.to)
+            held = max(position, 0.0)
+        return transfers
+
+    @staticmethod
+    def format_summary(report: DevTradeReport) -> str:
+        """一行摘要，显示在开发者交易标签中"""
+        if not report.trades:
+            return ""
+        pnl = f"已实现盈亏 ${report.realized_usd:,.0f}"
+        if report.sol_usd:
+            pnl += f"（{report.realized_sol:,.2f} SOL）"
+        held = report.position / report.peak_position if report.peak_position > 0 else 0.0
+        parts = [pnl, f"剩余持仓 {held:.0%}"]
+        if report.first_sell_after is not None:
+            parts.append(f"发射后{TimeUtil.format_duration(report.first_sell_after)}首次卖出")
+        if report.fresh_recipients:
+            parts.append(f"转出至{report.fresh_recipients}个新钱包")
+        return "，".join(parts)
+
+    @classmethod
+    async def report_async(cls, mint: str) -> Dict[str, Any]:
+        """获取代币、开发者交易和聪明钱成交（用于SOL价格）并分析，返回不含时间线的报告"""
+        coin = await CoinDataFetcher.fetch_coin_data_async(mint)
+        if coin is None or not coin.creator:
+            return {"mint": mint, "error": "未找到代币信息"}
+        trade_data, smart_money = await AsyncFetchEngine.gather(
+            DevDataFetcher.fetch_dev_trades_async(mint), NodeService.fetch_chain_fm_data_async(mint))
+        if trade_data is None:
+            return {"mint": mint, "creator": coin.creator, "error": "开发者交易记录获取失败"}
+        sol_usd = SmartMoneyAnalyzer.sol_price(smart_money, mint) if smart_money else 0.0
+        report = await AsyncFetchEngine.to_thread(
+            cls.analyze, trade_data.transactions or [], coin.created_timestamp or 0, sol_usd, coin.creator)
+        record = msgspec.to_builtins(msgspec.structs.replace(report, timeline=None))
+        del record["timeline"]
+        return {"mint": mint, "creator": coin.creator, "position_clear": trade_data.position_clear,
+                "position_increase": trade_data.position_increase, "position_decrease": trade_data.position_decrease,
+                **record, "realized_sol": report.realized_sol}
+
+    @classmethod
+    def run_batch(cls, mints: List[str]) -> int:
+        """批量分析，每个代币输出一行JSON；返回失败的代币数"""
+        records = AsyncFetchEngine.run(AsyncFetchEngine.gather(*(cls.report_async(mint) for mint in mints)))
+        for record in records:
+            print(msgspec.json.encode(record).decode(), flush=True)
+        return sum("error" in record for record in records)
+
+# ---------------------------------------------------------------------------
+# 新币扫描
+# 后台持续翻页 pump.fun 的最新/最热列表，只把没见过的代币送去分析
+# ---------------------------------------------------------------------------
+
+class BloomFilter:
+    """布隆过滤器：判断为没见过的一定没见过，判断为见过的有 error_rate 的概率误判"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, item: str) -> Iterator[int]:
+        # 由一个128位摘要派生k个位置（Kirsch-Mitzenmacher）
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(item))
+
+class SeenMints:
+    """
+    已评估代币的去重集合
+
+    列表每次翻页大部分是刚见过的代币，先查最近见过的LRU（精确）；LRU淘汰的代币由布隆过滤器兜底，
+    内存固定，不随扫描时长增长。
+    """
+
+    RECENT_SIZE = 4096
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.recent: collections.OrderedDict = collections.OrderedDict()
+
+    def check_and_add(self, mint: str) -> bool:
+        """返回代币之前是否见过，并记为已见过"""
+        if mint in self.recent:
+            self.recent.move_to_end(mint)
+            return True
+        seen = mint in self.bloom
+        self.recent[mint] = None
+        if len(self.recent) > self.RECENT_SIZE:
+            self.recent.popitem(last=False)
+        if not seen:
+            self.bloom.add(mint)
+        return seen
+
+class LaunchCandidate(msgspec.Struct):
+    """扫描发现的新代币及分析结果"""
+    coin: PumpCoin
+    feed: str
+    discovered_at: float
+    reputation: Optional[DevReputation] = None
+    dev_trade_status: str = ""
+
+class LaunchScanner(QObject):
+    """
+    新币扫描器
+
+    在后台线程中以后台优先级运行：有交互查询时在发出下一个请求前让出。
+    每轮按 FEEDS 翻页，某一页全是见过的代币时不再往后翻；新代币依次获取开发者历史和开发者交易，
+    结果并入开发者信誉索引和价格序列后通过 discovered 信号交给界面。
+    """
+
+    discovered = Signal(object)  # LaunchCandidate
+    scanned = Signal(str)        # 每轮结束时的统计说明
+
+    FEEDS = {
+        "最新": "created_timestamp",
+        "最热": "last_trade_timestamp",
+    }
+    PAGE_SIZE = 50
+    MAX_PAGES = 4
+    SCAN_INTERVAL = 15.0  # 秒
+
+    def __init__(self, parent=None, analyze: bool = True):
+        super().__init__(parent)
+        self.analyze = analyze
+        self.seen = SeenMints()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="launch-scanner", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        with RequestScheduler.priority(Priority.BACKGROUND):
+            while not self._stop.is_set():
+                try:
+                    self.scan_once()
+                except Exception as e:
+                    print(f"新币扫描出错: {e}")
+                self._stop.wait(self.SCAN_INTERVAL)
+
+    def scan_once(self) -> List[LaunchCandidate]:
+        """扫描一轮，返回新发现的代币"""
+        found = []
+        pages = 0
+        for feed, sort in self.FEEDS.items():
+            for page in range(self.MAX_PAGES):
+                if self._stop.is_set():
+                    return found
+                RequestScheduler.checkpoint()
+                coins = CoinDataFetcher.fetch_listing(sort, page * self.PAGE_SIZE, self.PAGE_SIZE)
+                pages += 1
+                if not coins:
+                    break
+                fresh = [coin for coin in coins if not self.seen.check_and_add(coin.mint)]
+                Metrics.scanner_mints.inc(len(fresh), feed=feed, result="new")
+                Metrics.scanner_mints.inc(len(coins) - len(fresh), feed=feed, result="seen")
+                for coin in fresh:
+                    if self._stop.is_set():
+                        return found
+                    candidate = self.evaluate(coin, feed)
+                    found.append(candidate)
+                    self.discovered.emit(candidate)
+                if not fresh:  # 后面的页更旧，都已见过
+                    break
+        self.scanned.emit(f"{datetime.now().strftime('%H:%M:%S')} 扫描{pages}页，新代币{len(found)}个")
+        return found
+
+    def evaluate(self, coin: PumpCoin, feed: str) -> LaunchCandidate:
+        """分析新代币：开发者历史和开发者交易只更新开发者信誉索引，不占用用户查看的代币的价格序列和告警状态"""
+        candidate = LaunchCandidate(coin, feed, time.time())
+        if not self.analyze:
+            return candidate
+        if coin.creator:
+            RequestScheduler.checkpoint()
+            DevDataFetcher.fetch_dev_history(coin.creator, track=False)
+            candidate.reputation = DevReputationIndex.get(coin.creator)
+        RequestScheduler.checkpoint()
+        trade_data = DevDataFetcher.fetch_dev_trades(coin.mint, track=False)
+        if trade_data is not None:
+            candidate.dev_trade_status = DevDataFetcher.format_dev_trade_status(trade_data)
+            if coin.creator:
+                candidate.reputation = DevReputationIndex.get(coin.creator)
+        return candidate
+
+# ---------------------------------------------------------------------------
+# 告警规则
+# 规则编译为按指标索引的条件，数据到达时只重新计算引用了变化指标的规则
+# ---------------------------------------------------------------------------
+
+class AlertCondition(msgspec.Struct, frozen=True):
+    """一个条件：指标 比较符 阈值，累计类指标可指定时间窗口"""
+    metric: str
+    op: str = "!="
+    threshold: float = 0.0  # 默认条件为指标为真（非零）
+    window: Optional[int] = None  # 秒
+
+    @property
+    def key(self) -> str:
+        """事实表中的键，带窗口的累计指标每个窗口单独计算"""
+        return self.metric if self.window is None else f"{self.metric}@{self.window}"
+
+    def test(self, value: Any) -> bool:
+        return value is not None and AlertEngine.OPERATORS[self.op](value, self.threshold)
+
+class AlertRule(msgspec.Struct):
+    """告警规则，全部条件同时满足时触发"""
+    name: str
+    conditions: List[AlertCondition]
+    channels: List[str] = msgspec.field(default_factory=lambda: ["desktop"])
+    cooldown: float = 300.0  # 同一规则对同一代币的最短告警间隔（秒）
+    tokens: Optional[List[str]] = None  # 只对这些代币生效，None表示全部
+
+class Alert(msgspec.Struct):
+    rule: str
+    token: str
+    message: str
+    values: Dict[str, Any]
+    time: float
+    channels: List[str]
+
+class RollingSum:
+    """时间窗口内的累计值，事件可以乱序到达"""
+    __slots__ = ("window", "times", "values", "total")
+
+    def __init__(self, window: Optional[int]):
+        self.window = window
+        self.times: List[float] = []
+        self.values: List[float] = []
+        self.total = 0.0
+
+    def add(self, time_s: float, value: float, now: float):
+        if self.window is None:
+            # 无窗口的累计值从不过期，只保留总和
+            self.total += value
+            return
+        if time_s < now - self.window:
+            return
+        if not self.times or time_s >= self.times[-1]:
+            self.times.append(time_s)
+            self.values.append(value)
+        else:
+            i = bisect.bisect_right(self.times, time_s)
+            self.times.insert(i, time_s)
+            self.values.insert(i, value)
+        self.total += value
+
+    def value(self, now: float) -> float:
+        if self.window is not None:
+            cut = bisect.bisect_left(self.times, now - self.window)
+            if cut:
+                self.total -= sum(self.values[:cut])
+                del self.times[:cut]
+                del self.values[:cut]
+        return self.total
+
+class AlertEngine:
+    """
+    增量告警规则引擎
+
+    规则写法：指标 [比较符 阈值[%]] [in 窗口]，多个条件用 and 连接，例如：
+        dev.position_clear
+        smart_money.net_buy > 50 in 5m
+        top10 > 30%
+    没有比较符时表示指标为真。指标名的最后一段不重复时可以省略前缀。
+
+    各数据源取到数据后调用 update（状态类指标）或 add_events（累计类指标），只有引用了取值发生变化的指标的规则
+    才会针对该代币重新计算；规则从不满足变为满足时触发一次告警，之后在条件恢复前不再重复触发。
+    冷却时间内满足的规则暂不触发，由 tick 在冷却结束后补发；tick 同时让滑出时间窗口的事件退出累计值。
+    """
+
+    METRICS = {
+        "dev.position_clear": "开发者清仓",
+        "dev.position_increase": "开发者加仓",
+        "dev.position_decrease": "开发者减仓",
+        "dev.trans_out": "开发者转出",
+        "dev.score": "开发者信誉分",
+        "dev.serial_rugger": "连环割开发者",
+        "smart_money.net_buy": "聪明钱净买入(SOL)",
+        "smart_money.buy_volume": "聪明钱买入(SOL)",
+        "smart_money.sell_volume": "聪明钱卖出(SOL)",
+        "smart_money.buy_count": "聪明钱买入笔数",
+        "smart_money.sell_count": "聪明钱卖出笔数",
+        "gmgn.holders": "持有人数",
+        "gmgn.bluechip_ratio": "蓝筹持有人比例",
+        "gmgn.rat_trader_ratio": "老鼠仓比例",
+        "gmgn.top10": "Top 10持有比例",
+        "gmgn.smart_wallets": "聪明钱地址数",
+        "gmgn.sniper_wallets": "阻击地址数",
+        "gmgn.rat_trader_wallets": "老鼠仓地址数",
+        "gmgn.whale_wallets": "大户地址数",
+    }
+    # 由逐笔事件累计的指标，可以指定时间窗口
+    STREAMS = {"smart_money.net_buy", "smart_money.buy_volume", "smart_money.sell_volume",
+               "smart_money.buy_count", "smart_money.sell_count"}
+    OPERATORS = {
+        ">": operator.gt, ">=": operator.ge, "<": operator.lt,
+        "<=": operator.le, "==": operator.eq, "!=": operator.ne,
+    }
+    WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600}
+    CONDITION_RE = re.compile(r"^([\w.]+)(?:\s*(>=|<=|==|!=|>|<)\s*(-?\d+(?:\.\d+)?)\s*(%)?)?(?:\s+in\s+(\d+)\s*([smh]))?$",
+                              re.IGNORECASE)
+    SEEN_LIMIT = 200_000  # 每个代币保留的已计入事件数，超过后先淘汰滑出最大窗口的事件，仍超出时淘汰最早计入的
+    TICK_INTERVAL = 5.0   # tick 的调用间隔（秒）
+
+    webhook_url: Optional[str] = None
+    watch: List[str] = []
+    poll_interval = 60.0
+    _rules: List[AlertRule] = []
+    _by_name: Dict[str, AlertRule] = {}
+    _by_key: Dict[str, List[AlertRule]] = {}
+    _windows: Dict[str, set] = {}
+    _facts: Dict[str, Dict[str, Any]] = {}
+    _sums: Dict[Tuple[str, str, Optional[int]], RollingSum] = {}
+    _seen: Dict[str, Dict[int, float]] = {}  # 代币 -> {去重键: 事件时间(秒)}，按计入顺序排列
+    _state: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+    _pending: set = set()  # 冷却期间满足条件、等待冷却结束的 (规则名称, 代币)
+    _listeners: List[Any] = []
+    _lock = threading.Lock()
+    _webhook_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="alert-webhook")
+
+    @classmethod
+    def resolve_metric(cls, name: str) -> str:
+        if name in cls.METRICS:
+            return name
+        matches = [metric for metric in cls.METRICS if metric.rsplit(".", 1)[-1] == name]
+        if len(matches) != 1:
+            raise ValueError(f"未知的指标: {name}" if not matches else f"指标名不唯一: {name}（{'、'.join(matches)}）")
+        return matches[0]
+
+    @classmethod
+    def parse_condition(cls, text: str) -> AlertCondition:
+        match = cls.CONDITION_RE.match(text.strip())
+        if match is None:
+            raise ValueError(f"无法解析的条件: {text}")
+        name, op, threshold, percent, window, unit = match.groups()
+        metric = cls.resolve_metric(name)
+        if window is not None and metric not in cls.STREAMS:
+            raise ValueError(f"{metric} 不是累计类指标，不能指定时间窗口")
+        if op is None:
+            return AlertCondition(metric, window=int(window) * cls.WINDOW_UNITS[unit.lower()] if window else None)
+        value = float(threshold) / (100 if percent else 1)
+        return AlertCondition(metric, op, value,
+                              int(window) * cls.WINDOW_UNITS[unit.lower()] if window else None)
+
+    @classmethod
+    def compile(cls, spec: Dict[str, Any]) -> AlertRule:
+        """
+        编译一条规则
+
+        Args:
+            spec: {"name": 名称, "when": 条件, "notify": ["desktop", "webhook"], "cooldown": 秒, "tokens": [代币地址]}
+        """
+        when = spec["when"]
+        conditions = [cls.parse_condition(part) for part in re.split(r"\s+and\s+", when.strip(), flags=re.IGNORECASE)]
+        return AlertRule(spec.get("name") or when, conditions, list(spec.get("notify", ["desktop"])),
+                         float(spec.get("cooldown", 300.0)), spec.get("tokens"))
+
+    @classmethod
+    def set_rules(cls, rules: List[AlertRule]):
+        """
+        替换全部规则并重建索引
+
+        Raises:
+            ValueError: 规则名称重复（告警状态按规则名称保存）
+        """
+        by_name: Dict[str, AlertRule] = {}
+        by_key: Dict[str, List[AlertRule]] = {}
+        windows: Dict[str, set] = {}
+        for rule in rules:
+            if rule.name in by_name:
+                raise ValueError(f"告警规则名称重复: {rule.name}")
+            by_name[rule.name] = rule
+            for condition in rule.conditions:
+                by_key.setdefault(condition.key, []).append(rule)
+                if condition.metric in cls.STREAMS:
+                    windows.setdefault(condition.metric, set()).add(condition.window)
+        with cls._lock:
+            cls._rules = rules
+            cls._by_name = by_name
+            cls._by_key = by_key
+            cls._windows = windows
+            cls._state = {}
+            cls._pending = set()
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        读取规则文件
+
+        格式: {"webhook": URL, "watch": [代币地址], "poll_interval": 秒,
+               "rules": [{"name": ..., "when": ..., "notify": [...], "cooldown": ..., "tokens": [...]}]}
+        无法解析的规则和与前面规则同名的规则跳过，其余规则照常生效
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        rules = []
+        names = set()
+        for spec in config.get("rules", []):
+            try:
+                rule = cls.compile(spec)
+            except (KeyError, ValueError) as e:
+                print(f"告警规则无效 {spec}: {e}")
+                continue
+            if rule.name in names:
+                print(f"告警规则无效 {spec}: 名称重复 {rule.name}")
+                continue
+            names.add(rule.name)
+            rules.append(rule)
+        cls.webhook_url = config.get("webhook")
+        cls.watch = list(config.get("watch", []))
+        cls.poll_interval = float(config.get("poll_interval", cls.poll_interval))
+        cls.set_rules(rules)
+
+    @classmethod
+    def subscribe(cls, listener):
+        """注册告警回调，回调在产生数据的线程中调用"""
+        cls._listeners.append(listener)
+
+    @classmethod
+    def needs(cls, prefix: str) -> bool:
+        """是否有规则用到某类指标，轮询时跳过没有规则关心的数据源"""
+        return any(key.startswith(prefix) for key in cls._by_key)
+
+    @classmethod
+    def update(cls, token: str, facts: Dict[str, Any], create: bool = True):
+        """
+        更新代币的状态类指标
+
+        Args:
+            facts: 指标 -> 当前值，没有规则引用的指标直接忽略
+            create: 代币还没有任何指标时是否记录（开发者历史会带来大量无关代币，此时为False）
+        """
+        if not cls._by_key:
+            return
+        with cls._lock:
+            table = cls._facts.get(token)
+            if table is None:
+                if not create:
+                    return
+                table = cls._facts[token] = {}
+            changed = set()
+            for key, value in facts.items():
+                if key in cls._by_key and table.get(key) != value:
+                    table[key] = value
+                    changed.add(key)
+            alerts = cls.evaluate(token, changed)
+        cls.deliver(alerts)
+
+    @classmethod
+    def add_events(cls, token: str, events: Iterable[Tuple[int, float, Dict[str, float]]]):
+        """
+        计入累计类指标的逐笔事件
+
+        Args:
+            events: (去重键, 时间(秒), {指标: 值})，同一事件重复到达只计一次
+        """
+        if not cls._windows:
+            return
+        now = time.time()
+        with cls._lock:
+            horizon = cls.horizon()
+            seen = cls._seen.setdefault(token, {})
+            if len(seen) > cls.SEEN_LIMIT:
+                cls.evict_seen(seen, now, horizon)
+            touched = set()
+            for key, time_s, values in events:
+                if key in seen or (horizon is not None and time_s < now - horizon):
+                    continue
+                seen[key] = time_s
+                for metric, value in values.items():
+                    for window in cls._windows.get(metric, ()):
+                        rolling = cls._sums.get((token, metric, window))
+                        if rolling is None:
+                            rolling = cls._sums[(token, metric, window)] = RollingSum(window)
+                        rolling.add(time_s, value, now)
+                        touched.add((metric, window))
+            if not touched:
+                return
+            table = cls._facts.setdefault(token, {})
+            changed = set()
+            for metric, window in touched:
+                key = AlertCondition(metric, window=window).key
+                value = cls._sums[(token, metric, window)].value(now)
+                if table.get(key) != value:
+                    table[key] = value
+                    changed.add(key)
+            alerts = cls.evaluate(token, changed)
+        cls.deliver(alerts)
+
+    @classmethod
+    def horizon(cls) -> Optional[int]:
+        """所有规则中最大的时间窗口，存在不限窗口的累计指标时返回 None，调用方持有锁"""
+        windows = set().union(*cls._windows.values())
+        return None if None in windows else max(windows)
+
+    @classmethod
+    def evict_seen(cls, seen: Dict[int, float], now: float, horizon: Optional[int]):
+        """
+        淘汰去重表中的事件，调用方持有锁
+
+        滑出最大窗口的事件再次到达时会被 add_events 直接丢弃，可以安全淘汰；
+        仍超出上限（有不限窗口的指标或短时间内事件过多）时淘汰最早计入的事件。
+        """
+        if horizon is not None:
+            cutoff = now - horizon
+            for key in [key for key, time_s in seen.items() if time_s < cutoff]:
+                del seen[key]
+        excess = len(seen) - cls.SEEN_LIMIT
+        if excess > 0:
+            for key in list(itertools.islice(seen, excess)):
+                del seen[key]
+
+    @classmethod
+    def evaluate(cls, token: str, changed: set) -> List[Alert]:
+        """只计算引用了变化指标的规则，调用方持有锁"""
+        if not changed:
+            return []
+        rules = {id(rule): rule for key in changed for rule in cls._by_key.get(key, ())}
+        table = cls._facts[token]
+        now = time.time()
+        alerts = []
+        for rule in rules.values():
+            if rule.tokens is not None and token not in rule.tokens:
+                continue
+            values = {condition.key: table.get(condition.key) for condition in rule.conditions}
+            matched = all(condition.test(values[condition.key]) for condition in rule.conditions)
+            state_key = (rule.name, token)
+            active, fired_at = cls._state.get(state_key, (False, 0.0))
+            if not matched:
+                active = False
+                cls._pending.discard(state_key)
+            elif not active:
+                if now - fired_at >= rule.cooldown:
+                    active, fired_at = True, now
+                    cls._pending.discard(state_key)
+                    alerts.append(Alert(rule.name, token, cls.format_alert(rule, token, values), values, now,
+                                        rule.channels))
+                else:
+                    cls._pending.add(state_key)
+            cls._state[state_key] = (active, fired_at)
+        return alerts
+
+    @classmethod
+    def tick(cls, now: Optional[float] = None):
+        """重新计算时间窗口累计值和冷却中的规则，由定时器每 TICK_INTERVAL 秒调用一次"""
+        if not cls._rules:
+            return
+        now = time.time() if now is None else now
+        alerts = []
+        with cls._lock:
+            changed: Dict[str, set] = {}
+            for (token, metric, window), rolling in cls._sums.items():
+                if window is None:
+                    continue
+                key = AlertCondition(metric, window=window).key
+                value = rolling.value(now)
+                table = cls._facts.setdefault(token, {})
+                if table.get(key) != value:
+                    table[key] = value
+                    changed.setdefault(token, set()).add(key)
+            for name, token in list(cls._pending):
+                rule = cls._by_name.get(name)
+                if rule is not None and token in cls._facts:
+                    changed.setdefault(token, set()).update(condition.key for condition in rule.conditions)
+            for token, keys in changed.items():
+                alerts.extend(cls.evaluate(token, keys))
+        cls.deliver(alerts)
+
+    @classmethod
+    def format_alert(cls, rule: AlertRule, token: str, values: Dict[str, Any]) -> str:
+        parts = []
+        for condition in rule.conditions:
+            value = values[condition.key]
+            if isinstance(value, bool):
+                text = "是" if value else "否"
+            elif isinstance(value, float):
+                text = f"{value:.2%}" if condition.metric.endswith(("ratio", "top10")) else f"{value:,.2f}"
+            else:
+                text = f"{value:,}"
+            if not condition.window:
+                window = ""
+            elif condition.window % 60:
+                window = f"（{condition.window}秒）"
+            else:
+                window = f"（{condition.window // 60}分钟）"
+            parts.append(f"{cls.METRICS[condition.metric]}{window} {text}")
+        return f"{rule.name} - {DevTradeTableModel.format_address(token)}：{'，'.join(parts)}"
+
+    @classmethod
+    def deliver(cls, alerts: List[Alert]):
+        for alert in alerts:
+            for listener in cls._listeners:
+                try:
+                    listener(alert)
+                except Exception as e:
+                    print(f"告警回调出错: {e}")
+            if "webhook" in alert.channels and cls.webhook_url:
+                cls._webhook_executor.submit(cls.post_webhook, cls.webhook_url, alert)
+
+    @staticmethod
+    def post_webhook(url: str, alert: Alert):
+        with RequestScheduler.priority(Priority.BACKGROUND):
+            try:
+                HttpClient.post(url, json=msgspec.to_builtins(alert)).raise_for_status()
+            except requests.RequestException as e:
+                print(f"告警Webhook发送失败: {e}")
+
+    @staticmethod
+    def dev_facts(trade_data: DevTradeInfo, reputation: Optional[DevReputation]) -> Dict[str, Any]:
+        facts = {
+            "dev.position_clear": trade_data.position_clear,
+            "dev.position_increase": trade_data.position_increase,
+            "dev.position_decrease": trade_data.position_decrease,
+            "dev.trans_out": trade_data.trans_out_amount > 0,
+        }
+        if reputation is not None:
+            facts.update(AlertEngine.reputation_facts(reputation))
+        return facts
+
+    @staticmethod
+    def reputation_facts(reputation: DevReputation) -> Dict[str, Any]:
+        return {"dev.score": reputation.score, "dev.serial_rugger": reputation.serial_rugger}
+
+    @classmethod
+    def smart_money_events(cls, data: ChainFmTransactionList, contract: str) -> List[Tuple[int, float, Dict[str, float]]]:
+        """带标签地址的成交，没有规则用到聪明钱指标时不展开"""
+        if not cls._windows:
+            return []
+        events = []
+        for key, block_time, is_buy, order, label in SmartMoneyAnalyzer.swaps(data, contract):
+            if label is None:
+                continue
+            volume = order.volume_native
+            if is_buy:
+                values = {"smart_money.net_buy": volume, "smart_money.buy_volume": volume, "smart_money.buy_count": 1}
+            else:
+                values = {"smart_money.net_buy": -volume, "smart_money.sell_volume": volume, "smart_money.sell_count": 1}
+            events.append((key, block_time, values))
+        return events
+
+    @staticmethod
+    def gmgn_facts(results: Dict[str, Tuple[Optional[Any], str]]) -> Dict[str, Any]:
+        facts = {}
+        holder = results.get("holder", (None, ""))[0]
+        if holder is not None:
+            facts.update({
+                "gmgn.holders": holder.holder_count,
+                "gmgn.bluechip_ratio": holder.bluechip_owner_percentage,
+                "gmgn.rat_trader_ratio": holder.top_rat_trader_percentage,
+            })
+        tags = results.get("wallet_tags", (None, ""))[0]
+        if tags is not None:
+            facts.update({
+                "gmgn.smart_wallets": tags.smart_wallets,
+                "gmgn.sniper_wallets": tags.sniper_wallets,
+                "gmgn.rat_trader_wallets": tags.rat_trader_wallets,
+                "gmgn.whale_wallets": tags.whale_wallets,
+            })
+        top_holders = results.get("top_holders", (None, ""))[0]
+        if top_holders is not None:
+            facts["gmgn.top10"] = top_holders.security.top_10_holder_rate
+        return facts
+
+class AlertPoller:
+    """按规则文件中的关注列表在后台轮询代币，只请求有规则关心的数据源"""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="alert-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        with RequestScheduler.priority(Priority.BACKGROUND):
+            while not self._stop.is_set():
+                try:
+                    self.poll_once()
+                except Exception as e:
+                    print(f"告警轮询出错: {e}")
+                self._stop.wait(AlertEngine.poll_interval)
+
+    def poll_once(self):
+        """各数据源的取数函数会把结果交给 AlertEngine，这里只负责发起请求"""
+        for token in list(AlertEngine.watch):
+            if self._stop.is_set():
+                return
+            if AlertEngine.needs("dev."):
+                RequestScheduler.checkpoint()
+                DevDataFetcher.fetch_dev_trades(token)
+            if AlertEngine.needs("smart_money."):
+                RequestScheduler.checkpoint()
+                NodeService.fetch_chain_fm_data(token)
+            if AlertEngine.needs("gmgn."):
+                RequestScheduler.checkpoint()
+                AsyncFetchEngine.run(NodeService.fetch_gmgn_data_async(token))
+
+# ---------------------------------------------------------------------------
+# 数据导出
+# 把采集到的数据写成按日期和代币分区的列式数据集，供 pandas/DuckDB 直接读取
+# ---------------------------------------------------------------------------
+
+class ExportDataset(msgspec.Struct, frozen=True):
+    """导出数据集：列名和列类型，by_mint 为True时按代币分区（代币地址只出现在分区目录中）"""
+    name: str
+    columns: Tuple[Tuple[str, str], ...]
+    by_mint: bool = True
+
+class ColumnarExporter:
+    """
+    列式数据导出
+
+    目录结构为 {根目录}/{数据集}/date=YYYY-MM-DD/mint={代币地址}/part-{运行编号}-{序号}.parquet（Hive分区，
+    日期为采集日期），可用 pyarrow.dataset 或 DuckDB 的 read_parquet(..., hive_partitioning=true) 读取整个目录。
+
+    各数据源取到数据后调用 export_* 提交到导出线程，不阻塞取数；行按分区缓冲，攒够一个行组或超过刷新间隔时写出。
+    每次运行写新的分区文件，不改写已有文件，追加即增加文件；文件在关闭写入器（退出或写入器数超过上限）时写完页脚。
+    逐笔成交在同一次运行中按交易去重，快照类数据（开发者历史、GMGN统计、推文）每次采集都写一份。
+    需要安装pyarrow，未安装时导出不启用。
+    """
+
+    TIMESTAMP_MS = "timestamp[ms]"
+    DATASETS = {
+        dataset.name: dataset for dataset in (
+            ExportDataset("dev_trades", (
+                ("captured_at", TIMESTAMP_MS), ("tx_hash", "string"), ("op", "string"), ("from", "string"),
+                ("to", "string"), ("price", "float64"), ("volume", "float64"), ("amount", "float64"),
+                ("time", "timestamp[s]"),
+            )),
+            ExportDataset("smart_money", (
+                ("captured_at", TIMESTAMP_MS), ("signature", "string"), ("event_index", "int32"),
+                ("block_time", "timestamp[s]"), ("wallet", "string"), ("side", "string"),
+                ("volume_native", "float64"), ("volume_usd", "float64"), ("price_usd", "float64"), ("label", "string"),
+            )),
+            ExportDataset("dev_histories", (
+                ("captured_at", TIMESTAMP_MS), ("creator", "string"), ("mint", "string"), ("name", "string"),
+                ("symbol", "string"), ("created_at", TIMESTAMP_MS), ("complete", "bool"), ("usd_market_cap", "float64"),
+            ), by_mint=False),
+            ExportDataset("gmgn_stats", (
+                ("captured_at", TIMESTAMP_MS), ("holder_count", "int64"), ("bluechip_owner_count", "int64"),
+                ("bluechip_owner_percentage", "float64"), ("top_rat_trader_percentage", "float64"),
+                ("smart_wallets", "int64"), ("fresh_wallets", "int64"), ("renowned_wallets", "int64"),
+                ("sniper_wallets", "int64"), ("rat_trader_wallets", "int64"), ("whale_wallets", "int64"),
+                ("top_wallets", "int64"), ("following_wallets", "int64"), ("top_10_holder_rate", "float64"),
+                ("burn_status", "string"),
+            )),
+            ExportDataset("tweets", (
+                ("captured_at", TIMESTAMP_MS), ("category", "string"), ("tweet_id", "string"),
+                ("screen_name", "string"), ("name", "string"), ("is_blue_verified", "bool"), ("text", "string"),
+                ("views", "int64"), ("favorite_count", "int64"), ("retweet_count", "int64"),
+            )),
+        )
+    }
+    FORMATS = ("parquet", "arrow")
+    ROW_GROUP_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 300.0          # 秒，不足一个行组的缓冲最长保留时间
+    MAX_BUFFERED_ROWS = 1_000_000   # 全部分区缓冲行数上限，超过时全部写出
+    MAX_OPEN_WRITERS = 64           # 同时打开的分区文件数，超过时关闭最久未写入的文件
+    SEEN_LIMIT = 200_000            # 每个代币每个数据集保留的已导出交易数，超过后清空
+
+    root: Optional[str] = None
+    format = "parquet"
+    run_id = ""
+    _pa = None
+    _schemas: Dict[str, Any] = {}
+    _buffers: Dict[Tuple[str, str, str], Dict[str, list]] = {}
+    _buffered = 0
+    _writers: "collections.OrderedDict[Tuple[str, str, str], Any]" = collections.OrderedDict()
+    _seen: Dict[Tuple[str, str], set] = {}
+    _sequence = 0
+    _flushed_at = 0.0
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @classmethod
+    def open(cls, root: str, file_format: str = "parquet") -> bool:
+        """启用导出，未安装pyarrow时返回False"""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            import pyarrow.ipc
+        except ImportError:
+            print("未安装pyarrow，数据导出未启用")
+            return False
+        cls._pa = pyarrow
+        cls.root = root
+        cls.format = file_format
+        cls.run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        cls._flushed_at = time.monotonic()
+        cls._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        return True
+
+    @classmethod
+    def close(cls):
+        """写出全部缓冲并关闭分区文件"""
+        if cls._executor is None:
+            return
+        executor, cls._executor = cls._executor, None
+        executor.submit(cls.close_writers)
+        executor.shutdown(wait=True)
+
+    @classmethod
+    def submit(cls, dataset: str, mint: str, build, *args):
+        """在导出线程中转换为列并缓冲，调用方只保留解码结果的引用"""
+        executor = cls._executor
+        if executor is not None:
+            executor.submit(cls.append, dataset, mint, build, *args)
+
+    @classmethod
+    def export_dev_trades(cls, mint: str, transactions: List[DevTransaction]):
+        cls.submit("dev_trades", mint, cls.dev_trade_columns, mint, transactions)
+
+    @classmethod
+    def export_smart_money(cls, mint: str, data: ChainFmTransactionList):
+        cls.submit("smart_money", mint, cls.smart_money_columns, mint, data)
+
+    @classmethod
+    def export_dev_history(cls, creator: str, coins: List[PumpCoin]):
+        cls.submit("dev_histories", "", cls.dev_history_columns, creator, coins)
+
+    @classmethod
+    def export_gmgn(cls, mint: str, results: Dict[str, Tuple[Optional[Any], str]]):
+        cls.submit("gmgn_stats", mint, cls.gmgn_columns, results)
+
+    @classmethod
+    def export_tweets(cls, mint: str, category: str, tweets: List[PumpNewsTweet]):
+        cls.submit("tweets", mint, cls.tweet_columns, category, tweets)
+
+    @classmethod
+    def unseen(cls, dataset: str, mint: str, key) -> bool:
+        seen = cls._seen.setdefault((dataset, mint), set())
+        if key in seen:
+            return False
+        if len(seen) >= cls.SEEN_LIMIT:
+            seen.clear()
+        seen.add(key)
+        return True
+
+    @classmethod
+    def dev_trade_columns(cls, mint: str, transactions: List[DevTransaction]) -> Dict[str, list]:
+        # 同一笔交易可能有多条记录（如买入加转出），部分记录没有哈希，按 (哈希, 类型, 时间) 去重
+        rows = [tx for tx in transactions if cls.unseen("dev_trades", mint, (tx.tx_hash, tx.op, tx.time))]
+        return {
+            "tx_hash": [tx.tx_hash for tx in rows],
+            "op": [tx.op for tx in rows],
+            "from": [tx.from_ for tx in rows],
+            "to": [tx.to for tx in rows],
+            "price": [tx.price for tx in rows],
+            "volume": [tx.volume for tx in rows],
+            "amount": [tx.amount for tx in rows],
+            "time": [int(tx.time) for tx in rows],
+        }
+
+    @classmethod
+    def smart_money_columns(cls, mint: str, data: ChainFmTransactionList) -> Dict[str, list]:
+        columns = {name: [] for name, _ in cls.DATASETS["smart_money"].columns[1:]}
+        labels_map = data.address_labels
+        primary_label = WalletLabelIndex.primary_label
+        for tx in data.parsedTransactions:
+            for event in tx.events:
+                event_data = event.data
+                is_buy = event_data.output.token == mint
+                if not is_buy and event_data.input.token != mint:
+                    continue
+                if not cls.unseen("smart_money", mint, (tx.signature, event.index)):
+                    continue
+                labels = labels_map.get(event.address)
+                order = event_data.order
+                columns["signature"].append(tx.signature)
+                columns["event_index"].append(event.index)
+                columns["block_time"].append(tx.block_time)
+                columns["wallet"].append(event.address)
+                columns["side"].append("buy" if is_buy else "sell")
+                columns["volume_native"].append(order.volume_native)
+                columns["volume_usd"].append(order.volume_usd)
+                columns["price_usd"].append(order.price_usd)
+                columns["label"].append(labels[0].label if labels else primary_label(event.address))
+        return columns
+
+    @staticmethod
+    def dev_history_columns(creator: str, coins: List[PumpCoin]) -> Dict[str, list]:
+        return {
+            "creator": [creator] * len(coins),
+            "mint": [coin.mint for coin in coins],
+            "name": [coin.name for coin in coins],
+            "symbol": [coin.symbol for coin in coins],
+            "created_at": [coin.created_timestamp for coin in coins],
+            "complete": [coin.complete for coin in coins],
+            "usd_market_cap": [coin.usd_market_cap for coin in coins],
+        }
+
+    @classmethod
+    def gmgn_columns(cls, results: Dict[str, Tuple[Optional[Any], str]]) -> Dict[str, list]:
+        """一行快照，失败的接口对应的列为空"""
+        holder = results.get("holder", (None, ""))[0]
+        tags = results.get("wallet_tags", (None, ""))[0]
+        top_holders = results.get("top_holders", (None, ""))[0]
+        if holder is None and tags is None and top_holders is None:
+            return {}
+        columns = {name: [None] for name, _ in cls.DATASETS["gmgn_stats"].columns[1:]}
+        for record in (holder, tags, top_holders.security if top_holders is not None else None):
+            if record is not None:
+                for field in record.__struct_fields__:
+                    if field in columns:
+                        columns[field] = [getattr(record, field)]
+        return columns
+
+    @staticmethod
+    def tweet_columns(category: str, tweets: List[PumpNewsTweet]) -> Dict[str, list]:
+        return {
+            "category": [category] * len(tweets),
+            "tweet_id": [None if tweet.tweet_id is None else str(tweet.tweet_id) for tweet in tweets],
+            "screen_name": [tweet.user.screen_name for tweet in tweets],
+            "name": [tweet.user.name for tweet in tweets],
+            "is_blue_verified": [tweet.user.is_blue_verified for tweet in tweets],
+            "text": [tweet.text for tweet in tweets],
+            "views": [tweet.views for tweet in tweets],
+            "favorite_count": [tweet.favorite_count for tweet in tweets],
+            "retweet_count": [tweet.retweet_count for tweet in tweets],
+        }
+
+    @classmethod
+    def append(cls, name: str, mint: str, build, *args):
+        """导出线程：转换并缓冲一批行，攒够行组的分区立即写出"""
+        try:
+            columns = build(*args)
+            rows = len(next(iter(columns.values()), ()))
+            if rows:
+                now = datetime.now()
+                key = (name, now.strftime("%Y-%m-%d"), mint)
+                buffer = cls._buffers.get(key)
+                if buffer is None:
+                    buffer = cls._buffers[key] = {column: [] for column, _ in cls.DATASETS[name].columns}
+                buffer["captured_at"].extend([int(now.timestamp() * 1000)] * rows)
+                for column, values in columns.items():
+                    buffer[column].extend(values)
+                cls._buffered += rows
+                if len(buffer["captured_at"]) >= cls.ROW_GROUP_SIZE:
+                    cls.write(key)
+            if cls._buffered >= cls.MAX_BUFFERED_ROWS or time.monotonic() - cls._flushed_at >= cls.FLUSH_INTERVAL:
+                cls.flush()
+        except Exception as e:
+            print(f"导出{name}失败: {e}")
+
+    @classmethod
+    def flush(cls):
+        for key in list(cls._buffers):
+            cls.write(key)
+        cls._flushed_at = time.monotonic()
+
+    @classmethod
+    def write(cls, key: Tuple[str, str, str]):
+        """把一个分区的缓冲写成一个行组"""
+        buffer = cls._buffers.pop(key)
+        rows = len(buffer["captured_at"])
+        cls._buffered -= rows
+        table = cls._pa.Table.from_pydict(buffer, schema=cls.schema(key[0]))
+        cls.writer(key).write_table(table)
+
+    @classmethod
+    def schema(cls, name: str):
+        schema = cls._schemas.get(name)
+        if schema is None:
+            pa = cls._pa
+            schema = cls._schemas[name] = pa.schema(
+                [pa.field(column, pa.type_for_alias(type_name)) for column, type_name in cls.DATASETS[name].columns])
+        return schema
+
+    @classmethod
+    def writer(cls, key: Tuple[str, str, str]):
+        writer = cls._writers.get(key)
+        if writer is not None:
+            cls._writers.move_to_end(key)
+            return writer
+        if len(cls._writers) >= cls.MAX_OPEN_WRITERS:
+            cls._writers.popitem(last=False)[1].close()
+
+        name, date, mint = key
+        directory = os.path.join(cls.root, name, f"date={date}")
+        if cls.DATASETS[name].by_mint:
+            directory = os.path.join(directory, f"mint={mint}")
+        os.makedirs(directory, exist_ok=True)
+        cls._sequence += 1
+        path = os.path.join(directory, f"part-{cls.run_id}-{cls._sequence}.{cls.format}")
+        schema = cls.schema(name)
+        if cls.format == "parquet":
+            writer = cls._pa.parquet.ParquetWriter(path, schema, compression="zstd")
+        else:
+            writer = cls._pa.ipc.new_file(path, schema, options=cls._pa.ipc.IpcWriteOptions(compression="zstd"))
+        cls._writers[key] = writer
+        return writer
+
+    @classmethod
+    def close_writers(cls):
+        try:
+            cls.flush()
+        except Exception as e:
+            print(f"导出失败: {e}")
+        while cls._writers:
+            _, writer = cls._writers.popitem(last=False)
+            try:
+                writer.close()
+            except Exception as e:
+                print(f"关闭导出文件失败: {e}")
+
+# ---------------------------------------------------------------------------
+# 富文本渲染
+# ---------------------------------------------------------------------------
+
+class RichTextTemplate:
+    """预编译的HTML模板，构造时把格式串拆成字面量和字段，渲染时只做拼接"""
+
+    _formatter = string.Formatter()
+
+    def __init__(self, name: str, source: str):
+        self.name = name
+        # 多行模板去掉源码缩进带来的空白，Qt解析时会忽略它们
+        if "\n" in source:
+            source = " ".join(line.strip() for line in source.strip().splitlines())
+        self.parts = [(literal, field, spec or "")
+                      for literal, field, spec, _ in self._formatter.parse(source)]
+        self.fields = tuple(field for _, field, _ in self.parts if field)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        chunks = []
+        for literal, field, spec in self.parts:
+            chunks.append(literal)
+            if field:
+                chunks.append(format(values[field], spec))
+        return "".join(chunks)
+
+class RichText:
+    """
+    标签和列表项共用的富文本渲染层
+
+    所有模板共用一份样式表：QTextDocument 通过 setDefaultStyleSheet 设置，QLabel 无法访问内部文档，
+    只能在文本前附加同一份 <style>。渲染结果按 (模板, 值) 缓存，解析后的 QTextDocument 同样按键缓存，
+    值不变的刷新不再重新拼接和解析HTML
+    """
+
+    STYLESHEET = """
+        a { color: #3498db; text-decoration: none; }
+        .log-time { color: #666; }
+        .log-op { color: #000000; }
+        .log-link { color: #2196F3; }
+        .log-ok { color: #4CAF50; }
+        .log-error { color: #F44336; font-weight: bold; }
+        .log-info { color: #000000; }
+        .dev-label { color: #000; font-weight: bold; }
+        .dev-address { color: #3498db; }
+        .copy-icon { font-size: 0.5em; color: #666; }
+        .buy { color: #4CAF50; }
+        .sell { color: #F44336; }
+        .container { font-family: Arial, sans-serif; padding: 10px; }
+        .title { color: #1976D2; font-size: 14px; font-weight: bold; margin-bottom: 5px; }
+        .label { color: #666; }
+        .value { color: #2196F3; font-weight: bold; }
+    """
+    STYLESHEET = " ".join(line.strip() for line in STYLESHEET.strip().splitlines())
+    STYLE_BLOCK = f"<style>{STYLESHEET}</style>"
+
+    TEMPLATES = {template.name: template for template in [
+        RichTextTemplate("log", """
+            <div style='margin: 2px 0;'>
+                <span class='log-time'>[{time}]</span>
+                <span class='log-op'>▶ {operation}</span>{link}{status}
+            </div>
+        """),
+        RichTextTemplate("log_link", " <a href='{link}' class='log-link'>[链接]</a>"),
+        RichTextTemplate("log_status", " <span class='log-{level}'>→ {status}</span>"),
+        RichTextTemplate("dev_info", """
+            <span class='dev-label'>DEV信息：</span>
+            <a href='https://gmgn.ai/sol/address/{creator}' class='dev-address'>{creator}</a>
+            <span class='copy-icon'> 📋</span>
+        """),
+        RichTextTemplate("smart_money_summary", """
+            <span>聪明钱：</span>
+            <span class='buy'>买{buy_count}人 {buy_volume}SOL</span>，
+            <span class='sell'>卖{sell_count}人 {sell_volume}SOL</span>，
+            <span class='{net_class}'>净{net_side} {net_volume}SOL</span>
+        """),
+        RichTextTemplate("gmgn_holder", """
+            <div class="container">
+                <div class="title">持有者统计：</div>
+                <span class="label">Holder：</span> <span class="value">{holder_count:,}</span>
+                <span class="label">蓝筹持有人：</span> <span class="value">{bluechip_owner_count:,}</span>
+                <span class="label">蓝筹比例：</span> <span class="value">{bluechip_owner_percentage:.2%}</span>
+                <span class="label">老鼠仓比例：</span> <span class="value">{top_rat_trader_percentage:.2%}</span>
+            </div>
+        """),
+        RichTextTemplate("gmgn_wallet_tags", """
+            <div class="container">
+                <div class="title">地址分类：</div>
+                <span class="label">聪明钱：</span> <span class="value">{smart_wallets:,}</span>
+                <span class="label">新地址：</span> <span class="value">{fresh_wallets:,}</span>
+                <span class="label">Renowned：</span> <span class="value">{renowned_wallets:,}</span>
+                <span class="label">阻击地址：</span> <span class="value">{sniper_wallets:,}</span>
+                <span class="label">老鼠仓地址：</span> <span class="value">{rat_trader_wallets:,}</span>
+                <span class="label">大户地址：</span> <span class="value">{whale_wallets:,}</span>
+                <span class="label">Top Wallet：</span> <span class="value">{top_wallets:,}</span>
+                <span class="label">关注地址：</span> <span class="value">{following_wallets:,}</span>
+            </div>
+        """),
+        RichTextTemplate("gmgn_top_holders", """
+            <div class="container">
+                <div class="title">Top 10持有者：</div>
+                <span class="label">Top 10比例：</span> <span class="value">{top_10_holder_rate:.2%}</span>
+                <span class="label">燃烧状态：</span> <span class="value">{burn_status}</span>
+            </div>
+        """),
+    ]}
+
+    HTML_CACHE_SIZE = 512
+    DOCUMENT_CACHE_SIZE = 256
+    _html: collections.OrderedDict = collections.OrderedDict()
+    _documents: collections.OrderedDict = collections.OrderedDict()
+
+    @classmethod
+    def html(cls, template: str, **values) -> str:
+        """按模板渲染HTML片段，相同的 (模板, 值) 直接返回缓存的字符串"""
+        key = (template, tuple(values.items()))
+        text = cls._html.get(key)
+        if text is not None:
+            cls._html.move_to_end(key)
+            Metrics.record_cache("render", True)
+            return text
+
+        text = cls.TEMPLATES[template].render(values)
+        Metrics.record_cache("render", False)
+        cls._html[key] = text
+        if len(cls._html) > cls.HTML_CACHE_SIZE:
+            cls._html.popitem(last=False)
+        return text
+
+    @classmethod
+    def set_label(cls, label: QLabel, template: str, **values):
+        """更新标签，内容与当前显示的相同时跳过setText，避免QLabel重新解析HTML和样式"""
+        text = cls.STYLE_BLOCK + cls.html(template, **values)
+        if label.text() != text:
+            label.setText(text)
+
+    @classmethod
+    def parsed(cls, html: str) -> QTextDocument:
+        """获取一段已渲染HTML的解析结果，供列表代理在paint和sizeHint中复用"""
+        return cls.cached_document(("", html), lambda: html)
+
+    @classmethod
+    def cached_document(cls, key: Any, render) -> QTextDocument:
+        doc = cls._documents.get(key)
+        if doc is not None:
+            cls._documents.move_to_end(key)
+            Metrics.record_cache("document", True)
+            return doc
+
+        doc = QTextDocument()
+        doc.setDefaultStyleSheet(cls.STYLESHEET)
+        doc.setHtml(render())
+        Metrics.record_cache("document", False)
+        cls._documents[key] = doc
+        if len(cls._documents) > cls.DOCUMENT_CACHE_SIZE:
+            cls._documents.popitem(last=False)
+        return doc
+
+class HTMLDelegate(QStyledItemDelegate):
+    """HTML格式的列表项代理，解析后的文档按文本缓存，重绘和滚动时不再重复解析"""
+    def paint(self, painter, option, index):
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+
+        style = options.widget.style() if options.widget else QApplication.style()
+
+        doc = RichText.parsed(options.text)
+
+        options.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, options, painter)
+
+        ctx = QAbstractTextDocumentLayout.PaintContext()
+
+        textRect = style.subElementRect(QStyle.SE_ItemViewItemText, options)
+        painter.save()
+        painter.translate(textRect.topLeft())
+        doc.documentLayout().draw(painter, ctx)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        options = QStyleOptionViewItem(option)
+        self.initStyleOption(options, index)
+
+        doc = RichText.parsed(options.text)
+        return QSize(doc.idealWidth(), doc.size().height())
+
+class HeadlessBrowser:
     """无头浏览器工具类，用于处理需要浏览器环境的API请求"""
 
     @staticmethod
@@ -656,7 +5279,6 @@ class HeadlessBrowser:
             Optional[Dict]: API返回的数据或None（如果获取失败）
         """
         try:
-            import asyncio
             from pyppeteer import launch
 
             # 启动浏览器，这里设置为非无头模式以便调试
@@ -710,12 +5332,8 @@ class HeadlessBrowser:
             Optional[Dict]: API返回的数据或None（如果获取失败）
         """
         try:
-            import asyncio
-            if sys.platform == 'win32':
-                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(HeadlessBrowser.fetch_with_puppeteer(url))
+            # 与其余异步请求共用事件循环
+            return AsyncFetchEngine.run(HeadlessBrowser.fetch_with_puppeteer(url))
 
         except Exception as e:
             print(f"获取API数据失败: {str(e)}")
@@ -725,103 +5343,1193 @@ class NodeService:
     """Node.js服务交互类"""
 
     BASE_URL = "http://localhost:3000"
+    CHAIN_FM_URL = "https://chain.fm/api/trpc/parsedTransaction.list"
+
+    # GMGN接口，经Node.js服务转发
+    GMGN_PARAMS = {
+        "device_id": "520cc162-92cd-4ee6-9add-25e40e359805",
+        "client_id": "gmgn_web_2025.0128.214338",
+        "from_app": "gmgn",
+        "app_ver": "2025.0128.214338",
+        "tz_name": "Asia/Shanghai",
+        "tz_offset": "28800",
+        "app_lang": "en"
+    }
+    GMGN_URLS = {
+        "holder": "https://gmgn.ai/api/v1/token_stat/sol/{}",
+        "wallet_tags": "https://gmgn.ai/api/v1/token_wallet_tags_stat/sol/{}",
+        "top_holders": "https://gmgn.ai/api/v1/mutil_window_token_security_launchpad/sol/{}"
+    }
 
     @staticmethod
-    def fetch_chain_fm_data(contract_address: str) -> Optional[Dict]:
+    @Metrics.instrument("chain_fm_transactions")
+    def fetch_chain_fm_data(contract_address: str, on_rows=None, page: int = 1,
+                            page_size: Optional[int] = None, track: bool = True) -> Optional[ChainFmTransactionList]:
         """
         从本地Node.js服务获取Chain.fm数据
 
         Args:
             contract_address: 代币合约地址
+            on_rows: 交易边接收边解码，每解码一批调用一次
+            page: 页码，从1开始
+            page_size: 每页交易数，默认为分页块大小
+            track: 为False时只合并地址标签，不写入价格序列和告警引擎、不导出（预取使用）
+
+        Returns:
+            Optional[ChainFmTransactionList]: 交易列表及地址标签或None（如果获取失败）
+        """
+        try:
+            response = HttpClient.open_stream("POST", NodeService.BASE_URL,
+                                              json=NodeService.chain_fm_request(contract_address, page, page_size))
+            result = PayloadDecoder.decode_stream(
+                "chain_fm_transactions", response, "parsedTransactions", ChainFmTransaction,
+                lambda result: result.response.data[0].result.data.json.data.parsedTransactions, on_rows)
+            data = NodeService.parse_chain_fm_data(result)
+            return NodeService.index_chain_fm_data(contract_address, data) if track else data
+
+        except Exception as e:
+            print(f"从Node.js服务获取数据失败: {str(e)}")
+            return None
+
+    @staticmethod
+    @Metrics.instrument("chain_fm_transactions")
+    async def fetch_chain_fm_data_async(contract_address: str, page: int = 1, page_size: Optional[int] = None,
+                                        track: bool = True) -> Optional[ChainFmTransactionList]:
+        """fetch_chain_fm_data 的异步版本（一次性解码，不逐批回调），track 含义相同"""
+        try:
+            response = await AsyncHttpClient.post(NodeService.BASE_URL,
+                                                  json=NodeService.chain_fm_request(contract_address, page, page_size))
+            response.raise_for_status()
+            data = NodeService.parse_chain_fm_data(PayloadDecoder.decode_response("chain_fm_transactions", response))
+            return NodeService.index_chain_fm_data(contract_address, data) if track else data
+        except Exception as e:
+            print(f"从Node.js服务获取数据失败: {str(e)}")
+            return None
+
+    @staticmethod
+    def chain_fm_request(contract_address: str, page: int, page_size: Optional[int]) -> Dict[str, Any]:
+        """构建转发给Node.js服务的chain.fm请求"""
+        # 构建batch请求格式
+        batch_input = {
+            "0": {
+                "json": {
+                    "page": page,
+                    "pageSize": page_size or PagedSource.DEFAULT_BLOCK_SIZE,
+                    "dateRange": None,
+                    "token": contract_address,
+                    "address": [],
+                    "useFollowing": True,
+                    "includeChannels": [],
+                    "lastUpdateTime": None,
+                    "events": []
+                },
+                "meta": {
+                    "values": {
+                        "dateRange": ["undefined"],
+                        "lastUpdateTime": ["undefined"]
+                    }
+                }
+            }
+        }
+
+        # 构建完整的URL
+        return {
+            "url": f"{NodeService.CHAIN_FM_URL}?batch=1&input={json.dumps(batch_input)}",
+            "dataType": "chain_fm_transactions"
+        }
+
+    @staticmethod
+    def index_chain_fm_data(contract_address: str,
+                            data: Optional[ChainFmTransactionList]) -> Optional[ChainFmTransactionList]:
+        """把chain.fm成交并入代币的价格序列和告警引擎，并导出"""
+        if data is not None and data.parsedTransactions:
+            TimeSeriesStore.series(contract_address).add_chain_fm(data)
+            ColumnarExporter.export_smart_money(contract_address, data)
+            AlertEngine.add_events(contract_address, AlertEngine.smart_money_events(data, contract_address))
+        return data
+
+    @staticmethod
+    def parse_chain_fm_data(result: ProxyResponse) -> Optional[ChainFmTransactionList]:
+        Metrics.record_upstream("chain_fm_transactions", result)
+        if result.success and result.response is not None:
+            data = result.response.data
+            if not data:
+                return None
+            transactions = data[0].result.data.json.data
+            WalletLabelIndex.merge_chain_fm(transactions.address_labels)
+            return transactions
+        print(f"获取数据失败: {result.error}")
+        return None
+
+    @staticmethod
+    async def fetch_gmgn_data_async(contract_address: str) -> Dict[str, Tuple[Optional[Any], str]]:
+        """
+        并发获取全部GMGN接口
+
+        Returns:
+            Dict[str, Tuple[Optional[Any], str]]: 接口名称 -> (数据或None, 结果说明)
+        """
+        names = list(NodeService.GMGN_URLS)
+        results = dict(zip(names, await asyncio.gather(*(NodeService.fetch_gmgn_endpoint_async(name, contract_address)
+                                                         for name in names))))
+        AlertEngine.update(contract_address, AlertEngine.gmgn_facts(results))
+        ColumnarExporter.export_gmgn(contract_address, results)
+        return results
+
+    @staticmethod
+    async def fetch_gmgn_endpoint_async(name: str, contract_address: str) -> Tuple[Optional[Any], str]:
+        """获取单个GMGN接口，超时或失败时返回None和失败原因，不影响其余接口"""
+        source = f"gmgn_{name}"
+        url = NodeService.GMGN_URLS[name].format(contract_address)
+        start = time.perf_counter()
+        result = "error"
+        try:
+            with Tracer.span(f"gmgn {name}", "fetch"):
+                response = await AsyncHttpClient.post(NodeService.BASE_URL, json={
+                    "url": f"{url}?{urllib.parse.urlencode(NodeService.GMGN_PARAMS)}",
+                    "dataType": "gmgn_data"
+                })
+            if response.status_code != 200:
+                return None, f"失败 - 状态码: {response.status_code}"
+            data = PayloadDecoder.decode_response(source, response)
+            Metrics.record_upstream(source, data)
+            if not data.success or data.response is None:
+                return None, f"失败 - {data.error}"
+            result = "ok"
+            return data.response.data.data, "成功"
+        except (requests.RequestException, SchemaError) as e:
+            return None, f"失败 - {e}"
+        finally:
+            Metrics.record_fetch(source, result, time.perf_counter() - start)
+
+class SocialDataFetcher:
+    """pump.news社交数据获取类"""
+
+    BASE_URL = "https://www.pump.news/api/trpc"
+
+    @staticmethod
+    @Metrics.instrument("pump_news_stats")
+    def fetch_social_stats(contract_address: str) -> Optional[PumpNewsTokenData]:
+        """
+        获取代币社交统计信息
+
+        Args:
+            contract_address: 代币合约地址
+
+        Returns:
+            Optional[PumpNewsTokenData]: 社交统计或None（如果获取失败）
+        """
+        return SocialDataFetcher.parse_social_stats(HttpClient.get(SocialDataFetcher.stats_url(contract_address)))
+
+    @staticmethod
+    def stats_url(contract_address: str) -> str:
+        return f"{SocialDataFetcher.BASE_URL}/analyze.getBatchTokenDataByTokenAddress,watchlist.batchTokenWatchState?batch=1&input=%7B%220%22%3A%7B%22json%22%3A%7B%22tokenAddresses%22%3A%5B%22{contract_address}%22%5D%7D%7D%2C%221%22%3A%7B%22json%22%3A%7B%22tokenAddresses%22%3A%5B%22{contract_address}%22%5D%7D%7D%7D"
+
+    @staticmethod
+    def parse_social_stats(response: requests.Response) -> Optional[PumpNewsTokenData]:
+        response.raise_for_status()
+        tokens = PayloadDecoder.decode_response("pump_news_stats", response)[0].result.data.json.data.data
+        return tokens[0] if tokens else None
+
+    @staticmethod
+    @Metrics.instrument("pump_news_tweets")
+    def fetch_tweets(contract_address: str, category: str, on_rows=None, track: bool = True) -> List[PumpNewsTweet]:
+        """
+        获取指定类型的推文列表
+
+        Args:
+            contract_address: 代币合约地址
+            category: 推文类型（top/official）
+            on_rows: 推文边接收边解码，每解码一批调用一次
+            track: 为False时不导出（预取使用）
+
+        Returns:
+            List[PumpNewsTweet]: 推文列表
+        """
+        response = HttpClient.open_stream("GET", SocialDataFetcher.tweets_url(contract_address, category))
+        tweets = PayloadDecoder.decode_stream(
+            "pump_news_tweets", response, "tweets", PumpNewsTweet,
+            lambda result: result[2].result.data.json.data.data.tweets, on_rows)[2].result.data.json.data.data.tweets
+        if track:
+            ColumnarExporter.export_tweets(contract_address, category, tweets)
+        return tweets
+
+    @staticmethod
+    def tweets_url(contract_address: str, category: str) -> str:
+        return f"{SocialDataFetcher.BASE_URL}/utils.getCannyList,service.getServiceCallCount,tweets.getTweetsByTokenAddress?batch=1&input=%7B%220%22%3A%7B%22json%22%3Anull%2C%22meta%22%3A%7B%22values%22%3A%5B%22undefined%22%5D%7D%7D%2C%221%22%3A%7B%22json%22%3A%7B%22service%22%3A%22optimize%22%7D%7D%2C%222%22%3A%7B%22json%22%3A%7B%22tokenAddress%22%3A%22{contract_address}%22%2C%22type%22%3A%22filter%22%2C%22category%22%3A%22{category}%22%7D%7D%7D"
+
+class NoDataTableModel(QAbstractTableModel):
+    """无数据时的表格模型"""
+
+    def __init__(self, message="暂无数据", parent=None):
+        super().__init__(parent)
+        self._message = message
+        self._headers = ["提示"]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 1
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._message
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+# ---------------------------------------------------------------------------
+# 主线程卡顿监测
+# ---------------------------------------------------------------------------
+
+class StallRecord(msgspec.Struct):
+    """一次主线程卡顿，stack为超过阈值时采集的主线程调用栈"""
+    started: datetime
+    duration: float  # 秒，卡顿结束前为检测到时已持续的时长
+    stack: str
+    finished: bool = False
+
+class EventLoopWatchdog(QObject):
+    """
+    主线程事件循环卡顿监测
+
+    主线程定时器按固定间隔记录心跳，心跳的延迟即帧延迟；后台线程轮询心跳，
+    超过阈值未更新时采集主线程的Python调用栈，定位阻塞事件循环的代码。
+    """
+
+    HEARTBEAT_MS = 50
+    POLL_SECONDS = 0.02
+    HISTORY_SIZE = 50
+
+    history: collections.deque = collections.deque(maxlen=HISTORY_SIZE)
+
+    def __init__(self, threshold: float = 0.25, parent=None):
+        """
+        Args:
+            threshold: 卡顿阈值（秒），心跳间隔超过该值时采集调用栈
+        """
+        super().__init__(parent)
+        self.threshold = threshold
+        self.main_ident = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self.current: Optional[StallRecord] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        """在主线程调用"""
+        self.main_ident = threading.get_ident()
+        self.last_beat = time.perf_counter()
+        self._stop.clear()
+        self.timer.start(self.HEARTBEAT_MS)
+        threading.Thread(target=self.watch, name="watchdog", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        self.timer.stop()
+
+    def beat(self):
+        """主线程心跳，记录帧延迟并结束正在进行的卡顿"""
+        now = time.perf_counter()
+        with self._lock:
+            gap = now - self.last_beat
+            self.last_beat = now
+            stall, self.current = self.current, None
+        Metrics.event_loop_lag.observe(max(gap - self.HEARTBEAT_MS / 1000, 0))
+
+        if stall is not None:
+            stall.duration = gap
+            stall.finished = True
+            print(f"主线程卡顿 {gap * 1000:.0f}ms，调用栈:\n{stall.stack}")
+
+    def watch(self):
+        """后台线程：心跳超时时采集主线程调用栈"""
+        while not self._stop.wait(self.POLL_SECONDS):
+            with self._lock:
+                gap = time.perf_counter() - self.last_beat
+                if self.current is not None or gap < self.threshold:
+                    continue
+                frame = sys._current_frames().get(self.main_ident)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+                self.current = StallRecord(datetime.now(), gap, stack)
+                self.history.append(self.current)
+            Metrics.event_loop_stalls.inc()
+
+class StallWindow(QWidget):
+    """主线程卡顿记录窗口"""
+
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("主线程卡顿记录")
+        self.resize(900, 500)
+
+        self.comboStalls = QComboBox()
+        self.comboStalls.currentIndexChanged.connect(self.show_stack)
+        self.textStack = QTextEdit()
+        self.textStack.setReadOnly(True)
+        self.textStack.setLineWrapMode(QTextEdit.NoWrap)
+        self.textStack.setFont(QFont("Consolas"))
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.comboStalls)
+        layout.addWidget(self.textStack, 1)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(self.REFRESH_INTERVAL_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """有新的卡顿或卡顿结束时刷新列表，默认选中最近一次"""
+        stalls = list(reversed(EventLoopWatchdog.history))
+        labels = [f"[{stall.started.strftime('%H:%M:%S')}] {stall.duration * 1000:.0f}ms"
+                  + ("" if stall.finished else "（进行中）") for stall in stalls]
+        if labels == [self.comboStalls.itemText(i) for i in range(self.comboStalls.count())]:
+            return
+        self.comboStalls.blockSignals(True)
+        self.comboStalls.clear()
+        for label, stall in zip(labels, stalls):
+            self.comboStalls.addItem(label, stall)
+        self.comboStalls.blockSignals(False)
+        self.show_stack()
+
+    def show_stack(self):
+        stall = self.comboStalls.currentData()
+        self.textStack.setPlainText(stall.stack if stall is not None else "暂无卡顿记录")
+
+class TraceWaterfallWidget(QWidget):
+    """查询耗时瀑布图"""
+
+    ROW_HEIGHT = 18
+    LABEL_WIDTH = 260
+    CATEGORY_COLORS = {
+        "queue": "#BDBDBD",
+        "fetch": "#42A5F5",
+        "http": "#26A69A",
+        "decode": "#FFA726",
+        "render": "#AB47BC",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.trace: Optional[QueryTrace] = None
+        self.spans: List[TraceSpan] = []
+
+    def set_trace(self, trace: Optional[QueryTrace]):
+        self.trace = trace
+        self.spans = trace.snapshot() if trace else []
+        self.setMinimumHeight(max(len(self.spans), 1) * self.ROW_HEIGHT + 24)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#ffffff"))
+        if not self.spans:
+            painter.drawText(self.rect(), Qt.AlignCenter, "暂无追踪数据")
+            return
+
+        total_us = max(span.start_us + span.dur_us for span in self.spans) or 1
+        bar_width = max(self.width() - self.LABEL_WIDTH - 10, 1)
+        scale = bar_width / total_us
+
+        painter.setPen(QColor("#666"))
+        painter.drawText(QRect(self.LABEL_WIDTH, 0, bar_width, 20), Qt.AlignRight | Qt.AlignVCenter,
+                         f"总耗时 {total_us / 1000:.1f}ms")
+
+        for row, span in enumerate(self.spans):
+            y = 24 + row * self.ROW_HEIGHT
+            painter.setPen(QColor("#333"))
+            painter.drawText(QRect(4, y, self.LABEL_WIDTH - 8, self.ROW_HEIGHT), Qt.AlignLeft | Qt.AlignVCenter,
+                             f"{span.name}  {span.dur_us / 1000:.1f}ms")
+            x = self.LABEL_WIDTH + int(span.start_us * scale)
+            width = max(int(span.dur_us * scale), 1)
+            painter.fillRect(QRect(x, y + 3, width, self.ROW_HEIGHT - 6),
+                             QColor(self.CATEGORY_COLORS.get(span.cat, "#90A4AE")))
+
+class TraceWindow(QWidget):
+    """查询耗时追踪窗口"""
+
+    REFRESH_INTERVAL_MS = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("查询耗时瀑布图")
+        self.resize(900, 500)
+
+        self.comboTraces = QComboBox()
+        self.comboTraces.currentIndexChanged.connect(self.refresh)
+        self.btnExport = QPushButton("导出Chrome Trace")
+        self.btnExport.clicked.connect(self.export_trace)
+        self.labelStatus = QLabel()
+
+        top = QHBoxLayout()
+        top.addWidget(self.comboTraces, 1)
+        top.addWidget(self.btnExport)
+
+        self.waterfall = TraceWaterfallWidget()
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.waterfall)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(scroll, 1)
+        layout.addWidget(self.labelStatus)
+
+        # 查询是异步进行的，窗口打开期间定时刷新
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.reload_traces()
+        self.timer.start(self.REFRESH_INTERVAL_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def reload_traces(self):
+        """刷新可选的查询列表，默认选中最近一次"""
+        traces = list(Tracer.history)
+        self.comboTraces.blockSignals(True)
+        self.comboTraces.clear()
+        for trace in reversed(traces):
+            self.comboTraces.addItem(f"[{trace.created.strftime('%H:%M:%S')}] {trace.name}", trace)
+        self.comboTraces.blockSignals(False)
+        self.refresh()
+
+    def selected_trace(self) -> Optional[QueryTrace]:
+        return self.comboTraces.currentData()
+
+    def refresh(self):
+        if self.comboTraces.count() != len(Tracer.history):
+            self.reload_traces()
+            return
+        self.waterfall.set_trace(self.selected_trace())
+
+    def export_trace(self):
+        trace = self.selected_trace()
+        if trace is None:
+            return
+        path = f"trace_{trace.created.strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            Tracer.export_chrome_trace(trace, path)
+            self.labelStatus.setText(f"已导出: {os.path.abspath(path)}")
+        except Exception as e:
+            self.labelStatus.setText(f"导出失败: {str(e)}")
+
+class MetricsWindow(QWidget):
+    """运行指标面板：按主机和数据源汇总请求数、失败率、限流次数和耗时分位数"""
+
+    REFRESH_INTERVAL_MS = 1000
+    SLOW_SECONDS = 2.0       # P95超过该值视为慢主机
+    ERROR_RATE_ALERT = 0.2   # 失败率超过该值标红
+    HEADERS = ["类型", "名称", "请求数", "失败率", "限流(429)", "P50", "P95", "进行中"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("运行指标")
+        self.resize(760, 360)
+
+        self.model = QStandardItemModel(0, len(self.HEADERS), self)
+        self.model.setHorizontalHeaderLabels(self.HEADERS)
+        self.tableMetrics = QTableView()
+        self.tableMetrics.setModel(self.model)
+        self.tableMetrics.verticalHeader().setVisible(False)
+        self.tableMetrics.setEditTriggers(QTableView.NoEditTriggers)
+        self.tableMetrics.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.labelSummary = QLabel()
+        self.labelSummary.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.tableMetrics, 1)
+        layout.addWidget(self.labelSummary)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(self.REFRESH_INTERVAL_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    @staticmethod
+    def latency_quantiles(histogram: Histogram, label: str) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        return {labels[label]: (histogram.quantile(0.5, counts, count), histogram.quantile(0.95, counts, count))
+                for labels, (counts, _, count) in histogram.items()}
+
+    def host_rows(self) -> List[List[Any]]:
+        stats: Dict[str, List[float]] = {}  # host -> [请求数, 失败数, 429次数]
+        for labels, value in Metrics.http_requests.items():
+            row = stats.setdefault(labels["host"], [0, 0, 0])
+            status = labels["status"]
+            row[0] += value
+            if status == "error" or int(status) >= 400:
+                row[1] += value
+            if status == "429":
+                row[2] += value
+        latency = self.latency_quantiles(Metrics.http_duration, "host")
+        inflight = {labels["host"]: value for labels, value in Metrics.http_inflight.items()}
+        return [["主机", host, *row, *latency.get(host, (None, None)), inflight.get(host, 0)]
+                for host, row in sorted(stats.items())]
+
+    def source_rows(self) -> List[List[Any]]:
+        stats: Dict[str, List[float]] = {}
+        for labels, value in Metrics.fetch_total.items():
+            row = stats.setdefault(labels["source"], [0, 0, 0])
+            row[0] += value
+            if labels["result"] == "error":
+                row[1] += value
+        for labels, value in Metrics.upstream_responses.items():
+            if labels["status"] == "429":
+                stats.setdefault(labels["source"], [0, 0, 0])[2] += value
+        latency = self.latency_quantiles(Metrics.fetch_duration, "source")
+        return [["数据源", source, *row, *latency.get(source, (None, None)), ""]
+                for source, row in sorted(stats.items())]
+
+    @staticmethod
+    def format_seconds(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.0f}ms"
+
+    def refresh(self):
+        self.model.setRowCount(0)
+        for kind, name, total, errors, limited, p50, p95, inflight in self.host_rows() + self.source_rows():
+            error_rate = errors / total if total else 0
+            cells = [kind, name, f"{total:.0f}", f"{error_rate:.0%}", f"{limited:.0f}",
+                     self.format_seconds(p50), self.format_seconds(p95), str(inflight)]
+            items = [QStandardItem(cell) for cell in cells]
+            if limited or error_rate > self.ERROR_RATE_ALERT:
+                color = QColor("#ffe6e6")
+            elif p95 is not None and p95 > self.SLOW_SECONDS:
+                color = QColor("#fff4d6")
+            else:
+                color = None
+            if color is not None:
+                for item in items:
+                    item.setBackground(QBrush(color))
+            self.model.appendRow(items)
+
+        cache = {}
+        for labels, value in Metrics.cache_requests.items():
+            cache.setdefault(labels["cache"], [0, 0])[labels["result"] == "miss"] += value
+        cache_text = "，".join(f"{name} {hit / (hit + miss):.0%}" for name, (hit, miss) in sorted(cache.items()) if hit + miss) or "-"
+        schema_errors = sum(value for _, value in Metrics.schema_errors.items())
+        self.labelSummary.setText(
+            f"缓存命中率：{cache_text}　工作线程：{Metrics.workers_active.get():.0f}　"
+            f"结构错误：{schema_errors:.0f}　主线程卡顿：{Metrics.event_loop_stalls.get():.0f}次　指标端点：{MetricsServer.url() or '未启用'}")
+
+class PriceChartWidget(QWidget):
+    """价格图表：K线或折线，叠加开发者和聪明钱交易标记；滚轮缩放，拖动平移，双击复位"""
+
+    CANDLE_WIDTH = 6   # 每根K线占用的像素
+    MARKER_SPACING = 8  # 每种交易标记在这么多像素内最多画一个
+    MARGIN_LEFT = 8
+    MARGIN_RIGHT = 80  # 价格刻度
+    MARGIN_TOP = 10
+    MARGIN_BOTTOM = 24
+    ZOOM_STEP = 1.25
+    UP_COLOR = "#26A69A"
+    DOWN_COLOR = "#EF5350"
+    MARKER_COLORS = {
+        "dev_buy": "#FF9800",
+        "dev_sell": "#FF9800",
+        "smart_buy": "#1E88E5",
+        "smart_sell": "#8E24AA",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series: Optional[PriceSeries] = None
+        self.mode = "candle"
+        self.x_range: Optional[Tuple[float, float]] = None  # None表示显示全部
+        self.last_view: Optional[ChartView] = None
+        self._drag_x: Optional[int] = None
+        self.setMinimumSize(400, 240)
+        self.setMouseTracking(False)
+
+    def set_series(self, series: Optional[PriceSeries]):
+        if series is not self.series:
+            self.series = series
+            self.x_range = None
+        self.update()
+
+    def set_mode(self, mode: str):
+        self.mode = mode
+        self.update()
+
+    def plot_rect(self) -> QRect:
+        return QRect(self.MARGIN_LEFT, self.MARGIN_TOP,
+                     max(self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT, 1),
+                     max(self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM, 1))
+
+    def visible_range(self) -> Optional[Tuple[float, float]]:
+        if self.x_range is not None:
+            return self.x_range
+        full = self.series.time_range() if self.series is not None else None
+        if full is None:
+            return None
+        t0, t1 = full
+        return (t0, t1) if t1 > t0 else (t0 - 30, t1 + 30)
+
+    def current_view(self, rect: QRect) -> Optional[ChartView]:
+        time_range = self.visible_range()
+        if time_range is None:
+            return None
+        per_point = self.CANDLE_WIDTH if self.mode == "candle" else 1
+        return self.series.view(time_range[0], time_range[1], rect.width() // per_point, self.mode,
+                                rect.width() // self.MARKER_SPACING)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#ffffff"))
+        rect = self.plot_rect()
+        view = self.current_view(rect)
+        self.last_view = view
+        if view is None or not (view.candles or view.points):
+            painter.drawText(self.rect(), Qt.AlignCenter, "暂无成交数据")
+            return
+
+        t0, t1 = self.visible_range()
+        if view.candles:
+            lows = [candle.low for candle in view.candles]
+            highs = [candle.high for candle in view.candles]
+        else:
+            lows = highs = [price for _, price in view.points]
+        low, high = min(lows), max(highs)
+        if high <= low:
+            low, high = low * 0.99, high * 1.01 or 1
+        pad = (high - low) * 0.05
+        low, high = max(low - pad, 0), high + pad
+
+        def x_of(t: float) -> float:
+            return rect.left() + (t - t0) / max(t1 - t0, 1e-9) * rect.width()
+
+        def y_of(price: float) -> float:
+            return rect.bottom() - (price - low) / (high - low) * rect.height()
+
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        self.draw_axes(painter, rect, t0, t1, low, high)
+
+        if view.candles:
+            width = max(rect.width() / max(len(view.candles), 1) * 0.7, 1)
+            for candle in view.candles:
+                color = QColor(self.UP_COLOR if candle.close >= candle.open else self.DOWN_COLOR)
+                x = x_of(candle.start + (view.resolution or 0) / 2)
+                painter.setPen(color)
+                painter.drawLine(QPointF(x, y_of(candle.high)), QPointF(x, y_of(candle.low)))
+                top, bottom = y_of(max(candle.open, candle.close)), y_of(min(candle.open, candle.close))
+                painter.fillRect(QRectF(x - width / 2, top, width, max(bottom - top, 1)), color)
+        else:
+            painter.setPen(QPen(QColor("#1976D2"), 1))
+            painter.drawPolyline(QPolygonF([QPointF(x_of(t), y_of(price)) for t, price in view.points]))
+
+        for marker in view.markers:
+            self.draw_marker(painter, x_of(marker.time), y_of(marker.price), marker.kind)
+
+    def draw_axes(self, painter: QPainter, rect: QRect, t0: float, t1: float, low: float, high: float):
+        painter.setPen(QColor("#E0E0E0"))
+        painter.drawRect(rect)
+        painter.setPen(QColor("#666"))
+        for i in range(5):
+            price = low + (high - low) * i / 4
+            y = rect.bottom() - rect.height() * i / 4
+            painter.drawText(QRectF(rect.right() + 4, y - 8, self.MARGIN_RIGHT - 6, 16),
+                             Qt.AlignLeft | Qt.AlignVCenter, f"{price:.4g}")
+        fmt = "MM-dd HH:mm" if t1 - t0 > 86400 else "HH:mm:ss"
+        for i in range(5):
+            t = t0 + (t1 - t0) * i / 4
+            x = rect.left() + rect.width() * i / 4
+            painter.drawText(QRectF(x - 50, rect.bottom() + 4, 100, 16), Qt.AlignCenter,
+                             QDateTime.fromSecsSinceEpoch(int(t)).toString(fmt))
+
+    def draw_marker(self, painter: QPainter, x: float, y: float, kind: str):
+        """买入为向上的三角（位于价格下方），卖出为向下的三角（位于价格上方）"""
+        color = QColor(self.MARKER_COLORS.get(kind, "#000"))
+        painter.setPen(color)
+        painter.setBrush(color)
+        if kind.endswith("buy"):
+            y += 4
+            points = [QPointF(x, y), QPointF(x - 4, y + 7), QPointF(x + 4, y + 7)]
+        else:
+            y -= 4
+            points = [QPointF(x, y), QPointF(x - 4, y - 7), QPointF(x + 4, y - 7)]
+        painter.drawPolygon(QPolygonF(points))
+        painter.setBrush(Qt.NoBrush)
+
+    def wheelEvent(self, event):
+        time_range = self.visible_range()
+        if time_range is None:
+            return
+        t0, t1 = time_range
+        rect = self.plot_rect()
+        ratio = min(max((event.position().x() - rect.left()) / rect.width(), 0), 1)
+        anchor = t0 + (t1 - t0) * ratio
+        factor = 1 / self.ZOOM_STEP if event.angleDelta().y() > 0 else self.ZOOM_STEP
+        span = max((t1 - t0) * factor, 10)
+        self.x_range = (anchor - span * ratio, anchor + span * (1 - ratio))
+        self.update()
+
+    def mousePressEvent(self, event):
+        self._drag_x = int(event.position().x())
+
+    def mouseMoveEvent(self, event):
+        time_range = self.visible_range()
+        if self._drag_x is None or time_range is None:
+            return
+        x = int(event.position().x())
+        t0, t1 = time_range
+        shift = (self._drag_x - x) / self.plot_rect().width() * (t1 - t0)
+        self.x_range = (t0 + shift, t1 + shift)
+        self._drag_x = x
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.x_range = None
+        self.update()
+
+class ChartWindow(QWidget):
+    """代币价格图表窗口"""
+
+    REFRESH_INTERVAL_MS = 1000
+    MODES = [("K线", "candle"), ("折线", "line")]
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("价格图表")
+        self.resize(1000, 520)
+
+        self.comboTokens = QComboBox()
+        self.comboTokens.currentIndexChanged.connect(self.refresh)
+        self.comboMode = QComboBox()
+        for text, mode in self.MODES:
+            self.comboMode.addItem(text, mode)
+        self.comboMode.currentIndexChanged.connect(lambda: self.chart.set_mode(self.comboMode.currentData()))
+        self.labelStatus = QLabel()
+
+        top = QHBoxLayout()
+        top.addWidget(self.comboTokens, 1)
+        top.addWidget(self.comboMode)
+
+        self.chart = PriceChartWidget()
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.chart, 1)
+        layout.addWidget(self.labelStatus)
+
+        # 成交是异步到达的，窗口打开期间定时刷新
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.reload_tokens()
+        self.timer.start(self.REFRESH_INTERVAL_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def reload_tokens(self, selected: Optional[str] = None):
+        """刷新可选的代币列表，默认选中最近查询的代币"""
+        selected = selected or self.comboTokens.currentData()
+        mints = TimeSeriesStore.mints()
+        self.comboTokens.blockSignals(True)
+        self.comboTokens.clear()
+        for mint in mints:
+            self.comboTokens.addItem(mint, mint)
+        if selected in mints:
+            self.comboTokens.setCurrentIndex(mints.index(selected))
+        self.comboTokens.blockSignals(False)
+        self.refresh()
+
+    def select_token(self, mint: str):
+        self.reload_tokens(mint)
+
+    def refresh(self):
+        if self.comboTokens.count() != len(TimeSeriesStore.mints()):
+            self.reload_tokens()
+            return
+        mint = self.comboTokens.currentData()
+        series = TimeSeriesStore.get(mint) if mint else None
+        self.chart.set_series(series)
+        if series is None:
+            self.labelStatus.setText("暂无数据，查询代币后自动显示")
+            return
+        view = self.chart.last_view
+        shown = f"，显示{len(view.candles) or len(view.points)}点/{len(view.markers)}个标记" if view else ""
+        resolution = f"，周期{view.resolution}秒" if view and view.resolution else ""
+        self.labelStatus.setText(f"成交{len(series)}笔，交易标记{series.marker_count}个{shown}{resolution}")
+
+class LaunchTableModel(QAbstractTableModel):
+    """新币扫描结果，最新发现的在最上面"""
+
+    HEADERS = ["发现时间", "来源", "代币", "合约地址", "创建", "市值", "开发者信誉", "开发者操作"]
+    MAX_ROWS = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._candidates: List[LaunchCandidate] = []
 
-        Returns:
-            Optional[Dict]: API返回的数据或None（如果获取失败）
-        """
-        try:
-            url = "https://chain.fm/api/trpc/parsedTransaction.list"
-
-            # 构建batch请求格式
-            batch_input = {
-                "0": {
-                    "json": {
-                        "page": 1,
-                        "pageSize": 30,
-                        "dateRange": None,
-                        "token": contract_address,
-                        "address": [],
-                        "useFollowing": True,
-                        "includeChannels": [],
-                        "lastUpdateTime": None,
-                        "events": []
-                    },
-                    "meta": {
-                        "values": {
-                            "dateRange": ["undefined"],
-                            "lastUpdateTime": ["undefined"]
-                        }
-                    }
-                }
-            }
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._candidates)
 
-            # 构建完整的URL
-            full_url = f"{url}?batch=1&input={json.dumps(batch_input)}"
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
 
-            response = requests.post(NodeService.BASE_URL, json={
-                "url": full_url,
-                "dataType": "chain_fm_transactions"
-            })
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
 
-            response.raise_for_status()
-            result = response.json()
+    def candidate(self, row: int) -> LaunchCandidate:
+        return self._candidates[row]
 
-            if result.get('success'):
-                return result.get('response', {}).get('data', [])
-            else:
-                print(f"获取数据失败: {result.get('error')}")
-                return None
+    def add(self, candidate: LaunchCandidate):
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._candidates.insert(0, candidate)
+        self.endInsertRows()
+        if len(self._candidates) > self.MAX_ROWS:
+            self.beginRemoveRows(QModelIndex(), self.MAX_ROWS, len(self._candidates) - 1)
+            del self._candidates[self.MAX_ROWS:]
+            self.endRemoveRows()
 
-        except Exception as e:
-            print(f"从Node.js服务获取数据失败: {str(e)}")
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
             return None
+        candidate = self._candidates[index.row()]
+        coin = candidate.coin
+        reputation = candidate.reputation
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return datetime.fromtimestamp(candidate.discovered_at).strftime("%H:%M:%S")
+            if column == 1:
+                return candidate.feed
+            if column == 2:
+                return f"{coin.name} ({coin.symbol})"
+            if column == 3:
+                return coin.mint
+            if column == 4:
+                return TimeUtil.get_time_diff(coin.created_timestamp)
+            if column == 5:
+                return DevHistoryTableModel.format_market_cap(coin.usd_market_cap)
+            if column == 6:
+                return f"{reputation.score}分 {reputation.verdict}" if reputation else "-"
+            if column == 7:
+                # 去掉状态中的HTML标签
+                return re.sub(r"<[^>]+>", "", candidate.dev_trade_status) or "-"
+        elif role == Qt.ForegroundRole and column == 6 and reputation is not None:
+            if reputation.serial_rugger:
+                return QBrush(QColor("#F44336"))
+            if reputation.verdict == "优质":
+                return QBrush(QColor("#4CAF50"))
+        return None
 
-class NoDataTableModel(QAbstractTableModel):
-    """无数据时的表格模型"""
+class ScannerWindow(QWidget):
+    """新币扫描窗口，双击一行查询该代币"""
+
+    def __init__(self, scanner: LaunchScanner, on_select, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("新币扫描")
+        self.resize(1000, 500)
+        self.scanner = scanner
+        self.on_select = on_select
+
+        self.btnToggle = QPushButton()
+        self.btnToggle.clicked.connect(self.toggle)
+        self.labelStatus = QLabel()
+
+        top = QHBoxLayout()
+        top.addWidget(self.btnToggle)
+        top.addWidget(self.labelStatus, 1)
+
+        self.model = LaunchTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.doubleClicked.connect(self.select_row)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.table, 1)
+
+        scanner.discovered.connect(self.model.add)
+        scanner.scanned.connect(self.labelStatus.setText)
+        self.update_button()
+
+    def toggle(self):
+        if self.scanner.running:
+            self.scanner.stop()
+            self.labelStatus.setText("已停止")
+        else:
+            self.scanner.start()
+            self.labelStatus.setText("扫描中...")
+        self.update_button()
 
-    def __init__(self, message="暂无数据", parent=None):
-        super().__init__(parent)
-        self._message = message
-        self._headers = ["提示"]
+    def update_button(self):
+        self.btnToggle.setText("停止扫描" if self.scanner.running else "开始扫描")
 
-    def rowCount(self, parent=QModelIndex()) -> int:
-        return 1
+    def select_row(self, index: QModelIndex):
+        self.on_select(self.model.candidate(index.row()).coin.mint)
 
-    def columnCount(self, parent=QModelIndex()) -> int:
-        return 1
+class DevTimelineTableModel(QAbstractTableModel):
+    """开发者持仓时间线，每笔交易一行"""
 
-    def data(self, index: QModelIndex, role=Qt.DisplayRole):
-        if not index.isValid():
-            return None
+    HEADERS = ["时间", "操作", "数量", "持仓", "剩余成本($)", "已实现盈亏($)"]
+    OPERATIONS = {"buy": "买入", "sell": "卖出", "trans_in": "转入", "trans_out": "转出"}
 
-        if role == Qt.DisplayRole:
-            return self._message
-        elif role == Qt.TextAlignmentRole:
-            return Qt.AlignCenter
+    def __init__(self, timeline: Optional[DevPositionTimeline] = None, parent=None):
+        super().__init__(parent)
+        self._timeline = timeline
 
-        return None
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._timeline.times) if self._timeline is not None else 0
 
-    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self._headers[section]
+            return self.HEADERS[section]
         return None
 
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        timeline = self._timeline
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return datetime.fromtimestamp(timeline.times[row]).strftime("%m-%d %H:%M:%S")
+        if column == 1:
+            return self.OPERATIONS.get(timeline.ops[row], timeline.ops[row])
+        if column == 2:
+            return f"{timeline.amounts[row]:,.0f}"
+        if column == 3:
+            return f"{timeline.positions[row]:,.0f}"
+        if column == 4:
+            return f"{timeline.costs[row]:,.2f}"
+        return f"{timeline.realized[row]:,.2f}"
+
+class DevReportWindow(QWidget):
+    """当前标签页的开发者交易分析"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("开发者分析")
+        self.resize(900, 600)
+
+        self.labelSummary = QLabel()
+        self.labelSummary.setWordWrap(True)
+        self.labelSummary.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.table = QTableView()
+        self.table.setModel(DevTimelineTableModel())
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.labelSummary)
+        layout.addWidget(self.table, 1)
+
+    def set_report(self, title: str, report: Optional[DevTradeReport]):
+        self.setWindowTitle(f"开发者分析 - {title}" if title else "开发者分析")
+        self.table.setModel(DevTimelineTableModel(report.timeline if report is not None else None))
+        self.labelSummary.setText(self.format_report(report) if report is not None else "暂无开发者交易分析")
+
+    @staticmethod
+    def format_report(report: DevTradeReport) -> str:
+        if not report.trades:
+            return "没有开发者交易"
+        realized = f"${report.realized_usd:,.2f}"
+        if report.sol_usd:
+            realized += f"（{report.realized_sol:,.3f} SOL）"
+        lines = [
+            f"交易 {report.trades} 笔：买入 {report.bought:,.0f}（${report.buy_usd:,.2f}），"
+            f"卖出 {report.sold:,.0f}（${report.sell_usd:,.2f}），"
+            f"转入 {report.transferred_in:,.0f}，转出 {report.transferred_out:,.0f}",
+            f"当前持仓 {report.position:,.0f} / 峰值 {report.peak_position:,.0f}，剩余成本 ${report.cost_basis_usd:,.2f}，"
+            f"已实现盈亏 {realized}，未实现盈亏 ${report.unrealized_usd:,.2f}",
+        ]
+        timing = []
+        if report.first_sell_after is not None:
+            timing.append(f"发射后{TimeUtil.format_duration(report.first_sell_after)}首次卖出")
+        if report.exit_after is not None:
+            timing.append(f"发射后{TimeUtil.format_duration(report.exit_after)}持仓降至峰值的{DevTradeAnalytics.EXIT_SHARE:.0%}以下")
+        if timing:
+            lines.append("，".join(timing))
+        for window in report.sell_windows:
+            lines.append(f"集中抛售 {datetime.fromtimestamp(window.start).strftime('%m-%d %H:%M:%S')} 起 "
+                         f"{TimeUtil.format_duration(window.end - window.start)}内卖出{window.sells}笔，"
+                         f"占峰值持仓{window.share:.0%}（${window.volume_usd:,.2f}）")
+        fresh = [transfer for transfer in report.transfers if transfer.fresh]
+        for transfer in fresh[:DevTradeAnalytics.MAX_WINDOWS]:
+            lines.append(f"转出至新钱包 {DevTradeTableModel.format_address(transfer.to)}："
+                         f"{transfer.amount:,.0f}（当时持仓的{transfer.share:.0%}）")
+        if len(fresh) > DevTradeAnalytics.MAX_WINDOWS:
+            lines.append(f"……共{len(fresh)}笔转出至{report.fresh_recipients}个新钱包")
+        return "\n".join(lines)
+
+# ---------------------------------------------------------------------------
+# 多代币工作区
+# ---------------------------------------------------------------------------
+
+class TokenSurface:
+    """
+    后台标签页的离屏控件
+
+    属性名与 MainWindow 上的结果控件相同，渲染代码不区分前台和后台标签页。
+    离屏控件从不显示，后台标签页收到数据时只更新模型和文本，不触发重绘；切回前台时一次性移交给主窗口控件。
+    """
+
+    TABLES = ("tableDevHistory", "tableDevTrade", "tableSmartMoney", "tableSocial")
+    LABELS = ("labelDevInfo", "labelDevHistory", "labelDevTrade", "labelSmartMoneyInfo", "labelCoinPic",
+              "labelCoinSymbol", "labelCoinDescription", "labelFilterTweets", "labelFollowers", "labelLikes",
+              "labelViews", "labelOfficalTweets", "labelSmartBuy", "labelHolderInfo", "labelWalletTag", "labelTop10")
+
+    def __init__(self, window):
+        for name in self.TABLES:
+            setattr(self, name, QTableView())
+        for name in self.LABELS:
+            label = QLabel()
+            label.resize(getattr(window, name).size())  # 图片按控件尺寸缩放
+            setattr(self, name, label)
+
+    @classmethod
+    def transfer(cls, source, target):
+        """把一组结果控件的模型和显示内容移交给另一组"""
+        for name in cls.TABLES:
+            getattr(target, name).setModel(getattr(source, name).model())
+        for name in cls.LABELS:
+            cls.copy_label(getattr(source, name), getattr(target, name))
+
+    @staticmethod
+    def copy_label(source: QLabel, target: QLabel):
+        # 重设样式表会触发整个窗口重新计算样式，只在不同时设置
+        if target.styleSheet() != source.styleSheet():
+            target.setStyleSheet(source.styleSheet())
+        target.setWordWrap(source.wordWrap())
+        target.setScaledContents(source.hasScaledContents())
+        target.setOpenExternalLinks(source.openExternalLinks())
+        target.setMinimumSize(source.minimumSize())
+        target.setMaximumSize(source.maximumSize())
+        pixmap = source.pixmap()
+        if not pixmap.isNull():
+            target.setPixmap(pixmap)
+        elif target.text() != source.text():
+            target.setText(source.text())
+
+    @classmethod
+    def clear(cls, surface):
+        for name in cls.TABLES:
+            getattr(surface, name).setModel(None)
+        for name in cls.LABELS:
+            getattr(surface, name).clear()
+
+class TokenSession:
+    """
+    一个代币标签页的查询状态
+
+    HTTP连接池、各级缓存、索引和请求调度器全局共享，标签页只保存自己的表格模型、正在运行的数据源和显示内容。
+    """
+
+    def __init__(self, contract: str, tweet_category: str):
+        self.contract = contract
+        self.title = f"{contract[:4]}...{contract[-4:]}"
+        self.creator = ""
+        self.tweet_category = tweet_category
+        self.rendered_payloads = {}   # 数据源 -> 当前显示的解码结果
+        self.stream_models = {}       # 数据源 -> 正在接收流式数据的表格模型
+        self.chain_fm_received = 0    # 本次查询已流式接收的聪明钱交易数
+        self.pending_sources = set()  # 当前查询中尚未结束的数据源
+        self.failed_sources = []      # 当前查询中失败或超时的数据源
+        self.gmgn_pending = False
+        self.workers = {}             # 数据源 -> 工作线程，保持引用直到线程结束
+        self.surface: Optional[TokenSurface] = None  # 在后台时使用的离屏控件
+        self.launch_ms = 0            # 代币创建时间（毫秒）
+        self.dev_trade_status = ""
+        self.dev_report: Optional[DevTradeReport] = None
+        self.updated = False          # 在后台期间收到过数据
+        self.query_trace: Optional[QueryTrace] = None  # 当前代币查询的追踪，查询结束时清除截止时间
+        self.gmgn_trace: Optional[QueryTrace] = None   # 当前GMGN查询的追踪
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.pending_sources) or self.gmgn_pending
+
 class MainWindow(QMainWindow):
     """主窗口类"""
 
+    query_deadline = 20.0  # 单次查询的整体截止时间（秒）
+    max_sessions = 8       # 同时打开的代币标签页数，超过时关闭最久未使用的空闲标签页
+    alert_received = Signal(object)  # 告警可能在后台线程产生，经信号回到主线程
+    SOCIAL_TABLE_STYLE = """
+            QTableView {
+                border: 1px solid #dcdcdc;
+                background-color: white;
+                gridline-color: #f0f0f0;
+            }
+            QTableView::item {
+                padding: 5px;
+            }
+            QTableView::item:hover {
+                background-color: #f8f9fa;
+            }
+            QHeaderView::section {
+                background-color: #f8f9fa;
+                padding: 5px;
+                border: none;
+                border-right: 1px solid #dcdcdc;
+                border-bottom: 1px solid #dcdcdc;
+            }
+        """
+
     def __init__(self):
         """初始化主窗口"""
         super(MainWindow, self).__init__()
         self.clipboard = QApplication.clipboard()  # 初始化剪贴板
-        self.current_tweet_category = "top"  # 默认推文类型
+        self.trace_window = None
+        self.metrics_window = None
+        self.stall_window = None
+        self.chart_window = None
+        self.scanner_window = None
+        self.dev_report_window = None
+        self.scanner = LaunchScanner(self)
+        self.alert_poller = AlertPoller()
+        self.tray_icon = None
+        self.prefetched_address = ""
+        self.sessions: "collections.OrderedDict[str, TokenSession]" = collections.OrderedDict()  # 按最近使用排序
+        self.session: Optional[TokenSession] = None  # 前台标签页
         self.init_ui()
 
     def init_ui(self):
@@ -849,9 +6557,138 @@ class MainWindow(QMainWindow):
         self.btnQuery.clicked.connect(self.query_coin_info)
         self.btnQueryTradeInfo.clicked.connect(self.query_gmgn_info)
 
+        # 初始化工具栏
+        self.init_tools()
+
+        # 告警
+        self.alert_received.connect(self.on_alert)
+        AlertEngine.subscribe(self.alert_received.emit)
+        self.alert_timer = QTimer(self)
+        self.alert_timer.timeout.connect(AlertEngine.tick)
+        self.alert_timer.start(int(AlertEngine.TICK_INTERVAL * 1000))
+
         # 显示主窗口
         self.ui.show()
 
+    def init_tools(self):
+        """初始化工具栏（UI文件的顶层窗口不是QMainWindow时只注册快捷键）"""
+        self.toolbar = self.ui.addToolBar("工具") if isinstance(self.ui, QMainWindow) else None
+        self.add_tool_action("耗时瀑布图", "Ctrl+Shift+T", self.show_trace_window)
+        self.add_tool_action("运行指标", "Ctrl+Shift+M", self.show_metrics_window)
+        self.add_tool_action("卡顿记录", "Ctrl+Shift+S", self.show_stall_window)
+        self.add_tool_action("价格图表", "Ctrl+Shift+C", self.show_chart_window)
+        self.add_tool_action("新币扫描", "Ctrl+Shift+N", self.show_scanner_window)
+        self.add_tool_action("开发者分析", "Ctrl+Shift+D", self.show_dev_report_window)
+        profile_action = self.add_tool_action("性能分析", "Ctrl+Shift+P", self.toggle_profiler)
+        profile_action.setCheckable(True)
+        profile_action.setChecked(QueryProfiler.enabled)
+        self.add_tool_action("关闭标签页", "Ctrl+W", lambda: self.close_session(self.tokenTabs.currentIndex()))
+
+        # 代币标签页，放在工具栏下一行；顶层窗口不是QMainWindow时插入到顶层布局最上方
+        self.tokenTabs = QTabBar()
+        self.tokenTabs.setTabsClosable(True)
+        self.tokenTabs.setMovable(True)
+        self.tokenTabs.setExpanding(False)
+        self.tokenTabs.currentChanged.connect(self.on_token_tab_changed)
+        self.tokenTabs.tabCloseRequested.connect(self.close_session)
+        if self.toolbar is not None:
+            self.ui.addToolBarBreak()
+            self.ui.addToolBar("代币").addWidget(self.tokenTabs)
+        elif isinstance(self.ui.layout(), QBoxLayout):
+            self.ui.layout().insertWidget(0, self.tokenTabs)
+
+    def add_tool_action(self, text: str, shortcut: str, slot) -> QAction:
+        """添加工具栏按钮及快捷键"""
+        action = QAction(text, self.ui)
+        action.setShortcut(QKeySequence(shortcut))
+        action.triggered.connect(slot)
+        self.ui.addAction(action)
+        if self.toolbar is not None:
+            self.toolbar.addAction(action)
+        return action
+
+    def show_trace_window(self):
+        """显示查询耗时瀑布图"""
+        if self.trace_window is None:
+            self.trace_window = TraceWindow(self.ui)
+        self.trace_window.show()
+        self.trace_window.raise_()
+
+    def show_metrics_window(self):
+        """显示运行指标面板"""
+        if self.metrics_window is None:
+            self.metrics_window = MetricsWindow(self.ui)
+        self.metrics_window.show()
+        self.metrics_window.raise_()
+
+    def toggle_profiler(self, enabled: bool):
+        """打开或关闭按查询划分的性能分析"""
+        self.add_log("性能分析", f"已{'开启' if enabled else '关闭'}（{QueryProfiler.mode}）")
+        self.log_profile_files(QueryProfiler.set_enabled(enabled))
+
+    def begin_query(self, name: str) -> QueryTrace:
+        """开始一次查询：耗时追踪、截止时间和性能分析都按查询划分"""
+        trace = Tracer.start(name, self.query_deadline)
+        self.log_profile_files(QueryProfiler.begin(name))
+        return trace
+
+    def log_profile_files(self, paths: List[str]):
+        for path in paths:
+            self.add_log("性能分析已保存", os.path.basename(path), QUrl.fromLocalFile(os.path.abspath(path)).toString())
+
+    def show_chart_window(self):
+        """显示当前代币的价格图表"""
+        if self.chart_window is None:
+            self.chart_window = ChartWindow(self.ui)
+        self.chart_window.show()
+        self.chart_window.raise_()
+        contract_address = self.leCA.text().strip()
+        if contract_address:
+            self.chart_window.select_token(contract_address)
+
+    def show_scanner_window(self):
+        """显示新币扫描窗口"""
+        if self.scanner_window is None:
+            self.scanner_window = ScannerWindow(self.scanner, self.query_scanned_token, self.ui)
+        self.scanner_window.show()
+        self.scanner_window.raise_()
+
+    def show_dev_report_window(self):
+        """显示当前标签页的开发者交易分析"""
+        if self.dev_report_window is None:
+            self.dev_report_window = DevReportWindow(self.ui)
+        self.refresh_dev_report_window()
+        self.dev_report_window.show()
+        self.dev_report_window.raise_()
+
+    def refresh_dev_report_window(self):
+        if self.dev_report_window is None:
+            return
+        session = self.session
+        self.dev_report_window.set_report(session.title if session else "", session.dev_report if session else None)
+
+    def query_scanned_token(self, mint: str):
+        """查询扫描发现的代币"""
+        self.leCA.setText(mint)
+        self.query_coin_info()
+
+    def on_alert(self, alert: Alert):
+        """规则触发：写入日志，配置了桌面通知时弹出系统托盘消息"""
+        self.add_log(f"告警：{alert.rule}", alert.message, f"https://gmgn.ai/sol/token/{alert.token}")
+        if "desktop" not in alert.channels or not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        if self.tray_icon is None:
+            self.tray_icon = QSystemTrayIcon(self.ui.windowIcon(), self.ui)
+            self.tray_icon.show()
+        self.tray_icon.showMessage(f"MEME通告警 - {alert.rule}", alert.message)
+
+    def show_stall_window(self):
+        """显示主线程卡顿记录"""
+        if self.stall_window is None:
+            self.stall_window = StallWindow(self.ui)
+        self.stall_window.show()
+        self.stall_window.raise_()
+
     def init_controls(self):
         """初始化并验证控件"""
         # 定义所有需要的控件及其名称
@@ -897,6 +6734,7 @@ class MainWindow(QMainWindow):
         # 初始化日志列表模型
         self.log_model = QStandardItemModel()
         self.listViewLog.setModel(self.log_model)
+        self.listViewLog.setItemDelegate(HTMLDelegate(self.listViewLog))  # 使用HTML代理
 
         # 设置列表视图可以选择和复制
         self.listViewLog.setSelectionMode(QListView.ExtendedSelection)  # 允许多选
@@ -931,6 +6769,7 @@ class MainWindow(QMainWindow):
 
         # 设置表格样式，与Material主题配合
         table_delegate = TableStyleDelegate()
+        self.tableSmartMoney.setItemDelegate(table_delegate)
         for table in [self.tableDevHistory, self.tableDevTrade, self.tableSocial]:
             table.setItemDelegate(table_delegate)
             table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -968,181 +6807,46 @@ class MainWindow(QMainWindow):
         default_ca = "9DHe3pycTuymFk4H4bbPoAJ4hQrr2kaLDF6J6aAKpump"
         self.leCA.setText(default_ca)
 
+        # 输入合法地址后立即预取
+        self.leCA.textChanged.connect(self.on_contract_changed)
+
         # 连接推文类型切换事件
         self.tabSocialOptions.currentChanged.connect(self.on_tweet_tab_changed)
 
-    def copy_dev_address(self, address: str):
-        """复制开发者地址到剪贴板"""
-        self.clipboard.setText(address)
-        self.add_log("复制成功", f"已复制Dev地址：{address}")
-
-    @staticmethod
-    def format_dev_info(creator: str) -> str:
-        """格式化开发者信息"""
-        return f"""
-        <html>
-        <head>
-        <style>
-            a:hover {{ text-decoration: underline; }}
-            .copy-icon {{
-                cursor: pointer;
-                font-size: 0.5em;
-                color: #666;
-            }}
-            .dev-label {{
-                color: #000;
-                font-weight: bold;
-            }}
-            .dev-address {{
-                color: #3498db;
-                text-decoration: none;
-            }}
-        </style>
-        </head>
-        <body>
-            <span class='dev-label'>DEV信息：</span>
-            <a href='https://gmgn.ai/sol/address/{creator}' class='dev-address'>{creator}</a>
-            <span class='copy-icon' onclick='copyAddress'> 📋</span>
-        </body>
-        </html>
-        """
-
-    def format_coin_info(self, coin_data: Dict[str, Any]) -> str:
-        """格式化代币信息，使用Material Design风格"""
-        name = coin_data.get('name', 'Unknown')
-        symbol = coin_data.get('symbol', '')
-        created_time = TimeUtil.get_time_diff(coin_data.get('created_timestamp', 0))
-        description = coin_data.get('description', '暂无描述')
-        image_uri = coin_data.get('image_uri', '')
-        twitter = coin_data.get('twitter', '')
-        website = coin_data.get('website', '')
-        contract = coin_data.get('mint', '')
-
-        # 获取base64编码的图片
-        image_data = ImageHandler.get_image_base64(image_uri) if image_uri else ''
-
-        # 更新HTML样式以匹配Material Design
-        html = f"""
-        <html>
-        <head>
-        <style type="text/css">
-            .container {{
-                font-family: Roboto, Arial, sans-serif;
-                padding: 16px;
-                max-width: 800px;
-                background-color: var(--background);
-                color: var(--text);
-            }}
-            .header {{
-                display: flex;
-                align-items: flex-start;
-                gap: 16px;
-                margin-bottom: 16px;
-            }}
-            .coin-image {{
-                width: 48px;
-                height: 48px;
-                object-fit: cover;
-                border-radius: 8px;
-                flex-shrink: 0;
-            }}
-            .info {{
-                flex: 1;
-                min-width: 0;
-            }}
-            .title {{
-                font-size: 18px;
-                font-weight: 500;
-                margin-bottom: 8px;
-                color: var(--primary);
-            }}
-            .description {{
-                font-size: 14px;
-                line-height: 1.5;
-                color: var(--text-secondary);
-            }}
-            .buttons {{
-                margin-top: 16px;
-                display: flex;
-                flex-wrap: wrap;
-                gap: 8px;
-            }}
-            .button {{
-                display: inline-block;
-                padding: 8px 16px;
-                background-color: var(--primary);
-                color: var(--on-primary);
-                text-decoration: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: 500;
-                transition: background-color 0.2s;
-            }}
-            .button:hover {{
-                background-color: var(--primary-dark);
-            }}
-        </style>
-        </head>
-        <body>
-        <div class='container'>
-            <div class='header'>
-                <img src='{image_data}' class='coin-image' onerror="this.style.display='none'"/>
-                <div class='info'>
-                    <div class='title'>{name} ({symbol})</div>
-                    <div class='description'>
-                        创建时间：{created_time}<br/>
-                        {description}
-                    </div>
-                </div>
-            </div>
-            <div class='buttons'>
-                <a href='https://gmgn.ai/sol/token/{contract}' class='button' target='_blank'>GMGN</a>
-                <a href='https://www.pump.news/en/{contract}-solana' class='button' target='_blank'>PUMPNEWS</a>
-                <a href='https://twitter.com/search?q={contract}' class='button' target='_blank'>搜推特</a>
-                <a href='{twitter}' class='button' target='_blank'>官推</a>
-                <a href='{website}' class='button' target='_blank'>官网</a>
-            </div>
-        </div>
-        </body>
-        </html>
-        """
-        return html
+        # 推文内容点击、开发者地址复制都作用于前台标签页
+        self.tableSocial.clicked.connect(self.on_social_table_clicked)
+        self.labelDevInfo.mousePressEvent = self.handle_dev_info_click
 
-    def update_dev_info(self, coin_data: Dict[str, Any]):
-        """更新开发者信息"""
-        creator = coin_data.get('creator')
-        if not creator:
+    def on_contract_changed(self, text: str):
+        """本地校验合约地址，合法时开始预取，非法地址不会发出任何请求"""
+        contract_address = text.strip()
+        if not contract_address or SolanaAddress.is_valid(contract_address):
+            self.leCA.setStyleSheet("")
+            self.leCA.setToolTip("")
+        else:
+            self.leCA.setStyleSheet("QLineEdit { border: 1px solid #e74c3c; }")
+            self.leCA.setToolTip("不是合法的Solana地址")
             return
 
-        # 获取开发者历史记录
-        history_data = DevDataFetcher.fetch_dev_history(creator)
-        if history_data:
-            # 更新开发者信息标签
-            self.labelDevInfo.setText(self.format_dev_info(creator))
-            self.labelDevInfo.setOpenExternalLinks(True)  # 允许打开外部链接
-
-            # 设置点击事件
-            self.labelDevInfo.mousePressEvent = lambda e: self.handle_dev_info_click(e, creator)
+        if contract_address and contract_address != self.prefetched_address:
+            self.prefetched_address = contract_address
+            PrefetchCache.prefetch_token(contract_address, self.selected_tweet_category())
 
-            self.labelDevHistory.setText(DevDataFetcher.format_dev_history(history_data))
-
-            # 按市值排序
-            sorted_history = sorted(history_data,
-                                  key=lambda x: (x.get('usd_market_cap', 0), x.get('created_timestamp', 0)),
-                                  reverse=True)
-
-            # 更新历史表格
-            history_model = DevHistoryTableModel(sorted_history)
-            self.tableDevHistory.setModel(history_model)
-            self.tableDevHistory.resizeColumnsToContents()
+    def validate_contract_address(self) -> Optional[str]:
+        """读取并校验输入的合约地址，非法时提示并返回None"""
+        contract_address = self.leCA.text().strip()
+        if not contract_address:
+            self.show_error_message("请输入代币合约地址")
+            return None
+        if not SolanaAddress.is_valid(contract_address):
+            self.show_error_message("合约地址格式错误，请输入合法的Solana地址")
+            return None
+        return contract_address
 
-        # 获取开发者交易记录
-        trade_data = DevDataFetcher.fetch_dev_trades(coin_data.get('mint', ''))
-        if trade_data and 'transactions' in trade_data:
-            # 更新交易表格
-            trade_model = DevTradeTableModel(trade_data['transactions'], creator)
-            self.tableDevTrade.setModel(trade_model)
-            self.tableDevTrade.resizeColumnsToContents()
+    def copy_dev_address(self, address: str):
+        """复制开发者地址到剪贴板"""
+        self.clipboard.setText(address)
+        self.add_log("复制成功", f"已复制Dev地址：{address}")
 
     def add_log(self, operation: str, status: str = "", link: str = ""):
         """添加日志到列表视图
@@ -1152,28 +6856,7 @@ class MainWindow(QMainWindow):
             link: 可选的链接
         """
         current_time = QDateTime.currentDateTime().toString("HH:mm:ss")
-
-        # 构建HTML格式的日志文本
-        log_html = f"""
-        <div style='margin: 2px 0;'>
-            <span style='color: #666;'>[{current_time}]</span> 
-            <span style='color: #000000;'>▶ {operation}</span>
-        """
-
-        if link:
-            log_html += f""" <a href='{link}' style='color: #2196F3; text-decoration: none;'>[链接]</a>"""
-
-        if status:
-            if "成功" in status:
-                status_color = "#4CAF50"  # 绿色
-            elif "失败" in status or "错误" in status:
-                status_color = "#F44336"  # 红色
-                status = f"<b>{status}</b>"  # 加粗错误信息
-            else:
-                status_color = "#000000"  # 黑色
-            log_html += f""" <span style='color: {status_color};'>→ {status}</span>"""
-
-        log_html += "</div>"
+        log_html = self.format_log_html(current_time, operation, status, link)
 
         item = QStandardItem()
         item.setData(log_html, Qt.DisplayRole)
@@ -1186,39 +6869,161 @@ class MainWindow(QMainWindow):
             item.setBackground(QBrush(QColor("#ffffff")))
 
         self.log_model.insertRow(0, item)  # 在顶部插入
-        self.listViewLog.setItemDelegate(HTMLDelegate(self.listViewLog))  # 使用HTML代理
         self.listViewLog.scrollToTop()
 
-    def clear_previous_results(self):
-        """清空上次查询的结果"""
-        # 清空表格
-        self.tableDevTrade.setModel(None)
-        self.tableDevHistory.setModel(None)
-
-        # 清空标签
-        self.labelDevInfo.clear()
-        self.labelDevHistory.clear()
-        self.labelDevTrade.clear()
-        self.labelFilterTweets.clear()
-        self.labelFollowers.clear()
-        self.labelLikes.clear()
-        self.labelViews.clear()
-        self.labelOfficalTweets.clear()
-        self.labelSmartBuy.clear()
-        self.labelCoinDescription.clear()
-        self.labelCoinSymbol.clear()
-        self.labelCoinPic.clear()
-        self.labelSmartMoneyInfo.clear()
+    @staticmethod
+    def format_log_html(current_time: str, operation: str, status: str = "", link: str = "") -> str:
+        """格式化单条日志的HTML，样式来自 RichText 的共享样式表"""
+        if status:
+            if "成功" in status:
+                level = "ok"
+            elif "失败" in status or "错误" in status:
+                level = "error"
+            else:
+                level = "info"
+            status = RichText.html("log_status", level=level, status=status)
+
+        return RichText.html("log", time=current_time, operation=operation,
+                             link=RichText.html("log_link", link=link) if link else "", status=status)
+
+    def selected_tweet_category(self) -> str:
+        """推文类型选项卡当前对应的推文类型"""
+        return "official" if "官方" in self.tabSocialOptions.tabText(self.tabSocialOptions.currentIndex()) else "top"
+
+    def surface(self, session: TokenSession):
+        """标签页的渲染目标：前台标签页是主窗口控件，后台标签页是离屏控件"""
+        if session is self.session:
+            return self
+        if session.surface is None:
+            session.surface = TokenSurface(self)
+        return session.surface
+
+    def open_session(self, contract_address: str) -> TokenSession:
+        """切换到代币的标签页，没有时新建；超过上限时关闭最久未使用的空闲标签页"""
+        session = self.sessions.get(contract_address)
+        if session is None:
+            idle = [s for s in self.sessions.values() if s is not self.session and not s.busy]
+            if len(self.sessions) >= self.max_sessions and idle:
+                self.close_session(self.tab_index(idle[0]))
+            session = self.sessions[contract_address] = TokenSession(contract_address, self.selected_tweet_category())
+            self.tokenTabs.blockSignals(True)
+            index = self.tokenTabs.addTab(session.title)
+            self.tokenTabs.setTabData(index, contract_address)
+            self.tokenTabs.setTabToolTip(index, contract_address)
+            self.tokenTabs.blockSignals(False)
+        self.activate_session(session)
+        return session
+
+    def tab_index(self, session: TokenSession) -> int:
+        for index in range(self.tokenTabs.count()):
+            if self.tokenTabs.tabData(index) == session.contract:
+                return index
+        return -1
+
+    def on_token_tab_changed(self, index: int):
+        session = self.sessions.get(self.tokenTabs.tabData(index)) if index >= 0 else None
+        if session is not None:
+            self.activate_session(session)
+
+    def activate_session(self, session: TokenSession):
+        """
+        把标签页切到前台
+
+        上一个前台标签页的模型和显示内容移交给它的离屏控件，新标签页的移交给主窗口控件，不重新查询。
+        移交期间暂停主窗口重绘，切换后只重绘一次
+        """
+        previous = self.session
+        if previous is not session:
+            self.ui.setUpdatesEnabled(False)
+            try:
+                if previous is not None:
+                    self.detach_session(previous)
+                self.session = session
+                if session.surface is not None:
+                    TokenSurface.transfer(session.surface, self)
+                    session.surface = None
+                else:
+                    TokenSurface.clear(self)
+                if isinstance(self.tableSocial.model(), SocialTableModel):
+                    self.setup_social_table(self.tableSocial)
+            finally:
+                self.ui.setUpdatesEnabled(True)
+        self.sessions.move_to_end(session.contract)
+
+        index = self.tab_index(session)
+        self.tokenTabs.blockSignals(True)
+        self.tokenTabs.setCurrentIndex(index)
+        self.tokenTabs.setTabTextColor(index, QColor())
+        self.tokenTabs.blockSignals(False)
+        session.updated = False
+        if self.dev_report_window is not None and self.dev_report_window.isVisible():
+            self.refresh_dev_report_window()
+
+        # 地址输入框和推文类型跟随标签页，不触发预取和重新获取推文
+        self.prefetched_address = session.contract
+        self.leCA.blockSignals(True)
+        self.leCA.setText(session.contract)
+        self.leCA.blockSignals(False)
+        self.on_contract_changed(session.contract)
+        self.tabSocialOptions.blockSignals(True)
+        for i in range(self.tabSocialOptions.count()):
+            if ("官方" in self.tabSocialOptions.tabText(i)) == (session.tweet_category == "official"):
+                self.tabSocialOptions.setCurrentIndex(i)
+                break
+        self.tabSocialOptions.blockSignals(False)
+
+        self.btnQuery.setEnabled(not session.pending_sources)
+        self.btnQuery.setText("查询中..." if session.pending_sources else "查询")
+        self.btnQueryTradeInfo.setEnabled(not session.gmgn_pending)
+        self.btnQueryTradeInfo.setText("查询中..." if session.gmgn_pending else "查询GMGN")
+
+        if self.chart_window is not None and self.chart_window.isVisible():
+            self.chart_window.select_token(session.contract)
+
+    def detach_session(self, session: TokenSession):
+        """把前台标签页的模型和显示内容移交给它的离屏控件"""
+        if session.surface is None:
+            session.surface = TokenSurface(self)
+        TokenSurface.transfer(self, session.surface)
+
+    def close_session(self, index: int):
+        """关闭标签页，正在运行的数据源结束后结果写入已关闭标签页的离屏控件，随标签页一起释放"""
+        session = self.sessions.pop(self.tokenTabs.tabData(index), None) if index >= 0 else None
+        if session is None:
+            return
+        if session is self.session:
+            self.detach_session(session)
+            self.session = None
+        self.tokenTabs.blockSignals(True)
+        self.tokenTabs.removeTab(index)
+        self.tokenTabs.blockSignals(False)
+        if self.session is None:
+            if self.sessions:
+                self.activate_session(next(reversed(self.sessions.values())))
+            else:
+                TokenSurface.clear(self)
+                self.refresh_dev_report_window()
+                self.btnQuery.setEnabled(True)
+                self.btnQuery.setText("查询")
+                self.btnQueryTradeInfo.setEnabled(True)
+                self.btnQueryTradeInfo.setText("查询GMGN")
+
+    def mark_updated(self, session: TokenSession):
+        """后台标签页收到数据时标记标签，同一次后台期间只标记一次"""
+        if session is self.session or session.updated or session.contract not in self.sessions:
+            return
+        session.updated = True
+        self.tokenTabs.setTabTextColor(self.tab_index(session), QColor("#1976d2"))
 
     def query_coin_info(self):
-        """查询代币信息"""
-        contract_address = self.leCA.text().strip()
-        if not contract_address:
-            self.show_error_message("请输入代币合约地址")
+        """查询代币信息，已打开的代币切换到其标签页并刷新，未变化的数据源不再刷新"""
+        contract_address = self.validate_contract_address()
+        if contract_address is None:
             return
 
-        # 清空上次查询结果
-        self.clear_previous_results()
+        session = self.open_session(contract_address)
+        if session.pending_sources:
+            return
 
         # 禁用查询按钮
         self.btnQuery.setEnabled(False)
@@ -1227,232 +7032,347 @@ class MainWindow(QMainWindow):
         # 添加日志
         self.add_log("开始查询代币信息", f"合约地址: {contract_address}", f"https://gmgn.ai/sol/token/{contract_address}")
 
+        # 开始耗时追踪和性能分析，后续工作线程和回调都记录到这次查询中
+        session.query_trace = self.begin_query(f"query_coin_info {contract_address}")
+        session.pending_sources = {"代币信息"}
+        session.failed_sources = []
+
         # 1. 创建异步工作线程获取代币数据
-        self.coin_worker = ApiWorker(CoinDataFetcher.fetch_coin_data, contract_address)
-        self.coin_worker.finished.connect(lambda data: self.on_coin_data_received(data, contract_address))
-        self.coin_worker.error.connect(self.on_api_error)
-        self.coin_worker.start()
+        self.start_source_worker(
+            session, "代币信息", CoinDataFetcher.fetch_coin_data, (contract_address,),
+            lambda data: self.on_coin_data_received(session, data), skip_unchanged=False)
+
+    def start_source_worker(self, session: TokenSession, source: str, api_call, args: Tuple, on_finished,
+                            on_error=None, skip_unchanged: bool = True, on_rows=None) -> ApiWorker:
+        """
+        为标签页启动获取单个数据源的工作线程
+
+        数据源返回None（请求失败或超时）或出错时记为缺失，全部数据源结束后恢复查询按钮；
+        返回的正是当前已显示的解码结果（内容未变化）时跳过刷新。
+        指定 on_rows 时大数组边接收边解码，每解码一批就在主线程中调用 on_rows
+        """
+        def finished(data):
+            session.workers.pop(source, None)
+            if data is None:
+                session.rendered_payloads.pop(source, None)
+            elif skip_unchanged and session.rendered_payloads.get(source) is data:
+                self.add_log(f"获取{source}", "数据未变化，跳过刷新")
+                session.stream_models.pop(source, None)
+                self.source_done(session, source, True)
+                return
+            on_finished(data)
+            session.stream_models.pop(source, None)
+            if data is not None:
+                session.rendered_payloads[source] = data
+                self.mark_updated(session)
+            self.source_done(session, source, data is not None)
+
+        def error(message):
+            session.workers.pop(source, None)
+            (on_error or self.on_api_error)(message)
+            session.stream_models.pop(source, None)
+            self.source_done(session, source, False)
+
+        worker = ApiWorker(api_call, *args)
+        if on_rows is not None:
+            worker.streaming = True
+            worker.progress.connect(on_rows)
+        worker.finished.connect(Tracer.bind(finished, f"render {source}"))
+        worker.error.connect(error)
+        session.workers[source] = worker
+        worker.start()
+        return worker
+
+    def append_stream_rows(self, session: TokenSession, source: str, table: str, factory, rows: List[Any]):
+        """把流式解码的一批数据追加到表格，第一批到达时创建模型"""
+        model = session.stream_models.get(source)
+        if model is None:
+            model = session.stream_models[source] = factory()
+            getattr(self.surface(session), table).setModel(model)
+        model.append_rows(rows)
+
+    @staticmethod
+    def streamed_model(session: TokenSession, source: str, rows: int) -> Optional[QAbstractTableModel]:
+        """流式接收的模型已包含全部数据时返回该模型，否则返回None"""
+        model = session.stream_models.get(source)
+        return model if model is not None and model.rowCount() == rows else None
+
+    def source_done(self, session: TokenSession, source: str, ok: bool):
+        """数据源结束，全部结束后显示（部分）结果汇总"""
+        if source not in session.pending_sources:
+            return
+        session.pending_sources.discard(source)
+        if not ok:
+            session.failed_sources.append(source)
+        if session.pending_sources:
+            return
 
-    def on_coin_data_received(self, coin_data, contract_address):
+        if session.query_trace is not None:
+            session.query_trace.deadline = None
+        if session.failed_sources:
+            self.add_log(f"查询完成 {session.title}", f"部分结果 - 未获取：{'、'.join(session.failed_sources)}")
+        else:
+            self.add_log(f"查询完成 {session.title}", "全部数据获取成功")
+        if session is self.session:
+            self.btnQuery.setEnabled(True)
+            self.btnQuery.setText("查询")
+
+    def on_coin_data_received(self, session: TokenSession, coin_data):
         """处理代币数据"""
+        contract_address = session.contract
         if coin_data:
             # 添加日志
             self.add_log("获取代币信息",
-                        f"成功 - {coin_data.get('name', '')} ({coin_data.get('symbol', '')})",
-                        f"https://gmgn.ai/sol/token/{coin_data.get('mint', '')}")
+                        f"成功 - {coin_data.name} ({coin_data.symbol})",
+                        f"https://gmgn.ai/sol/token/{coin_data.mint}")
+
+            # 标签页显示代币符号
+            if coin_data.symbol:
+                session.title = coin_data.symbol
+                index = self.tab_index(session)
+                if index >= 0:
+                    self.tokenTabs.setTabText(index, session.title)
 
             # 更新代币相关标签
-            self.update_coin_labels(coin_data)
+            self.update_coin_labels(session, coin_data)
+            session.launch_ms = coin_data.created_timestamp or 0
 
-            # 2. 获取开发者交易记录
-            creator = coin_data.get('creator')
+            # 2. 其余数据源互不依赖，并行获取；某个数据源失败或超时只影响自己的展示区域
+            creator = coin_data.creator
             if creator:
+                session.pending_sources |= {"开发者交易", "开发者历史"}
                 self.add_log("请求开发者交易记录", "正在获取...", f"https://gmgn.ai/sol/address/{creator}")
-                self.trade_worker = ApiWorker(DevDataFetcher.fetch_dev_trades, coin_data.get('mint', ''))
-                self.trade_worker.finished.connect(lambda data: self.on_trade_data_received(data, creator, contract_address))
-                self.trade_worker.error.connect(self.on_api_error)
-                self.trade_worker.start()
+                self.start_source_worker(
+                    session, "开发者交易", DevDataFetcher.fetch_dev_trades, (coin_data.mint,),
+                    lambda data: self.on_trade_data_received(session, data, creator),
+                    on_rows=lambda rows: self.append_stream_rows(
+                        session, "开发者交易", "tableDevTrade", lambda: DevTradeTableModel([], creator),
+                        DevTradeRow.from_payloads(rows)))
+
+                self.add_log("请求开发者历史记录", "正在获取...", f"https://gmgn.ai/sol/address/{creator}")
+                self.start_source_worker(
+                    session, "开发者历史", DevDataFetcher.fetch_dev_history, (creator,),
+                    lambda data: self.on_history_data_received(session, data, creator))
+
+            # 3. 获取聪明钱数据
+            session.pending_sources.add("聪明钱")
+            session.chain_fm_received = 0
+            self.add_log("请求聪明钱信息", "正在获取...", "https://chain.fm")
+            self.start_source_worker(
+                session, "聪明钱", NodeService.fetch_chain_fm_data, (contract_address,),
+                lambda data: self.on_chain_fm_data_received(session, data),
+                on_rows=lambda transactions: self.on_chain_fm_rows_received(session, transactions))
+
+            # 4. 获取社交媒体信息
+            self.get_social_media_info(session)
         else:
             self.add_log("获取代币信息", "失败 - 未找到代币信息或发生错误")
-            self.btnQuery.setEnabled(True)
-            self.btnQuery.setText("查询")
 
-    def on_trade_data_received(self, trade_data, creator, contract_address):
+    def on_trade_data_received(self, session: TokenSession, trade_data, creator):
         """处理交易数据"""
+        ui = self.surface(session)
         if trade_data:
-            self.labelDevTrade.setText(f"交易信息（{DevDataFetcher.format_dev_trade_status(trade_data)}）")
-
-            if 'transactions' in trade_data:
-                self.add_log("获取开发者交易记录", f"成功 - {len(trade_data['transactions'])}条交易")
-                trade_model = DevTradeTableModel(trade_data['transactions'], creator)
-                self.tableDevTrade.setModel(trade_model)
-
-                # 3. 获取开发者历史记录
-                self.add_log("请求开发者历史记录", "正在获取...", f"https://gmgn.ai/sol/address/{creator}")
-                self.history_worker = ApiWorker(DevDataFetcher.fetch_dev_history, creator)
-                self.history_worker.finished.connect(lambda data: self.on_history_data_received(data, creator, contract_address))
-                self.history_worker.error.connect(self.on_api_error)
-                self.history_worker.start()
-
-            # 在获取历史记录之前添加
-            self.btnQuery.setEnabled(True)
-            self.btnQuery.setText("查询")
+            ui.labelDevTrade.setText(f"交易信息（{DevDataFetcher.format_dev_trade_status(trade_data)}）")
+
+            if trade_data.transactions is not None:
+                self.add_log("获取开发者交易记录", f"成功 - {len(trade_data.transactions)}条交易")
+                self.analyze_dev_trades(session, trade_data, creator)
+                # 流式接收时表格已显示全部交易，不再重建模型；否则按块转换，滚动到末尾时再转换下一块
+                if self.streamed_model(session, "开发者交易", len(trade_data.transactions)) is None:
+                    source = ListSource(trade_data.transactions, DevTradeRow.from_payloads)
+                    trade_model = DevTradeTableModel(source.next_block(), creator, source)
+                    ui.tableDevTrade.setModel(trade_model)
+        else:
+            self.add_log("获取开发者交易记录", "失败 - 请求失败或超时")
+            ui.tableDevTrade.setModel(NoDataTableModel("开发者交易记录获取失败或超时"))
+
+    def analyze_dev_trades(self, session: TokenSession, trade_data: DevTradeInfo, creator: str):
+        """在工作线程中重放开发者交易，完成后把盈亏摘要追加到交易信息标签"""
+        session.dev_trade_status = DevDataFetcher.format_dev_trade_status(trade_data)
+        smart_money = session.rendered_payloads.get("聪明钱")
+        sol_usd = SmartMoneyAnalyzer.sol_price(smart_money, session.contract) if smart_money else 0.0
+
+        def finished(report: DevTradeReport):
+            session.workers.pop("开发者分析", None)
+            smart_money = session.rendered_payloads.get("聪明钱")
+            if not report.sol_usd and smart_money:  # 分析期间聪明钱数据已返回
+                report.sol_usd = SmartMoneyAnalyzer.sol_price(smart_money, session.contract)
+            session.dev_report = report
+            self.show_dev_report(session)
+
+        def error(message):
+            session.workers.pop("开发者分析", None)
+            self.add_log("开发者交易分析", f"失败 - {message}")
+
+        worker = ApiWorker(DevTradeAnalytics.analyze, trade_data.transactions, session.launch_ms, sol_usd, creator)
+        worker.finished.connect(finished)
+        worker.error.connect(error)
+        session.workers["开发者分析"] = worker
+        worker.start()
+
+    def show_dev_report(self, session: TokenSession):
+        summary = DevTradeAnalytics.format_summary(session.dev_report)
+        self.surface(session).labelDevTrade.setText(
+            f"交易信息（{session.dev_trade_status}）" + (f" {summary}" if summary else ""))
+        if session is self.session and self.dev_report_window is not None and self.dev_report_window.isVisible():
+            self.refresh_dev_report_window()
+
+    def on_chain_fm_rows_received(self, session: TokenSession, transactions: List[ChainFmTransaction]):
+        """聪明钱汇总需要地址标签，而标签在交易列表之后才返回，接收期间只显示进度"""
+        session.chain_fm_received += len(transactions)
+        self.surface(session).labelSmartMoneyInfo.setText(
+            f"正在接收聪明钱交易... 已接收{session.chain_fm_received}笔")
+
+    def on_chain_fm_data_received(self, session: TokenSession, data: Optional[ChainFmTransactionList]):
+        """处理聪明钱数据"""
+        if data:
+            self.update_smart_money_info(session, data.parsedTransactions, data.address_labels,
+                                         SmartMoneySource(session.contract, data))
+            # 开发者交易先分析完成时补上SOL计价的盈亏
+            report = session.dev_report
+            if report is not None and not report.sol_usd:
+                report.sol_usd = SmartMoneyAnalyzer.sol_price(data, session.contract)
+                if report.sol_usd:
+                    self.show_dev_report(session)
+        else:
+            self.add_log("获取聪明钱数据", "失败 - 返回数据为空、请求失败或超时")
+            self.surface(session).labelSmartMoneyInfo.clear()
 
-    def on_history_data_received(self, history_data, creator, contract_address):
+    def on_history_data_received(self, session: TokenSession, history_data, creator):
         """处理历史数据"""
+        ui = self.surface(session)
         if history_data:
             self.add_log("获取开发者历史记录", f"成功 - {len(history_data)}条记录")
 
-            # 更新开发者信息标签
-            self.labelDevInfo.setText(self.format_dev_info(creator))
-            self.labelDevInfo.setOpenExternalLinks(True)
-
-            # 设置点击事件
-            self.labelDevInfo.mousePressEvent = lambda e: self.handle_dev_info_click(e, creator)
-
-            self.labelDevHistory.setText(DevDataFetcher.format_dev_history(history_data))
-
-            # 按市值排序
-            sorted_history = sorted(history_data,
-                                  key=lambda x: (x.get('usd_market_cap', 0), x.get('created_timestamp', 0)),
-                                  reverse=True)
-
-            history_model = DevHistoryTableModel(sorted_history)
-            self.tableDevHistory.setModel(history_model)
+            # 更新开发者信息标签，点击复制的地址取自前台标签页
+            session.creator = creator
+            RichText.set_label(ui.labelDevInfo, "dev_info", creator=creator)
+            ui.labelDevInfo.setOpenExternalLinks(True)
 
-            # 4. 获取聪明钱数据
-            self.add_log("请求聪明钱信息", "正在获取...", "https://chain.fm")
-            try:
-                data = NodeService.fetch_chain_fm_data(contract_address)
-                if data and len(data) > 0:
-                    result = data[0].get('result', {})
-                    transactions = result.get('data', {}).get('json', {}).get('data', {}).get('parsedTransactions', [])
-                    address_labels = result['data']['json']['data']['data'][0]['renderContext']['addressLabelsMap']
-                    self.update_smart_money_info(transactions, address_labels)
-
-                    # 5. 获取社交媒体信息
-                    self.get_social_media_info(contract_address)
-                else:
-                    self.add_log("获取聪明钱数据", "失败 - 返回数据为空")
-                    # 即使聪明钱数据为空，也继续获取社交媒体信息
-                    self.get_social_media_info(contract_address)
-            except Exception as e:
-                self.add_log("获取聪明钱数据", f"错误 - {str(e)}")
-                # 发生错误时也继续获取社交媒体信息
-                self.get_social_media_info(contract_address)
+            ui.labelDevHistory.setText(DevDataFetcher.format_dev_history(history_data, creator))
 
-            # 在获取社交媒体信息之前添加
-            self.btnQuery.setEnabled(True)
-            self.btnQuery.setText("查询")
+            # 后续页在滚动到末尾时再请求，并按市值排序并入
+            history_model = DevHistoryTableModel(DevHistoryRow.from_payloads(history_data),
+                                                 DevHistorySource(creator, history_data))
+            history_model.sort(2, Qt.DescendingOrder)
+            history_model.load_failed.connect(lambda message: self.add_log("获取开发者历史记录", f"失败 - {message}"))
+            ui.tableDevHistory.setModel(history_model)
         else:
-            self.btnQuery.setEnabled(True)
-            self.btnQuery.setText("查询")
+            self.add_log("获取开发者历史记录", "失败 - 请求失败或超时")
+            ui.tableDevHistory.setModel(NoDataTableModel("开发者历史记录获取失败或超时"))
 
-    def get_social_media_info(self, contract_address):
+    def get_social_media_info(self, session: TokenSession):
         """获取社交媒体信息"""
         # 获取社交统计信息
-        url = f"https://www.pump.news/api/trpc/analyze.getBatchTokenDataByTokenAddress,watchlist.batchTokenWatchState?batch=1&input=%7B%220%22%3A%7B%22json%22%3A%7B%22tokenAddresses%22%3A%5B%22{contract_address}%22%5D%7D%7D%2C%221%22%3A%7B%22json%22%3A%7B%22tokenAddresses%22%3A%5B%22{contract_address}%22%5D%7D%7D%7D"
-
-        self.social_worker = ApiWorker(requests.get, url)
-        self.social_worker.finished.connect(lambda response: self.update_social_info(response.json()))
-        self.social_worker.error.connect(self.on_api_error)
-        self.social_worker.start()
+        session.pending_sources |= {"社交统计", "推文"}
+        self.start_source_worker(
+            session, "社交统计", SocialDataFetcher.fetch_social_stats, (session.contract,),
+            lambda data: self.update_social_info(session, data))
 
         # 获取推文列表
-        self.get_tweets_by_category(contract_address, self.current_tweet_category)
+        self.get_tweets_by_category(session, session.tweet_category)
 
-    def get_tweets_by_category(self, contract_address: str, category: str):
+    def get_tweets_by_category(self, session: TokenSession, category: str):
         """根据类型获取推文数据"""
-        # 清除现有数据
-        self.tableSocial.setModel(None)
-
         # 添加日志
         self.add_log(f"获取推文", f"正在获取{category}类型推文...")
 
-        tweets_url = f"https://www.pump.news/api/trpc/utils.getCannyList,service.getServiceCallCount,tweets.getTweetsByTokenAddress?batch=1&input=%7B%220%22%3A%7B%22json%22%3Anull%2C%22meta%22%3A%7B%22values%22%3A%5B%22undefined%22%5D%7D%7D%2C%221%22%3A%7B%22json%22%3A%7B%22service%22%3A%22optimize%22%7D%7D%2C%222%22%3A%7B%22json%22%3A%7B%22tokenAddress%22%3A%22{contract_address}%22%2C%22type%22%3A%22filter%22%2C%22category%22%3A%22{category}%22%7D%7D%7D"
+        self.start_source_worker(
+            session, "推文", SocialDataFetcher.fetch_tweets, (session.contract, category),
+            lambda tweets: self.update_tweets(session, tweets),
+            lambda message: self.on_tweets_error(session, message),
+            on_rows=lambda tweets: self.append_stream_rows(
+                session, "推文", "tableSocial", SocialTableModel, TweetRow.from_payloads(tweets)))
 
-        self.tweets_worker = ApiWorker(requests.get, tweets_url)
-        self.tweets_worker.finished.connect(lambda response: self.update_tweets(response.json()))
-        self.tweets_worker.error.connect(self.on_api_error)
-        self.tweets_worker.start()
-
-    def update_social_info(self, data):
+    def update_social_info(self, session: TokenSession, token_data: Optional[PumpNewsTokenData]):
         """更新社交信息"""
+        if token_data is None:
+            self.add_log("更新社交统计信息", "错误 - 未找到社交统计数据")
+            return
+
+        ui = self.surface(session)
         try:
             # 更新统计数据
-            stats = data[0]["result"]["data"]["json"]["data"]["data"][0]["stats"]
-            self.labelFilterTweets.setText(f"推文数：{stats['filter_tweets']}")
-            self.labelFollowers.setText(f"触达人数：{stats['followers']:,}人")
-            self.labelLikes.setText(f"点赞：{stats['likes']:,}")
-            self.labelViews.setText(f"浏览：{stats['views']:,}")
-            self.labelOfficalTweets.setText(f"官方推文：{stats['official_tweets']}")
-            self.labelSmartBuy.setText(f"智能买入：{data[0]['result']['data']['json']['data']['data'][0]['smartbuy']}")
+            stats = token_data.stats
+            ui.labelFilterTweets.setText(f"推文数：{stats.filter_tweets}")
+            ui.labelFollowers.setText(f"触达人数：{stats.followers:,}人")
+            ui.labelLikes.setText(f"点赞：{stats.likes:,}")
+            ui.labelViews.setText(f"浏览：{stats.views:,}")
+            ui.labelOfficalTweets.setText(f"官方推文：{stats.official_tweets}")
+            ui.labelSmartBuy.setText(f"智能买入：{token_data.smartbuy}")
 
             # 更新描述
-            summary = data[0]["result"]["data"]["json"]["data"]["data"][0]["analysis"]["lang-zh-CN"]["summary"]
-            self.labelCoinDescription.setText(summary)
+            ui.labelCoinDescription.setText(token_data.analysis["lang-zh-CN"].summary)
 
         except Exception as e:
             self.add_log("更新社交统计信息", f"错误 - {str(e)}")
 
-    def update_tweets(self, tweets_data):
+    def on_tweets_error(self, session: TokenSession, error_msg):
+        """处理推文获取错误"""
+        error_msg = f"获取推文数据失败：{error_msg}"
+        self.add_log("更新推文列表", f"错误 - {error_msg}")
+        self.surface(session).tableSocial.setModel(NoDataTableModel(error_msg))
+
+    def update_tweets(self, session: TokenSession, tweets: List[PumpNewsTweet]):
         """更新推文信息"""
+        table = self.surface(session).tableSocial
         try:
-            if not tweets_data or not isinstance(tweets_data, list) or len(tweets_data) < 3:
-                error_msg = "获取推文数据失败：数据格式无效"
-                self.add_log("更新推文列表", f"错误 - {error_msg}")
-                self.tableSocial.setModel(NoDataTableModel(error_msg))
-                return
-
-            tweets = tweets_data[2]["result"]["data"]["json"]["data"]["data"]["tweets"]
             if not tweets:
-                error_msg = f"未找到{self.current_tweet_category}类型的推文"
+                error_msg = f"未找到{session.tweet_category}类型的推文"
                 self.add_log("更新推文列表", f"提示 - {error_msg}")
-                self.tableSocial.setModel(NoDataTableModel(error_msg))
+                table.setModel(NoDataTableModel(error_msg))
                 return
 
-            self.add_log("推文列表", f"成功获取 {len(tweets)} 条{self.current_tweet_category}类型推文")
-
-            # 更新社交媒体表格
-            model = SocialTableModel(tweets)
-            self.tableSocial.setModel(model)
-
-            # 设置列宽
-            header = self.tableSocial.horizontalHeader()
-            header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # 用户名列
-            header.setSectionResizeMode(1, QHeaderView.Fixed)  # 蓝标列
-            header.setDefaultSectionSize(40)  # 蓝标列宽度
-            header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # 浏览列
-            header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # 点赞列
-            header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 转发列
-            header.setSectionResizeMode(5, QHeaderView.Stretch)  # 内容列
+            self.add_log("推文列表", f"成功获取 {len(tweets)} 条{session.tweet_category}类型推文")
 
-            # 设置表格样式
-            self.tableSocial.setStyleSheet("""
-                QTableView {
-                    border: 1px solid #dcdcdc;
-                    background-color: white;
-                    gridline-color: #f0f0f0;
-                }
-                QTableView::item {
-                    padding: 5px;
-                }
-                QTableView::item:hover {
-                    background-color: #f8f9fa;
-                }
-                QHeaderView::section {
-                    background-color: #f8f9fa;
-                    padding: 5px;
-                    border: none;
-                    border-right: 1px solid #dcdcdc;
-                    border-bottom: 1px solid #dcdcdc;
-                }
-            """)
+            # 更新社交媒体表格，流式接收时表格已显示全部推文；否则按块转换
+            if self.streamed_model(session, "推文", len(tweets)) is None:
+                source = ListSource(tweets, TweetRow.from_payloads)
+                model = SocialTableModel(source.next_block(), source)
+                table.setModel(model)
 
-            # 添加点击事件处理
-            self.tableSocial.clicked.connect(self.on_social_table_clicked)
+            self.setup_social_table(table)
 
         except Exception as e:
             error_msg = f"更新推文失败：{str(e)}"
             self.add_log("更新推文列表", f"错误 - {error_msg}")
-            self.tableSocial.setModel(NoDataTableModel(error_msg))
+            table.setModel(NoDataTableModel(error_msg))
+
+    @staticmethod
+    def setup_social_table(table: QTableView):
+        """设置推文表格的列宽和样式，更换模型后列宽设置需要重新应用"""
+        # 设置列宽
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # 用户名列
+        header.setSectionResizeMode(1, QHeaderView.Fixed)  # 蓝标列
+        header.setDefaultSectionSize(40)  # 蓝标列宽度
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # 浏览列
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # 点赞列
+        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 转发列
+        header.setSectionResizeMode(5, QHeaderView.Stretch)  # 内容列
+
+        # 设置表格样式
+        if table.styleSheet() != MainWindow.SOCIAL_TABLE_STYLE:
+            table.setStyleSheet(MainWindow.SOCIAL_TABLE_STYLE)
 
     def on_social_table_clicked(self, index):
         """处理社交媒体表格点击事件"""
         if index.column() == 5:  # 内容列
             tweet = self.tableSocial.model()._tweets[index.row()]
-            tweet_id = tweet.get("tweet_id")
-            user_screen_name = tweet.get("user", {}).get("screen_name")
+            tweet_id = tweet.tweet_id
+            user_screen_name = tweet.screen_name
             if tweet_id and user_screen_name:
                 url = f"https://twitter.com/{user_screen_name}/status/{tweet_id}"
                 QDesktopServices.openUrl(QUrl(url))
 
-    def update_coin_labels(self, coin_data: Dict[str, Any]):
+    def update_coin_labels(self, session: TokenSession, coin_data: PumpCoin):
         """更新代币相关标签"""
+        ui = self.surface(session)
+
         # 设置代币名称
-        symbol_text = f"{coin_data.get('name', 'Unknown')} ({coin_data.get('symbol', '')})"
-        self.labelCoinSymbol.setText(symbol_text)
-        self.labelCoinSymbol.setStyleSheet("""
+        symbol_text = f"{coin_data.name or 'Unknown'} ({coin_data.symbol})"
+        ui.labelCoinSymbol.setText(symbol_text)
+        ui.labelCoinSymbol.setStyleSheet("""
             QLabel {
                 font-size: 16px;
                 font-weight: bold;
@@ -1462,9 +7382,9 @@ class MainWindow(QMainWindow):
         """)
 
         # 设置代币描述
-        description = coin_data.get('description', '暂无描述')
-        self.labelCoinDescription.setText(description)
-        self.labelCoinDescription.setStyleSheet("""
+        description = coin_data.description or '暂无描述'
+        ui.labelCoinDescription.setText(description)
+        ui.labelCoinDescription.setStyleSheet("""
             QLabel {
                 font-size: 14px;
                 color: #666;
@@ -1472,16 +7392,16 @@ class MainWindow(QMainWindow):
                 line-height: 1.4;
             }
         """)
-        self.labelCoinDescription.setWordWrap(True)  # 允许文字换行
+        ui.labelCoinDescription.setWordWrap(True)  # 允许文字换行
 
         # 设置代币图片
-        image_uri = coin_data.get('image_uri', '')
+        image_uri = coin_data.image_uri
         if image_uri:
-            ImageHandler.download_and_display_image(image_uri, self.labelCoinPic)
-            self.labelCoinPic.setMinimumSize(64, 64)
-            self.labelCoinPic.setMaximumSize(64, 64)
-            self.labelCoinPic.setScaledContents(True)
-            self.labelCoinPic.setStyleSheet("""
+            ImageHandler.download_and_display_image(image_uri, ui.labelCoinPic)
+            ui.labelCoinPic.setMinimumSize(64, 64)
+            ui.labelCoinPic.setMaximumSize(64, 64)
+            ui.labelCoinPic.setScaledContents(True)
+            ui.labelCoinPic.setStyleSheet("""
                 QLabel {
                     border: 1px solid #dcdcdc;
                     border-radius: 4px;
@@ -1489,125 +7409,84 @@ class MainWindow(QMainWindow):
                 }
             """)
 
-    def handle_dev_info_click(self, event, creator: str):
+    def handle_dev_info_click(self, event):
         """处理开发者信息标签的点击事件"""
+        if self.session is None or not self.session.creator:
+            return
+
         # 获取点击位置的HTML
         pos = event.pos()
         html = self.labelDevInfo.text()
 
         # 如果点击了复制图标
         if "📋" in html[self.labelDevInfo.hitTest(pos)]:
-            self.copy_dev_address(creator)
-
-    def update_smart_money_info(self, transactions_data: List[Dict[str, Any]],
-                             address_labels_map: Dict[str, List[Dict[str, str]]]):
-        """更新聪明钱信息"""
-        processed_data = []
-        buy_count = 0
-        sell_count = 0
-        buy_volume = 0
-        sell_volume = 0
+            self.copy_dev_address(self.session.creator)
 
+    def update_smart_money_info(self, session: TokenSession, transactions_data: List[ChainFmTransaction],
+                             address_labels_map: Dict[str, List[ChainFmAddressLabel]],
+                             source: Optional[SmartMoneySource] = None):
+        """更新聪明钱信息，指定 source 时滚动到末尾继续加载后续页"""
         self.add_log(f"开始处理{len(transactions_data)}条交易数据")
 
         # 保存原始数据到文件
         try:
             with open('smart_money_raw_data.json', 'w', encoding='utf-8') as f:
-                json.dump({
+                json.dump(PayloadDecoder.to_builtins({
                     'transactions': transactions_data,
                     'address_labels': address_labels_map
-                }, f, ensure_ascii=False, indent=2)
+                }), f, ensure_ascii=False, indent=2)
         except Exception as e:
             self.add_log("保存原始数据", f"错误 - 无法保存到文件: {str(e)}")
 
-        for tx in transactions_data:
-            for event in tx.get('events', []):
-                address = event.get('address', '')
-                labels = address_labels_map.get(address, [])
-
-                if not labels:  # 如果没有标签，跳过
-                    continue
-
-                # 只取第一个标签
-                first_label = labels[0].get('label', '')
-
-                data = event.get('data', {})
-                order = data.get('order', {})
-                input_token = data.get('input', {}).get('token', '')
-                output_token = data.get('output', {}).get('token', '')
-                contract = self.leCA.text().strip()
-
-                is_buy = output_token == contract
-                volume_native = order.get('volume_native', 0)
-
-                if is_buy:
-                    buy_count += 1
-                    buy_volume += volume_native
-                else:
-                    sell_count += 1
-                    sell_volume += volume_native
-
-                processed_data.append({
-                    'address': address,
-                    'labels': [first_label],  # 只保存第一个标签
-                    'is_buy': is_buy,
-                    'price_usd': order.get('price_usd', 0),
-                    'volume_native': volume_native
-                })
+        processed_data, summary = SmartMoneyAnalyzer.aggregate(
+            transactions_data, address_labels_map, session.contract)
 
         # 保存处理后的数据到文件
         try:
             with open('smart_money_processed_data.json', 'w', encoding='utf-8') as f:
-                json.dump({
+                json.dump(PayloadDecoder.to_builtins({
                     'processed_data': processed_data,
-                    'summary': {
-                        'buy_count': buy_count,
-                        'sell_count': sell_count,
-                        'buy_volume': buy_volume,
-                        'sell_volume': sell_volume
-                    }
-                }, f, ensure_ascii=False, indent=2)
+                    'summary': summary
+                }), f, ensure_ascii=False, indent=2)
         except Exception as e:
             self.add_log("保存处理后数据", f"错误 - 无法保存到文件: {str(e)}")
 
-        self.add_log(f"处理完成: 买入{buy_count}笔, 卖出{sell_count}笔")
+        self.add_log(f"处理完成: 买入{summary.buy_count}笔, 卖出{summary.sell_count}笔")
 
         # 更新表格
-        if processed_data:
-            model = SmartMoneyTableModel(processed_data)
-            self.tableSmartMoney.setModel(model)
-            self.tableSmartMoney.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-            # 设置表格代理以处理背景色
-            self.tableSmartMoney.setItemDelegate(TableStyleDelegate())
+        if processed_data or (source is not None and not source.exhausted):
+            model = SmartMoneyTableModel(processed_data, source)
+            # 加载后续页后按全部已加载的行重新统计
+            model.rowsInserted.connect(lambda: self.show_smart_money_summary(
+                session, SmartMoneyAnalyzer.summarize(model.loaded_rows())))
+            model.load_failed.connect(lambda message: self.add_log("获取聪明钱数据", f"失败 - {message}"))
+            table = self.surface(session).tableSmartMoney
+            table.setModel(model)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
             # 打印一些调试信息
             self.add_log("表格数据", f"成功 - 添加了{len(processed_data)}行数据")
         else:
             self.add_log("表格数据", "警告 - 没有可显示的数据")
 
-        # 更新统计信息
-        net_volume = buy_volume - sell_volume
-        info_html = f"""
-        <html>
-        <body>
-            <span>聪明钱：</span>
-            <span style='color: #4CAF50;'>买{buy_count}人 {int(buy_volume)}SOL</span>，
-            <span style='color: #F44336;'>卖{sell_count}人 {int(sell_volume)}SOL</span>，
-            <span style='color: {"#4CAF50" if net_volume >= 0 else "#F44336"}'>
-                净{("买入" if net_volume >= 0 else "卖出")} {abs(int(net_volume))}SOL
-            </span>
-        </body>
-        </html>
-        """
-        self.labelSmartMoneyInfo.setText(info_html)
+        self.show_smart_money_summary(session, summary)
         self.add_log("聪明钱信息更新完成")
 
+    def show_smart_money_summary(self, session: TokenSession, summary: SmartMoneySummary):
+        """显示聪明钱买卖统计"""
+        net_volume = summary.net_volume
+        RichText.set_label(
+            self.surface(session).labelSmartMoneyInfo, "smart_money_summary",
+            buy_count=summary.buy_count, buy_volume=int(summary.buy_volume),
+            sell_count=summary.sell_count, sell_volume=int(summary.sell_volume),
+            net_class="buy" if net_volume >= 0 else "sell",
+            net_side="买入" if net_volume >= 0 else "卖出",
+            net_volume=abs(int(net_volume)),
+        )
+
     def on_api_error(self, error_msg):
         """处理API错误"""
         self.add_log("API请求错误", f"错误 - {error_msg}")
-        self.btnQuery.setEnabled(True)
-        self.btnQuery.setText("查询")
 
     def show_error_message(self, message: str):
         """显示错误信息"""
@@ -1620,42 +7499,44 @@ class MainWindow(QMainWindow):
         sys.exit(1)
 
     def on_tweet_tab_changed(self, index):
-        """处理推文类型选项卡切换事件"""
-        # 获取当前选中的tab名称
-        current_tab = self.tabSocialOptions.tabText(index).lower()
+        """处理推文类型选项卡切换事件，只重新获取前台标签页的推文"""
+        session = self.session
+        if session is None:
+            return
 
         # 根据tab名称确定category
-        if "官方" in current_tab:
-            new_category = "official"
-        else:
-            new_category = "top"
+        new_category = self.selected_tweet_category()
 
         # 如果类型没有改变，不需要重新获取数据
-        if new_category == self.current_tweet_category:
+        if new_category == session.tweet_category:
             return
 
         # 更新当前类型
-        self.current_tweet_category = new_category
-
-        # 获取当前合约地址
-        contract_address = self.leCA.text().strip()
-        if not contract_address:
-            return
+        session.tweet_category = new_category
 
         # 添加日志
         category_name = "官方" if new_category == "official" else "热门"
         self.add_log(f"切换推文类型", f"切换到{category_name}推文")
 
+        # 清除现有数据
+        self.tableSocial.setModel(None)
+        session.rendered_payloads.pop("推文", None)
+        session.stream_models.pop("推文", None)
+
         # 重新获取推文数据
-        self.get_tweets_by_category(contract_address, new_category)
+        self.get_tweets_by_category(session, new_category)
 
     def query_gmgn_info(self):
         """查询GMGN数据"""
-        contract_address = self.leCA.text().strip()
-        if not contract_address:
-            self.show_error_message("请输入代币合约地址")
+        contract_address = self.validate_contract_address()
+        if contract_address is None:
             return
 
+        session = self.open_session(contract_address)
+        if session.gmgn_pending:
+            return
+        session.gmgn_pending = True
+
         # 禁用查询按钮
         self.btnQueryTradeInfo.setEnabled(False)
         self.btnQueryTradeInfo.setText("查询中...")
@@ -1663,47 +7544,32 @@ class MainWindow(QMainWindow):
         # 添加日志
         self.add_log("开始查询GMGN数据", f"合约地址: {contract_address}")
 
-        # 构建API URLs和参数
-        base_params = {
-            "device_id": "520cc162-92cd-4ee6-9add-25e40e359805",
-            "client_id": "gmgn_web_2025.0128.214338",
-            "from_app": "gmgn",
-            "app_ver": "2025.0128.214338",
-            "tz_name": "Asia/Shanghai",
-            "tz_offset": "28800",
-            "app_lang": "en"
-        }
+        # 开始耗时追踪和性能分析
+        session.gmgn_trace = self.begin_query(f"query_gmgn_info {contract_address}")
 
-        urls = {
-            "holder": f"https://gmgn.ai/api/v1/token_stat/sol/{contract_address}",
-            "wallet_tags": f"https://gmgn.ai/api/v1/token_wallet_tags_stat/sol/{contract_address}",
-            "top_holders": f"https://gmgn.ai/api/v1/mutil_window_token_security_launchpad/sol/{contract_address}"
-        }
+        # 三个接口在共享事件循环中并发获取，界面线程不等待
+        self.add_log("通过本地Node.js服务获取数据")
+        task = session.workers["GMGN"] = AsyncTask(NodeService.fetch_gmgn_data_async, contract_address)
+        task.finished.connect(Tracer.bind(lambda responses: self.on_gmgn_data_received(session, responses),
+                                          "render GMGN"))
+        task.error.connect(lambda message: self.on_gmgn_error(session, message))
+        task.start()
 
+    def on_gmgn_data_received(self, session: TokenSession, responses: Dict[str, Tuple[Optional[Any], str]]):
+        """处理GMGN数据，单个接口超时或失败时展示其余接口的部分结果"""
         try:
-            self.add_log("通过本地Node.js服务获取数据")
             results = {}
-            for name, url in urls.items():
-                response = requests.post("http://localhost:3000", json={
-                    "url": f"{url}?{urllib.parse.urlencode(base_params)}",
-                    "dataType": "gmgn_data"
-                })
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('success'):
-                        results[name] = data.get('response')
-                        self.add_log(f"获取{name}数据", "成功")
-                    else:
-                        self.add_log(f"获取{name}数据", f"失败 - {data.get('error')}")
-                else:
-                    self.add_log(f"获取{name}数据", f"失败 - 状态码: {response.status_code}")
+            for name, (data, status) in responses.items():
+                self.add_log(f"获取{name}数据", status)
+                if data is not None:
+                    results[name] = data
 
             if results:
-                self.display_gmgn_results(results)
+                self.display_gmgn_results(session, results)
+                self.mark_updated(session)
 
                 # 获取Chain.fm数据
-                # chain_fm_response = requests.post("http://localhost:3000", json={
+                # chain_fm_response = HttpClient.post("http://localhost:3000", json={
                 #     "url": "https://chain.fm/api/trpc/parsedTransaction.list",
                 #     "dataType": "chain_fm_transactions",
                 #     "token": contract_address
@@ -1727,148 +7593,161 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.add_log("获取数据失败", f"错误: {str(e)}")
 
-        self.btnQueryTradeInfo.setEnabled(True)
-        self.btnQueryTradeInfo.setText("查询GMGN")
+        self.finish_gmgn_query(session)
+
+    def on_gmgn_error(self, session: TokenSession, error_msg):
+        """处理GMGN查询异常"""
+        self.add_log("获取数据失败", f"错误: {error_msg}")
+        self.finish_gmgn_query(session)
 
-    def display_gmgn_results(self, results):
+    def finish_gmgn_query(self, session: TokenSession):
+        """GMGN查询结束，恢复查询按钮"""
+        session.gmgn_pending = False
+        session.workers.pop("GMGN", None)
+        if session.gmgn_trace is not None:
+            session.gmgn_trace.deadline = None
+        if session is self.session:
+            self.btnQueryTradeInfo.setEnabled(True)
+            self.btnQueryTradeInfo.setText("查询GMGN")
+
+    def display_gmgn_results(self, session: TokenSession, results):
         """显示GMGN数据结果"""
+        ui = self.surface(session)
         try:
             # 显示holder数据
             if 'holder' in results:
-                holder_data = results['holder'].get('data', {})
-                holder_count = holder_data.get('data')['holder_count']
-                blue_chip_count = holder_data.get('data')['bluechip_owner_count']
-                # bluechip_owner_percentage = holder_data.get('data')['bluechip_owner_percentage']
-                # top_rat_trader_percentage = holder_data.get('data')['top_rat_trader_percentage']
-
-                bluechip_owner_percentage = float(holder_data.get('data', {}).get('bluechip_owner_percentage', 0))
-                top_rat_trader_percentage = float(holder_data.get('data', {}).get('top_rat_trader_percentage', 0))
-
-                holder_html = f"""
-                <html>
-                <head>
-                <style>
-                    .container {{ font-family: Arial, sans-serif; padding: 10px; }}
-                    .title {{ color: #1976D2; font-size: 14px; font-weight: bold; margin-bottom: 5px; }}
-                    .stat {{ margin: 5px 0; }}
-                    .label {{ color: #666; }}
-                    .value {{ color: #2196F3; font-weight: bold; }}
-                    .highlight {{ color: #4CAF50; font-weight: bold; }}
-                </style>
-                </head>
-                <body>
-                <div class="container">
-                    <div class="title">持有者统计：</div>
-                        <span class="label">Holder：</span>
-                        <span class="value">{holder_count:,}</span>
-
-                        <span class="label">蓝筹持有人：</span>
-                        <span class="value">{blue_chip_count:,}</span>
-
-                        <span class="label">蓝筹比例：</span>
-                        <span class="value">{bluechip_owner_percentage:.2%}</span>
-
-                        <span class="label">老鼠仓比例：</span>
-                        <span class="value">{top_rat_trader_percentage:.2%}</span>
-                    </div>
-                </div>
-                </body>
-                </html>
-                """
-                self.labelHolderInfo.setText(holder_html)
+                holder_data = results['holder']
+                RichText.set_label(
+                    ui.labelHolderInfo, "gmgn_holder",
+                    holder_count=holder_data.holder_count,
+                    bluechip_owner_count=holder_data.bluechip_owner_count,
+                    bluechip_owner_percentage=holder_data.bluechip_owner_percentage,
+                    top_rat_trader_percentage=holder_data.top_rat_trader_percentage,
+                )
 
             # 显示钱包分类统计
             if 'wallet_tags' in results:
-                wallet_data = results['wallet_tags'].get('data').get('data')
-                wallet_tags_smart_wallets=wallet_data['smart_wallets']
-                wallet_fresh_wallets=wallet_data['fresh_wallets']
-                wallet_tags_renowned_wallets=wallet_data['renowned_wallets']
-                wallet_tags_sniper_wallets=wallet_data['sniper_wallets']
-                wallet_tags_rat_trader_wallets=wallet_data['rat_trader_wallets']
-                wallet_tags_whale_wallets=wallet_data['whale_wallets']
-                wallet_tags_top_wallets=wallet_data['top_wallets']
-                wallet_tags_following_wallets=wallet_data['following_wallets']
-
-                tags_html = f"""
-                <html>
-                <head>
-                <style>
-                    .container {{ font-family: Arial, sans-serif; padding: 10px; }}
-                    .title {{ color: #1976D2; font-size: 14px; font-weight: bold; margin-bottom: 5px; }}
-                    .stat {{ margin: 5px 0; }}
-                    .label {{ color: #666; }}
-                    .value {{ color: #2196F3; font-weight: bold; }}
-                    .highlight {{ color: #4CAF50; font-weight: bold; }}
-                </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <div class="title">地址分类：</div>
-                            <span class="label">聪明钱：</span>
-                            <span class="value">{wallet_tags_smart_wallets:,}</span>
-                            <span class="label">新地址：</span>
-                            <span class="value">{wallet_fresh_wallets:,}</span>
-    
-                            <span class="label">Renowned：</span>
-                            <span class="value">{wallet_tags_renowned_wallets:,}</span>
-                            <span class="label">阻击地址：</span>
-                            <span class="value">{wallet_tags_sniper_wallets:,}</span>
-    
-                            <span class="label">老鼠仓地址：</span>
-                            <span class="value">{wallet_tags_rat_trader_wallets:,}</span>
-                            <span class="label">大户地址：</span>
-                            <span class="value">{wallet_tags_whale_wallets:,}</span>
-    
-                            <span class="label">Top Wallet：</span>
-                            <span class="value">{wallet_tags_top_wallets:,}</span>
-                            <span class="label">关注地址：</span>
-                            <span class="value">{wallet_tags_following_wallets:,}</span>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
-                self.labelWalletTag.setText(tags_html)
+                wallet_data = results['wallet_tags']
+                RichText.set_label(
+                    ui.labelWalletTag, "gmgn_wallet_tags",
+                    smart_wallets=wallet_data.smart_wallets,
+                    fresh_wallets=wallet_data.fresh_wallets,
+                    renowned_wallets=wallet_data.renowned_wallets,
+                    sniper_wallets=wallet_data.sniper_wallets,
+                    rat_trader_wallets=wallet_data.rat_trader_wallets,
+                    whale_wallets=wallet_data.whale_wallets,
+                    top_wallets=wallet_data.top_wallets,
+                    following_wallets=wallet_data.following_wallets,
+                )
 
             # 显示Top 10持有量
             if 'top_holders' in results:
-                holders_data = results['top_holders'].get('data').get('data').get('security')
-                top_10_holder_rate = float(holders_data.get('top_10_holder_rate'))
-                burn_status=holders_data.get('burn_status')
-
-                holders_html = f"""
-                <html>
-                <head>
-                <style>
-                    .container {{ font-family: Arial, sans-serif; padding: 10px; }}
-                    .title {{ color: #1976D2; font-size: 14px; font-weight: bold; margin-bottom: 5px; }}
-                    .stat {{ margin: 5px 0; }}
-                    .label {{ color: #666; }}
-                    .value {{ color: #2196F3; font-weight: bold; }}
-                    .highlight {{ color: #4CAF50; font-weight: bold; }}
-                </style>
-                </head>
-                <body>
-                <div class="container">
-                    <div class="title">Top 10持有者：</div>
-                        <span class="label">Top 10比例：</span>
-                        <span class="value">{top_10_holder_rate:.2%}</span>
-                        <span class="label">燃烧状态：</span>
-                        <span class="value">{burn_status}</span>
-                </div>
-                </body>
-                </html>
-                """
-                self.labelTop10.setText(holders_html)
+                holders_data = results['top_holders'].security
+                RichText.set_label(
+                    ui.labelTop10, "gmgn_top_holders",
+                    top_10_holder_rate=holders_data.top_10_holder_rate,
+                    burn_status=holders_data.burn_status,
+                )
 
         except Exception as e:
             self.add_log("显示数据时出错", f"错误: {str(e)}")
 
+def parse_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """解析命令行参数，未识别的参数交给Qt处理"""
+    parser = argparse.ArgumentParser(description="MEME通")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="PATH", help="录制所有HTTP请求/响应到文件")
+    cassette.add_argument("--replay", metavar="PATH", help="从录制文件回放HTTP响应，不访问网络")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="回放耗时相对录制耗时的倍数，0表示不等待")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="回放时注入故障的概率")
+    parser.add_argument("--failure-mode", choices=CassetteAdapter.FAILURE_MODES, default="error", help="注入的故障类型")
+    parser.add_argument("--failure-host", action="append", dest="failure_hosts", help="只对该主机注入故障，可多次指定")
+    parser.add_argument("--seed", type=int, help="故障注入随机种子")
+    parser.add_argument("--profile", nargs="?", const="sample", choices=QueryProfiler.MODES,
+                        help="按查询进行性能分析：sample（采样，默认）或 cprofile（确定性分析）")
+    parser.add_argument("--profile-dir", default="profiles", help="性能分析结果目录")
+    parser.add_argument("--query-deadline", type=float, default=MainWindow.query_deadline, help="单次查询的整体截止时间（秒）")
+    parser.add_argument("--hedge", action="store_true", help="对pump.fun、debot、pump.news的GET请求启用对冲请求")
+    parser.add_argument("--stall-threshold", type=int, default=250, help="主线程卡顿阈值（毫秒），0表示不监测")
+    parser.add_argument("--block-size", type=int, default=PagedSource.DEFAULT_BLOCK_SIZE,
+                        help="表格分页加载的每块行数（上游分页大小）")
+    parser.add_argument("--dev-index", default="dev_reputation.json",
+                        help="开发者信誉索引文件，空字符串表示只保存在内存中")
+    parser.add_argument("--wallet-index", default="wallet_labels.json",
+                        help="钱包标签索引文件，空字符串表示只保存在内存中")
+    parser.add_argument("--scan", action="store_true", help="启动后在后台扫描pump.fun新币")
+    parser.add_argument("--alert-rules", metavar="PATH", help="告警规则文件，规则文件中有关注列表时在后台轮询")
+    parser.add_argument("--export", metavar="DIR", help="把采集到的数据导出为按日期和代币分区的列式数据集（需要pyarrow）")
+    parser.add_argument("--export-format", choices=ColumnarExporter.FORMATS, default="parquet",
+                        help="导出格式：parquet（默认）或 arrow（Arrow IPC）")
+    parser.add_argument("--dev-report", metavar="MINT", nargs="+",
+                        help="不启动界面，分析这些代币的开发者交易并按行输出JSON")
+    parser.add_argument("--metrics-port", type=int, default=9464, help="Prometheus指标端口（仅监听127.0.0.1），0表示不启用")
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
+
 def main():
     """程序入口函数"""
     try:
+        args, qt_argv = parse_args(sys.argv)
+
+        # 录制/回放
+        if args.record or args.replay:
+            HttpClient.use_cassette(CassetteAdapter(
+                args.record or args.replay,
+                mode="record" if args.record else "replay",
+                latency_scale=args.latency_scale,
+                failure_rate=args.failure_rate,
+                failure_mode=args.failure_mode,
+                failure_hosts=args.failure_hosts,
+                seed=args.seed,
+            ))
+
+        # 超时与对冲请求
+        MainWindow.query_deadline = args.query_deadline
+        HttpClient.hedging = args.hedge
+
+        # 表格分页加载
+        PagedSource.DEFAULT_BLOCK_SIZE = max(args.block_size, 1)
+
+        # 开发者信誉索引
+        if args.dev_index:
+            DevReputationIndex.open(args.dev_index)
+
+        # 钱包标签索引
+        if args.wallet_index:
+            WalletLabelIndex.open(args.wallet_index)
+
+        # 告警规则
+        if args.alert_rules:
+            AlertEngine.load(args.alert_rules)
+
+        # 列式数据导出
+        if args.export:
+            ColumnarExporter.open(args.export, args.export_format)
+
+        # 批量开发者交易分析，完成后退出
+        if args.dev_report:
+            failed = DevTradeAnalytics.run_batch(args.dev_report)
+            DevReputationIndex.flush()
+            WalletLabelIndex.flush()
+            ColumnarExporter.close()
+            sys.exit(1 if failed else 0)
+
+        # 性能分析，运行时也可从工具栏开关
+        QueryProfiler.configure(args.profile or "sample", args.profile_dir)
+        QueryProfiler.enabled = args.profile is not None
+
+        # Prometheus指标端点
+        if args.metrics_port:
+            MetricsServer.start(args.metrics_port)
+
         # 创建应用
-        app = QApplication(sys.argv)
+        app = QApplication(qt_argv)
+
+        # 主线程卡顿监测
+        if args.stall_threshold > 0:
+            EventLoopWatchdog(args.stall_threshold / 1000, app).start()
 
         # 应用Material主题
         apply_stylesheet(app, theme='light_blue.xml', invert_secondary=True)
@@ -1879,7 +7758,21 @@ def main():
         # 设置窗口标题和图标
         window.ui.setWindowTitle("MEME通 - Material Style")
 
-        sys.exit(app.exec())
+        # 新币扫描
+        if args.scan:
+            window.scanner.start()
+
+        # 告警关注列表轮询
+        if AlertEngine.watch:
+            window.alert_poller.start()
+
+        exit_code = app.exec()
+        DevReputationIndex.flush()
+        WalletLabelIndex.flush()
+        ColumnarExporter.close()
+        for path in QueryProfiler.finish():
+            print(f"性能分析已保存: {path}")
+        sys.exit(exit_code)
     except Exception as e:
         print(f"程序启动时出错: {str(e)}")
         sys.exit(1)
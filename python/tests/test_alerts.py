@@ -0,0 +1,142 @@
+"""
+告警规则引擎单元测试
+描述: 覆盖条件解析、规则编译、冷却补发、滑动窗口累计值和事件去重表的淘汰，全部离线运行。
+
+用法:
+    python -m pytest tests/test_alerts.py
+"""
+
+import itertools
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+
+@pytest.fixture
+def alerts(monkeypatch):
+    """隔离告警引擎的类级状态，返回收到的告警列表"""
+    engine = meme.AlertEngine
+    received = []
+    monkeypatch.setattr(engine, "_listeners", [received.append])
+    monkeypatch.setattr(engine, "_facts", {})
+    monkeypatch.setattr(engine, "_sums", {})
+    monkeypatch.setattr(engine, "_seen", {})
+    yield received
+    engine.set_rules([])
+
+
+def test_parse_condition_forms():
+    parse = meme.AlertEngine.parse_condition
+
+    assert parse("dev.position_clear") == meme.AlertCondition("dev.position_clear")
+    assert parse("smart_money.net_buy > 50 in 5m") == meme.AlertCondition("smart_money.net_buy", ">", 50.0, 300)
+    assert parse("top10 > 30%") == meme.AlertCondition("gmgn.top10", ">", 0.3)
+    assert parse("  buy_count >= -2.5 IN 2H ") == meme.AlertCondition("smart_money.buy_count", ">=", -2.5, 7200)
+    assert parse("holders != 0").test(1) and not parse("holders != 0").test(None)
+
+
+@pytest.mark.parametrize("text", ["no_such_metric", "top10 >", "top10 > 1 in 5m", "dev.score => 3", ""])
+def test_parse_condition_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        meme.AlertEngine.parse_condition(text)
+
+
+def test_compile_splits_conditions():
+    rule = meme.AlertEngine.compile({"when": "dev.position_clear AND top10 > 20%", "cooldown": 5})
+
+    assert rule.name == "dev.position_clear AND top10 > 20%"
+    assert [condition.metric for condition in rule.conditions] == ["dev.position_clear", "gmgn.top10"]
+    assert rule.cooldown == 5.0
+
+
+def test_set_rules_rejects_duplicate_names():
+    compile_rule = meme.AlertEngine.compile
+    with pytest.raises(ValueError):
+        meme.AlertEngine.set_rules([compile_rule({"name": "a", "when": "top10 > 1%"}),
+                                    compile_rule({"name": "a", "when": "top10 > 2%"})])
+
+
+def test_alert_suppressed_by_cooldown_fires_after_cooldown(monkeypatch, alerts):
+    engine = meme.AlertEngine
+    clock = iter(itertools.count(1000, 10))
+    monkeypatch.setattr(meme.time, "time", lambda: float(next(clock)))
+    engine.set_rules([engine.compile({"name": "clear", "when": "dev.position_clear", "cooldown": 25})])
+
+    engine.update("T", {"dev.position_clear": True})   # t=1000 触发
+    engine.update("T", {"dev.position_clear": False})  # t=1010
+    engine.update("T", {"dev.position_clear": True})   # t=1020 冷却中
+    assert len(alerts) == 1
+    engine.tick()                                       # t=1030 冷却结束
+    assert len(alerts) == 2
+
+
+def test_rolling_sum_window_and_out_of_order():
+    rolling = meme.RollingSum(60)
+    for time_s, value in [(100, 1.0), (130, 2.0), (110, 4.0), (20, 8.0)]:
+        rolling.add(time_s, value, now=130)
+
+    assert rolling.value(130) == 7.0   # t=20 已在窗口外
+    assert rolling.value(175) == 2.0   # t=100、t=110 滑出窗口
+    assert rolling.times == [130]
+
+
+def test_rolling_sum_without_window_keeps_only_total():
+    rolling = meme.RollingSum(None)
+    for time_s in range(1000):
+        rolling.add(time_s, 1.0, now=0)
+
+    assert rolling.value(10 ** 9) == 1000.0
+    assert rolling.times == [] and rolling.values == []
+
+
+def test_add_events_deduplicates_and_fires_on_window_sum(monkeypatch, alerts):
+    engine = meme.AlertEngine
+    monkeypatch.setattr(meme.time, "time", lambda: 1000.0)
+    engine.set_rules([engine.compile({"name": "net", "when": "net_buy > 5 in 1m"})])
+
+    engine.add_events("T", [(1, 990, {"smart_money.net_buy": 3.0})])
+    engine.add_events("T", [(1, 990, {"smart_money.net_buy": 3.0})])
+    assert alerts == []
+    engine.add_events("T", [(2, 995, {"smart_money.net_buy": 3.0}),
+                            (3, 900, {"smart_money.net_buy": 100.0})])  # 已在窗口外
+    assert [alert.rule for alert in alerts] == ["net"]
+    assert set(engine._seen["T"]) == {1, 2}
+
+
+def test_seen_eviction_drops_events_outside_largest_window(monkeypatch, alerts):
+    engine = meme.AlertEngine
+    now = [1000.0]
+    monkeypatch.setattr(meme.time, "time", lambda: now[0])
+    monkeypatch.setattr(engine, "SEEN_LIMIT", 3)
+    engine.set_rules([engine.compile({"name": "a", "when": "buy_count > 100 in 10s"}),
+                      engine.compile({"name": "b", "when": "buy_count > 100 in 1m"})])
+
+    engine.add_events("T", [(key, 990 + key, {"smart_money.buy_count": 1.0}) for key in range(5)])
+    now[0] = 1052.0
+    engine.add_events("T", [(9, 1050, {"smart_money.buy_count": 1.0})])
+
+    # 超过上限时只淘汰早于最大窗口（60秒）的事件，未滑出的事件仍然去重
+    assert list(engine._seen["T"]) == [2, 3, 4, 9]
+    engine.add_events("T", [(3, 993, {"smart_money.buy_count": 1.0})])
+    assert engine._facts["T"][meme.AlertCondition("smart_money.buy_count", window=60).key] == 4.0
+
+
+def test_seen_eviction_falls_back_to_oldest_without_window(monkeypatch, alerts):
+    engine = meme.AlertEngine
+    monkeypatch.setattr(meme.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(engine, "SEEN_LIMIT", 3)
+    engine.set_rules([engine.compile({"name": "total", "when": "buy_count > 100"})])
+
+    engine.add_events("T", [(key, 0, {"smart_money.buy_count": 1.0}) for key in range(5)])
+    engine.add_events("T", [(9, 0, {"smart_money.buy_count": 1.0})])
+
+    assert list(engine._seen["T"]) == [2, 3, 4, 9]
@@ -0,0 +1,180 @@
+"""
+异步请求引擎单元测试
+描述: 覆盖共享事件循环的同步调用与上下文继承、协程与线程共用主机并发名额、取消排队、
+      经 HttpClient 的异步请求和 AsyncTask 的信号，全部离线运行。
+
+用法:
+    python -m pytest tests/test_async_engine.py
+"""
+
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from PySide6.QtWidgets import QApplication
+
+import meme
+
+Engine = meme.AsyncFetchEngine
+Scheduler = meme.RequestScheduler
+
+
+def wait_until(predicate, timeout: float = 5.0, app=None):
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end, "等待超时"
+        if app is not None:
+            app.processEvents()
+        time.sleep(0.005)
+
+
+def queued(host: str) -> int:
+    with Scheduler._cond:
+        return sum(1 for h, _, _ in Scheduler._waiting if h == host)
+
+
+async def current_state():
+    return meme.Tracer.current(), Scheduler.current().priority, threading.current_thread().name
+
+
+def test_run_inherits_trace_and_priority():
+    def body():
+        trace = meme.Tracer.start("query")
+        with Scheduler.priority(meme.Priority.BACKGROUND):
+            return trace, Engine.run(current_state(), timeout=5)
+
+    trace, (seen_trace, priority, thread) = contextvars.copy_context().run(body)
+    assert seen_trace is trace
+    assert priority == meme.Priority.BACKGROUND
+    assert thread == "asyncio"
+
+
+def test_to_thread_keeps_context_and_gather_collects():
+    async def body():
+        with Scheduler.priority(meme.Priority.PREFETCH):
+            return await Engine.gather(
+                Engine.to_thread(lambda: Scheduler.current().priority),
+                Engine.to_thread(lambda: threading.current_thread().name))
+
+    priority, thread = Engine.run(body(), timeout=5)
+    assert priority == meme.Priority.PREFETCH
+    assert thread.startswith("asyncio-io")
+
+
+def test_run_inside_loop_raises():
+    async def nested():
+        with pytest.raises(RuntimeError):
+            Engine.run(current_state())
+        return True
+
+    assert Engine.run(nested(), timeout=5)
+
+
+def test_slot_async_shares_quota_with_threads(monkeypatch):
+    host = "async-quota.test"
+    monkeypatch.setitem(Scheduler.HOST_SLOTS, host, 1)
+    entered, leave = threading.Event(), threading.Event()
+
+    def hold():
+        with Scheduler.slot(host):
+            entered.set()
+            leave.wait(5)
+
+    holder = threading.Thread(target=hold, daemon=True)
+    holder.start()
+    entered.wait(5)
+
+    async def request():
+        async with Scheduler.slot_async(host):
+            return Scheduler._active[host]
+
+    future = Engine.submit(request())
+    wait_until(lambda: queued(host) == 1)
+    time.sleep(0.05)
+    assert not future.done()  # 线程占用唯一的名额时协程等待，事件循环不被阻塞
+    assert Engine.run(current_state(), timeout=5)
+
+    leave.set()
+    assert future.result(5) == 1
+    holder.join(5)
+    assert Scheduler._active[host] == 0
+
+
+def test_cancelled_slot_async_withdraws_ticket(monkeypatch):
+    host = "async-cancel.test"
+    monkeypatch.setitem(Scheduler.HOST_SLOTS, host, 1)
+    interactive_before = Scheduler._interactive
+
+    async def hold_then_queue():
+        async with Scheduler.slot_async(host):
+            waiter = asyncio.ensure_future(queue())
+            while queued(host) == 0:
+                await asyncio.sleep(0.005)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return queued(host)
+
+    async def queue():
+        async with Scheduler.slot_async(host):
+            pass
+
+    assert Engine.run(hold_then_queue(), timeout=5) == 0
+    assert Scheduler._active[host] == 0
+    assert Scheduler._interactive == interactive_before
+
+
+class StaticAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"ok": true}'
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def test_async_client_without_native_transport_uses_http_client(monkeypatch):
+    session = requests.Session()
+    session.mount("https://", StaticAdapter())
+    monkeypatch.setattr(meme.HttpClient, "session", session)
+    monkeypatch.setattr(meme.HttpClient, "cache", meme.HttpCache())
+    monkeypatch.setattr(meme.AsyncHttpClient, "native", False)
+
+    response = Engine.run(meme.AsyncHttpClient.get("https://async-client.test/x"), timeout=5)
+    assert response.json() == {"ok": True}
+    assert meme.Metrics.http_requests.get(host="async-client.test", method="GET", status="200") == 1
+
+
+def test_async_task_delivers_result_and_error_on_main_thread():
+    app = QApplication.instance() or QApplication([])
+    results, errors = [], []
+
+    async def succeed(value):
+        return value * 2
+
+    async def fail():
+        raise ValueError("bad payload")
+
+    ok = meme.AsyncTask(succeed, 21)
+    ok.finished.connect(lambda value: results.append((value, threading.current_thread() is threading.main_thread())))
+    bad = meme.AsyncTask(fail)
+    bad.error.connect(errors.append)
+    ok.start()
+    bad.start()
+
+    wait_until(lambda: results and errors, app=app)
+    assert results == [(42, True)]
+    assert errors == ["bad payload"]
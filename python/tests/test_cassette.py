@@ -0,0 +1,122 @@
+"""
+录制/回放传输层单元测试
+描述: 覆盖录制后回放、按录制顺序返回、未录制请求和三种故障注入，全部离线运行，不访问网络。
+
+用法:
+    python -m pytest tests/test_cassette.py
+"""
+
+import base64
+import json
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+import requests
+
+import meme
+
+URL = "https://api.example.com/coins?limit=2"
+
+
+def interaction(method: str, url: str, body: bytes, status: int = 200, elapsed: float = 0.0) -> dict:
+    return {
+        "key": meme.CassetteAdapter.request_key(method, url, None),
+        "request": {"method": method, "url": url, "body": None},
+        "response": {"status": status, "reason": "OK", "headers": {"Content-Type": "application/json"},
+                     "body_b64": base64.b64encode(body).decode("ascii")},
+        "elapsed": elapsed,
+    }
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    path = tmp_path / "cassette.json"
+    path.write_text(json.dumps({"version": 1, "interactions": [
+        interaction("GET", URL, b'{"page": 1}'),
+        interaction("GET", URL, b'{"page": 2}'),
+        interaction("GET", "https://other.example.com/", b"other"),
+    ]}), encoding="utf-8")
+    return str(path)
+
+
+def session_for(adapter: meme.CassetteAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def test_record_then_replay_round_trip(tmp_path, monkeypatch):
+    path = str(tmp_path / "recorded.json")
+
+    def fake_send(adapter, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 201
+        response.reason = "Created"
+        response.headers = requests.structures.CaseInsensitiveDict({"Content-Encoding": "gzip", "X-Id": "7"})
+        response._content = request.body or b"empty"
+        return response
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", fake_send)
+    session_for(meme.CassetteAdapter(path, mode="record")).post(URL, data=b"payload")
+    monkeypatch.undo()
+
+    response = session_for(meme.CassetteAdapter(path, latency_scale=0)).post(URL, data=b"payload")
+    assert (response.status_code, response.content) == (201, b"payload")
+    assert response.headers["X-Id"] == "7"
+    assert "Content-Encoding" not in response.headers  # 录制的响应体已解压
+
+
+def test_replay_in_recorded_order_then_repeats_last(cassette):
+    session = session_for(meme.CassetteAdapter(cassette, latency_scale=0))
+
+    assert [session.get(URL).json()["page"] for _ in range(3)] == [1, 2, 2]
+
+
+def test_replay_miss_raises_connection_error(cassette):
+    session = session_for(meme.CassetteAdapter(cassette, latency_scale=0))
+
+    with pytest.raises(meme.CassetteMiss):
+        session.get(URL + "&offset=2")
+    with pytest.raises(requests.ConnectionError):
+        session.post(URL, data=b"not recorded")
+
+
+@pytest.mark.parametrize("mode, raised", [("error", requests.ConnectionError), ("timeout", requests.ReadTimeout)])
+def test_failure_injection_raises(cassette, mode, raised):
+    session = session_for(meme.CassetteAdapter(cassette, latency_scale=0, failure_rate=1.0, failure_mode=mode))
+
+    with pytest.raises(raised):
+        session.get(URL)
+
+
+def test_failure_injection_status_only_on_listed_hosts(cassette):
+    adapter = meme.CassetteAdapter(cassette, latency_scale=0, failure_rate=1.0, failure_mode="status",
+                                   failure_hosts=["api.example.com"])
+    session = session_for(adapter)
+
+    assert session.get(URL).status_code == 503
+    assert session.get("https://other.example.com/").content == b"other"
+
+
+def test_failure_injection_is_reproducible_with_seed(cassette):
+    def pattern():
+        adapter = meme.CassetteAdapter(cassette, latency_scale=0, failure_rate=0.5, failure_mode="status", seed=42)
+        return [adapter.should_inject_failure(URL) for _ in range(50)]
+
+    first = pattern()
+    assert first == pattern()
+    assert 0 < sum(first) < 50
+
+
+def test_invalid_modes_rejected(cassette):
+    with pytest.raises(ValueError):
+        meme.CassetteAdapter(cassette, mode="live")
+    with pytest.raises(ValueError):
+        meme.CassetteAdapter(cassette, failure_mode="slow")
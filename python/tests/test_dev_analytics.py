@@ -0,0 +1,71 @@
+"""
+开发者交易分析单元测试
+描述: 覆盖移动平均成本回放和已实现盈亏，全部离线运行。
+
+用法:
+    python -m pytest tests/test_dev_analytics.py
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+
+
+def replay(*trades: meme.DevTransaction):
+    return meme.DevTradeAnalytics.replay(list(trades))
+
+
+def test_replay_moving_average_cost():
+    costs, realized = replay(
+        meme.DevTransaction("buy", amount=100, volume=10),
+        meme.DevTransaction("buy", amount=100, volume=30),
+        meme.DevTransaction("sell", amount=100, volume=50),
+        meme.DevTransaction("trans_out", amount=50),
+        meme.DevTransaction("trans_in", amount=10, price=0.5),
+    )
+
+    assert costs == pytest.approx([10, 40, 20, 10, 15])
+    assert realized == pytest.approx([0, 0, 30, 30, 30])
+
+
+def test_replay_sell_without_recorded_buys_counts_full_volume():
+    costs, realized = replay(
+        meme.DevTransaction("sell", amount=10, volume=4),
+        meme.DevTransaction("buy", amount=10, volume=2),
+        meme.DevTransaction("sell", amount=30, volume=9),
+    )
+
+    # 第二次卖出超过持仓，只扣除已有的全部成本
+    assert costs == pytest.approx([0, 2, 0])
+    assert realized == pytest.approx([4, 4, 11])
+
+
+def test_analyze_report_exit_timing_and_sell_windows():
+    report = meme.DevTradeAnalytics.analyze([
+        meme.DevTransaction("sell", amount=4, volume=1, time=1000),
+        meme.DevTransaction("buy", amount=100, volume=10, time=10),
+        meme.DevTransaction("sell", amount=50, volume=20, time=100),
+        meme.DevTransaction("sell", amount=45, volume=30, time=200),
+        meme.DevTransaction("mint", amount=1e9, time=5),
+    ], sol_usd=150.0)
+
+    assert report.trades == 4
+    assert report.position == pytest.approx(1)
+    assert report.peak_position == 100
+    assert report.realized_usd == pytest.approx(41.1)
+    assert report.realized_sol == pytest.approx(41.1 / 150)
+    assert report.first_sell_after == 90
+    assert report.exit_after == 190
+    # 间隔不超过 SELL_WINDOW 的卖出合为一段，不足峰值持仓 5% 的时段不列出
+    assert [(window.start, window.end, window.sells) for window in report.sell_windows] == [(100, 200, 2)]
+    assert report.timeline.positions == pytest.approx([100, 50, 5, 1])
@@ -0,0 +1,121 @@
+"""
+开发者信誉索引单元测试
+描述: 覆盖发币记录合并、归零与连环割判定、评分、先到的开发者交易暂存和索引文件读写，全部离线运行。
+
+用法:
+    python -m pytest tests/test_dev_reputation.py
+"""
+
+import os
+import sys
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+Index = meme.DevReputationIndex
+DAY_MS = 24 * 3600 * 1000
+
+
+@pytest.fixture(autouse=True)
+def index(monkeypatch):
+    for name, value in (("_creators", {}), ("_mint_creators", {}), ("_pending", {}),
+                        ("path", None), ("_dirty", False)):
+        monkeypatch.setattr(Index, name, value)
+    return Index
+
+
+def coin(mint: str, age_days: float = 3, market_cap: float = 0.0, complete: bool = False) -> meme.PumpCoin:
+    created = int(time.time() * 1000 - age_days * DAY_MS)
+    return meme.PumpCoin(mint, symbol=mint.upper(), created_timestamp=created,
+                         usd_market_cap=market_cap, complete=complete)
+
+
+def test_serial_rugger():
+    Index.record_history("dev", [coin(f"m{i}", market_cap=3_000) for i in range(5)])
+    record = Index.get("dev")
+
+    assert (record.launched, record.rugged, record.completed) == (5, 5, 0)
+    assert record.serial_rugger and Index.is_serial_rugger("dev")
+    assert record.score == 0
+    assert record.verdict == "连环割"
+    assert Index.format_reputation(record) == "信誉：0分（连环割，累计5币/归零5）"
+
+
+def test_successful_creator_scores_high():
+    Index.record_history("dev", [coin("a", complete=True, market_cap=80_000), coin("b", complete=True)])
+    record = Index.get("dev")
+
+    assert record.score == 100 and record.verdict == "优质"
+    assert record.peak_market_cap == 80_000
+    assert not record.serial_rugger
+
+
+def test_young_low_cap_token_is_not_rugged_until_dev_clears():
+    Index.record_history("dev", [coin("young", age_days=0.1, market_cap=1_000)])
+    assert Index.get("dev").rugged == 0
+    assert Index.get("dev").verdict == "样本不足"
+
+    Index.record_trades("young", meme.DevTradeInfo(position_clear=True))
+    record = Index.get("dev")
+    assert record.rugged == 1 and record.cleared == 1
+    assert record.tokens["young"].dev_cleared
+
+
+def test_history_pages_merge_and_keep_peaks():
+    Index.record_history("dev", [coin("a", market_cap=50_000)])
+    Index.record_history("dev", [coin("a", market_cap=20_000, complete=True), coin("b")])
+    Index.record_history("dev", [coin("a", market_cap=10_000, complete=False)])
+    token = Index.get("dev").tokens["a"]
+
+    assert token.peak_market_cap == 50_000
+    assert token.complete
+    assert Index.get("dev").launched == 2
+    assert Index.creator_of("b") == "dev"
+
+
+def test_trades_before_history_are_applied_later():
+    Index.record_trades("m1", meme.DevTradeInfo(position_decrease=True, trans_out_amount=5,
+                                                transactions=[meme.DevTransaction("sell")]))
+    assert Index.get("dev") is None
+    assert Index._pending["m1"].transactions is None  # 暂存时不保留逐笔交易
+
+    Index.record_history("dev", [coin("m1", age_days=0.1)])
+    token = Index.get("dev").tokens["m1"]
+    assert (token.dev_cleared, token.dev_sold, token.dev_transferred) == (False, True, True)
+    assert Index._pending == {}
+
+
+def test_pending_trades_are_bounded(monkeypatch):
+    monkeypatch.setattr(Index, "PENDING_LIMIT", 2)
+    for mint in ("a", "b", "c"):
+        Index.record_trades(mint, meme.DevTradeInfo())
+
+    assert list(Index._pending) == ["b", "c"]
+
+
+def test_index_file_round_trip(tmp_path, capsys):
+    path = str(tmp_path / "dev_reputation.json")
+    Index.open(path)
+    Index.record_history("dev", [coin("a", complete=True), coin("b")])
+    Index.flush()
+    assert os.path.exists(path) and not os.path.exists(path + ".tmp")
+
+    Index._creators = {}
+    Index.open(path)
+    record = Index.get("dev")
+    assert sorted(record.tokens) == ["a", "b"]
+    assert Index.creator_of("a") == "dev"
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    Index.open(path)
+    assert Index.get("dev") is None
+    assert "读取开发者信誉索引失败" in capsys.readouterr().out
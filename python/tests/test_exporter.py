@@ -0,0 +1,225 @@
+"""
+列式数据导出单元测试
+描述: 覆盖列转换、同一次运行内的交易去重和Hive分区写出，全部离线运行。分区写出需要安装pyarrow。
+
+用法:
+    python -m pytest tests/test_exporter.py
+"""
+
+import builtins
+import collections
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+MINT = "MintExport111"
+QUOTE = "So11111111111111111111111111111111111111112"
+
+
+@pytest.fixture(autouse=True)
+def exporter(monkeypatch):
+    """每个用例使用独立的导出状态"""
+    cls = meme.ColumnarExporter
+    monkeypatch.setattr(cls, "root", None)
+    monkeypatch.setattr(cls, "format", "parquet")
+    monkeypatch.setattr(cls, "run_id", "")
+    monkeypatch.setattr(cls, "_pa", None)
+    monkeypatch.setattr(cls, "_schemas", {})
+    monkeypatch.setattr(cls, "_buffers", {})
+    monkeypatch.setattr(cls, "_buffered", 0)
+    monkeypatch.setattr(cls, "_writers", collections.OrderedDict())
+    monkeypatch.setattr(cls, "_seen", {})
+    monkeypatch.setattr(cls, "_sequence", 0)
+    monkeypatch.setattr(cls, "_flushed_at", 0.0)
+    monkeypatch.setattr(cls, "_executor", None)
+    monkeypatch.setattr(meme.WalletLabelIndex, "_wallets", {})
+    yield cls
+    cls.close()
+
+
+def swap(signature: str, index: int, address: str, token_in: str, token_out: str,
+         usd: float = 1.0) -> meme.ChainFmEvent:
+    return meme.ChainFmEvent(index, address, meme.ChainFmEventData(
+        meme.ChainFmOrder(volume_native=usd / 100, volume_usd=usd, price_usd=usd / 1000),
+        meme.ChainFmTokenRef(token_in), meme.ChainFmTokenRef(token_out)))
+
+
+def chain_fm_list(*transactions, labels=None) -> meme.ChainFmTransactionList:
+    return meme.ChainFmTransactionList(
+        list(transactions), [meme.ChainFmPage(meme.ChainFmRenderContext(labels or {}))])
+
+
+def read_dataset(root: str, name: str):
+    import pyarrow.dataset
+    return pyarrow.dataset.dataset(os.path.join(root, name), format="parquet", partitioning="hive").to_table()
+
+# ---------------------------------------------------------------------------
+# 列转换和去重
+# ---------------------------------------------------------------------------
+
+def test_dev_trade_columns_dedup_by_hash_op_and_time(exporter):
+    first = exporter.dev_trade_columns(MINT, [
+        meme.DevTransaction("buy", amount=100, volume=1, time=10, tx_hash="h1"),
+        meme.DevTransaction("trans_out", amount=100, time=10, tx_hash="h1"),
+        meme.DevTransaction("sell", amount=50, volume=2, time=20.7),
+    ])
+    # 第二次拉取返回同样的记录加一条新记录
+    second = exporter.dev_trade_columns(MINT, [
+        meme.DevTransaction("buy", amount=100, volume=1, time=10, tx_hash="h1"),
+        meme.DevTransaction("sell", amount=50, volume=2, time=20.7),
+        meme.DevTransaction("sell", amount=10, volume=1, time=30, tx_hash="h2"),
+    ])
+
+    assert first["op"] == ["buy", "trans_out", "sell"]
+    assert first["time"] == [10, 10, 20]
+    assert second["tx_hash"] == ["h2"]
+    # 去重按代币区分
+    assert exporter.dev_trade_columns("OtherMint", [meme.DevTransaction("buy", time=10, tx_hash="h1")])["op"] == ["buy"]
+
+
+def test_unseen_clears_at_limit(exporter, monkeypatch):
+    monkeypatch.setattr(exporter, "SEEN_LIMIT", 2)
+
+    assert exporter.unseen("dev_trades", MINT, 1)
+    assert exporter.unseen("dev_trades", MINT, 2)
+    assert not exporter.unseen("dev_trades", MINT, 2)
+    assert exporter.unseen("dev_trades", MINT, 3)
+    assert exporter._seen[("dev_trades", MINT)] == {3}
+
+
+def test_smart_money_columns_skip_other_tokens_and_label_wallets(exporter, monkeypatch):
+    # 接口没有返回标签的地址使用本地钱包标签
+    monkeypatch.setattr(meme.WalletLabelIndex, "_wallets", {"wallet-b": meme.WalletLabel(["fund"], 0, 0, ["local"])})
+    data = chain_fm_list(
+        meme.ChainFmTransaction("sig-1", 100, [
+            swap("sig-1", 0, "wallet-a", QUOTE, MINT, usd=200),
+            swap("sig-1", 1, "wallet-a", QUOTE, "OtherMint"),
+            swap("sig-1", 2, "wallet-b", MINT, QUOTE, usd=50),
+        ]),
+        meme.ChainFmTransaction("sig-2", 110, [swap("sig-2", 0, "wallet-c", QUOTE, MINT)]),
+        labels={"wallet-a": [meme.ChainFmAddressLabel("kol")]},
+    )
+
+    columns = exporter.smart_money_columns(MINT, data)
+
+    assert columns["signature"] == ["sig-1", "sig-1", "sig-2"]
+    assert columns["event_index"] == [0, 2, 0]
+    assert columns["side"] == ["buy", "sell", "buy"]
+    assert columns["volume_usd"] == [200, 50, 1.0]
+    assert columns["label"] == ["kol", "fund", None]
+    # 翻页重叠的交易不再导出
+    assert exporter.smart_money_columns(MINT, data)["signature"] == []
+
+
+def test_gmgn_columns_partial_and_all_failed(exporter):
+    results = {
+        "holder": (meme.GmgnHolderStat(holder_count=120, bluechip_owner_percentage=0.05), ""),
+        "wallet_tags": (None, "超时"),
+        "top_holders": (meme.GmgnSecurityLaunchpad(meme.GmgnSecurity(0.3, "burn")), ""),
+    }
+
+    columns = exporter.gmgn_columns(results)
+
+    assert set(columns) == {name for name, _ in exporter.DATASETS["gmgn_stats"].columns[1:]}
+    assert columns["holder_count"] == [120]
+    assert columns["smart_wallets"] == [None]
+    assert columns["top_10_holder_rate"] == [0.3]
+    assert columns["burn_status"] == ["burn"]
+    assert exporter.gmgn_columns({"holder": (None, "失败"), "wallet_tags": (None, "失败")}) == {}
+
+
+def test_tweet_columns_stringify_ids(exporter):
+    columns = exporter.tweet_columns("kol", [
+        meme.PumpNewsTweet(1234567890123456789, "gm", 10, user=meme.PumpNewsUser("Name", "handle", True)),
+        meme.PumpNewsTweet(None, "no id"),
+    ])
+
+    assert columns["category"] == ["kol", "kol"]
+    assert columns["tweet_id"] == ["1234567890123456789", None]
+    assert columns["screen_name"] == ["handle", ""]
+    assert columns["is_blue_verified"] == [True, False]
+
+
+def test_open_without_pyarrow_disables_export(exporter, monkeypatch, tmp_path):
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name.split(".")[0] == "pyarrow":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+
+    assert not exporter.open(str(tmp_path))
+    assert exporter._executor is None
+    # 未启用时提交直接忽略
+    exporter.export_dev_trades(MINT, [meme.DevTransaction("buy", tx_hash="h1")])
+    assert exporter._buffers == {} and exporter._seen == {}
+
+# ---------------------------------------------------------------------------
+# 分区写出
+# ---------------------------------------------------------------------------
+
+def test_append_round_trip_hive_partitions(exporter, tmp_path):
+    pytest.importorskip("pyarrow")
+    assert exporter.open(str(tmp_path))
+
+    exporter.export_dev_trades(MINT, [
+        meme.DevTransaction("buy", "wallet-a", price=0.1, volume=1, amount=10, time=100, tx_hash="h1"),
+        meme.DevTransaction("sell", amount=5, time=200, tx_hash="h2"),
+    ])
+    exporter.export_dev_trades(MINT, [meme.DevTransaction("sell", amount=5, time=200, tx_hash="h2")])
+    exporter.export_dev_trades("OtherMint", [meme.DevTransaction("buy", amount=1, time=300, tx_hash="h3")])
+    exporter.export_dev_history("creator-1", [meme.PumpCoin(MINT, "Token", "TK", created_timestamp=1700000000000)])
+    exporter.close()
+
+    dataset_dir = tmp_path / "dev_trades"
+    dates = os.listdir(dataset_dir)
+    assert len(dates) == 1 and dates[0].startswith("date=")
+    assert sorted(os.listdir(dataset_dir / dates[0])) == [f"mint={MINT}", "mint=OtherMint"]
+    parts = os.listdir(dataset_dir / dates[0] / f"mint={MINT}")
+    assert len(parts) == 1 and parts[0].startswith(f"part-{exporter.run_id}-") and parts[0].endswith(".parquet")
+
+    table = read_dataset(str(tmp_path), "dev_trades").sort_by("time")
+    assert table.column("tx_hash").to_pylist() == ["h1", "h2", "h3"]
+    assert table.column("mint").to_pylist() == [MINT, MINT, "OtherMint"]
+    assert table.column("from").to_pylist() == ["wallet-a", "", ""]
+    # Parquet没有秒精度，读回为毫秒时间戳，时刻不变
+    assert table.column("time").cast("int64").to_pylist() == [100_000, 200_000, 300_000]
+
+    # 开发者历史不按代币分区，代币地址作为普通列
+    history = os.listdir(tmp_path / "dev_histories" / dates[0])
+    assert all(name.endswith(".parquet") for name in history)
+    assert read_dataset(str(tmp_path), "dev_histories").column("mint").to_pylist() == [MINT]
+
+
+def test_append_writes_row_group_and_limits_open_writers(exporter, monkeypatch, tmp_path):
+    pytest.importorskip("pyarrow")
+    assert exporter.open(str(tmp_path))
+    monkeypatch.setattr(exporter, "ROW_GROUP_SIZE", 2)
+    monkeypatch.setattr(exporter, "MAX_OPEN_WRITERS", 1)
+    monkeypatch.setattr(exporter, "FLUSH_INTERVAL", 1e9)
+
+    exporter.append("tweets", "MintA", exporter.tweet_columns, "kol", [meme.PumpNewsTweet(1), meme.PumpNewsTweet(2)])
+    # 攒够行组的分区立即写出，缓冲清空
+    assert exporter._buffers == {} and exporter._buffered == 0
+    assert len(exporter._writers) == 1
+
+    exporter.append("tweets", "MintB", exporter.tweet_columns, "kol", [meme.PumpNewsTweet(3)])
+    assert exporter._buffered == 1
+    exporter.close_writers()
+    # 第二个分区打开时关闭了第一个分区的文件，两个分区都能读取
+    assert exporter._writers == {}
+
+    table = read_dataset(str(tmp_path), "tweets").sort_by("tweet_id")
+    assert table.column("tweet_id").to_pylist() == ["1", "2", "3"]
+    assert table.column("mint").to_pylist() == ["MintA", "MintA", "MintB"]
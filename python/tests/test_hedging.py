@@ -0,0 +1,164 @@
+"""
+对冲请求与超时预算单元测试
+描述: 用脚本化的传输适配器代替网络，覆盖按数据源的超时预算、查询截止时间、对冲时机和对冲请求的胜出规则，
+      全部离线运行。
+
+用法:
+    python -m pytest tests/test_hedging.py
+"""
+
+import contextvars
+import os
+import sys
+import threading
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+import meme
+
+Client = meme.HttpClient
+
+
+class ScriptedAdapter(HTTPAdapter):
+    """按请求序号执行脚本：(延迟秒数, 响应体或异常)"""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = script
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            index = len(self.requests)
+            self.requests.append((request, kwargs))
+        delay, outcome = self.script[min(index, len(self.script) - 1)]
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        response.status_code = 200
+        response._content = outcome
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def host(request, monkeypatch):
+    name = f"{request.node.name.replace('[', '-').rstrip(']')}.test"
+    monkeypatch.setattr(Client, "cache", meme.HttpCache())
+    monkeypatch.setattr(Client, "HEDGE_HOSTS", {name})
+    monkeypatch.setattr(Client, "hedging", True)
+    monkeypatch.setattr(Client, "HEDGE_DEFAULT_DELAY", 0.05)
+    return name
+
+
+def mount(monkeypatch, script) -> ScriptedAdapter:
+    adapter = ScriptedAdapter(script)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    monkeypatch.setattr(Client, "session", session)
+    return adapter
+
+
+def hedges(host: str):
+    return {winner: meme.Metrics.hedged_requests.get(host=host, winner=winner) for winner in ("primary", "hedge")}
+
+
+def test_timeout_budget_per_source(monkeypatch):
+    kwargs = {}
+    Client.apply_timeout("https://debot.ai/x", "debot.ai", kwargs)
+    assert kwargs["timeout"] == (3.05, 10)
+
+    kwargs = {}
+    Client.apply_timeout("https://unknown.example/x", "unknown.example", kwargs)
+    assert kwargs["timeout"] == Client.DEFAULT_TIMEOUT
+
+    kwargs = {"timeout": 1}
+    Client.apply_timeout("https://debot.ai/x", "debot.ai", kwargs)
+    assert kwargs["timeout"] == 1
+
+
+def test_timeout_truncated_to_query_deadline():
+    def body():
+        meme.Tracer.start("query", timeout=2.0)
+        kwargs = {}
+        Client.apply_timeout("https://debot.ai/x", "debot.ai", kwargs)
+        return kwargs["timeout"]
+
+    connect, read = contextvars.copy_context().run(body)
+    assert 1.5 < connect <= 2.0 and connect == pytest.approx(read, abs=0.01)
+
+
+def test_expired_deadline_raises_before_sending(monkeypatch, host):
+    adapter = mount(monkeypatch, [(0, b"late")])
+
+    def body():
+        trace = meme.Tracer.start("query", timeout=1.0)
+        trace.deadline = time.perf_counter() - 0.01
+        Client.get(f"https://{host}/x")
+
+    with pytest.raises(meme.QueryDeadlineExceeded) as raised:
+        contextvars.copy_context().run(body)
+    assert isinstance(raised.value, requests.Timeout)
+    assert adapter.requests == []
+
+
+def test_hedge_delay_uses_observed_p95(monkeypatch, host):
+    assert Client.hedge_delay(host) == 0.05
+    monkeypatch.setattr(Client, "HEDGE_MIN_SAMPLES", 10)
+    for _ in range(19):
+        meme.Metrics.http_duration.observe(0.07, host=host)
+    meme.Metrics.http_duration.observe(20.0, host=host)
+
+    assert Client.hedge_delay(host) == pytest.approx(0.1)
+
+
+def test_fast_primary_sends_no_hedge(monkeypatch, host):
+    adapter = mount(monkeypatch, [(0, b"primary")])
+
+    assert Client.get(f"https://{host}/x").content == b"primary"
+    assert len(adapter.requests) == 1
+    assert hedges(host) == {"primary": 0, "hedge": 0}
+
+
+def test_slow_primary_loses_to_hedge(monkeypatch, host):
+    adapter = mount(monkeypatch, [(0.5, b"primary"), (0, b"hedge")])
+
+    start = time.perf_counter()
+    assert Client.get(f"https://{host}/x").content == b"hedge"
+    assert time.perf_counter() - start < 0.4
+    assert len(adapter.requests) == 2
+    assert hedges(host) == {"primary": 0, "hedge": 1}
+
+
+def test_failed_hedge_falls_back_to_primary(monkeypatch, host):
+    mount(monkeypatch, [(0.2, b"primary"), (0, requests.ConnectionError("hedge failed"))])
+
+    assert Client.get(f"https://{host}/x").content == b"primary"
+    assert hedges(host) == {"primary": 1, "hedge": 0}
+
+
+def test_both_failing_raises_primary_error(monkeypatch, host):
+    mount(monkeypatch, [(0.1, requests.ConnectionError("primary failed")),
+                        (0, requests.ConnectionError("hedge failed"))])
+
+    with pytest.raises(requests.ConnectionError, match="primary failed"):
+        Client.get(f"https://{host}/x")
+
+
+def test_post_is_never_hedged(monkeypatch, host):
+    adapter = mount(monkeypatch, [(0.2, b"posted")])
+
+    assert Client.post(f"https://{host}/x", data=b"{}").content == b"posted"
+    assert len(adapter.requests) == 1
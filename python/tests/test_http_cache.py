@@ -0,0 +1,168 @@
+"""
+条件请求缓存单元测试
+描述: 用模拟服务器校验器的传输适配器代替网络，覆盖ETag/Last-Modified条件请求、304命中、
+      流式读取写入缓存和容量淘汰，全部离线运行。
+
+用法:
+    python -m pytest tests/test_http_cache.py
+"""
+
+import io
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import meme
+
+Client = meme.HttpClient
+URL = "https://cache.test/coins"
+
+
+class ValidatingServer(HTTPAdapter):
+    """按 body 返回内容，请求带的校验器与当前版本一致时返回304"""
+
+    def __init__(self, body: bytes, etag=None, last_modified=None):
+        super().__init__()
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.seen_headers = []
+
+    def send(self, request, **kwargs):
+        headers = request.headers
+        self.seen_headers.append({k: headers[k] for k in ("If-None-Match", "If-Modified-Since") if k in headers})
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "X-Served": "origin"})
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = self.last_modified
+        matched = ((self.etag and headers.get("If-None-Match") == self.etag)
+                   or (not self.etag and self.last_modified and headers.get("If-Modified-Since") == self.last_modified))
+        if matched:
+            response.status_code = 304
+            response.headers["X-Served"] = "revalidated"
+            response.raw = io.BytesIO(b"")
+        else:
+            response.status_code = 200
+            response.raw = io.BytesIO(self.body)
+        return response
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = ValidatingServer(b'{"v": 1}', etag='"v1"')
+    session = requests.Session()
+    session.mount("https://", server)
+    monkeypatch.setattr(Client, "session", session)
+    monkeypatch.setattr(Client, "cache", meme.HttpCache())
+    monkeypatch.setattr(Client, "hedging", False)
+    return server
+
+
+def http_cache(result: str) -> float:
+    return meme.Metrics.cache_requests.get(cache="http", result=result)
+
+
+def test_etag_revalidation_returns_cached_body(server):
+    hits = http_cache("hit")
+    first = Client.get(URL, params={"limit": 2})
+    second = Client.get(URL, params={"limit": 2})
+
+    assert server.seen_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert first.content == second.content == b'{"v": 1}'
+    assert not hasattr(first, "from_cache") and second.from_cache
+    assert second.status_code == 200 and second.json() == {"v": 1}
+    assert second.headers["X-Served"] == "revalidated"  # 304的头部覆盖缓存的头部
+    assert second.content_hash == first.content_hash == meme.HttpCache.digest(b'{"v": 1}')
+    assert http_cache("hit") == hits + 1
+
+
+def test_changed_resource_replaces_entry(server):
+    Client.get(URL)
+    server.body, server.etag = b'{"v": 2}', '"v2"'
+    changed = Client.get(URL)
+    again = Client.get(URL)
+
+    assert changed.content == b'{"v": 2}' and not hasattr(changed, "from_cache")
+    assert again.from_cache and again.content == b'{"v": 2}'
+    assert server.seen_headers[-1] == {"If-None-Match": '"v2"'}
+
+
+def test_last_modified_validator(server):
+    server.etag, server.last_modified = None, "Wed, 21 Oct 2026 07:28:00 GMT"
+    Client.get(URL)
+
+    assert Client.get(URL).from_cache
+    assert server.seen_headers[-1] == {"If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT"}
+
+
+def test_response_without_validators_is_hashed_but_not_cached(server):
+    server.etag = None
+    first = Client.get(URL)
+    second = Client.get(URL)
+
+    assert server.seen_headers == [{}, {}]
+    assert first.content_hash == second.content_hash
+    assert Client.cache.get(meme.HttpCache.key(URL)) is None
+
+
+def test_streamed_get_populates_cache_after_body_is_read(server):
+    response = Client.open_stream("GET", URL)
+    assert b"".join(Client.iter_body(response)) == b'{"v": 1}'
+    assert response.content_hash == meme.HttpCache.digest(b'{"v": 1}')
+
+    cached = Client.open_stream("GET", URL)
+    assert cached.from_cache
+    assert b"".join(Client.iter_body(cached)) == b'{"v": 1}'
+
+
+def test_error_status_raises_for_streams(server, monkeypatch):
+    def unavailable(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 503
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(b"")
+        return response
+
+    monkeypatch.setattr(server, "send", unavailable)
+    with pytest.raises(requests.HTTPError):
+        Client.open_stream("GET", URL)
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(meme.HttpCache, "MAX_BYTES", 10)
+    cache = meme.HttpCache()
+
+    def stored(key: str, content: bytes):
+        response = requests.Response()
+        response.headers = CaseInsensitiveDict({"ETag": f'"{key}"'})
+        response._content = content
+        response.content_hash = meme.HttpCache.digest(content)
+        cache.store(key, response)
+
+    stored("a", b"1234")
+    stored("b", b"1234")
+    cache.get("a")           # a 最近使用
+    stored("c", b"1234")     # 超过10字节，淘汰 b
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_key_includes_query_parameters():
+    assert meme.HttpCache.key(URL, {"limit": 2, "offset": 0}) == URL + "?limit=2&offset=0"
+    assert meme.HttpCache.key(URL + "?limit=2") == URL + "?limit=2"
@@ -0,0 +1,134 @@
+"""
+MEME通纯逻辑单元测试
+描述: 覆盖流式JSON数组解析和流式解码，全部离线运行，不访问网络。
+
+用法:
+    python -m pytest tests
+"""
+
+import io
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+import requests
+
+import meme
+
+# ---------------------------------------------------------------------------
+# JsonArrayStream
+# ---------------------------------------------------------------------------
+
+TRICKY_DOC = {
+    "code": 0,
+    "note": "before \"transactions\": [ ] } { \\",
+    "data": {
+        "transactions": [
+            {"op": "buy", "memo": "a]b}c{d[e", "path": "C:\\dir\\", "quote": "say \"hi\""},
+            {"op": "sell", "memo": "\u4e2d\u6587 \\u0041", "nested": {"list": [[1, 2], [3, [4]]], "empty": []}},
+            {"op": "trans_out", "memo": "", "tail": "\\\\\""},
+        ],
+        "position_clear": True,
+    },
+    "after": ["x", {"y": "]"}],
+}
+
+
+def feed_in_chunks(stream: meme.JsonArrayStream, content: bytes, size: int) -> List[Any]:
+    items = []
+    for start in range(0, len(content), size):
+        items.extend(stream.feed(content[start:start + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 16, 64, 10_000])
+def test_stream_chunk_boundaries_inside_strings_and_escapes(size):
+    content = json.dumps(TRICKY_DOC, ensure_ascii=False).encode("utf-8")
+    stream = meme.JsonArrayStream("transactions", Dict[str, Any])
+    items = feed_in_chunks(stream, content, size)
+
+    assert stream.found
+    assert items == TRICKY_DOC["data"]["transactions"]
+    skeleton = json.loads(stream.finish())
+    expected = json.loads(json.dumps(TRICKY_DOC))
+    expected["data"]["transactions"] = []
+    assert skeleton == expected
+
+
+@pytest.mark.parametrize("size", [1, 4, 9, 1000])
+def test_stream_nested_array_items(size):
+    doc = {"rows": [[1, [2, 3]], [], [[[]]], [4]], "n": 4}
+    stream = meme.JsonArrayStream("rows", List[Any])
+    items = feed_in_chunks(stream, json.dumps(doc).encode("utf-8"), size)
+
+    assert items == doc["rows"]
+    assert json.loads(stream.finish()) == {"rows": [], "n": 4}
+
+
+def test_stream_key_split_across_chunks():
+    content = b'{"padding": "' + b"x" * 1000 + b'", "transactions" :\n [{"op": "buy"}]}'
+    key_start = content.index(b'"transactions"')
+    stream = meme.JsonArrayStream("transactions", Dict[str, Any])
+    items = stream.feed(content[:key_start + 5]) + stream.feed(content[key_start + 5:])
+
+    assert items == [{"op": "buy"}]
+
+
+def test_stream_missing_key():
+    content = json.dumps({"data": {"other": [{"op": "buy"}]}}).encode("utf-8")
+    stream = meme.JsonArrayStream("transactions", Dict[str, Any])
+    items = feed_in_chunks(stream, content, 3)
+
+    assert items == []
+    assert not stream.found
+    assert json.loads(stream.finish()) == {"data": {"other": [{"op": "buy"}]}}
+
+
+def test_stream_truncated_array():
+    stream = meme.JsonArrayStream("transactions", Dict[str, Any])
+    stream.feed(b'{"transactions": [{"op": "buy"}, {"op": ')
+    with pytest.raises(meme.SchemaError):
+        stream.finish()
+
+
+def test_stream_item_schema_error():
+    stream = meme.JsonArrayStream("transactions", meme.DevTransaction)
+    with pytest.raises(meme.SchemaError):
+        stream.feed(b'{"transactions": [{"op": ["not", "a", "string"]}]}')
+
+
+def streamed_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def decode_dev_trades(content: bytes):
+    return meme.PayloadDecoder.decode_stream(
+        "debot_dev_info", streamed_response(content), "transactions", meme.DevTransaction,
+        lambda result: result.data.transactions)
+
+
+def test_decode_stream_missing_key_keeps_skeleton():
+    result = decode_dev_trades(json.dumps({"data": {"position_clear": True}}).encode("utf-8"))
+
+    assert result.data.position_clear
+    assert result.data.transactions is None
+
+
+def test_decode_stream_memoizes_identical_content():
+    content = json.dumps({"data": {"transactions": [{"op": "buy", "amount": 1.5, "tx_hash": "memo-test"}]}})
+    first = decode_dev_trades(content.encode("utf-8"))
+    second = decode_dev_trades(content.encode("utf-8"))
+
+    assert [tx.amount for tx in first.data.transactions] == [1.5]
+    assert second is first
@@ -0,0 +1,135 @@
+"""
+运行指标单元测试
+描述: 覆盖Prometheus文本格式、标签转义、直方图分桶与分位数估算、数据获取计数和本地指标端点，全部离线运行。
+
+用法:
+    python -m pytest tests/test_metrics.py
+"""
+
+import asyncio
+import os
+import sys
+import urllib.request
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+
+def test_counter_render_escapes_labels():
+    counter = meme.Counter("test_requests_total", "请求数", ("host", "status"))
+    counter.inc(host='a"b\\c\nd', status=200)
+    counter.inc(2, host="example.com", status=200)
+
+    assert counter.get(host="example.com", status="200") == 2
+    assert counter.render().splitlines() == [
+        "# HELP test_requests_total 请求数",
+        "# TYPE test_requests_total counter",
+        'test_requests_total{host="a\\"b\\\\c\\nd",status="200"} 1',
+        'test_requests_total{host="example.com",status="200"} 2',
+    ]
+
+
+def test_gauge_without_labels():
+    gauge = meme.Gauge("test_inflight", "进行中")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert gauge.render().splitlines()[-1] == "test_inflight 1"
+    gauge.set(7.5)
+    assert gauge.get() == 7.5
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = meme.Histogram("test_seconds", "耗时", ("host",), buckets=(4, 1, 2))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value, host="h")
+
+    counts, total, count = histogram.get(host="h")
+    assert (counts, total, count) == ([1, 3, 4], 16.5, 5)
+    assert histogram.samples() == [
+        'test_seconds_bucket{host="h",le="1"} 1',
+        'test_seconds_bucket{host="h",le="2"} 3',
+        'test_seconds_bucket{host="h",le="4"} 4',
+        'test_seconds_bucket{host="h",le="+Inf"} 5',
+        'test_seconds_sum{host="h"} 16.5',
+        'test_seconds_count{host="h"} 5',
+    ]
+
+
+@pytest.mark.parametrize("q, expected", [(0.25, 1.0), (0.5, 1.5), (0.8, 2.4), (1.0, 4.0), (0.0, 0.0)])
+def test_histogram_quantile_interpolates_within_bucket(q, expected):
+    histogram = meme.Histogram("test_q", "分位数", buckets=(1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3):
+        histogram.observe(value)
+    counts, _, count = histogram.get()
+
+    assert histogram.quantile(q, counts, count) == pytest.approx(expected)
+
+
+def test_histogram_quantile_edges():
+    histogram = meme.Histogram("test_q", "分位数", buckets=(1, 2))
+    assert histogram.quantile(0.5, *histogram.get()[::2]) is None
+    histogram.observe(100)
+    counts, _, count = histogram.get()
+    assert histogram.quantile(0.99, counts, count) == 2  # 落在+Inf桶时返回最大上界
+
+
+def fetch_result(source: str):
+    return {result: meme.Metrics.fetch_total.get(source=source, result=result) for result in ("ok", "empty", "error")}
+
+
+def test_instrument_classifies_results():
+    source = "test_instrument"
+    instrument = meme.Metrics.instrument(source)
+    returns = iter([{"a": 1}, [], None, "", False])
+    fetch = instrument(lambda: next(returns))
+    for _ in range(5):
+        fetch()
+
+    @instrument
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        failing()
+
+    assert fetch_result(source) == {"ok": 1, "empty": 1, "error": 4}
+    assert meme.Metrics.fetch_duration.get(source=source)[2] == 6
+
+
+def test_instrument_async():
+    source = "test_instrument_async"
+
+    @meme.Metrics.instrument(source)
+    async def fetch(value):
+        return value
+
+    asyncio.run(fetch([1]))
+    asyncio.run(fetch(None))
+
+    assert fetch_result(source) == {"ok": 1, "empty": 0, "error": 1}
+
+
+def test_metrics_server_serves_registry():
+    url = meme.MetricsServer.start(0)
+    assert url is not None
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        meme.MetricsServer.server.shutdown()
+        meme.MetricsServer.server.server_close()
+        meme.MetricsServer.server = None
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE meme_http_request_duration_seconds histogram" in body
+    assert body.endswith("\n")
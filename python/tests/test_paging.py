@@ -0,0 +1,144 @@
+"""
+表格分页加载单元测试
+描述: 覆盖本地数据源按块转换、排序前读取全部本地数据、上游分页的占位行、失败后停止加载，
+      以及chain.fm分页跳过没有带标签地址的页，全部离线运行。
+
+用法:
+    python -m pytest tests/test_paging.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+import meme
+
+CREATOR = "Creator111111111111111111111111111111111111"
+MINT = "Mint1111111111111111111111111111111111111111"
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def wait_loaded(app, model, timeout: float = 5.0):
+    """等待分页线程的结果经信号回到主线程"""
+    end = time.monotonic() + timeout
+    while model.loading:
+        assert time.monotonic() < end, "等待分页结果超时"
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def dev_trades(count: int):
+    return [meme.DevTransaction("buy" if i % 2 else "sell", price=float(i), time=float(i)) for i in range(count)]
+
+
+def test_local_source_converts_block_by_block(app):
+    source = meme.ListSource(dev_trades(5), meme.DevTradeRow.from_payloads, block_size=2)
+    model = meme.DevTradeTableModel(source.next_block(), "creator", source)
+
+    assert model.rowCount() == 2 and model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 4 and model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 5
+    assert not model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 5
+
+
+def test_sort_reads_all_local_rows_first(app):
+    source = meme.ListSource(dev_trades(7), meme.DevTradeRow.from_payloads, block_size=3)
+    model = meme.DevTradeTableModel(source.next_block(), "creator", source)
+    model.sort(3, Qt.DescendingOrder)  # 价格
+
+    assert model.rowCount() == 7 and not model.canFetchMore()
+    assert [row.price for row in model._data] == [6, 5, 4, 3, 2, 1, 0]
+
+
+def coins(start: int, count: int):
+    return [meme.PumpCoin(f"mint{i}", symbol=f"C{i}", created_timestamp=i) for i in range(start, start + count)]
+
+
+def test_remote_source_shows_placeholder_then_appends(app, monkeypatch):
+    requested = []
+    release = threading.Event()
+
+    def fetch_dev_history(creator, offset=0, limit=None, **kwargs):
+        requested.append((offset, limit))
+        release.wait(5)
+        return coins(offset, 1 if offset >= 4 else limit)
+
+    monkeypatch.setattr(meme.DevDataFetcher, "fetch_dev_history", fetch_dev_history)
+    first_page = coins(0, 2)
+    model = meme.DevHistoryTableModel(meme.DevHistoryRow.from_payloads(first_page),
+                                      meme.DevHistorySource(CREATOR, first_page, block_size=2))
+
+    model.fetchMore()
+    assert model.loading and model.rowCount() == 3
+    assert model.data(model.index(2, 0)) == meme.PagedTableModel.PLACEHOLDER_TEXT
+    assert not model.canFetchMore()  # 加载中不重复请求
+    release.set()
+    wait_loaded(app, model)
+    assert model.rowCount() == 4 and model.canFetchMore()
+
+    model.fetchMore()
+    wait_loaded(app, model)
+    assert [row.symbol for row in model._data] == ["C0", "C1", "C2", "C3", "C4"]
+    assert requested == [(2, 2), (4, 2)]
+    assert not model.canFetchMore()  # 不足一页，没有更多数据
+
+
+def test_failed_block_stops_paging(app, monkeypatch):
+    monkeypatch.setattr(meme.DevDataFetcher, "fetch_dev_history", lambda *args, **kwargs: None)
+    first_page = coins(0, 2)
+    model = meme.DevHistoryTableModel(meme.DevHistoryRow.from_payloads(first_page),
+                                      meme.DevHistorySource(CREATOR, first_page, block_size=2))
+    failures = []
+    model.load_failed.connect(failures.append)
+
+    model.fetchMore()
+    wait_loaded(app, model)
+
+    assert model.rowCount() == 2
+    assert failures == ["加载下一页失败"]
+    assert not model.canFetchMore()
+
+
+def chain_fm_page(labeled: bool, size: int) -> meme.ChainFmTransactionList:
+    data = meme.ChainFmEventData(order=meme.ChainFmOrder(1.0, 150.0, 0.01),
+                                 input=meme.ChainFmTokenRef("SOL"), output=meme.ChainFmTokenRef(MINT))
+    transactions = [meme.ChainFmTransaction(f"sig{i}", i, [meme.ChainFmEvent(0, f"wallet{i}", data)])
+                    for i in range(size)]
+    labels = {f"wallet{i}": [meme.ChainFmAddressLabel("smart")] for i in range(size)} if labeled else {}
+    return meme.ChainFmTransactionList(transactions, [meme.ChainFmPage(meme.ChainFmRenderContext(labels))])
+
+
+def test_smart_money_source_skips_pages_without_labels(monkeypatch):
+    pages = {2: chain_fm_page(False, 2), 3: chain_fm_page(False, 2), 4: chain_fm_page(True, 2)}
+    requested = []
+
+    def fetch_chain_fm_data(contract, page=1, page_size=None, **kwargs):
+        requested.append(page)
+        return pages.get(page, chain_fm_page(False, 0))
+
+    monkeypatch.setattr(meme.NodeService, "fetch_chain_fm_data", fetch_chain_fm_data)
+    source = meme.SmartMoneySource(MINT, chain_fm_page(True, 2), block_size=2)
+
+    assert len(source.next_block()) == 2
+    assert requested == [2, 3, 4] and not source.exhausted
+    assert source.next_block() == []
+    assert source.exhausted
@@ -0,0 +1,125 @@
+"""
+地址校验与预取单元测试
+描述: 覆盖Solana地址本地校验，以及预取结果的接管、一次性使用、失败重试和接管时补做的写入，全部离线运行。
+
+用法:
+    python -m pytest tests/test_prefetch.py
+"""
+
+import os
+import sys
+import threading
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+CONTRACT = "So11111111111111111111111111111111111111112"
+
+
+@pytest.mark.parametrize("text", [CONTRACT, "1" * 32, "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"])
+def test_valid_addresses(text):
+    assert meme.SolanaAddress.is_valid(text)
+
+
+@pytest.mark.parametrize("text", [
+    "", "So1111111111111111111111111111111",   # 过短
+    "0" + CONTRACT[1:], "O" + CONTRACT[1:], "l" + CONTRACT[1:],  # base58不含 0 O I l
+    "z" * 44,                                   # 解码超过32字节
+    CONTRACT + "1",                             # 过长
+])
+def test_invalid_addresses(text):
+    assert not meme.SolanaAddress.is_valid(text)
+
+
+class CountingFetcher:
+    """记录调用次数的取数函数，release 之前阻塞"""
+
+    def __init__(self, results=None):
+        self.calls = []
+        self.results = results
+        self.release = threading.Event()
+        self.release.set()
+        self.__qualname__ = f"CountingFetcher.{id(self)}"
+
+    def __call__(self, contract, track=True, on_rows=None):
+        self.calls.append((contract, track, meme.RequestScheduler.current().priority))
+        self.release.wait(5)
+        if isinstance(self.results, Exception):
+            raise self.results
+        return self.results if self.results is not None else f"data:{contract}:{len(self.calls)}"
+
+
+@pytest.fixture(autouse=True)
+def entries(monkeypatch):
+    monkeypatch.setattr(meme.PrefetchCache, "_entries", {})
+
+
+def test_fetch_adopts_prefetch_once():
+    fetcher = CountingFetcher()
+    meme.PrefetchCache.submit(fetcher, CONTRACT, track=False).result(5)
+
+    # on_rows 和 track 不影响接管
+    assert meme.PrefetchCache.fetch(fetcher, CONTRACT, on_rows=print) == f"data:{CONTRACT}:1"
+    assert meme.PrefetchCache.fetch(fetcher, CONTRACT) == f"data:{CONTRACT}:2"
+    assert fetcher.calls == [(CONTRACT, False, meme.Priority.PREFETCH), (CONTRACT, True, meme.Priority.INTERACTIVE)]
+
+
+def test_adopting_running_prefetch_promotes_priority():
+    fetcher = CountingFetcher()
+    fetcher.release.clear()
+    future = meme.PrefetchCache.submit(fetcher, CONTRACT)
+    context = meme.PrefetchCache._entries[meme.PrefetchCache.key(fetcher, (CONTRACT,), {})][2]
+    threading.Timer(0.1, fetcher.release.set).start()
+
+    with meme.RequestScheduler.priority(meme.Priority.INTERACTIVE):
+        assert meme.PrefetchCache.fetch(fetcher, CONTRACT) == f"data:{CONTRACT}:1"
+    assert future.done()
+    assert context.priority == meme.Priority.INTERACTIVE
+    assert len(fetcher.calls) == 1
+
+
+def test_failed_prefetch_falls_back_to_live_request():
+    fetcher = CountingFetcher(RuntimeError("upstream down"))
+    meme.PrefetchCache.submit(fetcher, CONTRACT).exception(5)
+    fetcher.results = None
+
+    assert meme.PrefetchCache.fetch(fetcher, CONTRACT) == f"data:{CONTRACT}:2"
+
+
+def test_expired_prefetch_is_not_adopted(monkeypatch):
+    fetcher = CountingFetcher()
+    meme.PrefetchCache.submit(fetcher, CONTRACT).result(5)
+    monkeypatch.setattr(meme.PrefetchCache, "TTL_SECONDS", 0)
+
+    assert meme.PrefetchCache.fetch(fetcher, CONTRACT) == f"data:{CONTRACT}:2"
+
+
+def test_submit_deduplicates_and_unhashable_args_run_directly():
+    fetcher = CountingFetcher()
+    first = meme.PrefetchCache.submit(fetcher, CONTRACT)
+    assert meme.PrefetchCache.submit(fetcher, CONTRACT) is first
+    first.result(5)
+
+    unhashable = CountingFetcher()
+    assert meme.PrefetchCache.fetch(unhashable, [CONTRACT]) == f"data:{[CONTRACT]}:1"
+
+
+@pytest.mark.parametrize("track, tracked", [(True, 1), (False, 0)])
+def test_adoption_runs_tracker_unless_untracked(monkeypatch, track, tracked):
+    fetcher = CountingFetcher(meme.DevTradeInfo(position_clear=True))
+    monkeypatch.setattr(meme.DevDataFetcher, "fetch_dev_trades", fetcher)
+    calls = []
+    monkeypatch.setattr(meme.DevDataFetcher, "track_trades", lambda contract, data: calls.append((contract, data)))
+
+    meme.PrefetchCache.submit(meme.DevDataFetcher.fetch_dev_trades, CONTRACT, track=False).result(5)
+    result = meme.PrefetchCache.fetch(meme.DevDataFetcher.fetch_dev_trades, CONTRACT, track=track)
+
+    assert result.position_clear
+    assert calls == [(CONTRACT, result)] * tracked
@@ -0,0 +1,94 @@
+"""
+性能分析模式单元测试
+描述: 覆盖按查询切分的分析会话、采样分析器的折叠栈输出和cprofile模式的工作线程统计，全部离线运行。
+
+用法:
+    python -m pytest tests/test_profiler.py
+"""
+
+import os
+import pstats
+import sys
+import threading
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+Profiler = meme.QueryProfiler
+
+
+@pytest.fixture
+def profiler(tmp_path, monkeypatch):
+    for name, value in (("enabled", False), ("mode", "sample"), ("session", None)):
+        monkeypatch.setattr(Profiler, name, value)
+    monkeypatch.setattr(Profiler, "directory", str(tmp_path))
+    yield Profiler
+    Profiler.finish()
+
+
+def busy_loop(seconds: float):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(200))
+    return total
+
+
+def worker_task():
+    with Profiler.profile_thread():
+        busy_loop(0.05)
+
+
+def test_configure_rejects_unknown_mode(profiler):
+    with pytest.raises(ValueError):
+        profiler.configure("tracing", "profiles")
+
+
+def test_disabled_profiler_is_noop(profiler, tmp_path):
+    assert profiler.begin("query A") == []
+    assert profiler.session is None
+    with profiler.profile_thread():
+        busy_loop(0.01)
+    assert profiler.finish() == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_sample_mode_writes_collapsed_stacks_per_query(profiler):
+    profiler.set_enabled(True)
+    profiler.begin("query/A")
+    busy_loop(0.2)
+    paths = profiler.begin("query B")  # 开始下一次查询时写入上一次的结果
+
+    assert [os.path.splitext(path)[1] for path in paths] == [".collapsed"]
+    assert os.path.basename(paths[0]).endswith("_query_A.collapsed")
+    with open(paths[0], encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert any("busy_loop (" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    assert profiler.session is not None and profiler.session.name == "query B"
+    assert [os.path.splitext(path)[1] for path in profiler.set_enabled(False)] in ([], [".collapsed"])
+    assert profiler.session is None
+
+
+def test_cprofile_mode_includes_worker_threads(profiler, tmp_path):
+    profiler.configure("cprofile", str(tmp_path))
+    profiler.set_enabled(True)
+    profiler.begin("query")
+    thread = threading.Thread(target=worker_task)
+    thread.start()
+    thread.join()
+    paths = profiler.set_enabled(False)
+
+    prof = [path for path in paths if path.endswith(".prof")]
+    assert len(prof) == 1
+    functions = {name for _, _, name in pstats.Stats(prof[0]).stats}
+    assert "busy_loop" in functions
@@ -0,0 +1,120 @@
+"""
+富文本渲染层单元测试
+描述: 覆盖模板预编译、按 (模板, 值) 缓存的HTML、跳过内容未变化的 setText 和解析后文档的复用，全部离线运行。
+
+用法:
+    python -m pytest tests/test_rich_text.py
+"""
+
+import collections
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel
+
+import meme
+
+RichText = meme.RichText
+
+
+@pytest.fixture(autouse=True)
+def caches(monkeypatch):
+    monkeypatch.setattr(RichText, "_html", collections.OrderedDict())
+    monkeypatch.setattr(RichText, "_documents", collections.OrderedDict())
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def cache_hits(cache: str) -> float:
+    return meme.Metrics.cache_requests.get(cache=cache, result="hit")
+
+
+def test_template_collapses_indentation_and_applies_format_spec():
+    template = meme.RichTextTemplate("t", """
+        <div>
+            <b>{name}</b> {share:.1%}
+        </div>
+    """)
+
+    assert template.fields == ("name", "share")
+    assert template.render({"name": "PEPE", "share": 0.1234}) == "<div> <b>PEPE</b> 12.3% </div>"
+
+
+def test_html_cached_by_template_and_values():
+    hits = cache_hits("render")
+    first = RichText.html("log_status", level="ok", status="成功")
+    second = RichText.html("log_status", level="ok", status="成功")
+    other = RichText.html("log_status", level="error", status="失败")
+
+    assert first is second
+    assert first == " <span class='log-ok'>→ 成功</span>"
+    assert other == " <span class='log-error'>→ 失败</span>"
+    assert cache_hits("render") == hits + 1
+
+
+def test_html_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(RichText, "HTML_CACHE_SIZE", 2)
+    RichText.html("log_link", link="a")
+    RichText.html("log_link", link="b")
+    RichText.html("log_link", link="a")
+    RichText.html("log_link", link="c")
+
+    assert [values for _, values in RichText._html] == [(("link", "a"),), (("link", "c"),)]
+
+
+def test_format_log_html_levels():
+    html = meme.MainWindow.format_log_html("12:00:00", "获取聪明钱数据", "失败 - 超时", "https://chain.fm")
+
+    assert "[12:00:00]" in html and "▶ 获取聪明钱数据" in html
+    assert "class='log-error'" in html and "href='https://chain.fm'" in html
+    assert "log-ok" in meme.MainWindow.format_log_html("t", "op", "成功")
+    assert "log-info" in meme.MainWindow.format_log_html("t", "op", "正在获取...")
+    plain = meme.MainWindow.format_log_html("t", "op")
+    assert "→" not in plain and "log-link" not in plain
+
+
+class CountingLabel(QLabel):
+    def __init__(self):
+        super().__init__()
+        self.set_count = 0
+
+    def setText(self, text):
+        self.set_count += 1
+        super().setText(text)
+
+
+def test_set_label_skips_unchanged_text(app):
+    label = CountingLabel()
+    RichText.set_label(label, "dev_info", creator="Creator1")
+    RichText.set_label(label, "dev_info", creator="Creator1")
+
+    assert label.set_count == 1
+    assert label.text().startswith(RichText.STYLE_BLOCK)
+    assert "https://gmgn.ai/sol/address/Creator1" in label.text()
+    RichText.set_label(label, "dev_info", creator="Creator2")
+    assert label.set_count == 2
+
+
+def test_parsed_documents_are_reused_with_shared_stylesheet(app, monkeypatch):
+    hits = cache_hits("document")
+    html = RichText.html("log", time="t", operation="op", link="", status="")
+    doc = RichText.parsed(html)
+
+    assert RichText.parsed(html) is doc
+    assert cache_hits("document") == hits + 1
+    assert doc.defaultStyleSheet() == RichText.STYLESHEET
+    assert "[t]" in doc.toPlainText()
+
+    monkeypatch.setattr(RichText, "DOCUMENT_CACHE_SIZE", 1)
+    RichText.parsed("<b>other</b>")
+    assert RichText.parsed(html) is not doc
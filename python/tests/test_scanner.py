@@ -0,0 +1,68 @@
+"""
+新币扫描单元测试
+描述: 覆盖布隆过滤器、最近代币LRU和扫描器的翻页与去重，全部离线运行，不访问网络。
+
+用法:
+    python -m pytest tests/test_scanner.py
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import meme
+
+
+
+def test_bloom_filter_no_false_negatives_and_bounded_false_positives():
+    bloom = meme.BloomFilter(capacity=5000, error_rate=0.01)
+    added = [f"mint-{i}" for i in range(5000)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+    false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.03
+
+
+def test_seen_mints_falls_back_to_bloom_after_lru_eviction(monkeypatch):
+    monkeypatch.setattr(meme.SeenMints, "RECENT_SIZE", 2)
+    seen = meme.SeenMints(capacity=1000, error_rate=0.001)
+
+    assert [seen.check_and_add(mint) for mint in ("a", "b", "a", "c", "d")] == [False, False, True, False, False]
+    assert "b" not in seen.recent
+    assert seen.check_and_add("b")
+
+
+def test_scan_stops_paging_at_seen_page_and_skips_seen_mints(monkeypatch):
+    listings = {
+        "created_timestamp": [["a", "b"], ["c"], ["d"]],
+        "last_trade_timestamp": [["b", "e"], ["a"], ["f"]],
+    }
+    requested = []
+
+    def fetch_listing(sort, offset, limit):
+        requested.append((sort, offset // limit))
+        pages = listings[sort]
+        page = offset // limit
+        return [meme.PumpCoin(mint) for mint in pages[page]] if page < len(pages) else []
+
+    monkeypatch.setattr(meme.CoinDataFetcher, "fetch_listing", staticmethod(fetch_listing))
+    scanner = meme.LaunchScanner(analyze=False)
+    discovered = []
+    scanner.discovered.connect(discovered.append)
+
+    found = scanner.scan_once()
+
+    assert [candidate.coin.mint for candidate in found] == ["a", "b", "c", "d", "e"]
+    assert [candidate.coin.mint for candidate in discovered] == ["a", "b", "c", "d", "e"]
+    assert [candidate.feed for candidate in found] == ["最新"] * 4 + ["最热"]
+    # 最热的第2页全部见过，不再请求第3页
+    assert requested == [("created_timestamp", 0), ("created_timestamp", 1), ("created_timestamp", 2),
+                         ("created_timestamp", 3), ("last_trade_timestamp", 0), ("last_trade_timestamp", 1)]
+    assert scanner.scan_once() == []
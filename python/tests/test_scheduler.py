@@ -0,0 +1,170 @@
+"""
+请求调度单元测试
+描述: 用占用名额的线程模拟并发请求，覆盖主机并发上限、交互请求保留名额、按优先级放行和后台请求让出，
+      全部离线运行。
+
+用法:
+    python -m pytest tests/test_scheduler.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+Scheduler = meme.RequestScheduler
+Priority = meme.Priority
+
+
+class Holder(threading.Thread):
+    """在指定优先级下占用主机的一个名额，直到 leave 被设置"""
+
+    def __init__(self, name: str, host: str, priority: int, started: list, checkpoint: bool = False):
+        super().__init__(name=name, daemon=True)
+        self.host = host
+        self.priority = priority
+        self.started = started
+        self.checkpoint = checkpoint
+        self.entered = threading.Event()
+        self.leave = threading.Event()
+
+    def run(self):
+        with Scheduler.priority(self.priority):
+            if self.checkpoint:
+                Scheduler.checkpoint()
+            with Scheduler.slot(self.host):
+                self.started.append(self.name)
+                self.entered.set()
+                self.leave.wait(5)
+
+    def finish(self):
+        self.leave.set()
+        self.join(5)
+
+
+def wait_until(predicate, timeout: float = 5.0):
+    end = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < end, "等待超时"
+        time.sleep(0.005)
+
+
+def queued(host: str) -> int:
+    with Scheduler._cond:
+        return sum(1 for h, _, _ in Scheduler._waiting if h == host)
+
+
+@pytest.fixture
+def host(request, monkeypatch):
+    """每个测试使用独立的主机名，并发上限为2"""
+    name = f"{request.node.name}.test"
+    monkeypatch.setitem(Scheduler.HOST_SLOTS, name, 2)
+    yield name
+    assert Scheduler._active[name] == 0
+    assert queued(name) == 0
+
+
+def start(holder: Holder) -> Holder:
+    holder.start()
+    return holder
+
+
+def test_host_limit_and_priority_order(host):
+    started = []
+    first = start(Holder("first", host, Priority.INTERACTIVE, started))
+    second = start(Holder("second", host, Priority.INTERACTIVE, started))
+    wait_until(lambda: first.entered.is_set() and second.entered.is_set())
+
+    prefetch = start(Holder("prefetch", host, Priority.PREFETCH, started))
+    wait_until(lambda: queued(host) == 1)
+    interactive = start(Holder("interactive", host, Priority.INTERACTIVE, started))
+    wait_until(lambda: queued(host) == 2)
+
+    # 先排队的预取让给后到的交互请求
+    first.finish()
+    wait_until(interactive.entered.is_set)
+    assert started[2:] == ["interactive"]
+
+    # 剩下一个空闲名额保留给交互请求，预取仍需等待
+    interactive.finish()
+    time.sleep(0.05)
+    assert not prefetch.entered.is_set()
+
+    second.finish()
+    wait_until(prefetch.entered.is_set)
+    prefetch.finish()
+    assert started == ["first", "second", "interactive", "prefetch"]
+
+
+def test_same_priority_is_first_come_first_served(host, monkeypatch):
+    monkeypatch.setitem(Scheduler.HOST_SLOTS, host, 1)
+    started = []
+    blocker = start(Holder("blocker", host, Priority.INTERACTIVE, started))
+    wait_until(blocker.entered.is_set)
+    holders = []
+    for i in range(3):
+        holders.append(start(Holder(f"q{i}", host, Priority.INTERACTIVE, started)))
+        wait_until(lambda: queued(host) == i + 1)
+
+    blocker.finish()
+    for holder in holders:
+        wait_until(holder.entered.is_set)
+        holder.finish()
+    assert started == ["blocker", "q0", "q1", "q2"]
+
+
+def test_background_yields_to_interactive_on_any_host(host):
+    other = host + ".other"
+    started = []
+    interactive = start(Holder("interactive", other, Priority.INTERACTIVE, started))
+    wait_until(interactive.entered.is_set)
+
+    background = start(Holder("background", host, Priority.BACKGROUND, started))
+    scanner = start(Holder("scanner", host, Priority.BACKGROUND, started, checkpoint=True))
+    wait_until(lambda: queued(host) == 1)
+    time.sleep(0.05)
+    assert started == ["interactive"]
+
+    interactive.finish()
+    # 非交互请求只能使用一个名额，两个后台任务依次执行
+    wait_until(background.entered.is_set)
+    background.finish()
+    wait_until(scanner.entered.is_set)
+    scanner.finish()
+    assert started == ["interactive", "background", "scanner"]
+
+
+def test_promote_waiting_request(host):
+    started = []
+    holders = [start(Holder(f"h{i}", host, Priority.INTERACTIVE, started)) for i in range(2)]
+    wait_until(lambda: all(holder.entered.is_set() for holder in holders))
+    context = meme.PriorityContext(Priority.PREFETCH)
+    promoted = threading.Event()
+
+    def run():
+        with Scheduler.use(context), Scheduler.slot(host):
+            promoted.set()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    wait_until(lambda: queued(host) == 1)
+
+    # 预取只能用非保留名额；被查询接管提升后可以使用保留名额
+    holders[0].finish()
+    time.sleep(0.05)
+    assert not promoted.is_set()
+    Scheduler.promote(context)
+    wait_until(promoted.is_set)
+    thread.join(5)
+    holders[1].finish()
+    assert Scheduler._interactive == 0
@@ -0,0 +1,68 @@
+"""
+价格时间序列单元测试
+描述: 覆盖LTTB降采样和开发者成交与chain.fm成交按交易签名合并，全部离线运行。
+
+用法:
+    python -m pytest tests/test_timeseries.py
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import meme
+
+MINT = "Mint1111111111111111111111111111111111111111"
+SOL = "So11111111111111111111111111111111111111112"
+
+
+def test_lttb_returns_all_points_below_threshold():
+    xs, ys = [0, 1, 2], [5, 6, 7]
+    assert meme.PriceSeries.lttb(xs, ys, 3) == [(0, 5), (1, 6), (2, 7)]
+    assert meme.PriceSeries.lttb(xs, ys, 2) == [(0, 5), (1, 6), (2, 7)]
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    xs = list(range(1000))
+    ys = [1.0] * 1000
+    ys[437] = 50.0
+    points = meme.PriceSeries.lttb(xs, ys, 20)
+
+    assert len(points) == 20
+    assert points[0] == (0, 1.0) and points[-1] == (999, 1.0)
+    assert [x for x, _ in points] == sorted(x for x, _ in points)
+    assert (437, 50.0) in points
+
+
+def chain_fm_swap(signature: str, block_time: int, price: float, address: str = "wallet") -> meme.ChainFmTransaction:
+    data = meme.ChainFmEventData(order=meme.ChainFmOrder(1.0, 150.0, price),
+                                 input=meme.ChainFmTokenRef(SOL), output=meme.ChainFmTokenRef(MINT))
+    return meme.ChainFmTransaction(signature, block_time, [meme.ChainFmEvent(3, address, data)])
+
+
+def test_dev_trade_and_chain_fm_swap_merge_by_signature():
+    series = meme.PriceSeries(MINT)
+    series.add_chain_fm(meme.ChainFmTransactionList([chain_fm_swap("sig-1", 100, 2.0), chain_fm_swap("sig-2", 110, 3.0)]))
+    series.add_dev_trades([meme.DevTransaction("buy", price=2.0, volume=150.0, time=100, tx_hash="sig-1"),
+                           meme.DevTransaction("sell", price=4.0, volume=10.0, time=120, tx_hash="sig-3")])
+
+    assert len(series) == 3
+    assert series.marker_count == 2
+    with series._lock:
+        assert [marker.kind for marker in series.markers_in(0, 200, 10)] == ["dev_buy", "dev_sell"]
+
+
+def test_repeated_responses_are_not_counted_twice():
+    series = meme.PriceSeries(MINT)
+    data = meme.ChainFmTransactionList([chain_fm_swap("sig-1", 100, 2.0)])
+    series.add_chain_fm(data)
+    series.add_chain_fm(data)
+    series.add_dev_trades([meme.DevTransaction("buy", price=2.0, time=100, tx_hash="sig-1")] * 2)
+
+    assert len(series) == 1
+    assert series.marker_count == 1
@@ -0,0 +1,112 @@
+"""
+查询链路追踪单元测试
+描述: 覆盖区间记录、截止时间、跨线程绑定和Chrome trace导出，全部离线运行。
+      每个测试在独立的上下文中运行，激活的追踪不会泄漏到其他测试。
+
+用法:
+    python -m pytest tests/test_tracing.py
+"""
+
+import contextvars
+import json
+import os
+import sys
+import threading
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+Tracer = meme.Tracer
+
+
+@pytest.fixture
+def isolated():
+    """在复制的上下文中运行被测函数"""
+    return lambda fn: contextvars.copy_context().run(fn)
+
+
+def test_span_without_trace_is_noop(isolated):
+    def body():
+        with Tracer.span("parse", "decode"):
+            pass
+        Tracer.record("fetch", "http", 0.0, 1.0)
+        return Tracer.current(), Tracer.remaining()
+
+    assert isolated(body) == (None, None)
+
+
+def test_spans_recorded_relative_to_origin(isolated):
+    def body():
+        trace = Tracer.start("query ABC")
+        with Tracer.span("parse", "decode", rows=3):
+            pass
+        Tracer.record("fetch", "http", trace.origin + 0.5, trace.origin + 0.75, host="example.com")
+        return trace
+
+    trace = isolated(body)
+    assert trace in Tracer.history
+    spans = trace.snapshot()
+    assert [span.name for span in spans] == ["parse", "fetch"]
+    assert spans[0].args == {"rows": 3}
+    fetch = spans[1]
+    assert fetch.start_us == pytest.approx(500_000) and fetch.dur_us == pytest.approx(250_000)
+    assert fetch.tid == threading.get_ident()
+
+
+def test_remaining_counts_down_to_deadline(isolated):
+    def body():
+        trace = Tracer.start("query", timeout=20.0)
+        remaining = Tracer.remaining()
+        trace.deadline = None  # 查询结束
+        return remaining, Tracer.remaining()
+
+    remaining, after = isolated(body)
+    assert 19.0 < remaining <= 20.0
+    assert after is None
+
+
+def test_bind_runs_slot_in_bound_trace_on_other_thread(isolated):
+    seen = []
+
+    def slot(value):
+        seen.append((value, Tracer.current()))
+        return value * 2
+
+    def body():
+        trace = Tracer.start("query")
+        return trace, Tracer.bind(slot, "render table")
+
+    trace, wrapped = isolated(body)
+    # 模拟主线程在另一次查询激活时执行完成信号的槽函数
+    thread = threading.Thread(target=lambda: isolated(lambda: (Tracer.start("other"), wrapped(21))))
+    thread.start()
+    thread.join()
+
+    assert seen == [(21, trace)]
+    assert [(span.name, span.cat) for span in trace.snapshot()] == [("render table", "render")]
+
+
+def test_chrome_trace_export(isolated, tmp_path):
+    def body():
+        trace = Tracer.start("query XYZ")
+        with Tracer.span("decode", "decode"):
+            pass
+        return trace
+
+    trace = isolated(body)
+    path = tmp_path / "trace.json"
+    Tracer.export_chrome_trace(trace, str(path))
+    exported = json.loads(path.read_text(encoding="utf-8"))
+
+    assert exported["otherData"] == {"query": "query XYZ"}
+    phases = [event["ph"] for event in exported["traceEvents"]]
+    assert phases == ["M", "X"]
+    span = exported["traceEvents"][1]
+    assert (span["name"], span["cat"], span["pid"]) == ("decode", "decode", os.getpid())
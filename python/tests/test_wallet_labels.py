@@ -0,0 +1,89 @@
+"""
+钱包标签索引单元测试
+描述: 覆盖addressLabelsMap合并、主标签、跨代币复用标签、批量查询和索引文件读写，全部离线运行。
+
+用法:
+    python -m pytest tests/test_wallet_labels.py
+"""
+
+import os
+import sys
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+
+import meme
+
+Index = meme.WalletLabelIndex
+MINT = "Mint1111111111111111111111111111111111111111"
+
+
+@pytest.fixture(autouse=True)
+def index(monkeypatch):
+    for name, value in (("_wallets", {}), ("path", None), ("_dirty", False)):
+        monkeypatch.setattr(Index, name, value)
+    return Index
+
+
+def chain_fm_labels(mapping):
+    return {address: [meme.ChainFmAddressLabel(label) for label in labels] for address, labels in mapping.items()}
+
+
+def test_merge_keeps_first_seen_order_and_sources(monkeypatch):
+    clock = iter([1000.0, 2000.0])
+    monkeypatch.setattr(meme.time, "time", lambda: next(clock))
+    Index.merge_chain_fm(chain_fm_labels({"w1": ["kol", "", "kol", "sniper"]}))
+    Index.merge({"w1": ["whale", "sniper"], "w2": []}, "manual")
+    wallet = Index._wallets["w1"]
+
+    assert wallet.labels == ["kol", "sniper", "whale"]
+    assert (wallet.first_seen, wallet.last_seen) == (1000, 2000)
+    assert wallet.sources == ["chain.fm", "manual"]
+    assert Index.primary_label("w1") == "kol"
+    assert Index.labels("w2") == [] and Index.primary_label("w2") is None
+    assert Index.lookup(["w1", "w2", "w3"]) == {"w1": ["kol", "sniper", "whale"]}
+    assert Index.size() == 2
+
+
+def test_labels_learned_on_one_token_apply_to_another():
+    Index.merge_chain_fm(chain_fm_labels({"smart1": ["聪明钱A"]}))
+
+    # 另一个代币的响应只返回了部分标签表
+    data = meme.ChainFmEventData(order=meme.ChainFmOrder(2.0, 300.0, 0.1),
+                                 input=meme.ChainFmTokenRef("SOL"), output=meme.ChainFmTokenRef(MINT))
+    transactions = [meme.ChainFmTransaction("sig", 1, [meme.ChainFmEvent(0, "smart1", data),
+                                                       meme.ChainFmEvent(1, "unknown", data)])]
+    rows, summary = meme.SmartMoneyAnalyzer.aggregate(transactions, {}, MINT)
+
+    assert [row.label for row in rows] == ["聪明钱A"]
+    assert summary.buy_count == 1
+
+
+def test_index_file_round_trip(tmp_path):
+    path = str(tmp_path / "wallet_labels.json")
+    Index.open(path)
+    Index.merge_chain_fm(chain_fm_labels({"w1": ["kol"], "w2": ["whale", "kol"]}))
+    Index.flush()
+
+    Index._wallets = {}
+    Index.open(path)
+    assert Index.lookup(["w1", "w2"]) == {"w1": ["kol"], "w2": ["whale", "kol"]}
+    assert Index._wallets["w2"].sources == ["chain.fm"]
+    # 标签字符串驻留，大量钱包共用同一个标签对象
+    assert Index.labels("w1")[0] is Index.labels("w2")[1]
+
+
+def test_flush_is_rate_limited(tmp_path, monkeypatch):
+    path = str(tmp_path / "wallet_labels.json")
+    Index.open(path)
+    Index.merge({"w1": ["kol"]}, "chain.fm")
+    assert not os.path.exists(path)  # 距上次保存不足 SAVE_INTERVAL
+
+    monkeypatch.setattr(Index, "SAVE_INTERVAL", 0)
+    Index.merge({"w2": ["kol"]}, "chain.fm")
+    assert os.path.exists(path)
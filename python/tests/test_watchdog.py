@@ -0,0 +1,69 @@
+"""
+主线程卡顿监测单元测试
+描述: 在offscreen平台上阻塞主线程，检查卡顿记录、采集到的调用栈和帧延迟指标。
+
+用法:
+    python -m pytest tests/test_watchdog.py
+"""
+
+import collections
+import os
+import sys
+import time
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+import meme
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def watchdog(app, monkeypatch):
+    monkeypatch.setattr(meme.EventLoopWatchdog, "history", collections.deque(maxlen=5))
+    watchdog = meme.EventLoopWatchdog(threshold=0.1)
+    watchdog.start()
+    yield watchdog
+    watchdog.stop()
+
+
+def process_events(app, seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def blocking_handler():
+    time.sleep(0.4)
+
+
+def test_stall_records_main_thread_stack(app, watchdog):
+    process_events(app, 0.2)
+    stalls_before = meme.Metrics.event_loop_stalls.get()
+
+    blocking_handler()
+    process_events(app, 0.2)
+
+    stalls = [stall for stall in watchdog.history if "blocking_handler" in stall.stack]
+    assert len(stalls) == 1
+    assert stalls[0].finished
+    assert stalls[0].duration >= 0.35
+    assert meme.Metrics.event_loop_stalls.get() >= stalls_before + 1
+
+
+def test_beat_observes_frame_lag(app, watchdog):
+    _, _, count_before = meme.Metrics.event_loop_lag.get()
+    process_events(app, 0.3)
+
+    assert meme.Metrics.event_loop_lag.get()[2] > count_before
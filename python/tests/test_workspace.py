@@ -0,0 +1,88 @@
+"""
+多代币工作区单元测试
+描述: 覆盖标签页状态、离屏控件与前台控件之间的移交和流式接收计数，全部离线运行，不需要UI文件。
+
+用法:
+    python -m pytest tests/test_workspace.py
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# 离线运行，使用offscreen平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+import pytest
+from PySide6.QtGui import QStandardItemModel
+from PySide6.QtWidgets import QApplication
+
+import meme
+
+CONTRACT = "Mint1111111111111111111111111111111111111111"
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app):
+    """具有 MainWindow 结果控件的替身，属性名与 TokenSurface 相同"""
+    window = SimpleNamespace()
+    for name in meme.TokenSurface.TABLES:
+        setattr(window, name, meme.QTableView())
+    for name in meme.TokenSurface.LABELS:
+        setattr(window, name, meme.QLabel())
+    return window
+
+
+def test_token_session_busy():
+    session = meme.TokenSession(CONTRACT, "top")
+
+    assert session.title == "Mint...1111"
+    assert not session.busy
+    session.gmgn_pending = True
+    assert session.busy
+    session.gmgn_pending = False
+    session.pending_sources.add("聪明钱")
+    assert session.busy
+
+
+def test_surface_transfer_keeps_models_and_text(window):
+    model = QStandardItemModel(3, 2)
+    window.tableSmartMoney.setModel(model)
+    window.labelDevInfo.setText("开发者信息")
+    window.labelDevInfo.setWordWrap(True)
+
+    surface = meme.TokenSurface(window)
+    meme.TokenSurface.transfer(window, surface)
+    meme.TokenSurface.clear(window)
+
+    assert window.tableSmartMoney.model() is None and window.labelDevInfo.text() == ""
+    assert surface.tableSmartMoney.model() is model
+    assert surface.labelDevInfo.text() == "开发者信息" and surface.labelDevInfo.wordWrap()
+
+    meme.TokenSurface.transfer(surface, window)
+    assert window.tableSmartMoney.model() is model
+    assert window.labelDevInfo.text() == "开发者信息"
+
+
+def test_chain_fm_progress_counted_per_session(window):
+    first, second = meme.TokenSession(CONTRACT, "top"), meme.TokenSession(CONTRACT[::-1], "top")
+    surfaces = {id(first): window, id(second): meme.TokenSurface(window)}
+    main = SimpleNamespace(surface=lambda session: surfaces[id(session)])
+    received = meme.MainWindow.on_chain_fm_rows_received
+
+    received(main, first, [meme.ChainFmTransaction()] * 3)
+    received(main, second, [meme.ChainFmTransaction()])
+    received(main, first, [meme.ChainFmTransaction()] * 2)
+
+    assert (first.chain_fm_received, second.chain_fm_received) == (5, 1)
+    assert first.stream_models == {}
+    assert window.labelSmartMoneyInfo.text().endswith("已接收5笔")
+    assert surfaces[id(second)].labelSmartMoneyInfo.text().endswith("已接收1笔")